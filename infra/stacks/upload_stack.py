@@ -150,6 +150,22 @@ class UploadStack(Stack):
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
+        # ==================== Near-Duplicate Table ====================
+        # MinHash signatures ("sig#<document_id>") and LSH band buckets
+        # ("<band>:<hash>") for near-duplicate upload detection
+        
+        self.near_duplicate_table = dynamodb.Table(
+            self,
+            "NearDuplicateTable",
+            table_name="regulatory-kb-near-duplicates",
+            partition_key=dynamodb.Attribute(
+                name="bucket",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
         # ==================== S3 Upload Bucket ====================
         # Implements Requirements 1.6, 6.2: S3 storage with versioning
         
@@ -237,6 +253,7 @@ class UploadStack(Stack):
         # Grant DynamoDB permissions
         self.upload_status_table.grant_read_write_data(self.upload_lambda_role)
         self.version_history_table.grant_read_write_data(self.upload_lambda_role)
+        self.near_duplicate_table.grant_read_write_data(self.upload_lambda_role)
 
         # Grant SQS permissions
         self.upload_queue.grant_send_messages(self.upload_lambda_role)
@@ -250,6 +267,7 @@ class UploadStack(Stack):
             "UPLOAD_BUCKET": self.upload_bucket.bucket_name,
             "UPLOAD_STATUS_TABLE": self.upload_status_table.table_name,
             "VERSION_HISTORY_TABLE": self.version_history_table.table_name,
+            "NEAR_DUPLICATE_TABLE": self.near_duplicate_table.table_name,
             "UPLOAD_QUEUE_URL": self.upload_queue.queue_url,
             "DOCUMENT_BUCKET": storage_stack.document_bucket.bucket_name,
             "LOG_LEVEL": "INFO",
@@ -285,6 +303,8 @@ class UploadStack(Stack):
                 **common_env,
                 "FALKORDB_HOST": "localhost",  # Will be updated for production
                 "FALKORDB_PORT": "6379",
+                # Stage latency histograms, emitted as CloudWatch EMF
+                "TIMING_EMF_NAMESPACE": "RegulatoryKB/UploadProcessing",
             },
             log_retention=logs.RetentionDays.ONE_MONTH,
         )
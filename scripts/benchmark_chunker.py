@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark DocumentChunker on documents with many sections.
+
+Builds synthetic documents shaped like paragraph-level CFR text (thousands
+of tiny sections) and a few large sections, then times chunk_document.
+
+Usage:
+    python scripts/benchmark_chunker.py                 # 10k sections
+    python scripts/benchmark_chunker.py --sections 50000 --repeat 5
+    python scripts/benchmark_chunker.py --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import structlog  # noqa: E402
+
+from regulatory_kb.processing.chunker import ChunkerConfig, DocumentChunker  # noqa: E402
+from regulatory_kb.processing.parser import (  # noqa: E402
+    DocumentFormat,
+    ParsedDocument,
+    ParsedSection,
+)
+
+WORDS = [
+    "capital", "liquidity", "institution", "shall", "report", "quarterly",
+    "Tier 1", "exposure", "risk-weighted", "assets", "within", "days",
+]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def build_document(sections: int, words_per_section: int, seed: int = 0) -> ParsedDocument:
+    """Build a document of many short paragraph-level sections."""
+    rng = random.Random(seed)
+    return ParsedDocument(
+        text="",
+        format=DocumentFormat.CFR,
+        sections=[
+            ParsedSection(
+                number=f"§ 217.{i}",
+                title="",
+                content=_sentence(rng, max(1, int(rng.expovariate(1 / words_per_section)))),
+                level=2,
+            )
+            for i in range(sections)
+        ],
+    )
+
+
+def build_large_sections(sections: int, paragraphs: int, seed: int = 0) -> ParsedDocument:
+    """Build a document of sections that each need size-based splitting."""
+    rng = random.Random(seed)
+    return ParsedDocument(
+        text="",
+        format=DocumentFormat.CFR,
+        sections=[
+            ParsedSection(
+                number=f"Part {i}",
+                title="Requirements",
+                content="\n\n".join(_sentence(rng, rng.randint(5, 80)) for _ in range(paragraphs)),
+                level=1,
+            )
+            for i in range(sections)
+        ],
+    )
+
+
+def time_chunking(
+    chunker: DocumentChunker,
+    document: ParsedDocument,
+    repeat: int,
+) -> dict[str, Any]:
+    """Time chunk_document and keep the fastest run."""
+    best: Optional[float] = None
+    chunks = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        chunks = chunker.chunk_document(document, "bench")
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        "sections": len(document.sections),
+        "chunks": len(chunks),
+        "best_ms": round((best or 0.0) * 1000, 2),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=10_000, help="Tiny sections per document")
+    parser.add_argument("--words", type=int, default=12, help="Mean words per tiny section")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (fastest kept)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    cases = {
+        "tiny_sections_default": (
+            DocumentChunker(),
+            build_document(args.sections, args.words),
+        ),
+        "tiny_sections_large_chunks": (
+            DocumentChunker(ChunkerConfig(
+                min_chunk_tokens=50_000, target_chunk_tokens=100_000, max_chunk_tokens=200_000
+            )),
+            build_document(args.sections, args.words),
+        ),
+        "large_sections_split": (
+            DocumentChunker(),
+            build_large_sections(max(1, args.sections // 1000), 2000),
+        ),
+    }
+
+    results = {name: time_chunking(c, doc, args.repeat) for name, (c, doc) in cases.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            print(
+                f"{name:30s} {result['sections']:7d} sections -> "
+                f"{result['chunks']:6d} chunks  {result['best_ms']:9.2f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
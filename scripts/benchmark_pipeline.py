@@ -0,0 +1,717 @@
+#!/usr/bin/env python3
+"""Benchmark knowledge-base ingestion and search end to end.
+
+Generates a deterministic synthetic corpus of CFR-style text, PDF and HTML
+documents, runs it through each pipeline stage (parse, metadata, validate,
+chunk, store, index) and then runs document, vector and hybrid searches
+against the stored corpus. Each stage is timed per call and reported with
+throughput, latency percentiles, graph query counts and peak traced memory.
+
+The graph is an in-process stand-in for FalkorDB that answers the queries
+the pipeline issues; pass --falkordb-host to benchmark a real instance
+instead (a scratch graph is used and deleted afterwards). Peak memory is
+measured in a separate tracemalloc pass so it does not skew latencies.
+
+Usage:
+    python scripts/benchmark_pipeline.py                       # 30 docs
+    python scripts/benchmark_pipeline.py --documents 300 --sections 40
+    python scripts/benchmark_pipeline.py --query-latency-ms 1  # model RTT
+    python scripts/benchmark_pipeline.py --json --output bench.json
+    python scripts/benchmark_pipeline.py --compare bench.json  # exit 1 on regression
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import re
+import resource
+import sys
+import time
+import tracemalloc
+import zlib
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Iterable, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import structlog  # noqa: E402
+
+from regulatory_kb.api.rest import DocumentSearchService, SearchFilters  # noqa: E402
+from regulatory_kb.models.document import (  # noqa: E402
+    Document,
+    DocumentContent,
+    DocumentType,
+)
+from regulatory_kb.processing.chunker import DocumentChunker  # noqa: E402
+from regulatory_kb.processing.metadata import MetadataExtractor  # noqa: E402
+from regulatory_kb.processing.parser import DocumentFormat, DocumentParser  # noqa: E402
+from regulatory_kb.processing.validation import ContentValidator  # noqa: E402
+from regulatory_kb.storage.chunk_store import ChunkStore  # noqa: E402
+from regulatory_kb.storage.graph_store import FalkorDBStore, GraphStoreConfig  # noqa: E402
+from regulatory_kb.storage.vector_search import (  # noqa: E402
+    VectorSearchConfig,
+    VectorSearchService,
+)
+
+TERMS = [
+    "capital", "liquidity", "institution", "report", "quarterly", "Tier 1",
+    "exposure", "risk-weighted assets", "stress test", "holding company",
+    "leverage ratio", "collateral", "deposit", "counterparty", "reserve",
+    "supervisory", "resolution plan", "suspicious activity", "threshold",
+]
+
+SENTENCES = [
+    "A {term} subject to this part shall {verb} the {term2} within {days} days.",
+    "The {term} must be reported on the FR Y-14A schedule each {freq} period.",
+    "Banks shall maintain a {term} ratio of at least {pct} percent of {term2}.",
+    "See 12 CFR 217.{ref} for the calculation of {term} and {term2}.",
+    "This requirement is effective {month} 1, {year} under OMB No. 7100-0{ref}.",
+    "Each {term} shall be reviewed by the board in light of {term2}.",
+]
+
+VERBS = ["calculate", "report", "maintain", "disclose", "monitor", "submit"]
+FREQUENCIES = ["quarterly", "annual", "monthly"]
+MONTHS = ["January", "April", "July", "October"]
+REGULATORS = ["us_frb", "us_occ", "us_fdic", "us_fincen", "ca_osfi"]
+FORMATS = [DocumentFormat.CFR, DocumentFormat.PDF, DocumentFormat.HTML]
+
+# Lines per generated PDF page
+PDF_PAGE_LINES = 48
+
+
+# ==================== Synthetic Corpus ====================
+
+
+@dataclass
+class SyntheticDocument:
+    """A generated document in one source format."""
+
+    id: str
+    title: str
+    format: DocumentFormat
+    regulator_id: str
+    content: bytes | str
+
+    @property
+    def size(self) -> int:
+        """Content size in bytes."""
+        return len(self.content) if isinstance(self.content, bytes) else len(self.content.encode())
+
+
+def _sentence(rng: random.Random) -> str:
+    return rng.choice(SENTENCES).format(
+        term=rng.choice(TERMS),
+        term2=rng.choice(TERMS),
+        verb=rng.choice(VERBS),
+        freq=rng.choice(FREQUENCIES),
+        month=rng.choice(MONTHS),
+        days=rng.choice([15, 30, 45, 52, 90]),
+        pct=rng.choice([3, 4.5, 6, 8, 10.5]),
+        ref=rng.randint(10, 999),
+        year=rng.randint(2020, 2026),
+    )
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    sentences: list[str] = []
+    count = 0
+    target = max(1, int(rng.expovariate(1 / words)))
+    while count < target:
+        sentences.append(_sentence(rng))
+        count += len(sentences[-1].split())
+    return " ".join(sentences)
+
+
+def _outline(rng: random.Random, sections: int, paragraphs: int, words: int) -> list[tuple[str, list[str]]]:
+    """Generate section titles with their paragraphs."""
+    return [
+        (
+            f"{rng.choice(TERMS).capitalize()} {rng.choice(['requirements', 'reporting', 'definitions', 'calculation'])}",
+            [_paragraph(rng, words) for _ in range(rng.randint(1, paragraphs))],
+        )
+        for _ in range(sections)
+    ]
+
+
+def render_cfr(outline: list[tuple[str, list[str]]], part: int) -> str:
+    """Render an outline as eCFR-style plain text."""
+    lines = [f"PART {part}—CAPITAL ADEQUACY OF BANK HOLDING COMPANIES", ""]
+    for i, (title, paragraphs) in enumerate(outline, 1):
+        lines.append(f"§ {part}.{i} {title}.")
+        for letter, paragraph in zip("abcdefghijklmnopqrstuvwxyz", paragraphs):
+            lines.append(f"({letter}) {paragraph}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_html(outline: list[tuple[str, list[str]]], title: str) -> str:
+    """Render an outline as a regulator web page."""
+    body = [f"<h1>{title}</h1>"]
+    for i, (heading, paragraphs) in enumerate(outline, 1):
+        body.append(f"<h2>{i}. {heading}</h2>")
+        body.extend(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+    return (
+        f"<html><head><title>{title}</title></head><body>"
+        "<nav><a href='/'>Home</a></nav><main>"
+        + "\n".join(body)
+        + "</main><footer>Board of Governors</footer></body></html>"
+    )
+
+
+def _wrap(text: str, width: int = 90) -> list[str]:
+    lines: list[str] = []
+    line = ""
+    for word in text.split():
+        if line and len(line) + len(word) + 1 > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def render_pdf(outline: list[tuple[str, list[str]]], title: str) -> bytes:
+    """Render an outline as a minimal text PDF that PyPDF2 can extract."""
+    lines = [title, ""]
+    for i, (heading, paragraphs) in enumerate(outline, 1):
+        lines.append(f"{i} {heading}")
+        for paragraph in paragraphs:
+            lines.extend(_wrap(paragraph))
+        lines.append("")
+    pages = [lines[i:i + PDF_PAGE_LINES] for i in range(0, len(lines), PDF_PAGE_LINES)]
+    return build_pdf(pages)
+
+
+def _pdf_string(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return "(" + escaped.encode("latin-1", errors="replace").decode("latin-1") + ")"
+
+
+def build_pdf(pages: list[list[str]]) -> bytes:
+    """Build a PDF with one Helvetica text stream per page.
+
+    Args:
+        pages: Lines of text for each page.
+
+    Returns:
+        PDF file bytes.
+    """
+    font_id = 3
+    objects: dict[int, bytes] = {font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for i, page_lines in enumerate(pages):
+        page_id, stream_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        stream = "BT /F1 10 Tf 14 TL 50 770 Td " + " ".join(
+            f"{_pdf_string(line)} Tj T*" for line in page_lines
+        ) + " ET"
+        data = stream.encode("latin-1")
+        objects[stream_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(data), data)
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {stream_id} 0 R >>"
+        ).encode()
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for obj_id in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def build_corpus(
+    documents: int,
+    sections: int = 20,
+    paragraphs: int = 3,
+    words: int = 60,
+    seed: int = 0,
+) -> list[SyntheticDocument]:
+    """Generate a deterministic corpus cycling through CFR, PDF and HTML.
+
+    Args:
+        documents: Number of documents.
+        sections: Sections per document.
+        paragraphs: Maximum paragraphs per section.
+        words: Mean words per paragraph.
+        seed: Random seed; the same arguments always give the same corpus.
+
+    Returns:
+        List of synthetic documents.
+    """
+    corpus = []
+    for i in range(documents):
+        rng = random.Random(f"{seed}:{i}")
+        doc_format = FORMATS[i % len(FORMATS)]
+        part = 200 + i
+        title = f"{rng.choice(TERMS).capitalize()} Rule {part}"
+        outline = _outline(rng, sections, paragraphs, words)
+        if doc_format == DocumentFormat.CFR:
+            content: bytes | str = render_cfr(outline, part)
+        elif doc_format == DocumentFormat.PDF:
+            content = render_pdf(outline, title)
+        else:
+            content = render_html(outline, title)
+        corpus.append(SyntheticDocument(
+            id=f"bench_{doc_format.value}_{i:05d}",
+            title=title,
+            format=doc_format,
+            regulator_id=REGULATORS[i % len(REGULATORS)],
+            content=content,
+        ))
+    return corpus
+
+
+def build_queries(count: int, seed: int = 0) -> list[str]:
+    """Generate deterministic search queries over the corpus vocabulary."""
+    rng = random.Random(f"{seed}:queries")
+    return [f"{rng.choice(TERMS)} {rng.choice(VERBS)} {rng.choice(TERMS)}" for _ in range(count)]
+
+
+def hashed_embedding(dimension: int) -> Callable[[str], list[float]]:
+    """Get a deterministic bag-of-words embedding function.
+
+    Words are hashed into buckets, so texts sharing vocabulary are close
+    without calling an embedding model.
+    """
+    word = re.compile(r"\w+")
+
+    def embed(text: str) -> list[float]:
+        vector = [0.0] * dimension
+        for token in word.findall(text.lower()):
+            h = zlib.crc32(token.encode())
+            vector[h % dimension] += 1.0 if h & 1 << 31 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    return embed
+
+
+# ==================== In-Process Graph ====================
+
+
+@dataclass
+class MemoryNode:
+    """Node returned from the in-process graph."""
+
+    properties: dict[str, Any]
+
+
+@dataclass
+class MemoryResult:
+    """Query result with the falkordb result_set shape."""
+
+    result_set: list[list[Any]] = field(default_factory=list)
+
+
+class MemoryGraph:
+    """In-process stand-in for a FalkorDB graph.
+
+    Answers the query shapes issued by FalkorDBStore, ChunkStore,
+    VectorSearchService and DocumentSearchService; other queries (such as
+    relationship MERGEs and index creation) succeed with no rows.
+    """
+
+    _CONDITION = re.compile(r"d\.(\w+)\s+(CONTAINS|=)\s+\$(\w+)")
+    _KEYWORD = re.compile(r"c\.text CONTAINS '([^']*)'")
+
+    def __init__(self):
+        self.documents: dict[str, dict[str, Any]] = {}
+        self.chunks: dict[str, dict[str, Any]] = {}
+        self.vectors: dict[tuple[str, int], dict[str, Any]] = {}
+        self._matrix: Any = None
+        self._keys: list[tuple[str, int]] = []
+
+    def query(self, cypher: str, params: Optional[dict] = None) -> MemoryResult:
+        params = params or {}
+        if "MERGE (d:Document {id: $id})" in cypher:
+            self.documents[params["id"]] = dict(params)
+            return MemoryResult([[params["id"]]])
+        if "MERGE (c:Chunk {chunk_id: $chunk_id})" in cypher:
+            self.chunks[params["chunk_id"]] = dict(params)
+            return MemoryResult([[params["chunk_id"]]])
+        if "UNWIND $chunks" in cypher and "DocumentChunk" in cypher:
+            for row in params["chunks"]:
+                self.vectors[(params["doc_id"], row["index"])] = {
+                    "title": params.get("title"), "text": row["text"], "embedding": row["embedding"],
+                }
+            self._matrix = None
+            return MemoryResult()
+        if "queryNodes" in cypher and "'DocumentChunk'" in cypher:
+            return self._vector_query(params)
+        if "MATCH (c:DocumentChunk)" in cypher and "CONTAINS" in cypher:
+            return self._keyword_query(cypher, params)
+        if "MATCH (d:Document)" in cypher and "RETURN d" in cypher:
+            return self._document_query(cypher, params)
+        return MemoryResult()
+
+    def _vector_query(self, params: dict) -> MemoryResult:
+        import numpy as np
+
+        if self._matrix is None:
+            self._keys = list(self.vectors)
+            matrix = np.asarray([self.vectors[k]["embedding"] for k in self._keys], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True) if len(matrix) else 1.0
+            self._matrix = matrix / np.where(norms == 0, 1.0, norms)
+        if not len(self._keys):
+            return MemoryResult()
+        query = np.asarray(params["query_embedding"], dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+        scores = self._matrix @ query
+        top = np.argsort(-scores)[:params["top_k"]]
+        rows = []
+        for i in top:
+            if scores[i] < params.get("min_score", 0.0):
+                continue
+            doc_id, index = self._keys[i]
+            chunk = self.vectors[(doc_id, index)]
+            rows.append([doc_id, chunk["title"], chunk["text"], index, float(scores[i])])
+        return MemoryResult(rows)
+
+    def _keyword_query(self, cypher: str, params: dict) -> MemoryResult:
+        keywords = self._KEYWORD.findall(cypher)
+        rows = []
+        for (doc_id, index), chunk in self.vectors.items():
+            if any(kw in chunk["text"] for kw in keywords):
+                rows.append([doc_id, chunk["title"], chunk["text"], index])
+                if len(rows) >= params.get("top_k", len(self.vectors)):
+                    break
+        return MemoryResult(rows)
+
+    def _document_query(self, cypher: str, params: dict) -> MemoryResult:
+        conditions = self._CONDITION.findall(cypher.split("RETURN")[0])
+        rows = []
+        for document in self.documents.values():
+            if all(
+                (params[name] in (document.get(prop) or "")) if op == "CONTAINS"
+                else document.get(prop) == params[name]
+                for prop, op, name in conditions
+            ):
+                rows.append(document)
+        rows.sort(key=lambda d: d.get("title") or "")
+        return MemoryResult([[MemoryNode(d)] for d in rows[:params.get("limit", len(rows))]])
+
+
+class CountingGraph:
+    """Graph wrapper that counts queries and can add per-query latency."""
+
+    def __init__(self, graph: Any, latency: float = 0.0):
+        self.graph = graph
+        self.latency = latency
+        self.queries = 0
+
+    def query(self, cypher: str, params: Optional[dict] = None) -> Any:
+        self.queries += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.graph.query(cypher, params or {})
+
+
+# ==================== Measurement ====================
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class StageRunner:
+    """Times each call of a stage and tracks queries and peak memory."""
+
+    def __init__(self, graph: CountingGraph, trace_memory: bool = True):
+        self.graph = graph
+        self.trace_memory = trace_memory
+        self.results: dict[str, dict[str, Any]] = {}
+
+    def run(self, stage: str, items: Iterable[Any], fn: Callable[[Any], Any]) -> list[Any]:
+        """Run fn over items as one stage and record its statistics.
+
+        Peak memory comes from a second, traced pass over the same items,
+        because tracemalloc slows allocation-heavy stages several times
+        over; stages must therefore be safe to repeat.
+
+        Args:
+            stage: Stage name.
+            items: Inputs, one call each.
+            fn: Stage function.
+
+        Returns:
+            Outputs of fn in input order, from the timed pass.
+        """
+        items = list(items)
+        latencies: list[float] = []
+        outputs = []
+        queries = self.graph.queries
+        started = time.perf_counter()
+        for item in items:
+            call_started = time.perf_counter()
+            outputs.append(fn(item))
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        queries = self.graph.queries - queries
+
+        latencies.sort()
+        result = {
+            "calls": len(latencies),
+            "total_s": round(elapsed, 4),
+            "throughput_per_s": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(latencies, 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+            "max_ms": round((latencies[-1] if latencies else 0.0) * 1000, 3),
+            "graph_queries": queries,
+        }
+        if self.trace_memory:
+            result["peak_mb"] = round(self._peak_memory(items, fn) / 2**20, 3)
+        self.results[stage] = result
+        return outputs
+
+    def _peak_memory(self, items: list[Any], fn: Callable[[Any], Any]) -> int:
+        """Get the peak bytes allocated while re-running a stage."""
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            outputs = [fn(item) for item in items]
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            del outputs
+            return peak
+        finally:
+            tracemalloc.stop()
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Compare a report against a baseline report.
+
+    Args:
+        report: Current benchmark report.
+        baseline: Earlier report from --output.
+        threshold: Allowed fractional slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        Descriptions of stages whose p50 latency or throughput regressed.
+    """
+    regressions = []
+    for stage, current in report["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous:
+            continue
+        if previous["p50_ms"] and current["p50_ms"] > previous["p50_ms"] * (1 + threshold):
+            regressions.append(f"{stage}: p50 {previous['p50_ms']}ms -> {current['p50_ms']}ms")
+        if current["throughput_per_s"] < previous["throughput_per_s"] / (1 + threshold):
+            regressions.append(
+                f"{stage}: throughput {previous['throughput_per_s']}/s -> {current['throughput_per_s']}/s"
+            )
+    return regressions
+
+
+# ==================== Pipeline ====================
+
+
+def connect_store(args: argparse.Namespace) -> tuple[FalkorDBStore, CountingGraph]:
+    """Get a store backed by the in-process graph or a real FalkorDB."""
+    latency = args.query_latency_ms / 1000
+    if args.falkordb_host:
+        store = FalkorDBStore(GraphStoreConfig(
+            host=args.falkordb_host, port=args.falkordb_port, graph_name=args.graph_name
+        ))
+        store.connect()
+    else:
+        store = FalkorDBStore()
+        store._client = object()
+        store._graph = MemoryGraph()
+    graph = CountingGraph(store._graph, latency)
+    store._graph = graph
+    return store, graph
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every stage over a generated corpus and collect the report."""
+    corpus = build_corpus(args.documents, args.sections, args.paragraphs, args.words, args.seed)
+    queries = build_queries(args.queries, args.seed)
+
+    store, graph = connect_store(args)
+    parser = DocumentParser()
+    extractor = MetadataExtractor(use_nlp=False)
+    validator = ContentValidator()
+    chunker = DocumentChunker()
+    chunk_store = ChunkStore(store)
+    vectors = VectorSearchService(
+        store,
+        VectorSearchConfig(embedding_dimension=args.dimension),
+        embedding_fn=hashed_embedding(args.dimension),
+    )
+    search = DocumentSearchService(store)
+    if args.falkordb_host:
+        vectors.create_vector_index()
+
+    # Load lazily imported parser and embedding dependencies before timing
+    for doc_format in FORMATS:
+        sample = next((d for d in corpus if d.format == doc_format), None)
+        if sample is not None:
+            parser.parse(sample.content, sample.format, sample.id)
+    vectors.generate_embeddings(["warm up"])
+    import numpy  # noqa: F401  (used by the stand-in's vector queries)
+
+    runner = StageRunner(graph, trace_memory=args.memory)
+    try:
+        parsed = runner.run("parse", corpus, lambda d: parser.parse(d.content, d.format, d.id))
+        metadata = runner.run(
+            "metadata", zip(corpus, parsed),
+            lambda pair: extractor.extract(pair[1].text, document_id=pair[0].id),
+        )
+        runner.run(
+            "validate", zip(corpus, parsed, metadata),
+            lambda item: validator.validate(item[1], item[2], document_id=item[0].id),
+        )
+        chunks = runner.run(
+            "chunk", zip(corpus, parsed), lambda pair: chunker.chunk_document(pair[1], pair[0].id)
+        )
+        documents = [
+            Document(
+                id=source.id,
+                title=source.title,
+                document_type=DocumentType.REGULATION,
+                regulator_id=source.regulator_id,
+                source_url=f"https://example.com/{source.id}",
+                categories=meta.categories,
+                metadata=meta.to_document_metadata(),
+                content=DocumentContent(text=doc.text),
+            )
+            for source, doc, meta in zip(corpus, parsed, metadata)
+        ]
+
+        def store_document(pair: tuple[Document, list]) -> int:
+            store.create_document_node(pair[0])
+            return len(chunk_store.store_chunks(pair[1]))
+
+        runner.run("store", zip(documents, chunks), store_document)
+        runner.run("index", documents, vectors.index_document)
+
+        rng = random.Random(f"{args.seed}:titles")
+        hits = {
+            "document_search": runner.run(
+                "document_search", queries,
+                lambda q: search.search(SearchFilters(query=rng.choice(TERMS).capitalize())).total_count,
+            ),
+            "vector_search": runner.run(
+                "vector_search", queries, lambda q: len(vectors.vector_search(q, top_k=args.top_k))
+            ),
+            "hybrid_search": runner.run(
+                "hybrid_search", queries, lambda q: len(vectors.hybrid_search(q, top_k=args.top_k))
+            ),
+        }
+    finally:
+        if args.falkordb_host:
+            try:
+                graph.graph.delete()
+            except Exception:
+                pass
+
+    for stage, counts in hits.items():
+        runner.results[stage]["mean_hits"] = round(sum(counts) / len(counts), 2) if counts else 0.0
+    runner.results["chunk"]["chunks"] = sum(len(c) for c in chunks)
+
+    by_format: dict[str, dict[str, int]] = {}
+    for doc in corpus:
+        entry = by_format.setdefault(doc.format.value, {"documents": 0, "bytes": 0})
+        entry["documents"] += 1
+        entry["bytes"] += doc.size
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "generated": date.today().isoformat(),
+        "python": sys.version.split()[0],
+        "config": {
+            "documents": args.documents,
+            "sections": args.sections,
+            "paragraphs": args.paragraphs,
+            "words": args.words,
+            "queries": args.queries,
+            "dimension": args.dimension,
+            "seed": args.seed,
+            "graph": "falkordb" if args.falkordb_host else "memory",
+            "query_latency_ms": args.query_latency_ms,
+            "memory_traced": args.memory,
+        },
+        "corpus": {
+            "documents": len(corpus),
+            "bytes": sum(entry["bytes"] for entry in by_format.values()),
+            "by_format": by_format,
+        },
+        "stages": runner.results,
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        "peak_rss_mb": round(maxrss / (2**20 if sys.platform == "darwin" else 2**10), 1),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=30, help="Documents in the corpus")
+    parser.add_argument("--sections", type=int, default=20, help="Sections per document")
+    parser.add_argument("--paragraphs", type=int, default=3, help="Max paragraphs per section")
+    parser.add_argument("--words", type=int, default=60, help="Mean words per paragraph")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per search stage")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per search")
+    parser.add_argument("--dimension", type=int, default=256, help="Embedding dimension")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument(
+        "--query-latency-ms", type=float, default=0.0, help="Simulated latency per graph query"
+    )
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false", help="Skip tracemalloc peak memory"
+    )
+    parser.add_argument("--falkordb-host", help="Benchmark a real FalkorDB instead of the stand-in")
+    parser.add_argument("--falkordb-port", type=int, default=6379)
+    parser.add_argument("--graph-name", default="regulatory_kb_benchmark", help="Scratch graph name")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report; exit 1 on regression")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed slowdown vs baseline (fraction)"
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    report = run_benchmark(args)
+    regressions: list[str] = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        corpus = report["corpus"]
+        print(f"corpus: {corpus['documents']} documents, {corpus['bytes'] / 2**20:.2f} MiB")
+        for stage, result in report["stages"].items():
+            peak = f"  peak {result['peak_mb']:8.2f}MiB" if "peak_mb" in result else ""
+            print(
+                f"{stage:16s} {result['calls']:6d} calls {result['throughput_per_s']:10.1f}/s  "
+                f"p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+                f"p99 {result['p99_ms']:8.2f}ms  {result['graph_queries']:7d} queries{peak}"
+            )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
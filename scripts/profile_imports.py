@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Profile Lambda handler import cost and enforce cold-start budgets.
+
+Each handler is imported in a fresh interpreter with ``-X importtime``;
+the per-module costs are reported and checked against a budget file
+listing a time limit and modules that must not load at import.
+
+Usage:
+    python scripts/profile_imports.py                     # report all handlers
+    python scripts/profile_imports.py handlers.api --top 30
+    python scripts/profile_imports.py --budget scripts/import_budget.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+DEFAULT_BUDGET = os.path.join(ROOT, "scripts", "import_budget.json")
+
+
+@dataclass
+class ModuleImport:
+    """Import cost of one module."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Import profile of one handler module."""
+
+    handler: str
+    total_us: int
+    modules: list[ModuleImport] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    def imported(self, name: str) -> bool:
+        """Check if a module (or any of its submodules) was imported."""
+        return any(m.name == name or m.name.startswith(name + ".") for m in self.modules)
+
+    def top(self, count: int) -> list[ModuleImport]:
+        """Most expensive modules by cumulative time."""
+        return sorted(self.modules, key=lambda m: m.cumulative_us, reverse=True)[:count]
+
+    def to_dict(self, top: int = 20) -> dict[str, Any]:
+        return {
+            "handler": self.handler,
+            "total_ms": round(self.total_ms, 1),
+            "module_count": len(self.modules),
+            "top": [
+                {
+                    "module": m.name,
+                    "cumulative_ms": round(m.cumulative_us / 1000, 1),
+                    "self_ms": round(m.self_us / 1000, 1),
+                }
+                for m in self.top(top)
+            ],
+        }
+
+
+def parse_importtime(handler: str, output: str) -> ImportProfile:
+    """Parse ``-X importtime`` output."""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append(
+            ModuleImport(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    total = next((m.cumulative_us for m in modules if m.name == handler), 0)
+    return ImportProfile(handler=handler, total_us=total, modules=modules)
+
+
+def profile_handler(handler: str, repeat: int = 3) -> ImportProfile:
+    """Import a handler in fresh interpreters and keep the fastest run."""
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    best: Optional[ImportProfile] = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {handler}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=ROOT,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"importing {handler} failed:\n{result.stderr[-2000:]}")
+        profile = parse_importtime(handler, result.stderr)
+        if best is None or profile.total_us < best.total_us:
+            best = profile
+    return best  # type: ignore[return-value]
+
+
+def check_budget(
+    profile: ImportProfile,
+    budget: dict[str, Any],
+    check_time: bool = True,
+) -> list[str]:
+    """Get budget violations for a handler profile."""
+    violations = []
+    max_ms = budget.get("max_ms")
+    if check_time and max_ms is not None and profile.total_ms > max_ms:
+        violations.append(
+            f"{profile.handler}: import took {profile.total_ms:.0f}ms (budget {max_ms}ms)"
+        )
+    for module in budget.get("forbidden", []):
+        if profile.imported(module):
+            violations.append(f"{profile.handler}: imports {module} at module load")
+    return violations
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("handlers", nargs="*", help="Handler modules (default: budget file)")
+    parser.add_argument("--budget", default=None, help="Budget JSON file to enforce")
+    parser.add_argument("--top", type=int, default=15, help="Modules to show per handler")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per handler (fastest kept)")
+    parser.add_argument("--no-time", action="store_true", help="Only check forbidden modules")
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args(argv)
+
+    with open(args.budget or DEFAULT_BUDGET) as f:
+        budgets = json.load(f)["handlers"]
+    handlers = args.handlers or list(budgets)
+
+    profiles = [profile_handler(h, args.repeat) for h in handlers]
+    violations: list[str] = []
+    if args.budget:
+        for profile in profiles:
+            violations.extend(
+                check_budget(profile, budgets.get(profile.handler, {}), not args.no_time)
+            )
+
+    if args.json:
+        print(json.dumps({
+            "profiles": [p.to_dict(args.top) for p in profiles],
+            "violations": violations,
+        }, indent=2))
+    else:
+        for profile in profiles:
+            print(f"{profile.handler}: {profile.total_ms:.1f}ms, {len(profile.modules)} modules")
+            for m in profile.top(args.top):
+                print(f"  {m.cumulative_us / 1000:8.1f}ms  {m.self_us / 1000:7.1f}ms  {m.name}")
+        for violation in violations:
+            print(f"BUDGET EXCEEDED: {violation}", file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,36 +11,36 @@ Implements Requirements 13.1-13.4, 13.6:
 import json
 import os
 import time
-from typing import Any, Optional
+from typing import Any, Optional, TYPE_CHECKING
 
 from regulatory_kb.core import get_logger, configure_logging
-from regulatory_kb.agent import (
-    BedrockAgentService,
-    AgentConfig,
-    QueryProcessor,
-    ToolRegistry,
-)
 from regulatory_kb.api import (
     DocumentSearchService,
     SearchFilters,
     AuthService,
     AuthConfig,
+    api_key_store_from_env,
     Permission,
     AuditLogger,
     AuditEventType,
     RateLimiter,
     RateLimitConfig,
+    rate_limit_backend_from_env,
 )
 from regulatory_kb.models.document import DocumentCategory, DocumentType
 from regulatory_kb.storage.graph_store import FalkorDBStore, GraphStoreConfig
-from regulatory_kb.storage.vector_search import VectorSearchService
+
+if TYPE_CHECKING:
+    # The agent stack is only needed for natural language queries and is
+    # imported on first use to keep search cold starts cheap
+    from regulatory_kb.agent import BedrockAgentService, QueryProcessor
 
 configure_logging(level="INFO", json_format=True)
 logger = get_logger(__name__)
 
 # Global service instances (initialized lazily)
-_agent_service: Optional[BedrockAgentService] = None
-_query_processor: Optional[QueryProcessor] = None
+_agent_service: Optional["BedrockAgentService"] = None
+_query_processor: Optional["QueryProcessor"] = None
 _search_service: Optional[DocumentSearchService] = None
 _auth_service: Optional[AuthService] = None
 _audit_logger: Optional[AuditLogger] = None
@@ -85,7 +85,7 @@ def _get_auth_service() -> AuthService:
         config = AuthConfig(
             secret_key=os.environ.get("API_SECRET_KEY", "default-secret-key"),
         )
-        _auth_service = AuthService(config)
+        _auth_service = AuthService(config, key_store=api_key_store_from_env())
     
     return _auth_service
 
@@ -110,16 +110,19 @@ def _get_rate_limiter() -> RateLimiter:
                 os.environ.get("RATE_LIMIT_PER_MINUTE", "100")
             ),
         )
-        _rate_limiter = RateLimiter(config)
+        _rate_limiter = RateLimiter(config, backend=rate_limit_backend_from_env())
     
     return _rate_limiter
 
 
-def _get_agent_service() -> BedrockAgentService:
+def _get_agent_service() -> "BedrockAgentService":
     """Get or create the Bedrock Agent service."""
     global _agent_service
     
     if _agent_service is None:
+        from regulatory_kb.agent import AgentConfig, BedrockAgentService, ToolRegistry
+        from regulatory_kb.storage.vector_search import VectorSearchService
+        
         config = AgentConfig(
             region=os.environ.get("AWS_REGION", "us-east-1"),
             model_id=os.environ.get(
@@ -137,11 +140,13 @@ def _get_agent_service() -> BedrockAgentService:
     return _agent_service
 
 
-def _get_query_processor() -> QueryProcessor:
+def _get_query_processor() -> "QueryProcessor":
     """Get or create the query processor."""
     global _query_processor
     
     if _query_processor is None:
+        from regulatory_kb.agent import QueryProcessor
+        
         agent_service = _get_agent_service()
         _query_processor = QueryProcessor(agent_service.tool_registry)
     
@@ -13,11 +13,13 @@ from regulatory_kb.core import get_logger, configure_logging
 from regulatory_kb.api import (
     AuthService,
     AuthConfig,
+    api_key_store_from_env,
     Permission,
     AuditLogger,
     AuditEventType,
     RateLimiter,
     RateLimitConfig,
+    rate_limit_backend_from_env,
 )
 from regulatory_kb.api.graphql import GraphQLService, GraphQLContext
 from regulatory_kb.storage.graph_store import FalkorDBStore, GraphStoreConfig
@@ -58,10 +60,33 @@ def _get_graphql_service() -> GraphQLService:
     
     if _graphql_service is None:
         _graphql_service = GraphQLService(_get_graph_store())
+        _load_persisted_queries(_graphql_service)
     
     return _graphql_service
 
 
+def _load_persisted_queries(service: GraphQLService) -> None:
+    """Register the persisted queries listed in GRAPHQL_PERSISTED_QUERIES.
+    
+    The variable names a JSON file holding a list of query strings, or an
+    object whose values are query strings.
+    """
+    path = os.environ.get("GRAPHQL_PERSISTED_QUERIES")
+    if not path:
+        return
+    
+    try:
+        with open(path) as f:
+            queries = json.load(f)
+        if isinstance(queries, dict):
+            queries = list(queries.values())
+        for query in queries:
+            service.register_persisted_query(query)
+        logger.info("persisted_queries_loaded", path=path, count=len(queries))
+    except Exception as e:
+        logger.warning("persisted_queries_load_failed", path=path, error=str(e))
+
+
 def _get_auth_service() -> AuthService:
     """Get or create the auth service."""
     global _auth_service
@@ -70,7 +95,7 @@ def _get_auth_service() -> AuthService:
         config = AuthConfig(
             secret_key=os.environ.get("API_SECRET_KEY", "default-secret-key"),
         )
-        _auth_service = AuthService(config)
+        _auth_service = AuthService(config, key_store=api_key_store_from_env())
     
     return _auth_service
 
@@ -95,7 +120,7 @@ def _get_rate_limiter() -> RateLimiter:
                 os.environ.get("RATE_LIMIT_PER_MINUTE", "100")
             ),
         )
-        _rate_limiter = RateLimiter(config)
+        _rate_limiter = RateLimiter(config, backend=rate_limit_backend_from_env())
     
     return _rate_limiter
 
@@ -201,6 +226,9 @@ def graphql_handler(event: dict, context: Any) -> dict:
     POST /graphql
     Body: {"query": "...", "variables": {...}, "operationName": "..."}
 
+    A persisted query is sent as its hash alone:
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+
     Args:
         event: API Gateway event with POST body
         context: Lambda context
@@ -229,15 +257,18 @@ def graphql_handler(event: dict, context: Any) -> dict:
         query = body.get("query")
         variables = body.get("variables", {})
         operation_name = body.get("operationName")
+        extensions = body.get("extensions") or {}
+        persisted_hash = (extensions.get("persistedQuery") or {}).get("sha256Hash")
 
-        if not query:
+        if not query and not persisted_hash:
             return _build_response(400, {
                 "errors": [{"message": "query is required"}]
             }, rate_headers)
 
         logger.info(
             "processing_graphql_query",
-            query_length=len(query),
+            query_length=len(query or ""),
+            persisted=persisted_hash is not None,
             has_variables=bool(variables),
             operation_name=operation_name,
         )
@@ -257,6 +288,7 @@ def graphql_handler(event: dict, context: Any) -> dict:
             variables=variables,
             operation_name=operation_name,
             context=gql_context,
+            extensions=extensions,
         )
 
         duration_ms = int((time.time() - start_time) * 1000)
@@ -267,7 +299,7 @@ def graphql_handler(event: dict, context: Any) -> dict:
             audit_logger._events[-1] if audit_logger._events else
             audit_logger.log_search(
                 client_id=client_id,
-                query_params={"query": query[:100], "operation": operation_name},
+                query_params={"query": (query or persisted_hash)[:100], "operation": operation_name},
                 result_count=0,
                 request_path=event.get("path"),
                 duration_ms=duration_ms,
@@ -21,11 +21,13 @@ from regulatory_kb.core import get_logger, configure_logging
 from regulatory_kb.api import (
     AuthService,
     AuthConfig,
+    api_key_store_from_env,
     Permission,
     AuditLogger,
     CloudWatchAuditLogger,
     RateLimiter,
     RateLimitConfig,
+    rate_limit_backend_from_env,
 )
 from regulatory_kb.upload import (
     UploadService,
@@ -34,11 +36,22 @@ from regulatory_kb.upload import (
     UploadStatus,
     VersionManager,
 )
+from regulatory_kb.api.audit_store import AuditEventStore
 from regulatory_kb.api.webhooks import WebhookService
+from regulatory_kb.upload.multipart import (
+    MAX_FIELD_BYTES,
+    MultipartError,
+    get_boundary,
+    iter_parts,
+)
+from regulatory_kb.upload.validator import PDF_MAX_SIZE
 
 configure_logging(level="INFO", json_format=True)
 logger = get_logger(__name__)
 
+# Largest accepted request body: one maximum-size file plus form fields
+MAX_REQUEST_BYTES = PDF_MAX_SIZE + MAX_FIELD_BYTES
+
 # Global service instances (initialized lazily)
 _upload_service: Optional[UploadService] = None
 _status_tracker: Optional[StatusTracker] = None
@@ -72,7 +85,7 @@ def _get_auth_service() -> AuthService:
         config = AuthConfig(
             secret_key=os.environ.get("API_SECRET_KEY", "default-secret-key"),
         )
-        _auth_service = AuthService(config)
+        _auth_service = AuthService(config, key_store=api_key_store_from_env())
     return _auth_service
 
 
@@ -84,13 +97,19 @@ def _get_audit_logger() -> AuditLogger:
     """
     global _audit_logger
     if _audit_logger is None:
+        # Spill sealed audit segments to disk (e.g. /tmp) when configured
+        store = AuditEventStore(
+            max_memory_events=int(os.environ.get("AUDIT_MAX_MEMORY_EVENTS", "10000")),
+            segment_dir=os.environ.get("AUDIT_SEGMENT_DIR") or None,
+        )
         # Use CloudWatch logger in production for 7-year retention (Requirement 7.5)
         if os.environ.get("USE_CLOUDWATCH_AUDIT", "true").lower() == "true":
             _audit_logger = CloudWatchAuditLogger(
                 log_group_name=os.environ.get("AUDIT_LOG_GROUP", "/regulatory-kb/upload-audit"),
+                store=store,
             )
         else:
-            _audit_logger = AuditLogger()
+            _audit_logger = AuditLogger(store)
     return _audit_logger
 
 
@@ -103,7 +122,7 @@ def _get_rate_limiter() -> RateLimiter:
                 os.environ.get("RATE_LIMIT_PER_MINUTE", "100")
             ),
         )
-        _rate_limiter = RateLimiter(config)
+        _rate_limiter = RateLimiter(config, backend=rate_limit_backend_from_env())
     return _rate_limiter
 
 
@@ -272,11 +291,17 @@ def _build_response(
     }
 
 
-def _parse_multipart_form_data(event: dict) -> tuple[Optional[bytes], Optional[str], Optional[dict]]:
+def _parse_multipart_form_data(event: dict) -> tuple[Optional[memoryview], Optional[str], Optional[dict]]:
     """Parse multipart form data from API Gateway event.
     
+    The body is decoded once; file content is returned as a memoryview
+    slice of the decoded body rather than a copy.
+    
     Returns:
         Tuple of (file_content, file_name, metadata_dict)
+        
+    Raises:
+        MultipartError: If the body is malformed or too large.
     """
     content_type = (event.get("headers") or {}).get("Content-Type", "")
     content_type = content_type or (event.get("headers") or {}).get("content-type", "")
@@ -284,6 +309,14 @@ def _parse_multipart_form_data(event: dict) -> tuple[Optional[bytes], Optional[s
     body = event.get("body", "")
     is_base64 = event.get("isBase64Encoded", False)
     
+    # Reject oversized bodies before decoding them
+    encoded_size = len(body) * 3 // 4 if is_base64 else len(body)
+    if encoded_size > MAX_REQUEST_BYTES:
+        raise MultipartError(
+            f"Request body exceeds maximum size of {MAX_REQUEST_BYTES} bytes",
+            status_code=413,
+        )
+    
     if is_base64:
         body = base64.b64decode(body)
     elif isinstance(body, str):
@@ -292,24 +325,17 @@ def _parse_multipart_form_data(event: dict) -> tuple[Optional[bytes], Optional[s
     # Handle JSON body (for simpler testing)
     if "application/json" in content_type:
         try:
-            data = json.loads(body.decode("utf-8") if isinstance(body, bytes) else body)
+            data = json.loads(body)
             file_content = base64.b64decode(data.get("file", "")) if data.get("file") else None
             file_name = data.get("file_name", "document")
             metadata = data.get("metadata")
-            return file_content, file_name, metadata
+            return (memoryview(file_content) if file_content else None), file_name, metadata
         except (json.JSONDecodeError, ValueError):
             return None, None, None
     
     # Handle multipart form data
     if "multipart/form-data" in content_type:
-        # Extract boundary
-        boundary = None
-        for part in content_type.split(";"):
-            part = part.strip()
-            if part.startswith("boundary="):
-                boundary = part[9:].strip('"')
-                break
-        
+        boundary = get_boundary(content_type)
         if not boundary:
             return None, None, None
         
@@ -318,7 +344,7 @@ def _parse_multipart_form_data(event: dict) -> tuple[Optional[bytes], Optional[s
     return None, None, None
 
 
-def _parse_multipart_body(body: bytes, boundary: str) -> tuple[Optional[bytes], Optional[str], Optional[dict]]:
+def _parse_multipart_body(body: bytes, boundary: str) -> tuple[Optional[memoryview], Optional[str], Optional[dict]]:
     """Parse multipart body content.
     
     Args:
@@ -327,56 +353,27 @@ def _parse_multipart_body(body: bytes, boundary: str) -> tuple[Optional[bytes],
         
     Returns:
         Tuple of (file_content, file_name, metadata_dict)
+        
+    Raises:
+        MultipartError: If the body is malformed or a part is too large.
     """
     file_content = None
     file_name = None
     metadata = {}
     
-    boundary_bytes = f"--{boundary}".encode()
-    parts = body.split(boundary_bytes)
-    
-    for part in parts:
-        if not part or part == b"--" or part == b"--\r\n":
-            continue
-        
-        # Split headers from content
-        if b"\r\n\r\n" in part:
-            headers_section, content = part.split(b"\r\n\r\n", 1)
-        elif b"\n\n" in part:
-            headers_section, content = part.split(b"\n\n", 1)
-        else:
-            continue
-        
-        headers_str = headers_section.decode("utf-8", errors="ignore")
-        
-        # Parse Content-Disposition
-        name = None
-        filename = None
-        for line in headers_str.split("\n"):
-            line = line.strip()
-            if line.lower().startswith("content-disposition:"):
-                for item in line.split(";"):
-                    item = item.strip()
-                    if item.startswith("name="):
-                        name = item[5:].strip('"')
-                    elif item.startswith("filename="):
-                        filename = item[9:].strip('"')
-        
-        # Remove trailing boundary markers
-        content = content.rstrip(b"\r\n-")
-        
-        if name == "file" and filename:
-            file_content = content
-            file_name = filename
-        elif name == "metadata":
+    for part in iter_parts(body, boundary, max_file_size=PDF_MAX_SIZE):
+        if part.name == "file" and part.filename:
+            file_content = part.content
+            file_name = part.filename
+        elif part.name == "metadata":
             try:
-                metadata = json.loads(content.decode("utf-8"))
+                metadata = json.loads(part.text())
             except (json.JSONDecodeError, UnicodeDecodeError):
                 pass
-        elif name and name != "file":
+        elif part.name and part.name != "file":
             # Handle individual metadata fields
             try:
-                metadata[name] = content.decode("utf-8").strip()
+                metadata[part.name] = part.text().strip()
             except UnicodeDecodeError:
                 pass
     
@@ -499,7 +496,10 @@ def _handle_single_upload(event: dict, client_id: str, rate_headers: dict) -> di
     client_info = _extract_client_info(event)
     
     # Parse multipart form data
-    file_content, file_name, metadata_dict = _parse_multipart_form_data(event)
+    try:
+        file_content, file_name, metadata_dict = _parse_multipart_form_data(event)
+    except MultipartError as e:
+        return _build_response(e.status_code, {"error": e.message}, rate_headers)
     
     if not file_content or not file_name:
         return _build_response(
@@ -846,7 +846,10 @@ def _handle_document_replace(
     client_info = _extract_client_info(event)
     
     # Parse request body
-    file_content, file_name, metadata_dict = _parse_multipart_form_data(event)
+    try:
+        file_content, file_name, metadata_dict = _parse_multipart_form_data(event)
+    except MultipartError as e:
+        return _build_response(e.status_code, {"error": e.message}, rate_headers)
     
     if not file_content or not file_name:
         return _build_response(
@@ -1152,6 +1155,8 @@ def _handle_audit_query(event: dict, client_id: str, rate_headers: dict) -> dict
     - end_date: Filter events before this date (ISO format)
     - limit: Maximum events to return (default 100, max 1000)
     - offset: Number of events to skip for pagination
+    - cursor: Opaque cursor from a previous page; pass an empty cursor to
+      start cursor pagination from the most recent event (overrides offset)
     
     Args:
         event: API Gateway event
@@ -1214,6 +1219,19 @@ def _handle_audit_query(event: dict, client_id: str, rate_headers: dict) -> dict
             rate_headers,
         )
     
+    if "cursor" in query_params:
+        return _handle_audit_cursor_query(
+            audit_logger,
+            cursor=query_params.get("cursor") or None,
+            limit=limit,
+            uploader_id=uploader_id,
+            document_id=document_id,
+            event_types=event_types,
+            start_date=start_date,
+            end_date=end_date,
+            rate_headers=rate_headers,
+        )
+    
     # Query events
     events, total_count = audit_logger.query_events(
         uploader_id=uploader_id,
@@ -1250,3 +1268,54 @@ def _handle_audit_query(event: dict, client_id: str, rate_headers: dict) -> dict
         },
         rate_headers,
     )
+
+
+def _handle_audit_cursor_query(
+    audit_logger: AuditLogger,
+    cursor: Optional[str],
+    limit: int,
+    uploader_id: Optional[str],
+    document_id: Optional[str],
+    event_types: Optional[list],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    rate_headers: dict,
+) -> dict:
+    """Handle a cursor-paginated audit log query.
+    
+    Cursor pages seek directly into the audit store and skip the total
+    count, so deep pages cost the same as the first one.
+    """
+    try:
+        events, next_cursor = audit_logger.query_events_page(
+            uploader_id=uploader_id,
+            document_id=document_id,
+            event_types=event_types,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        return _build_response(400, {"error": str(e)}, rate_headers)
+    
+    return _build_response(
+        200,
+        {
+            "events": [e.to_dict() for e in events],
+            "pagination": {
+                "limit": limit,
+                "cursor": cursor,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            },
+            "filters": {
+                "uploader_id": uploader_id,
+                "document_id": document_id,
+                "event_types": [et.value for et in event_types] if event_types else None,
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+            },
+        },
+        rate_headers,
+    )
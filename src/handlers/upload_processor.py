@@ -7,6 +7,7 @@ Implements Requirements 3.1-3.4:
 - Call existing metadata extractor
 - Call document chunker for large documents
 - Call existing content validator
+- Route near-duplicate uploads to the replace or skip flow
 - Update status throughout processing
 """
 
@@ -16,19 +17,28 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
 from regulatory_kb.core import get_logger, configure_logging
+from regulatory_kb.core.logging import get_timing_registry, span, span_scope
+from regulatory_kb.core.lazy import lazy_import
 from regulatory_kb.processing.parser import DocumentParser, DocumentFormat, ParsedDocument
 from regulatory_kb.processing.metadata import MetadataExtractor, RegulatorType, ExtractedMetadata
 from regulatory_kb.processing.validation import ContentValidator, ValidationResult
 from regulatory_kb.processing.chunker import DocumentChunker, DocumentChunk
+from regulatory_kb.processing.tokenizer import tokenizer_from_env
 from regulatory_kb.upload.models import UploadStatus, FileType
-from regulatory_kb.upload.status_tracker import StatusTracker
+from regulatory_kb.upload.status_tracker import StatusTracker, StatusUpdateCoalescer
 from regulatory_kb.upload.metadata_handler import MetadataHandler
+from regulatory_kb.upload.near_duplicates import NearDuplicateAction
+from regulatory_kb.upload.version_manager import (
+    NearDuplicateDecision,
+    VersionManager,
+    VersionRecord,
+)
 from regulatory_kb.api.webhooks import WebhookService, WebhookEventType
 
+boto3 = lazy_import("boto3")
 configure_logging(level="INFO", json_format=True)
 logger = get_logger(__name__)
 
@@ -44,6 +54,7 @@ _content_validator: Optional[ContentValidator] = None
 _document_chunker: Optional[DocumentChunker] = None
 _metadata_handler: Optional[MetadataHandler] = None
 _webhook_service: Optional[WebhookService] = None
+_version_manager: Optional[VersionManager] = None
 
 
 def _get_status_tracker() -> StatusTracker:
@@ -90,7 +101,7 @@ def _get_document_chunker() -> DocumentChunker:
     """Get or create the document chunker."""
     global _document_chunker
     if _document_chunker is None:
-        _document_chunker = DocumentChunker()
+        _document_chunker = DocumentChunker(tokenizer=tokenizer_from_env())
     return _document_chunker
 
 
@@ -112,6 +123,17 @@ def _get_webhook_service() -> WebhookService:
     return _webhook_service
 
 
+def _get_version_manager() -> Optional[VersionManager]:
+    """Get or create the version manager used for near-duplicate lookup.
+    
+    Near-duplicate detection is enabled by setting NEAR_DUPLICATE_TABLE.
+    """
+    global _version_manager
+    if _version_manager is None and os.environ.get("NEAR_DUPLICATE_TABLE"):
+        _version_manager = VersionManager(status_tracker=_get_status_tracker())
+    return _version_manager
+
+
 class ProcessingError(Exception):
     """Error during document processing.
     
@@ -153,6 +175,7 @@ class ProcessingStage:
     CHUNKING = "chunking"
     VALIDATION = "validation"
     STORAGE = "storage"
+    DUPLICATE = "duplicate"
     COMPLETED = "completed"
     QUARANTINE = "quarantine"
 
@@ -176,6 +199,8 @@ class UploadProcessor:
         status_tracker: Optional[StatusTracker] = None,
         s3_client: Optional[Any] = None,
         webhook_service: Optional[WebhookService] = None,
+        status_flush_interval: Optional[float] = None,
+        version_manager: Optional[VersionManager] = None,
     ):
         """Initialize the upload processor.
         
@@ -184,13 +209,25 @@ class UploadProcessor:
             status_tracker: Status tracker instance.
             s3_client: Optional S3 client (for testing).
             webhook_service: Optional webhook service (for testing).
+            status_flush_interval: Seconds between writes of intermediate
+                stage updates. Defaults to STATUS_FLUSH_INTERVAL_SECONDS
+                or 1 second.
+            version_manager: Version manager for near-duplicate routing.
+                Defaults to one configured by NEAR_DUPLICATE_TABLE, or no
+                near-duplicate detection.
         """
         self.bucket_name = bucket_name or os.environ.get(
             "UPLOAD_BUCKET", "regulatory-kb-uploads"
         )
         self.status_tracker = status_tracker or _get_status_tracker()
+        if status_flush_interval is None:
+            status_flush_interval = float(os.environ.get("STATUS_FLUSH_INTERVAL_SECONDS", "1"))
+        self.status_updates = StatusUpdateCoalescer(
+            self.status_tracker, flush_interval=status_flush_interval
+        )
         self._s3_client = s3_client
         self.webhook_service = webhook_service or _get_webhook_service()
+        self.version_manager = version_manager or _get_version_manager()
         
         self.parser = _get_document_parser()
         self.metadata_extractor = _get_metadata_extractor()
@@ -215,12 +252,20 @@ class UploadProcessor:
         - Validates content
         - Handles errors at each stage
         
+        Each stage is timed as an ``upload_stage`` span; log events carry
+        the durations of the stages finished before them.
+        
         Args:
             message: SQS message containing upload details.
             
         Returns:
             Processing result with document ID and status.
         """
+        with span_scope(), span("upload_processing"):
+            return self._process_upload(message)
+
+    def _process_upload(self, message: dict) -> dict:
+        """Run the processing pipeline for one upload message."""
         upload_id = message.get("upload_id", "")
         file_path = message.get("file_path", "")
         file_type = message.get("file_type", "pdf")
@@ -239,7 +284,8 @@ class UploadProcessor:
             
             # Step 1: Move file from pending to processing
             try:
-                processing_key = self._move_to_processing(upload_id, file_path)
+                with span("upload_stage", stage=ProcessingStage.FILE_MOVE):
+                    processing_key = self._move_to_processing(upload_id, file_path)
                 self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.FILE_MOVE)
             except ProcessingError:
                 raise
@@ -252,11 +298,13 @@ class UploadProcessor:
             
             # Step 2: Download and parse document
             try:
-                file_content = self._download_file(processing_key)
+                with span("upload_stage", stage=ProcessingStage.FILE_DOWNLOAD):
+                    file_content = self._download_file(processing_key)
                 self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.PARSING)
                 
                 doc_format = self._get_document_format(file_type)
-                parsed_doc = self.parser.parse(file_content, doc_format, upload_id)
+                with span("upload_stage", stage=ProcessingStage.PARSING):
+                    parsed_doc = self.parser.parse(file_content, doc_format, upload_id)
                 logger.info(
                     "document_parsed",
                     upload_id=upload_id,
@@ -272,19 +320,27 @@ class UploadProcessor:
                     {"file_type": file_type},
                 )
             
+            # Near-duplicates of stored documents skip the rest of the
+            # pipeline or become a new version of the stored document
+            with span("upload_stage", stage=ProcessingStage.DUPLICATE):
+                signature, duplicate = self._check_near_duplicate(upload_id, parsed_doc)
+            if duplicate and duplicate.action == NearDuplicateAction.SKIP:
+                return self._complete_duplicate(upload_id, processing_key, duplicate, uploader_id)
+            
             # Step 3: Extract metadata
             try:
                 self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.METADATA_EXTRACTION)
-                extracted_metadata = self.metadata_extractor.extract(
-                    parsed_doc.text,
-                    document_id=upload_id,
-                )
-                
-                # Merge user-provided and extracted metadata
-                merged_metadata = self.metadata_handler.merge_metadata(
-                    user_metadata=user_metadata,
-                    extracted_metadata=extracted_metadata,
-                )
+                with span("upload_stage", stage=ProcessingStage.METADATA_EXTRACTION):
+                    extracted_metadata = self.metadata_extractor.extract(
+                        parsed_doc.text,
+                        document_id=upload_id,
+                    )
+                    
+                    # Merge user-provided and extracted metadata
+                    merged_metadata = self.metadata_handler.merge_metadata(
+                        user_metadata=user_metadata,
+                        extracted_metadata=extracted_metadata,
+                    )
                 logger.info(
                     "metadata_extracted",
                     upload_id=upload_id,
@@ -306,7 +362,8 @@ class UploadProcessor:
                 try:
                     self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.CHUNKING)
                     document_id = f"uploaded_{upload_id}"
-                    chunks = self.chunker.chunk_document(parsed_doc, document_id)
+                    with span("upload_stage", stage=ProcessingStage.CHUNKING):
+                        chunks = self.chunker.chunk_document(parsed_doc, document_id)
                     logger.info(
                         "document_chunked",
                         upload_id=upload_id,
@@ -323,11 +380,12 @@ class UploadProcessor:
             # Step 5: Validate content
             try:
                 self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.VALIDATION)
-                validation_result = self.content_validator.validate(
-                    parsed_doc,
-                    extracted_metadata,
-                    document_id=upload_id,
-                )
+                with span("upload_stage", stage=ProcessingStage.VALIDATION):
+                    validation_result = self.content_validator.validate(
+                        parsed_doc,
+                        extracted_metadata,
+                        document_id=upload_id,
+                    )
                 
                 if not validation_result.is_valid:
                     logger.warning(
@@ -350,6 +408,16 @@ class UploadProcessor:
             kb_document_id = f"uploaded_{upload_id}"
             self._update_status(upload_id, UploadStatus.PROCESSING, ProcessingStage.STORAGE)
             
+            replaced_document_id = None
+            with span("upload_stage", stage=ProcessingStage.STORAGE):
+                if duplicate and duplicate.action == NearDuplicateAction.REPLACE:
+                    new_document_id = self._replace_duplicate(
+                        upload_id, duplicate, file_content, message, merged_metadata
+                    )
+                    if new_document_id:
+                        kb_document_id = new_document_id
+                        replaced_document_id = duplicate.match.document_id
+            
             # Move file to completed
             try:
                 completed_key = self._move_to_completed(upload_id, processing_key, kb_document_id)
@@ -362,13 +430,25 @@ class UploadProcessor:
                 completed_key = processing_key
             
             # Step 7: Update status to completed
-            self.status_tracker.update_status(
+            self.status_updates.update_status(
                 upload_id=upload_id,
                 status=UploadStatus.COMPLETED,
                 processing_stage=ProcessingStage.COMPLETED,
                 kb_document_id=kb_document_id,
             )
             
+            # Only a stored, completed document may become a near-duplicate match
+            if self.version_manager is not None:
+                self._register_completed_document(
+                    upload_id,
+                    kb_document_id,
+                    completed_key,
+                    signature,
+                    merged_metadata,
+                    uploader_id,
+                    replaced_document_id,
+                )
+            
             # Step 8: Trigger webhook notification for processing complete
             # Implements Requirement 3.6
             self._trigger_completion_webhook(
@@ -425,6 +505,216 @@ class UploadProcessor:
             )
             raise ProcessingError(str(e), "unknown")
 
+    def _check_near_duplicate(
+        self,
+        upload_id: str,
+        parsed_doc: ParsedDocument,
+    ) -> tuple[Any, Optional[NearDuplicateDecision]]:
+        """Compute the upload's MinHash signature and look up near-duplicates.
+        
+        Lookup failures are logged and treated as no match.
+        
+        Args:
+            upload_id: Upload identifier.
+            parsed_doc: Parsed document.
+            
+        Returns:
+            Tuple of (signature, decision); both None when detection is
+            disabled, the document has no text or the lookup failed.
+        """
+        if self.version_manager is None or not parsed_doc.text.strip():
+            return None, None
+        
+        try:
+            signature = self.version_manager.compute_signature(parsed_doc.text)
+            return signature, self.version_manager.check_near_duplicate(signature)
+        except Exception as e:
+            logger.warning(
+                "near_duplicate_check_failed",
+                upload_id=upload_id,
+                error=str(e),
+            )
+            return None, None
+
+    def _complete_duplicate(
+        self,
+        upload_id: str,
+        processing_key: str,
+        duplicate: NearDuplicateDecision,
+        uploader_id: Optional[str] = None,
+    ) -> dict:
+        """Complete an upload whose content is already stored.
+        
+        The upload resolves to the stored document; the uploaded file is
+        discarded instead of being processed again.
+        
+        Args:
+            upload_id: Upload identifier.
+            processing_key: S3 key of the uploaded file.
+            duplicate: SKIP decision with the matched document.
+            uploader_id: ID of the uploader.
+            
+        Returns:
+            Processing result pointing at the stored document.
+        """
+        match = duplicate.match
+        try:
+            self.s3_client.delete_object(Bucket=self.bucket_name, Key=processing_key)
+        except Exception as e:
+            logger.warning(
+                "duplicate_cleanup_failed",
+                upload_id=upload_id,
+                error=str(e),
+            )
+        
+        self.status_updates.update_status(
+            upload_id=upload_id,
+            status=UploadStatus.COMPLETED,
+            processing_stage=ProcessingStage.DUPLICATE,
+            kb_document_id=match.document_id,
+        )
+        self._trigger_completion_webhook(
+            upload_id=upload_id,
+            kb_document_id=match.document_id,
+            merged_metadata=None,
+            chunk_count=0,
+            validation_score=0.0,
+            uploader_id=uploader_id,
+        )
+        
+        logger.info(
+            "processing_upload_skipped_duplicate",
+            upload_id=upload_id,
+            kb_document_id=match.document_id,
+            similarity=match.similarity,
+        )
+        
+        return {
+            "upload_id": upload_id,
+            "kb_document_id": match.document_id,
+            "status": "duplicate",
+            "duplicate_of": match.to_dict(),
+            "chunks": 0,
+        }
+
+    def _replace_duplicate(
+        self,
+        upload_id: str,
+        duplicate: NearDuplicateDecision,
+        file_content: bytes,
+        message: dict,
+        merged_metadata: Any,
+    ) -> Optional[str]:
+        """Store a revised near-duplicate as a new version of its match.
+        
+        Args:
+            upload_id: Upload identifier.
+            duplicate: REPLACE decision with the matched document.
+            file_content: Uploaded file content.
+            message: SQS message with upload details.
+            merged_metadata: Merged metadata object.
+            
+        Returns:
+            Document ID of the new version, or None if replacement failed
+            and the upload should be stored as a new document.
+        """
+        match = duplicate.match
+        result = self.version_manager.replace_document(
+            existing_document_id=match.document_id,
+            new_file_content=file_content,
+            new_file_name=message.get("file_name") or f"document.{message.get('file_type', 'pdf')}",
+            uploader_id=message.get("uploader_id", ""),
+            title=merged_metadata.title if merged_metadata else None,
+            regulator=merged_metadata.regulator if merged_metadata else None,
+        )
+        if not result.success:
+            logger.warning(
+                "near_duplicate_replace_failed",
+                upload_id=upload_id,
+                document_id=match.document_id,
+                error=result.error_message,
+            )
+            return None
+        
+        logger.info(
+            "near_duplicate_replaced",
+            upload_id=upload_id,
+            previous_document_id=match.document_id,
+            kb_document_id=result.new_document_id,
+            similarity=match.similarity,
+        )
+        return result.new_document_id
+
+    def _register_completed_document(
+        self,
+        upload_id: str,
+        kb_document_id: str,
+        completed_key: str,
+        signature: Any,
+        merged_metadata: Any,
+        uploader_id: str,
+        replaced_document_id: Optional[str] = None,
+    ) -> None:
+        """Record a completed document for versioning and near-duplicate lookup.
+        
+        New documents get a version 1 record, so a later revision can
+        replace them; replacements already have theirs. The signature is
+        then indexed. Called once the document is stored and marked
+        completed, so a failed upload never leaves a signature that later
+        uploads would resolve to. Failures are logged; the upload stays
+        completed.
+        
+        Args:
+            upload_id: Upload identifier.
+            kb_document_id: Knowledge base document ID.
+            completed_key: S3 key of the stored file.
+            signature: MinHash signature of the document text, if computed.
+            merged_metadata: Merged metadata object.
+            uploader_id: ID of the uploader.
+            replaced_document_id: Document this upload superseded, whose
+                signature is removed.
+        """
+        if replaced_document_id is None:
+            try:
+                self.version_manager.create_version_record(VersionRecord(
+                    document_id=kb_document_id,
+                    version_number=1,
+                    s3_key=completed_key,
+                    title=merged_metadata.title if merged_metadata else None,
+                    regulator=merged_metadata.regulator if merged_metadata else None,
+                    uploader_id=uploader_id or None,
+                ))
+            except Exception as e:
+                logger.warning(
+                    "version_record_failed",
+                    upload_id=upload_id,
+                    kb_document_id=kb_document_id,
+                    error=str(e),
+                )
+        
+        if signature is None:
+            return
+        try:
+            if replaced_document_id:
+                self.version_manager.remove_signature(replaced_document_id)
+            self.version_manager.register_signature(
+                kb_document_id,
+                signature,
+                title=merged_metadata.title if merged_metadata else None,
+                regulator=merged_metadata.regulator if merged_metadata else None,
+            )
+        except Exception as e:
+            logger.warning(
+                "near_duplicate_register_failed",
+                upload_id=upload_id,
+                kb_document_id=kb_document_id,
+                error=str(e),
+            )
+
+    def close(self) -> None:
+        """Write pending status updates and stop the background flusher."""
+        self.status_updates.close()
+
     def _update_status(
         self,
         upload_id: str,
@@ -433,13 +723,15 @@ class UploadProcessor:
     ) -> None:
         """Update upload status.
         
+        Intermediate stages are coalesced and written in the background.
+        
         Args:
             upload_id: Upload identifier.
             status: New status.
             stage: Current processing stage.
         """
         try:
-            self.status_tracker.update_status(
+            self.status_updates.update_status(
                 upload_id=upload_id,
                 status=status,
                 processing_stage=stage,
@@ -631,7 +923,7 @@ class UploadProcessor:
         error_json = json.dumps(full_error_details)
         
         try:
-            self.status_tracker.update_status(
+            self.status_updates.update_status(
                 upload_id=upload_id,
                 status=UploadStatus.FAILED,
                 processing_stage=stage,
@@ -708,17 +1000,16 @@ class UploadProcessor:
                 uploader_id=uploader_id,
             )
             
-            # Attempt to deliver webhooks
-            for delivery in deliveries:
-                try:
-                    self.webhook_service.deliver_sync(delivery)
-                except Exception as e:
-                    logger.warning(
-                        "webhook_delivery_failed",
-                        upload_id=upload_id,
-                        delivery_id=delivery.id,
-                        error=str(e),
-                    )
+            # Attempt to deliver webhooks concurrently
+            try:
+                self.webhook_service.deliver_many_sync(deliveries)
+            except Exception as e:
+                logger.warning(
+                    "webhook_delivery_failed",
+                    upload_id=upload_id,
+                    delivery_count=len(deliveries),
+                    error=str(e),
+                )
             
             logger.info(
                 "completion_webhook_triggered",
@@ -762,17 +1053,16 @@ class UploadProcessor:
                 file_name=file_name,
             )
             
-            # Attempt to deliver webhooks
-            for delivery in deliveries:
-                try:
-                    self.webhook_service.deliver_sync(delivery)
-                except Exception as e:
-                    logger.warning(
-                        "webhook_delivery_failed",
-                        upload_id=upload_id,
-                        delivery_id=delivery.id,
-                        error=str(e),
-                    )
+            # Attempt to deliver webhooks concurrently
+            try:
+                self.webhook_service.deliver_many_sync(deliveries)
+            except Exception as e:
+                logger.warning(
+                    "webhook_delivery_failed",
+                    upload_id=upload_id,
+                    delivery_count=len(deliveries),
+                    error=str(e),
+                )
             
             logger.info(
                 "failure_webhook_triggered",
@@ -902,57 +1192,64 @@ def process_handler(event: dict, context: Any) -> dict:
     processor = UploadProcessor()
     results = []
     
-    for record in event.get("Records", []):
-        try:
-            # Parse SQS message body
-            body = json.loads(record.get("body", "{}"))
-            
-            # Process the upload
-            result = processor.process_upload(body)
-            results.append({
-                "messageId": record.get("messageId"),
-                "status": "success",
-                "result": result,
-            })
-            
-        except ProcessingError as e:
-            logger.error(
-                "processing_failed",
-                message_id=record.get("messageId"),
-                stage=e.stage,
-                error=e.message,
-            )
-            results.append({
-                "messageId": record.get("messageId"),
-                "status": "failed",
-                "error": e.message,
-                "stage": e.stage,
-            })
-            # Don't raise - let other messages process
-            
-        except json.JSONDecodeError as e:
-            logger.error(
-                "invalid_message_format",
-                message_id=record.get("messageId"),
-                error=str(e),
-            )
-            results.append({
-                "messageId": record.get("messageId"),
-                "status": "failed",
-                "error": f"Invalid message format: {str(e)}",
-            })
-            
-        except Exception as e:
-            logger.error(
-                "unexpected_processing_error",
-                message_id=record.get("messageId"),
-                error=str(e),
-            )
-            results.append({
-                "messageId": record.get("messageId"),
-                "status": "failed",
-                "error": str(e),
-            })
+    try:
+        for record in event.get("Records", []):
+            try:
+                # Parse SQS message body
+                body = json.loads(record.get("body", "{}"))
+                
+                # Process the upload
+                result = processor.process_upload(body)
+                results.append({
+                    "messageId": record.get("messageId"),
+                    "status": "success",
+                    "result": result,
+                })
+                
+            except ProcessingError as e:
+                logger.error(
+                    "processing_failed",
+                    message_id=record.get("messageId"),
+                    stage=e.stage,
+                    error=e.message,
+                )
+                results.append({
+                    "messageId": record.get("messageId"),
+                    "status": "failed",
+                    "error": e.message,
+                    "stage": e.stage,
+                })
+                # Don't raise - let other messages process
+                
+            except json.JSONDecodeError as e:
+                logger.error(
+                    "invalid_message_format",
+                    message_id=record.get("messageId"),
+                    error=str(e),
+                )
+                results.append({
+                    "messageId": record.get("messageId"),
+                    "status": "failed",
+                    "error": f"Invalid message format: {str(e)}",
+                })
+                
+            except Exception as e:
+                logger.error(
+                    "unexpected_processing_error",
+                    message_id=record.get("messageId"),
+                    error=str(e),
+                )
+                results.append({
+                    "messageId": record.get("messageId"),
+                    "status": "failed",
+                    "error": str(e),
+                })
+    finally:
+        # Lambda may freeze the process once the handler returns
+        processor.close()
+        namespace = os.environ.get("TIMING_EMF_NAMESPACE")
+        if namespace:
+            get_timing_registry().emit_emf(namespace)
     
     # Return batch item failures for SQS
     failed_message_ids = [
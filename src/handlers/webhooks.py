@@ -12,6 +12,7 @@ from regulatory_kb.core import get_logger, configure_logging
 from regulatory_kb.api import (
     AuthService,
     AuthConfig,
+    api_key_store_from_env,
     Permission,
     AuditLogger,
 )
@@ -52,7 +53,7 @@ def _get_auth_service() -> AuthService:
         config = AuthConfig(
             secret_key=os.environ.get("API_SECRET_KEY", "default-secret-key"),
         )
-        _auth_service = AuthService(config)
+        _auth_service = AuthService(config, key_store=api_key_store_from_env())
     
     return _auth_service
 
@@ -507,15 +508,16 @@ def event_trigger_handler(event: dict, context: Any) -> dict:
                 "body": json.dumps({"error": f"Unknown event type: {event_type}"}),
             }
         
-        # Deliver webhooks
-        results = []
-        for delivery in deliveries:
-            success = webhook_service.deliver_sync(delivery)
-            results.append({
+        # Deliver webhooks concurrently over the pooled session
+        successes = webhook_service.deliver_many_sync(deliveries)
+        results = [
+            {
                 "delivery_id": delivery.id,
                 "success": success,
                 "status": delivery.status.value,
-            })
+            }
+            for delivery, success in zip(deliveries, successes)
+        ]
         
         return {
             "statusCode": 200,
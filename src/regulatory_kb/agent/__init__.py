@@ -1,24 +1,29 @@
 """AWS Bedrock Agent Core integration for regulatory knowledge base."""
 
-from regulatory_kb.agent.bedrock_agent import (
-    BedrockAgentService,
-    AgentConfig,
-    AgentSession,
-    AgentResponse,
-)
-from regulatory_kb.agent.tools import (
-    AgentTool,
-    ToolRegistry,
-    GraphQueryTool,
-    DocumentRetrievalTool,
-    RegulatorySearchTool,
-)
-from regulatory_kb.agent.query_processor import (
-    QueryProcessor,
-    QueryIntent,
-    QueryResult,
-    Citation,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.agent.bedrock_agent import (
+        BedrockAgentService,
+        AgentConfig,
+        AgentSession,
+        AgentResponse,
+    )
+    from regulatory_kb.agent.tools import (
+        AgentTool,
+        ToolRegistry,
+        GraphQueryTool,
+        DocumentRetrievalTool,
+        RegulatorySearchTool,
+    )
+    from regulatory_kb.agent.query_processor import (
+        QueryProcessor,
+        QueryIntent,
+        QueryResult,
+        Citation,
+    )
 
 __all__ = [
     "BedrockAgentService",
@@ -35,3 +40,28 @@ __all__ = [
     "QueryResult",
     "Citation",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.agent.bedrock_agent": (
+            "BedrockAgentService",
+            "AgentConfig",
+            "AgentSession",
+            "AgentResponse",
+        ),
+        "regulatory_kb.agent.tools": (
+            "AgentTool",
+            "ToolRegistry",
+            "GraphQueryTool",
+            "DocumentRetrievalTool",
+            "RegulatorySearchTool",
+        ),
+        "regulatory_kb.agent.query_processor": (
+            "QueryProcessor",
+            "QueryIntent",
+            "QueryResult",
+            "Citation",
+        ),
+    },
+)
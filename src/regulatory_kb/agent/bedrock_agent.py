@@ -11,12 +11,13 @@ from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Any, Optional
 
-import boto3
-from botocore.config import Config
-
 from regulatory_kb.agent.tools import ToolRegistry, ToolResult
 from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.core.resilience import with_bulkhead
 
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
 logger = get_logger(__name__)
 
 
@@ -177,7 +178,7 @@ class BedrockAgentService:
     def _get_client(self):
         """Get or create Bedrock runtime client."""
         if self._client is None:
-            boto_config = Config(
+            boto_config = botocore_config.Config(
                 region_name=self.config.region,
                 retries={"max_attempts": self.config.max_retries},
                 connect_timeout=self.config.connect_timeout,
@@ -389,6 +390,7 @@ class BedrockAgentService:
         schemas = self.tool_registry.get_all_schemas()
         return [{"toolSpec": schema} for schema in schemas]
 
+    @with_bulkhead("bedrock")
     def _invoke_model(
         self,
         messages: list[dict[str, Any]],
@@ -1,46 +1,75 @@
 """API module for regulatory knowledge base REST and GraphQL endpoints."""
 
-from regulatory_kb.api.rest import (
-    DocumentSearchService,
-    SearchFilters,
-    SearchResult,
-    PaginatedResponse,
-)
-from regulatory_kb.api.auth import (
-    AuthService,
-    AuthConfig,
-    APIKey,
-    AuthResult,
-    Permission,
-)
-from regulatory_kb.api.audit import (
-    AuditLogger,
-    AuditEvent,
-    AuditEventType,
-)
-from regulatory_kb.api.cloudwatch_audit import (
-    CloudWatchAuditLogger,
-    RETENTION_DAYS,
-)
-from regulatory_kb.api.rate_limiter import (
-    RateLimiter,
-    RateLimitConfig,
-    RateLimitResult,
-)
-from regulatory_kb.api.graphql import (
-    GraphQLService,
-    GraphQLContext,
-    GraphQLResult,
-    GRAPHQL_SCHEMA,
-)
-from regulatory_kb.api.webhooks import (
-    WebhookService,
-    WebhookSubscription,
-    WebhookDelivery,
-    WebhookEventType,
-    WebhookStatus,
-    WebhookPayload,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.api.rest import (
+        DocumentSearchService,
+        SearchFilters,
+        SearchResult,
+        PaginatedResponse,
+    )
+    from regulatory_kb.api.auth import (
+        AuthService,
+        AuthConfig,
+        APIKey,
+        AuthResult,
+        Permission,
+        ValidatedKeyCache,
+    )
+    from regulatory_kb.api.key_store import (
+        APIKeyStore,
+        InMemoryAPIKeyStore,
+        DynamoDBAPIKeyStore,
+        api_key_store_from_env,
+    )
+    from regulatory_kb.api.audit import (
+        AuditLogger,
+        AuditEvent,
+        AuditEventType,
+    )
+    from regulatory_kb.api.audit_store import (
+        AuditEventStore,
+        AuditQuery,
+    )
+    from regulatory_kb.api.cloudwatch_audit import (
+        CloudWatchAuditLogger,
+        RETENTION_DAYS,
+    )
+    from regulatory_kb.api.rate_limiter import (
+        RateLimiter,
+        RateLimitConfig,
+        RateLimitResult,
+        rate_limit_backend_from_env,
+    )
+    from regulatory_kb.api.rate_limit_backends import (
+        RateLimitBackend,
+        ShardedMemoryBackend,
+        RedisRateLimitBackend,
+    )
+    from regulatory_kb.api.graphql import (
+        GraphQLService,
+        GraphQLContext,
+        GraphQLResult,
+        DocumentLoader,
+        GRAPHQL_SCHEMA,
+    )
+    from regulatory_kb.api.query_plan import (
+        GraphQLError,
+        QueryLimits,
+        QueryPlan,
+        QueryPlanCache,
+    )
+    from regulatory_kb.api.webhooks import (
+        WebhookService,
+        WebhookSubscription,
+        WebhookDelivery,
+        WebhookEventType,
+        WebhookStatus,
+        WebhookPayload,
+    )
 
 __all__ = [
     "DocumentSearchService",
@@ -52,18 +81,34 @@ __all__ = [
     "APIKey",
     "AuthResult",
     "Permission",
+    "ValidatedKeyCache",
+    "APIKeyStore",
+    "InMemoryAPIKeyStore",
+    "DynamoDBAPIKeyStore",
+    "api_key_store_from_env",
     "AuditLogger",
     "AuditEvent",
     "AuditEventType",
+    "AuditEventStore",
+    "AuditQuery",
     "CloudWatchAuditLogger",
     "RETENTION_DAYS",
     "RateLimiter",
     "RateLimitConfig",
     "RateLimitResult",
+    "rate_limit_backend_from_env",
+    "RateLimitBackend",
+    "ShardedMemoryBackend",
+    "RedisRateLimitBackend",
     "GraphQLService",
     "GraphQLContext",
     "GraphQLResult",
+    "DocumentLoader",
     "GRAPHQL_SCHEMA",
+    "GraphQLError",
+    "QueryLimits",
+    "QueryPlan",
+    "QueryPlanCache",
     "WebhookService",
     "WebhookSubscription",
     "WebhookDelivery",
@@ -71,3 +116,72 @@ __all__ = [
     "WebhookStatus",
     "WebhookPayload",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.api.rest": (
+            "DocumentSearchService",
+            "SearchFilters",
+            "SearchResult",
+            "PaginatedResponse",
+        ),
+        "regulatory_kb.api.auth": (
+            "AuthService",
+            "AuthConfig",
+            "APIKey",
+            "AuthResult",
+            "Permission",
+            "ValidatedKeyCache",
+        ),
+        "regulatory_kb.api.key_store": (
+            "APIKeyStore",
+            "InMemoryAPIKeyStore",
+            "DynamoDBAPIKeyStore",
+            "api_key_store_from_env",
+        ),
+        "regulatory_kb.api.audit": (
+            "AuditLogger",
+            "AuditEvent",
+            "AuditEventType",
+        ),
+        "regulatory_kb.api.audit_store": (
+            "AuditEventStore",
+            "AuditQuery",
+        ),
+        "regulatory_kb.api.cloudwatch_audit": (
+            "CloudWatchAuditLogger",
+            "RETENTION_DAYS",
+        ),
+        "regulatory_kb.api.rate_limiter": (
+            "RateLimiter",
+            "RateLimitConfig",
+            "RateLimitResult",
+            "rate_limit_backend_from_env",
+        ),
+        "regulatory_kb.api.rate_limit_backends": (
+            "RateLimitBackend",
+            "ShardedMemoryBackend",
+            "RedisRateLimitBackend",
+        ),
+        "regulatory_kb.api.graphql": (
+            "GraphQLService",
+            "GraphQLContext",
+            "GraphQLResult",
+            "DocumentLoader",
+            "GRAPHQL_SCHEMA",
+    "GraphQLError",
+    "QueryLimits",
+    "QueryPlan",
+    "QueryPlanCache",
+        ),
+        "regulatory_kb.api.webhooks": (
+            "WebhookService",
+            "WebhookSubscription",
+            "WebhookDelivery",
+            "WebhookEventType",
+            "WebhookStatus",
+            "WebhookPayload",
+        ),
+    },
+)
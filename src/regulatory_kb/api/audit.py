@@ -4,6 +4,7 @@ Implements Requirements 13.6:
 - Audit logging for API access
 """
 
+import itertools
 import json
 import uuid
 from dataclasses import dataclass, field
@@ -12,6 +13,12 @@ from enum import Enum
 from typing import Any, Optional
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.api.audit_store import (
+    AuditEventStore,
+    AuditQuery,
+    decode_cursor,
+    encode_cursor,
+)
 
 logger = get_logger(__name__)
 
@@ -119,6 +126,36 @@ class AuditEvent:
     def to_json(self) -> str:
         """Convert to JSON string."""
         return json.dumps(self.to_dict())
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AuditEvent":
+        """Create an event from its dictionary representation.
+        
+        Raises:
+            ValueError: If the event type or timestamp is invalid.
+        """
+        return cls(
+            event_id=data.get("event_id", ""),
+            event_type=AuditEventType(data.get("event_type", "document.view")),
+            timestamp=datetime.fromisoformat(data.get("timestamp", "")),
+            client_id=data.get("client_id"),
+            user_id=data.get("user_id"),
+            ip_address=data.get("ip_address"),
+            user_agent=data.get("user_agent"),
+            request_id=data.get("request_id"),
+            resource_type=data.get("resource_type"),
+            resource_id=data.get("resource_id"),
+            action=data.get("action"),
+            status=data.get("status", "success"),
+            status_code=data.get("status_code", 200),
+            duration_ms=data.get("duration_ms"),
+            request_path=data.get("request_path"),
+            request_method=data.get("request_method"),
+            query_params=data.get("query_params", {}),
+            response_size=data.get("response_size"),
+            error_message=data.get("error_message"),
+            metadata=data.get("metadata", {}),
+        )
 
 
 class AuditLogger:
@@ -131,10 +168,14 @@ class AuditLogger:
     - Security event logging
     """
     
-    def __init__(self):
-        """Initialize the audit logger."""
-        self._events: list[AuditEvent] = []
-        self._max_events: int = 10000  # In-memory limit
+    def __init__(self, store: Optional[AuditEventStore] = None):
+        """Initialize the audit logger.
+        
+        Args:
+            store: Optional event store (defaults to an in-memory store
+                holding the most recent 10000 events).
+        """
+        self._store = store or AuditEventStore(max_memory_events=10000)
     
     def log(self, event: AuditEvent) -> None:
         """Log an audit event.
@@ -142,10 +183,8 @@ class AuditLogger:
         Args:
             event: The audit event to log.
         """
-        # Store in memory (for testing/development)
-        self._events.append(event)
-        if len(self._events) > self._max_events:
-            self._events = self._events[-self._max_events:]
+        # Store in the indexed event store
+        self._store.append(event)
         
         # Log to structured logger
         logger.info(
@@ -420,19 +459,25 @@ class AuditLogger:
         Returns:
             List of matching audit events.
         """
-        events = self._events
-        
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-        
-        if client_id:
-            events = [e for e in events if e.client_id == client_id]
-        
-        return events[-limit:]
+        query = AuditQuery(
+            principal=client_id,
+            event_types=frozenset([event_type.value]) if event_type else None,
+        )
+        events = []
+        for _, event in self._store.scan(query):
+            if len(events) >= limit:
+                break
+            if client_id and event.client_id != client_id:
+                continue
+            events.append(event)
+        
+        # Oldest first, matching append order
+        events.reverse()
+        return events
     
     def clear_events(self) -> None:
         """Clear all stored events."""
-        self._events = []
+        self._store.clear()
 
     # ==================== Upload Audit Methods ====================
     # Implements Requirements 7.2, 7.3
@@ -821,30 +866,69 @@ class AuditLogger:
         Returns:
             Tuple of (matching events, total count).
         """
-        events = self._events.copy()
-        
-        # Apply filters
-        if uploader_id:
-            events = [e for e in events if e.client_id == uploader_id or e.user_id == uploader_id]
-        
-        if document_id:
-            events = [e for e in events if e.resource_id == document_id]
-        
-        if event_types:
-            events = [e for e in events if e.event_type in event_types]
-        
-        if start_date:
-            events = [e for e in events if e.timestamp >= start_date]
+        query = self._build_query(uploader_id, document_id, event_types, start_date, end_date)
         
-        if end_date:
-            events = [e for e in events if e.timestamp <= end_date]
+        # Most recent first; the store yields in descending time order
+        events = [
+            event for _, event in itertools.islice(
+                self._store.scan(query), offset, offset + limit
+            )
+        ]
         
-        # Sort by timestamp descending (most recent first)
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        
-        total_count = len(events)
+        return events, self._store.count(query)
+    
+    def query_events_page(
+        self,
+        uploader_id: Optional[str] = None,
+        document_id: Optional[str] = None,
+        event_types: Optional[list[AuditEventType]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[AuditEvent], Optional[str]]:
+        """Query audit events with cursor pagination.
         
-        # Apply pagination
-        events = events[offset:offset + limit]
+        Unlike offset pagination, each page seeks directly to the cursor
+        position instead of skipping over earlier results.
         
-        return events, total_count
+        Args:
+            uploader_id: Filter by uploader/client ID.
+            document_id: Filter by document/resource ID.
+            event_types: Filter by event types.
+            start_date: Filter events after this date.
+            end_date: Filter events before this date.
+            limit: Maximum events to return.
+            cursor: Cursor returned by the previous page.
+            
+        Returns:
+            Tuple of (matching events, next cursor or None on the last page).
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        query = self._build_query(uploader_id, document_id, event_types, start_date, end_date)
+        before = decode_cursor(cursor) if cursor else None
+        
+        limit = max(limit, 0)
+        page = list(itertools.islice(self._store.scan(query, before=before), limit + 1))
+        next_cursor = encode_cursor(page[limit - 1][0]) if 0 < limit < len(page) else None
+        
+        return [event for _, event in page[:limit]], next_cursor
+    
+    @staticmethod
+    def _build_query(
+        uploader_id: Optional[str],
+        document_id: Optional[str],
+        event_types: Optional[list[AuditEventType]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> AuditQuery:
+        """Build a store query from API filter arguments."""
+        return AuditQuery(
+            principal=uploader_id,
+            resource_id=document_id,
+            event_types=frozenset(et.value for et in event_types) if event_types else None,
+            start=start_date,
+            end=end_date,
+        )
@@ -0,0 +1,256 @@
+"""Buffered, background shipping of audit events to CloudWatch Logs.
+
+Audit events are queued on the request path and sent in PutLogEvents
+batches from a background thread, so requests never wait on CloudWatch.
+"""
+
+import atexit
+import os
+import signal
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Optional
+
+from regulatory_kb.core import get_logger
+from regulatory_kb.core.errors import RetryableError
+from regulatory_kb.core.resilience import RetryConfig, RetryHandler
+
+logger = get_logger(__name__)
+
+# PutLogEvents limits
+MAX_BATCH_EVENTS = 10000
+MAX_BATCH_BYTES = 1_048_576
+MAX_EVENT_BYTES = 262_144
+EVENT_OVERHEAD_BYTES = 26
+MAX_BATCH_SPAN_MS = 24 * 60 * 60 * 1000
+
+DEFAULT_SHIPPER_RETRY = RetryConfig(
+    max_retries=5,
+    base_delay=0.2,
+    max_delay=10.0,
+    retryable_exceptions=(ConnectionError, TimeoutError, RetryableError),
+)
+
+# Started shippers, flushed by the process-wide shutdown hooks
+_live_shippers: "weakref.WeakSet[CloudWatchLogShipper]" = weakref.WeakSet()
+_hooks_lock = threading.Lock()
+_atexit_installed = False
+_sigterm_installed = False
+_previous_sigterm: Any = None
+
+
+def _close_live_shippers() -> None:
+    """Close every started shipper, shipping its queued events."""
+    for shipper in list(_live_shippers):
+        try:
+            shipper.close()
+        except Exception as e:
+            logger.error("audit_shipper_close_error", error=str(e))
+
+
+def _on_sigterm(signum, frame) -> None:
+    """Flush shippers, then let SIGTERM do what it did before."""
+    _close_live_shippers()
+    if callable(_previous_sigterm):
+        _previous_sigterm(signum, frame)
+    elif _previous_sigterm != signal.SIG_IGN:
+        # Default action: terminate the process as if we were never installed
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _install_shutdown_hooks() -> None:
+    """Flush on interpreter exit and on SIGTERM (Lambda shutdown).
+
+    Installed once per process, however many shippers are created.
+    """
+    global _atexit_installed, _sigterm_installed, _previous_sigterm
+    with _hooks_lock:
+        if not _atexit_installed:
+            atexit.register(_close_live_shippers)
+            _atexit_installed = True
+        if _sigterm_installed or threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+        try:
+            signal.signal(signal.SIGTERM, _on_sigterm)
+        except ValueError:
+            # Not allowed outside the main interpreter thread
+            return
+        _previous_sigterm = previous
+        _sigterm_installed = True
+
+
+class CloudWatchLogShipper:
+    """Batches log events and ships them off the request thread.
+
+    Batches are flushed when they reach the PutLogEvents count or size
+    limit, every ``flush_interval`` seconds, on ``flush()``/``close()`` and
+    on process shutdown (atexit/SIGTERM). Failed sends are retried with
+    exponential backoff on the shipper thread.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[dict[str, Any]]], None],
+        max_queue_size: int = 10000,
+        flush_interval: float = 5.0,
+        retry_config: Optional[RetryConfig] = None,
+        background: bool = True,
+    ):
+        """Initialize the shipper.
+
+        Args:
+            send_batch: Callable that sends one batch of log events.
+            max_queue_size: Maximum buffered events before new ones are dropped.
+            flush_interval: Seconds between periodic flushes.
+            retry_config: Retry configuration for failed batches.
+            background: Whether to start the background flush thread.
+        """
+        self._send_batch = send_batch
+        self.max_queue_size = max_queue_size
+        self.flush_interval = flush_interval
+        self._retry = RetryHandler(retry_config or DEFAULT_SHIPPER_RETRY)
+
+        self._queue: deque[tuple[int, dict[str, Any]]] = deque()
+        self._queued_bytes = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._sent_events = 0
+        self._sent_batches = 0
+        self._dropped_events = 0
+        self._failed_events = 0
+        self._retries = 0
+
+        if background:
+            self.start()
+
+    def start(self) -> None:
+        """Start the background flush thread and shutdown hooks."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="cloudwatch-audit-shipper", daemon=True
+        )
+        self._thread.start()
+        _live_shippers.add(self)
+        _install_shutdown_hooks()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be shipped."""
+        return len(self._queue)
+
+    def enqueue(self, log_event: dict[str, Any]) -> bool:
+        """Queue a log event for shipping.
+
+        Args:
+            log_event: Event with ``timestamp`` (ms) and ``message`` keys.
+
+        Returns:
+            True if queued, False if dropped (queue full or event too large).
+        """
+        size = len(log_event["message"].encode()) + EVENT_OVERHEAD_BYTES
+        with self._lock:
+            if self._closed or size > MAX_EVENT_BYTES or len(self._queue) >= self.max_queue_size:
+                self._dropped_events += 1
+                return False
+            self._queue.append((size, log_event))
+            self._queued_bytes += size
+            batch_ready = (
+                len(self._queue) >= MAX_BATCH_EVENTS
+                or self._queued_bytes >= MAX_BATCH_BYTES
+            )
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        """Pop the next batch that fits PutLogEvents limits."""
+        batch: list[dict[str, Any]] = []
+        batch_bytes = 0
+        with self._lock:
+            while self._queue and len(batch) < MAX_BATCH_EVENTS:
+                size, log_event = self._queue[0]
+                if batch_bytes + size > MAX_BATCH_BYTES:
+                    break
+                if batch and abs(log_event["timestamp"] - batch[0]["timestamp"]) > MAX_BATCH_SPAN_MS:
+                    break
+                self._queue.popleft()
+                self._queued_bytes -= size
+                batch_bytes += size
+                batch.append(log_event)
+        # PutLogEvents requires chronological order within a batch
+        batch.sort(key=lambda e: e["timestamp"])
+        return batch
+
+    def _send_with_retry(self, batch: list[dict[str, Any]]) -> None:
+        """Send a batch, retrying retryable failures with backoff."""
+        attempt = 0
+        while True:
+            try:
+                self._send_batch(batch)
+                self._sent_events += len(batch)
+                self._sent_batches += 1
+                return
+            except Exception as e:
+                if not self._retry.should_retry(e, attempt):
+                    self._failed_events += len(batch)
+                    logger.error(
+                        "audit_batch_ship_failed",
+                        events=len(batch),
+                        attempts=attempt + 1,
+                        error=str(e),
+                    )
+                    return
+                self._retries += 1
+                time.sleep(self._retry.calculate_delay(attempt))
+                attempt += 1
+
+    def flush(self) -> None:
+        """Ship all queued events on the calling thread."""
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return
+                self._send_with_retry(batch)
+
+    def _run(self) -> None:
+        """Background loop: flush on interval or when a batch is full."""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("audit_shipper_flush_error", error=str(e))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and ship remaining events."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self.flush()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get shipping counters."""
+        return {
+            "queue_depth": self.queue_depth,
+            "queued_bytes": self._queued_bytes,
+            "sent_events": self._sent_events,
+            "sent_batches": self._sent_batches,
+            "dropped_events": self._dropped_events,
+            "failed_events": self._failed_events,
+            "retries": self._retries,
+        }
@@ -0,0 +1,468 @@
+"""Indexed storage engine for audit events.
+
+Implements Requirement 7.4 at scale:
+- Append-only, time-ordered segments
+- Secondary indexes on principal (client/user id), resource id and event type
+- Time-range binary search and cursor pagination
+- Optional memory-mapped on-disk segments for retention beyond RAM
+"""
+
+import base64
+import binascii
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+from regulatory_kb.core import get_logger
+
+logger = get_logger(__name__)
+
+# Sort key for an event inside the store: (epoch seconds, append sequence)
+AuditKey = tuple[float, int]
+
+# Index field names
+PRINCIPAL_INDEX = "principal"
+RESOURCE_INDEX = "resource"
+EVENT_TYPE_INDEX = "event_type"
+
+_SEGMENT_MAGIC = b"RKBAUD01"
+_HEADER = struct.Struct("<8sQQ")  # magic, record count, postings offset
+_RECORD = struct.Struct("<dQQI")  # timestamp, seq, payload offset, payload length
+
+
+def encode_cursor(key: AuditKey) -> str:
+    """Encode a store key as an opaque pagination cursor."""
+    raw = f"{key[0]!r}:{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> AuditKey:
+    """Decode a pagination cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts_str, seq_str = base64.urlsafe_b64decode(padded).decode().split(":")
+        return float(ts_str), int(seq_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class AuditQuery:
+    """Filter criteria for an audit store scan."""
+
+    principal: Optional[str] = None
+    resource_id: Optional[str] = None
+    event_types: Optional[frozenset[str]] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @property
+    def lower_key(self) -> AuditKey:
+        """Inclusive lower bound key for the time range."""
+        return (self.start.timestamp(), -1) if self.start else (-math.inf, -1)
+
+    @property
+    def upper_key(self) -> AuditKey:
+        """Exclusive upper bound key for the time range."""
+        return (self.end.timestamp(), math.inf) if self.end else (math.inf, 0)
+
+    def index_keys(self) -> list[list[tuple[str, str]]]:
+        """Candidate index lookups, one alternative list per filter."""
+        lookups = []
+        if self.principal:
+            lookups.append([(PRINCIPAL_INDEX, self.principal)])
+        if self.resource_id:
+            lookups.append([(RESOURCE_INDEX, self.resource_id)])
+        if self.event_types:
+            lookups.append([(EVENT_TYPE_INDEX, et) for et in sorted(self.event_types)])
+        return lookups
+
+    def matches(self, event: Any) -> bool:
+        """Check the non-time filters against an event."""
+        if self.principal and self.principal not in (event.client_id, event.user_id):
+            return False
+        if self.resource_id and event.resource_id != self.resource_id:
+            return False
+        if self.event_types and event.event_type.value not in self.event_types:
+            return False
+        return True
+
+
+def _index_entries(event: Any) -> set[tuple[str, str]]:
+    """Secondary index entries for an event."""
+    entries = {(EVENT_TYPE_INDEX, event.event_type.value)}
+    for principal in (event.client_id, event.user_id):
+        if principal:
+            entries.add((PRINCIPAL_INDEX, principal))
+    if event.resource_id:
+        entries.add((RESOURCE_INDEX, event.resource_id))
+    return entries
+
+
+class _MemorySegment:
+    """In-memory segment holding events sorted by key."""
+
+    def __init__(self):
+        self.keys: list[AuditKey] = []
+        self.events: dict[int, Any] = {}
+        self.postings: dict[tuple[str, str], list[AuditKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def min_ts(self) -> float:
+        return self.keys[0][0]
+
+    @property
+    def max_ts(self) -> float:
+        return self.keys[-1][0]
+
+    def add(self, key: AuditKey, event: Any) -> None:
+        """Add an event, keeping keys and postings sorted."""
+        if not self.keys or key > self.keys[-1]:
+            self.keys.append(key)
+        else:
+            insort(self.keys, key)
+        self.events[key[1]] = event
+        for entry in _index_entries(event):
+            posting = self.postings.setdefault(entry, [])
+            if not posting or key > posting[-1]:
+                posting.append(key)
+            else:
+                insort(posting, key)
+
+    def key_sequences(self, query: AuditQuery) -> list[Sequence[AuditKey]]:
+        """Pick the most selective key sequences for a query."""
+        best: Optional[list[Sequence[AuditKey]]] = None
+        best_size = len(self.keys)
+        for alternatives in query.index_keys():
+            sequences = [self.postings.get(entry, []) for entry in alternatives]
+            size = sum(len(s) for s in sequences)
+            if best is None or size < best_size:
+                best, best_size = sequences, size
+        return best if best is not None else [self.keys]
+
+    def scan(
+        self, query: AuditQuery, lower: AuditKey, upper: AuditKey
+    ) -> Iterator[tuple[AuditKey, Any]]:
+        """Yield matching (key, event) pairs in descending key order."""
+        # Slices are copied eagerly so concurrent appends cannot shift them.
+        streams = [
+            self._scan_keys(
+                sequence[bisect_left(sequence, lower):bisect_left(sequence, upper)], query
+            )
+            for sequence in self.key_sequences(query)
+        ]
+        return heapq.merge(*streams, key=lambda item: item[0], reverse=True)
+
+    def _scan_keys(
+        self, keys: list[AuditKey], query: AuditQuery
+    ) -> Iterator[tuple[AuditKey, Any]]:
+        events = self.events
+        for key in reversed(keys):
+            event = events[key[1]]
+            if query.matches(event):
+                yield key, event
+
+    def range_count(self, entry: Optional[tuple[str, str]], lower: AuditKey, upper: AuditKey) -> int:
+        """Count keys in [lower, upper) for an index entry (or all keys)."""
+        sequence = self.keys if entry is None else self.postings.get(entry, [])
+        return bisect_left(sequence, upper) - bisect_left(sequence, lower)
+
+
+class _KeyView(Sequence):
+    """Read-only sequence of keys for record positions in a mapped segment."""
+
+    def __init__(self, segment: "_MappedSegment", positions: Optional[array] = None):
+        self._segment = segment
+        self._positions = positions
+
+    def __len__(self) -> int:
+        if self._positions is None:
+            return self._segment.count
+        return len(self._positions)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        position = i if self._positions is None else self._positions[i]
+        return self._segment.key_at(position)
+
+    def position(self, i: int) -> int:
+        return i if self._positions is None else self._positions[i]
+
+
+class _MappedSegment:
+    """Immutable on-disk segment read through mmap.
+
+    File layout: header, fixed-size record table sorted by key, JSON event
+    payloads, then a JSON postings map of index entry to record positions.
+    Only the postings are held in memory.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, postings_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _SEGMENT_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not an audit segment file: {path}")
+        raw_postings = json.loads(self._mmap[postings_offset:].decode())
+        self.postings: dict[tuple[str, str], array] = {}
+        for name, positions in raw_postings.items():
+            field_name, _, value = name.partition("\x1f")
+            self.postings[(field_name, value)] = array("L", positions)
+        self.keys = _KeyView(self)
+
+    @classmethod
+    def write(cls, path: str, segment: _MemorySegment) -> "_MappedSegment":
+        """Persist a memory segment to disk and open it mapped."""
+        payloads = [segment.events[seq].to_json().encode() for _, seq in segment.keys]
+        positions = {key: i for i, key in enumerate(segment.keys)}
+        offset = _HEADER.size + _RECORD.size * len(payloads)
+        records = bytearray()
+        for (ts, seq), payload in zip(segment.keys, payloads):
+            records += _RECORD.pack(ts, seq, offset, len(payload))
+            offset += len(payload)
+        postings = {
+            f"{field_name}\x1f{value}": [positions[key] for key in keys]
+            for (field_name, value), keys in segment.postings.items()
+        }
+
+        directory = os.path.dirname(path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_SEGMENT_MAGIC, len(payloads), offset))
+                f.write(records)
+                for payload in payloads:
+                    f.write(payload)
+                f.write(json.dumps(postings).encode())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def min_ts(self) -> float:
+        return self.key_at(0)[0]
+
+    @property
+    def max_ts(self) -> float:
+        return self.key_at(self.count - 1)[0]
+
+    def key_at(self, position: int) -> AuditKey:
+        ts, seq, _, _ = _RECORD.unpack_from(self._mmap, _HEADER.size + position * _RECORD.size)
+        return ts, seq
+
+    def event_at(self, position: int) -> Any:
+        from regulatory_kb.api.audit import AuditEvent
+
+        _, _, offset, length = _RECORD.unpack_from(
+            self._mmap, _HEADER.size + position * _RECORD.size
+        )
+        return AuditEvent.from_dict(json.loads(self._mmap[offset:offset + length]))
+
+    def key_sequences(self, query: AuditQuery) -> list[_KeyView]:
+        best: Optional[list[_KeyView]] = None
+        best_size = self.count
+        for alternatives in query.index_keys():
+            views = [
+                _KeyView(self, self.postings.get(entry, array("L")))
+                for entry in alternatives
+            ]
+            size = sum(len(v) for v in views)
+            if best is None or size < best_size:
+                best, best_size = views, size
+        return best if best is not None else [self.keys]
+
+    def scan(
+        self, query: AuditQuery, lower: AuditKey, upper: AuditKey
+    ) -> Iterator[tuple[AuditKey, Any]]:
+        streams = [
+            self._scan_view(view, query, bisect_left(view, lower), bisect_left(view, upper))
+            for view in self.key_sequences(query)
+        ]
+        return heapq.merge(*streams, key=lambda item: item[0], reverse=True)
+
+    def _scan_view(
+        self, view: _KeyView, query: AuditQuery, lo: int, hi: int
+    ) -> Iterator[tuple[AuditKey, Any]]:
+        for i in range(hi - 1, lo - 1, -1):
+            event = self.event_at(view.position(i))
+            if query.matches(event):
+                yield view[i], event
+
+    def range_count(self, entry: Optional[tuple[str, str]], lower: AuditKey, upper: AuditKey) -> int:
+        view = self.keys if entry is None else _KeyView(
+            self, self.postings.get(entry, array("L"))
+        )
+        return bisect_left(view, upper) - bisect_left(view, lower)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+class AuditEventStore:
+    """Segmented, indexed store for audit events.
+
+    Events are appended to an active segment; full segments are sealed.
+    Once more than ``max_memory_events`` are held in RAM, the oldest sealed
+    segments are either written to ``segment_dir`` as memory-mapped files
+    or, without a segment directory, discarded.
+    """
+
+    def __init__(
+        self,
+        max_memory_events: int = 10000,
+        segment_size: int = 1024,
+        segment_dir: Optional[str] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            max_memory_events: Maximum events held in memory-resident segments.
+            segment_size: Events per segment before it is sealed.
+            segment_dir: Optional directory for memory-mapped segment files.
+        """
+        self.max_memory_events = max_memory_events
+        self.segment_size = max(1, min(segment_size, max_memory_events))
+        self.segment_dir = segment_dir
+        self._disk_segments: list[_MappedSegment] = []
+        self._memory_segments: list[_MemorySegment] = [_MemorySegment()]
+        self._memory_count = 0
+        self._next_seq = 0
+        self._lock = threading.RLock()
+
+        if segment_dir:
+            os.makedirs(segment_dir, exist_ok=True)
+            self._load_disk_segments()
+
+    def _load_disk_segments(self) -> None:
+        """Open existing segment files from the segment directory."""
+        for name in sorted(os.listdir(self.segment_dir)):
+            if not name.endswith(".seg"):
+                continue
+            try:
+                segment = _MappedSegment(os.path.join(self.segment_dir, name))
+            except (OSError, ValueError) as e:
+                logger.warning("audit_segment_load_failed", segment=name, error=str(e))
+                continue
+            if segment.count:
+                self._disk_segments.append(segment)
+                self._next_seq = max(self._next_seq, segment.key_at(segment.count - 1)[1] + 1)
+
+    def __len__(self) -> int:
+        return self._memory_count + sum(s.count for s in self._disk_segments)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of non-empty segments (memory and disk)."""
+        return len(self._disk_segments) + sum(1 for s in self._memory_segments if s.keys)
+
+    def append(self, event: Any) -> AuditKey:
+        """Append an event and return its store key."""
+        with self._lock:
+            key = (event.timestamp.timestamp(), self._next_seq)
+            self._next_seq += 1
+            active = self._memory_segments[-1]
+            if len(active) >= self.segment_size:
+                active = _MemorySegment()
+                self._memory_segments.append(active)
+            active.add(key, event)
+            self._memory_count += 1
+            self._enforce_memory_limit()
+            return key
+
+    def _enforce_memory_limit(self) -> None:
+        """Spill or drop the oldest sealed segments when over the limit."""
+        while self._memory_count > self.max_memory_events and len(self._memory_segments) > 1:
+            oldest = self._memory_segments.pop(0)
+            self._memory_count -= len(oldest)
+            if self.segment_dir:
+                path = os.path.join(self.segment_dir, f"{oldest.keys[0][1]:020d}.seg")
+                self._disk_segments.append(_MappedSegment.write(path, oldest))
+                logger.debug("audit_segment_spilled", path=path, events=len(oldest))
+
+    def _segments(self) -> list[Any]:
+        return [*self._disk_segments, *(s for s in self._memory_segments if s.keys)]
+
+    def scan(
+        self,
+        query: Optional[AuditQuery] = None,
+        before: Optional[AuditKey] = None,
+    ) -> Iterator[tuple[AuditKey, Any]]:
+        """Yield matching (key, event) pairs, most recent first.
+
+        Args:
+            query: Filter criteria.
+            before: Exclusive upper bound key (for cursor pagination).
+        """
+        query = query or AuditQuery()
+        lower, upper = query.lower_key, query.upper_key
+        if before is not None and before < upper:
+            upper = before
+        with self._lock:
+            streams = [
+                s.scan(query, lower, upper)
+                for s in self._segments()
+                if s.max_ts >= lower[0] and s.min_ts <= upper[0]
+            ]
+        # Segments rarely overlap in time; merging keeps late arrivals ordered.
+        return heapq.merge(*streams, key=lambda item: item[0], reverse=True)
+
+    def count(self, query: Optional[AuditQuery] = None) -> int:
+        """Count matching events.
+
+        Single-filter queries are answered from index range sizes without
+        touching events; combined filters verify each candidate.
+        """
+        query = query or AuditQuery()
+        lookups = query.index_keys()
+        if len(lookups) > 1:
+            return sum(1 for _ in self.scan(query))
+        lower, upper = query.lower_key, query.upper_key
+        entries: list[Optional[tuple[str, str]]] = lookups[0] if lookups else [None]
+        with self._lock:
+            return sum(
+                s.range_count(entry, lower, upper)
+                for s in self._segments()
+                for entry in entries
+            )
+
+    def clear(self) -> None:
+        """Remove all events, including on-disk segments."""
+        with self._lock:
+            for segment in self._disk_segments:
+                segment.close()
+                os.unlink(segment.path)
+            self._disk_segments = []
+            self._memory_segments = [_MemorySegment()]
+            self._memory_count = 0
+
+    def close(self) -> None:
+        """Release memory maps held by on-disk segments."""
+        with self._lock:
+            for segment in self._disk_segments:
+                segment.close()
+            self._disk_segments = []
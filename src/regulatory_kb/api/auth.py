@@ -7,13 +7,16 @@ Implements Requirements 13.6:
 import hashlib
 import hmac
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Any, Optional
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.api.key_store import APIKeyStore, InMemoryAPIKeyStore
 
 logger = get_logger(__name__)
 
@@ -76,6 +79,8 @@ class AuthConfig:
     token_expiry_hours: int = 24
     api_key_prefix: str = "rk_"
     hash_algorithm: str = "sha256"
+    key_cache_ttl_seconds: float = 30.0
+    key_cache_max_entries: int = 10000
 
 
 @dataclass
@@ -98,6 +103,66 @@ class AuthResult:
         }
 
 
+class ValidatedKeyCache:
+    """Short-lived cache of recently validated keys, keyed by digest.
+    
+    Entries expire after ``ttl_seconds`` so changes made through another
+    process's store are picked up; changes made through this service
+    invalidate the entry immediately.
+    """
+    
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        """Initialize the cache.
+        
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching).
+            max_entries: Maximum cached keys; least recently used are evicted.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, APIKey]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key_hash: str) -> Optional[APIKey]:
+        """Get a cached key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key_hash]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key_hash)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, api_key: APIKey) -> None:
+        """Cache a validated key."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[api_key.key_hash] = (time.monotonic() + self.ttl_seconds, api_key)
+            self._entries.move_to_end(api_key.key_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key_hash: str) -> None:
+        """Drop a cached key."""
+        with self._lock:
+            self._entries.pop(key_hash, None)
+    
+    def clear(self) -> None:
+        """Drop all cached keys."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
 class AuthService:
     """Authentication service for API access control.
     
@@ -105,16 +170,28 @@ class AuthService:
     - API key generation and validation
     - Permission checking
     - Token-based authentication
+    
+    Keys are looked up by digest in the key store, so validation cost does
+    not grow with the number of issued keys.
     """
     
-    def __init__(self, config: Optional[AuthConfig] = None):
+    def __init__(
+        self,
+        config: Optional[AuthConfig] = None,
+        key_store: Optional[APIKeyStore] = None,
+    ):
         """Initialize the auth service.
         
         Args:
             config: Authentication configuration.
+            key_store: Optional API key store (defaults to in-memory).
         """
         self.config = config or AuthConfig()
-        self._api_keys: dict[str, APIKey] = {}
+        self._key_store = key_store if key_store is not None else InMemoryAPIKeyStore()
+        self._key_cache = ValidatedKeyCache(
+            ttl_seconds=self.config.key_cache_ttl_seconds,
+            max_entries=self.config.key_cache_max_entries,
+        )
     
     def generate_api_key(
         self,
@@ -163,7 +240,7 @@ class AuthService:
         )
         
         # Store the key
-        self._api_keys[key_id] = api_key
+        self._key_store.put(api_key)
         
         logger.info(
             "api_key_generated",
@@ -192,29 +269,34 @@ class AuthService:
         # Hash the provided key
         key_hash = self._hash_key(raw_key)
         
-        # Find matching key
-        for api_key in self._api_keys.values():
-            if hmac.compare_digest(api_key.key_hash, key_hash):
-                # Check if active
-                if not api_key.is_active:
-                    logger.warning("api_key_inactive", key_id=api_key.key_id)
-                    return AuthResult(success=False, error="API key is inactive")
-                
-                # Check expiration
-                if api_key.is_expired:
-                    logger.warning("api_key_expired", key_id=api_key.key_id)
-                    return AuthResult(success=False, error="API key has expired")
-                
-                logger.info("api_key_validated", key_id=api_key.key_id)
-                return AuthResult(
-                    success=True,
-                    api_key=api_key,
-                    user_id=api_key.key_id,
-                    permissions=api_key.permissions,
-                )
+        # Find matching key by digest
+        api_key = self._key_cache.get(key_hash)
+        if api_key is None:
+            api_key = self._key_store.get_by_hash(key_hash)
+            if api_key is not None and api_key.is_active:
+                self._key_cache.put(api_key)
+        
+        if api_key is None or not hmac.compare_digest(api_key.key_hash, key_hash):
+            logger.warning("api_key_not_found")
+            return AuthResult(success=False, error="Invalid API key")
         
-        logger.warning("api_key_not_found")
-        return AuthResult(success=False, error="Invalid API key")
+        # Check if active
+        if not api_key.is_active:
+            logger.warning("api_key_inactive", key_id=api_key.key_id)
+            return AuthResult(success=False, error="API key is inactive")
+        
+        # Check expiration
+        if api_key.is_expired:
+            logger.warning("api_key_expired", key_id=api_key.key_id)
+            return AuthResult(success=False, error="API key has expired")
+        
+        logger.info("api_key_validated", key_id=api_key.key_id)
+        return AuthResult(
+            success=True,
+            api_key=api_key,
+            user_id=api_key.key_id,
+            permissions=api_key.permissions,
+        )
     
     def check_permission(
         self,
@@ -241,11 +323,14 @@ class AuthService:
         Returns:
             True if key was revoked.
         """
-        if key_id in self._api_keys:
-            self._api_keys[key_id].is_active = False
-            logger.info("api_key_revoked", key_id=key_id)
-            return True
-        return False
+        api_key = self._key_store.get(key_id)
+        if api_key is None:
+            return False
+        api_key.is_active = False
+        self._key_store.put(api_key)
+        self._key_cache.invalidate(api_key.key_hash)
+        logger.info("api_key_revoked", key_id=key_id)
+        return True
     
     def delete_api_key(self, key_id: str) -> bool:
         """Delete an API key.
@@ -256,11 +341,12 @@ class AuthService:
         Returns:
             True if key was deleted.
         """
-        if key_id in self._api_keys:
-            del self._api_keys[key_id]
-            logger.info("api_key_deleted", key_id=key_id)
-            return True
-        return False
+        api_key = self._key_store.delete(key_id)
+        if api_key is None:
+            return False
+        self._key_cache.invalidate(api_key.key_hash)
+        logger.info("api_key_deleted", key_id=key_id)
+        return True
     
     def get_api_key(self, key_id: str) -> Optional[APIKey]:
         """Get an API key by ID.
@@ -271,7 +357,7 @@ class AuthService:
         Returns:
             APIKey or None if not found.
         """
-        return self._api_keys.get(key_id)
+        return self._key_store.get(key_id)
     
     def list_api_keys(self) -> list[APIKey]:
         """List all API keys.
@@ -279,7 +365,15 @@ class AuthService:
         Returns:
             List of API keys (without hashes exposed).
         """
-        return list(self._api_keys.values())
+        return self._key_store.list()
+    
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get validated-key cache statistics.
+        
+        Returns:
+            Dictionary with cache size, hits and misses.
+        """
+        return self._key_cache.get_stats()
     
     def authenticate_request(
         self,
@@ -11,17 +11,29 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
 from regulatory_kb.core import get_logger
-from regulatory_kb.api.audit import AuditEvent, AuditEventType, AuditLogger
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.api.audit import AuditEvent, AuditLogger
+from regulatory_kb.api.audit_shipper import CloudWatchLogShipper
+from regulatory_kb.api.audit_store import AuditEventStore
+from regulatory_kb.core.errors import RetryableError
+from regulatory_kb.core.resilience import RetryConfig
 
+boto3 = lazy_import("boto3")
 logger = get_logger(__name__)
 
 # 7 years in days (Requirement 7.5)
 RETENTION_DAYS = 2557
 
+# PutLogEvents error codes worth retrying
+RETRYABLE_ERROR_CODES = {
+    "InvalidSequenceTokenException",
+    "ThrottlingException",
+    "ServiceUnavailableException",
+}
+
 
 class CloudWatchAuditLogger(AuditLogger):
     """CloudWatch-based audit logger for regulatory compliance.
@@ -33,6 +45,9 @@ class CloudWatchAuditLogger(AuditLogger):
     - Logs all upload actions with uploader identity
     - Logs document modifications with before/after states
     - Stores logs in CloudWatch with 7-year retention
+    
+    Events are shipped in batches by a background CloudWatchLogShipper so
+    the request path never waits on PutLogEvents.
     """
     
     def __init__(
@@ -41,6 +56,11 @@ class CloudWatchAuditLogger(AuditLogger):
         log_stream_prefix: str = "upload-audit",
         region: Optional[str] = None,
         cloudwatch_client: Optional[Any] = None,
+        store: Optional[AuditEventStore] = None,
+        async_shipping: bool = True,
+        flush_interval: float = 5.0,
+        max_queue_size: int = 10000,
+        retry_config: Optional[RetryConfig] = None,
     ):
         """Initialize the CloudWatch audit logger.
         
@@ -49,8 +69,14 @@ class CloudWatchAuditLogger(AuditLogger):
             log_stream_prefix: Prefix for log stream names.
             region: AWS region.
             cloudwatch_client: Optional CloudWatch client (for testing).
+            store: Optional local event store for in-process queries.
+            async_shipping: Ship from a background thread; when False each
+                event is flushed synchronously (useful for tests).
+            flush_interval: Seconds between background flushes.
+            max_queue_size: Maximum buffered events before dropping.
+            retry_config: Retry configuration for failed batches.
         """
-        super().__init__()
+        super().__init__(store)
         
         self.log_group_name = log_group_name or os.environ.get(
             "AUDIT_LOG_GROUP", "/regulatory-kb/upload-audit"
@@ -61,6 +87,14 @@ class CloudWatchAuditLogger(AuditLogger):
         self._log_stream_name: Optional[str] = None
         self._sequence_token: Optional[str] = None
         self._initialized = False
+        self._async_shipping = async_shipping
+        self._shipper = CloudWatchLogShipper(
+            self._put_log_events,
+            max_queue_size=max_queue_size,
+            flush_interval=flush_interval,
+            retry_config=retry_config,
+            background=async_shipping,
+        )
     
     @property
     def cloudwatch_client(self):
@@ -162,48 +196,71 @@ class CloudWatchAuditLogger(AuditLogger):
         self._log_to_cloudwatch(event)
     
     def _log_to_cloudwatch(self, event: AuditEvent) -> None:
-        """Log an event to CloudWatch Logs.
+        """Queue an event for shipping to CloudWatch Logs.
         
         Args:
             event: The audit event to log.
         """
-        try:
-            self._ensure_initialized()
-            
-            if not self._log_stream_name:
-                return
-            
-            # Prepare log event
-            log_event = {
-                "timestamp": int(event.timestamp.timestamp() * 1000),
-                "message": event.to_json(),
-            }
-            
-            # Put log event
-            kwargs = {
-                "logGroupName": self.log_group_name,
-                "logStreamName": self._log_stream_name,
-                "logEvents": [log_event],
-            }
-            
-            if self._sequence_token:
-                kwargs["sequenceToken"] = self._sequence_token
+        queued = self._shipper.enqueue({
+            "timestamp": int(event.timestamp.timestamp() * 1000),
+            "message": event.to_json(),
+        })
+        if not queued:
+            logger.warning("cloudwatch_audit_event_dropped", event_id=event.event_id)
+        elif not self._async_shipping:
+            self._shipper.flush()
+    
+    def _put_log_events(self, log_events: list[dict[str, Any]]) -> None:
+        """Send one batch of log events (called by the shipper).
+        
+        Args:
+            log_events: Chronologically ordered log events.
             
+        Raises:
+            RetryableError: For sequence token and throttling errors.
+            ClientError: For non-retryable CloudWatch errors.
+        """
+        self._ensure_initialized()
+        
+        if not self._log_stream_name:
+            return
+        
+        kwargs = {
+            "logGroupName": self.log_group_name,
+            "logStreamName": self._log_stream_name,
+            "logEvents": log_events,
+        }
+        
+        if self._sequence_token:
+            kwargs["sequenceToken"] = self._sequence_token
+        
+        try:
             response = self.cloudwatch_client.put_log_events(**kwargs)
             self._sequence_token = response.get("nextSequenceToken")
-            
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             
-            if error_code == "InvalidSequenceTokenException":
-                # Get correct sequence token and retry
+            if error_code == "DataAlreadyAcceptedException":
+                # Batch already accepted, update sequence token
                 self._sequence_token = e.response["Error"].get("expectedSequenceToken")
-                self._log_to_cloudwatch(event)
-            elif error_code == "DataAlreadyAcceptedException":
-                # Log already accepted, update sequence token
+                return
+            if error_code == "InvalidSequenceTokenException":
                 self._sequence_token = e.response["Error"].get("expectedSequenceToken")
-            else:
-                logger.error("cloudwatch_log_failed", error=str(e))
+            if error_code in RETRYABLE_ERROR_CODES:
+                raise RetryableError(f"PutLogEvents failed: {error_code}") from e
+            raise
+    
+    def flush(self) -> None:
+        """Ship all buffered audit events immediately."""
+        self._shipper.flush()
+    
+    def close(self) -> None:
+        """Stop background shipping after flushing buffered events."""
+        self._shipper.close()
+    
+    def get_shipping_stats(self) -> dict[str, int]:
+        """Get queue depth and shipping counters."""
+        return self._shipper.get_stats()
     
     def query_cloudwatch_events(
         self,
@@ -242,29 +299,7 @@ class CloudWatchAuditLogger(AuditLogger):
             events = []
             for log_event in response.get("events", []):
                 try:
-                    event_data = json.loads(log_event["message"])
-                    event = AuditEvent(
-                        event_id=event_data.get("event_id", ""),
-                        event_type=AuditEventType(event_data.get("event_type", "document.view")),
-                        timestamp=datetime.fromisoformat(event_data.get("timestamp", "")),
-                        client_id=event_data.get("client_id"),
-                        user_id=event_data.get("user_id"),
-                        ip_address=event_data.get("ip_address"),
-                        user_agent=event_data.get("user_agent"),
-                        request_id=event_data.get("request_id"),
-                        resource_type=event_data.get("resource_type"),
-                        resource_id=event_data.get("resource_id"),
-                        action=event_data.get("action"),
-                        status=event_data.get("status", "success"),
-                        status_code=event_data.get("status_code", 200),
-                        duration_ms=event_data.get("duration_ms"),
-                        request_path=event_data.get("request_path"),
-                        request_method=event_data.get("request_method"),
-                        query_params=event_data.get("query_params", {}),
-                        response_size=event_data.get("response_size"),
-                        error_message=event_data.get("error_message"),
-                        metadata=event_data.get("metadata", {}),
-                    )
+                    event = AuditEvent.from_dict(json.loads(log_event["message"]))
                     events.append(event)
                 except (json.JSONDecodeError, ValueError) as e:
                     logger.warning("parse_log_event_failed", error=str(e))
@@ -4,15 +4,26 @@ Implements Requirements 13.5:
 - GraphQL queries for traversing relationships between regulations and implementing guidance
 """
 
+import base64
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Callable
+from typing import Any, Iterable, Optional, Callable, Sequence
 
 from regulatory_kb.models.document import DocumentCategory, DocumentType
 from regulatory_kb.models.regulator import ALL_REGULATORS, Country
 from regulatory_kb.models.relationship import RelationshipType
 from regulatory_kb.storage.graph_store import FalkorDBStore
+from regulatory_kb.api.query_plan import (
+    GraphQLError,
+    QueryLimits,
+    QueryPlan,
+    QueryPlanCache,
+    compile_plan,
+    parse_query,
+    query_hash,
+)
 from regulatory_kb.core import get_logger
 
 logger = get_logger(__name__)
@@ -230,6 +241,167 @@ scalar JSON
 '''
 
 
+# documents(orderBy:) fields, mapped to the node properties they sort on
+ORDER_FIELDS = {
+    "TITLE": "title",
+    "EFFECTIVE_DATE": "effective_date",
+    "UPDATED_AT": "updated_at",
+    "CREATED_AT": "created_at",
+}
+
+_REGULATORS_BY_ID = {regulator.id: regulator for regulator in ALL_REGULATORS.values()}
+
+# Document fields that list documents over one relationship: (direction, types)
+_DOCUMENT_LIST_FIELDS = {
+    "references": ("out", ["REFERENCES"]),
+    "referencedBy": ("in", ["REFERENCES"]),
+}
+
+
+def _properties(item: Any) -> dict[str, Any]:
+    """Get the properties of a graph node or relationship."""
+    if hasattr(item, "properties"):
+        return dict(item.properties)
+    return dict(item or {})
+
+
+@dataclass
+class RelatedNode:
+    """A node reached over one relationship from a source document."""
+    
+    source_id: str
+    relationship_type: str
+    node: dict[str, Any]
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+class DocumentLoader:
+    """Per-request batching loader for nested GraphQL fields.
+    
+    Instead of one graph query per parent document, the resolver passes
+    the ids of every document at one level of the selection and the loader
+    fetches all their neighbours with a single ``UNWIND`` query. Results are
+    cached for the request, so a relationship reached from several parents
+    is fetched once.
+    """
+    
+    def __init__(self, graph_store: FalkorDBStore):
+        """Initialize the loader.
+        
+        Args:
+            graph_store: FalkorDB store for queries.
+        """
+        self.graph_store = graph_store
+        self.query_count = 0
+        self._related: dict[tuple, dict[str, list[RelatedNode]]] = {}
+        self._regulator_documents: dict[tuple, dict[str, list[dict[str, Any]]]] = {}
+    
+    def load_related(
+        self,
+        ids: Sequence[str],
+        direction: str = "out",
+        types: Optional[Sequence[str]] = None,
+        label: str = "Document",
+    ) -> dict[str, list[RelatedNode]]:
+        """Load the neighbours of many documents in one query.
+        
+        Args:
+            ids: Source document IDs.
+            direction: "out" for outgoing relationships, "in" for incoming.
+            types: Relationship types to follow (all if not provided).
+            label: Label of the neighbour nodes.
+            
+        Returns:
+            Dictionary mapping each source ID to its related nodes.
+            
+        Raises:
+            ValueError: If direction or label is not supported.
+        """
+        if direction not in ("out", "in"):
+            raise ValueError(f"Invalid direction: {direction}")
+        if label not in ("Document", "Requirement", "Section"):
+            raise ValueError(f"Invalid label: {label}")
+        
+        key = (direction, label, tuple(sorted(types)) if types else None)
+        cache = self._related.setdefault(key, {})
+        missing = [doc_id for doc_id in dict.fromkeys(ids) if doc_id not in cache]
+        
+        if missing:
+            arrow = "-[r]->" if direction == "out" else "<-[r]-"
+            where = "WHERE type(r) IN $types" if types else ""
+            query = f"""
+            UNWIND $ids AS source_id
+            MATCH (s:Document {{id: source_id}}){arrow}(t:{label})
+            {where}
+            RETURN source_id, type(r), t, r
+            """
+            params: dict[str, Any] = {"ids": missing}
+            if types:
+                params["types"] = list(types)
+            
+            for doc_id in missing:
+                cache[doc_id] = []
+            for source_id, rel_type, node, rel in self._rows(query, params):
+                cache[source_id].append(RelatedNode(
+                    source_id=source_id,
+                    relationship_type=rel_type,
+                    node=_properties(node),
+                    properties=_properties(rel),
+                ))
+        
+        return {doc_id: cache[doc_id] for doc_id in ids}
+    
+    def load_regulator_documents(
+        self,
+        regulator_ids: Sequence[str],
+        first: int = 20,
+        category: Optional[str] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Load the first documents of many regulators in one query.
+        
+        Args:
+            regulator_ids: Regulator IDs.
+            first: Maximum documents per regulator, ordered by title.
+            category: Optional category filter.
+            
+        Returns:
+            Dictionary mapping each regulator ID to its document nodes.
+        """
+        key = (first, category)
+        cache = self._regulator_documents.setdefault(key, {})
+        missing = [reg_id for reg_id in dict.fromkeys(regulator_ids) if reg_id not in cache]
+        
+        if missing:
+            where = "d.regulator_id = regulator_id"
+            params: dict[str, Any] = {"ids": missing, "limit": first}
+            if category:
+                where += " AND d.categories CONTAINS $category"
+                params["category"] = category
+            query = f"""
+            UNWIND $ids AS regulator_id
+            MATCH (d:Document)
+            WHERE {where}
+            WITH regulator_id, d
+            ORDER BY d.title, d.id
+            WITH regulator_id, collect(d) AS docs
+            RETURN regulator_id, docs[0..$limit]
+            """
+            for reg_id in missing:
+                cache[reg_id] = []
+            for reg_id, docs in self._rows(query, params):
+                cache[reg_id] = [_properties(doc) for doc in docs]
+        
+        return {reg_id: cache[reg_id] for reg_id in regulator_ids}
+    
+    def _rows(self, query: str, params: dict[str, Any]) -> list[list[Any]]:
+        """Run a query and get its rows."""
+        self.query_count += 1
+        result = self.graph_store.query(query, params)
+        if result.raw_result is not None and result.raw_result.result_set:
+            return list(result.raw_result.result_set)
+        return []
+
+
 @dataclass
 class GraphQLContext:
     """Context for GraphQL resolvers."""
@@ -237,6 +409,8 @@ class GraphQLContext:
     graph_store: FalkorDBStore
     client_id: Optional[str] = None
     request_id: Optional[str] = None
+    variables: dict[str, Any] = field(default_factory=dict)
+    loader: Optional[DocumentLoader] = None
 
 
 @dataclass
@@ -265,15 +439,25 @@ class GraphQLService:
     - Path finding between documents
     - Complex filtering and aggregation
     - Cursor-based pagination
+    - Cached query plans, persisted queries and depth/cost limits
     """
     
-    def __init__(self, graph_store: FalkorDBStore):
+    def __init__(
+        self,
+        graph_store: FalkorDBStore,
+        limits: Optional[QueryLimits] = None,
+        plan_cache: Optional[QueryPlanCache] = None,
+    ):
         """Initialize the GraphQL service.
         
         Args:
             graph_store: FalkorDB store for queries.
+            limits: Query limits. Uses defaults if not provided.
+            plan_cache: Plan cache. Creates one if not provided.
         """
         self.graph_store = graph_store
+        self.limits = limits or QueryLimits()
+        self.plan_cache = plan_cache if plan_cache is not None else QueryPlanCache()
         self._resolvers: dict[str, Callable] = {}
         self._setup_resolvers()
     
@@ -291,40 +475,49 @@ class GraphQLService:
     
     def execute(
         self,
-        query: str,
+        query: Optional[str] = None,
         variables: Optional[dict[str, Any]] = None,
         operation_name: Optional[str] = None,
         context: Optional[GraphQLContext] = None,
+        extensions: Optional[dict[str, Any]] = None,
     ) -> GraphQLResult:
         """Execute a GraphQL query.
         
+        Parsed plans are cached by query hash. A client may send only the
+        hash of a persisted or previously sent query, as
+        ``extensions.persistedQuery.sha256Hash``. Depth and cost limits are
+        checked before any resolver touches the graph.
+        
         Args:
-            query: GraphQL query string.
+            query: GraphQL query string (optional with a persisted query hash).
             variables: Query variables.
             operation_name: Name of operation to execute.
             context: Execution context.
+            extensions: Request extensions, e.g. ``persistedQuery``.
             
         Returns:
             GraphQLResult with data or errors.
         """
         variables = variables or {}
         context = context or GraphQLContext(graph_store=self.graph_store)
+        context.variables = variables
+        if context.loader is None:
+            context.loader = DocumentLoader(context.graph_store)
         
         try:
-            # Parse the query to extract operation
-            parsed = self._parse_query(query)
-            
-            if not parsed:
-                return GraphQLResult(errors=[{
-                    "message": "Failed to parse query",
-                    "locations": [{"line": 1, "column": 1}],
-                }])
+            persisted = (extensions or {}).get("persistedQuery") or {}
+            plan = self._get_plan(query, persisted.get("sha256Hash"))
+            plan.check(self.limits, variables)
             
             # Execute the query
-            data = self._execute_operation(parsed, variables, context)
+            data = self._execute_operation(plan.operation, variables, context)
             
             return GraphQLResult(data=data)
         
+        except GraphQLError as e:
+            logger.info("graphql_query_rejected", code=e.code, error=e.message)
+            return GraphQLResult(errors=[e.to_dict()])
+        
         except Exception as e:
             logger.error("graphql_execution_error", error=str(e))
             return GraphQLResult(errors=[{
@@ -332,126 +525,50 @@ class GraphQLService:
                 "extensions": {"code": "INTERNAL_ERROR"},
             }])
     
-    def _parse_query(self, query: str) -> Optional[dict[str, Any]]:
-        """Parse a GraphQL query string.
+    def register_persisted_query(self, query: str) -> str:
+        """Compile a query and register it as a persisted query.
         
-        This is a simplified parser for common query patterns.
-        For production, use a proper GraphQL library like graphql-core.
+        Args:
+            query: GraphQL query string.
+            
+        Returns:
+            SHA-256 hash clients send in place of the query.
+            
+        Raises:
+            GraphQLError: If the query is malformed or exceeds a limit.
         """
-        query = query.strip()
-        
-        # Extract query type and fields
-        if query.startswith("query"):
-            # Remove 'query' keyword and optional name
-            query = query[5:].strip()
-            if query.startswith("{"):
-                pass
-            else:
-                # Skip operation name and variables
-                brace_idx = query.find("{")
-                if brace_idx > 0:
-                    query = query[brace_idx:]
-        
-        if not query.startswith("{"):
-            query = "{" + query + "}"
-        
-        # Parse the query body
-        return self._parse_selection_set(query)
-    
-    def _parse_selection_set(self, query: str) -> dict[str, Any]:
-        """Parse a selection set from query string."""
-        result = {"selections": []}
-        
-        # Remove outer braces
-        query = query.strip()
-        if query.startswith("{"):
-            query = query[1:]
-        if query.endswith("}"):
-            query = query[:-1]
-        
-        # Split by top-level fields (simplified)
-        current_field = ""
-        brace_depth = 0
-        paren_depth = 0
-        
-        for char in query:
-            if char == "{":
-                brace_depth += 1
-                current_field += char
-            elif char == "}":
-                brace_depth -= 1
-                current_field += char
-            elif char == "(":
-                paren_depth += 1
-                current_field += char
-            elif char == ")":
-                paren_depth -= 1
-                current_field += char
-            elif char == "\n" and brace_depth == 0 and paren_depth == 0:
-                if current_field.strip():
-                    result["selections"].append(self._parse_field(current_field.strip()))
-                current_field = ""
-            else:
-                current_field += char
+        plan = compile_plan(query, self.limits)
+        self.plan_cache.persist(plan)
+        return plan.query_hash
+    
+    def _get_plan(self, query: Optional[str], persisted_hash: Optional[str]) -> QueryPlan:
+        """Get the cached plan for a query or hash, compiling it on a miss.
         
-        if current_field.strip():
-            result["selections"].append(self._parse_field(current_field.strip()))
+        Raises:
+            GraphQLError: If a hash-only query is unknown, the hash does not
+                match the query, or the query cannot be compiled.
+        """
+        if not query:
+            if not persisted_hash:
+                raise GraphQLError("query is required", code="BAD_USER_INPUT")
+            plan = self.plan_cache.get(persisted_hash)
+            if plan is None:
+                raise GraphQLError("PersistedQueryNotFound", code="PERSISTED_QUERY_NOT_FOUND")
+            return plan
         
-        return result
+        key = query_hash(query)
+        if persisted_hash and persisted_hash != key:
+            raise GraphQLError("provided sha does not match query", code="BAD_USER_INPUT")
+        
+        plan = self.plan_cache.get(key)
+        if plan is None:
+            plan = compile_plan(query, self.limits)
+            self.plan_cache.put(plan)
+        return plan
     
-    def _parse_field(self, field_str: str) -> dict[str, Any]:
-        """Parse a single field from query string."""
-        field = {"name": "", "arguments": {}, "selections": None}
-        
-        # Extract field name
-        paren_idx = field_str.find("(")
-        brace_idx = field_str.find("{")
-        
-        if paren_idx > 0 and (brace_idx < 0 or paren_idx < brace_idx):
-            field["name"] = field_str[:paren_idx].strip()
-            # Parse arguments
-            close_paren = field_str.find(")")
-            if close_paren > paren_idx:
-                args_str = field_str[paren_idx + 1:close_paren]
-                field["arguments"] = self._parse_arguments(args_str)
-            
-            # Check for nested selection
-            if brace_idx > 0:
-                field["selections"] = self._parse_selection_set(field_str[brace_idx:])
-        elif brace_idx > 0:
-            field["name"] = field_str[:brace_idx].strip()
-            field["selections"] = self._parse_selection_set(field_str[brace_idx:])
-        else:
-            field["name"] = field_str.strip()
-        
-        return field
-    
-    def _parse_arguments(self, args_str: str) -> dict[str, Any]:
-        """Parse arguments from string."""
-        args = {}
-        
-        # Simple key: value parsing
-        parts = args_str.split(",")
-        for part in parts:
-            if ":" in part:
-                key, value = part.split(":", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                
-                # Handle special values
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                elif value.isdigit():
-                    value = int(value)
-                elif value.startswith("$"):
-                    # Variable reference - will be resolved later
-                    value = {"$var": value[1:]}
-                
-                args[key] = value
-        
-        return args
+    def _parse_query(self, query: str) -> dict[str, Any]:
+        """Parse a GraphQL query string into a selection tree."""
+        return parse_query(query)
     
     def _execute_operation(
         self,
@@ -470,11 +587,12 @@ class GraphQLService:
             resolved_args = self._resolve_variables(arguments, variables)
             
             # Get resolver
+            key = selection.get("alias") or field_name
             resolver = self._resolvers.get(field_name)
             if resolver:
-                result[field_name] = resolver(resolved_args, selection, context)
+                result[key] = resolver(resolved_args, selection, context)
             else:
-                result[field_name] = None
+                result[key] = None
         
         return result
     
@@ -518,15 +636,25 @@ class GraphQLService:
         selection: dict[str, Any],
         context: GraphQLContext,
     ) -> dict[str, Any]:
-        """Resolve documents with filtering and pagination."""
-        filter_args = args.get("filter", {})
-        first = args.get("first", 20)
+        """Resolve documents with filtering and keyset pagination.
+        
+        Pages are ordered by the sort field with the document ID as a tie
+        breaker, and the ``after`` cursor holds both, so each page seeks
+        past the previous one instead of skipping rows. ``totalCount`` is
+        a separate count query, only run when it is selected.
+        
+        Raises:
+            ValueError: If the order field or cursor is invalid.
+        """
+        filter_args = args.get("filter") or {}
+        first = args.get("first") or 20
         after = args.get("after")
-        order_by = args.get("orderBy", {})
+        order_by = args.get("orderBy") or {}
+        fields = self._fields(selection)
         
         # Build query
         conditions = []
-        params: dict[str, Any] = {"limit": first + 1}  # +1 to check hasNextPage
+        params: dict[str, Any] = {}
         
         if filter_args.get("regulatorId"):
             conditions.append("d.regulator_id = $regulator_id")
@@ -542,40 +670,73 @@ class GraphQLService:
         
         where_clause = " AND ".join(conditions) if conditions else "true"
         
-        # Order by
-        order_field = order_by.get("field", "title")
-        order_dir = order_by.get("direction", "ASC")
+        # Order by a whitelisted property, never interpolating client input
+        requested_field = str(order_by.get("field", "TITLE"))
+        order_field = ORDER_FIELDS.get(requested_field.upper())
+        if order_field is None:
+            if requested_field not in ORDER_FIELDS.values():
+                raise ValueError(f"Invalid order field: {requested_field}")
+            order_field = requested_field
+        descending = str(order_by.get("direction", "ASC")).upper() == "DESC"
+        order_dir = "DESC" if descending else "ASC"
+        sort_key = f"coalesce(d.{order_field}, '')"
+        
+        page_conditions = list(conditions)
+        page_params = dict(params, limit=first + 1)  # +1 to check hasNextPage
+        if after:
+            after_value, after_id = self._decode_cursor(after)
+            op = "<" if descending else ">"
+            page_conditions.append(
+                f"({sort_key} {op} $after_value "
+                f"OR ({sort_key} = $after_value AND d.id {op} $after_id))"
+            )
+            page_params["after_value"] = after_value
+            page_params["after_id"] = after_id
+        page_where = " AND ".join(page_conditions) if page_conditions else "true"
         
         query = f"""
         MATCH (d:Document)
-        WHERE {where_clause}
+        WHERE {page_where}
         RETURN d
-        ORDER BY d.{order_field.lower()} {order_dir}
+        ORDER BY {sort_key} {order_dir}, d.id {order_dir}
         LIMIT $limit
         """
         
-        result = context.graph_store.query(query, params)
+        result = context.graph_store.query(query, page_params)
+        nodes = result.nodes[:first]
         
         # Format results
-        edges = []
-        for i, node in enumerate(result.nodes[:first]):
-            edges.append({
-                "node": self._format_document(node, selection, context),
-                "cursor": self._encode_cursor(node.get("id", str(i))),
-            })
-        
-        has_next = len(result.nodes) > first
+        node_selection = self._fields(fields.get("edges")).get("node")
+        documents = self._format_documents(nodes, node_selection, context)
+        edges = [
+            {
+                "node": doc,
+                "cursor": self._encode_cursor([node.get(order_field) or "", node.get("id", "")]),
+            }
+            for node, doc in zip(nodes, documents)
+        ]
         
-        return {
+        connection: dict[str, Any] = {
             "edges": edges,
             "pageInfo": {
-                "hasNextPage": has_next,
+                "hasNextPage": len(result.nodes) > first,
                 "hasPreviousPage": after is not None,
                 "startCursor": edges[0]["cursor"] if edges else None,
                 "endCursor": edges[-1]["cursor"] if edges else None,
             },
-            "totalCount": len(edges),
         }
+        
+        if not fields or "totalCount" in fields:
+            count_query = f"""
+            MATCH (d:Document)
+            WHERE {where_clause}
+            RETURN count(d)
+            """
+            count_result = context.graph_store.query(count_query, params)
+            rows = count_result.raw_result.result_set if count_result.raw_result else None
+            connection["totalCount"] = rows[0][0] if rows else 0
+        
+        return connection
     
     def _resolve_regulator(
         self,
@@ -588,11 +749,11 @@ class GraphQLService:
         if not reg_id:
             return None
         
-        for regulator in ALL_REGULATORS.values():
-            if regulator.id == reg_id:
-                return self._format_regulator(regulator, selection, context)
+        regulator = _REGULATORS_BY_ID.get(reg_id)
+        if regulator is None:
+            return None
         
-        return None
+        return self._format_regulator(regulator, selection, context)
     
     def _resolve_regulators(
         self,
@@ -603,13 +764,12 @@ class GraphQLService:
         """Resolve all regulators with optional country filter."""
         country = args.get("country")
         
-        regulators = []
-        for regulator in ALL_REGULATORS.values():
-            if country and regulator.country.value != country:
-                continue
-            regulators.append(self._format_regulator(regulator, selection, context))
+        regulators = [
+            regulator for regulator in ALL_REGULATORS.values()
+            if not country or regulator.country.value == country
+        ]
         
-        return regulators
+        return self._format_regulators(regulators, selection, context)
     
     def _resolve_search_documents(
         self,
@@ -647,10 +807,9 @@ class GraphQLService:
         result = context.graph_store.query(query, params)
         
         # Format documents
-        documents = [
-            self._format_document(node, selection, context)
-            for node in result.nodes
-        ]
+        documents = self._format_documents(
+            result.nodes, self._fields(selection).get("documents"), context
+        )
         
         # Calculate facets
         facets = self._calculate_facets(result.nodes)
@@ -670,7 +829,7 @@ class GraphQLService:
         """Find path between two documents."""
         from_id = args.get("fromId")
         to_id = args.get("toId")
-        max_depth = args.get("maxDepth", 5)
+        max_depth = int(args.get("maxDepth") or 5)
         
         if not from_id or not to_id:
             return []
@@ -685,8 +844,10 @@ class GraphQLService:
         
         result = context.graph_store.query(query, {"from_id": from_id, "to_id": to_id})
         
-        # Extract path segments
+        # Extract path segments, then format their documents together
         segments = []
+        from_nodes: list[dict[str, Any]] = []
+        to_nodes: list[dict[str, Any]] = []
         if result.raw_result and result.raw_result.result_set:
             for row in result.raw_result.result_set:
                 if row and hasattr(row[0], "nodes"):
@@ -696,17 +857,20 @@ class GraphQLService:
                     
                     for i, rel in enumerate(rels):
                         if i + 1 < len(nodes):
+                            from_nodes.append(_properties(nodes[i]))
+                            to_nodes.append(_properties(nodes[i + 1]))
                             segments.append({
-                                "fromDocument": self._format_document(
-                                    dict(nodes[i].properties), selection, context
-                                ),
-                                "toDocument": self._format_document(
-                                    dict(nodes[i + 1].properties), selection, context
-                                ),
                                 "relationshipType": rel.relation if hasattr(rel, "relation") else "RELATED_TO",
                                 "depth": i + 1,
                             })
         
+        fields = self._fields(selection)
+        from_docs = self._format_documents(from_nodes, fields.get("fromDocument"), context)
+        to_docs = self._format_documents(to_nodes, fields.get("toDocument"), context)
+        for segment, from_doc, to_doc in zip(segments, from_docs, to_docs):
+            segment["fromDocument"] = from_doc
+            segment["toDocument"] = to_doc
+        
         return segments
     
     def _resolve_related_documents(
@@ -737,26 +901,120 @@ class GraphQLService:
         
         result = context.graph_store.query(query, {"doc_id": doc_id})
         
-        related = []
-        for node in result.nodes:
-            related.append({
-                "document": self._format_document(node, selection, context),
+        documents = self._format_documents(
+            result.nodes, self._fields(selection).get("document"), context
+        )
+        
+        return [
+            {
+                "document": doc,
                 "relationshipType": "RELATED_TO",  # Simplified
                 "strength": 1.0,
                 "properties": {},
-            })
-        
-        return related
+            }
+            for doc in documents
+        ]
     
     # ==================== Formatters ====================
     
     def _format_document(
         self,
         node: dict[str, Any],
-        selection: dict[str, Any],
+        selection: Optional[dict[str, Any]],
         context: GraphQLContext,
     ) -> dict[str, Any]:
         """Format a document node for GraphQL response."""
+        return self._format_documents([node], selection, context)[0]
+    
+    def _format_documents(
+        self,
+        nodes: Sequence[dict[str, Any]],
+        selection: Optional[dict[str, Any]],
+        context: GraphQLContext,
+    ) -> list[dict[str, Any]]:
+        """Format document nodes and resolve their selected relationships.
+        
+        Relationship fields are resolved breadth-first: each selected field
+        is loaded for every document at this level in one batched query,
+        and the documents it returns are formatted together one level down.
+        The number of graph queries therefore depends on the shape of the
+        selection, not on the number of documents.
+        
+        Args:
+            nodes: Document node properties.
+            selection: Field selection of the Document type, if any.
+            context: Execution context.
+            
+        Returns:
+            Formatted documents, in the order of nodes.
+        """
+        docs = [self._document_fields(node) for node in nodes]
+        fields = self._fields(selection)
+        if not docs or not fields:
+            return docs
+        
+        ids = [doc["id"] for doc in docs]
+        loader = self._loader(context)
+        
+        for name, field_selection in fields.items():
+            if name in _DOCUMENT_LIST_FIELDS:
+                direction, types = _DOCUMENT_LIST_FIELDS[name]
+                related = loader.load_related(ids, direction, types)
+                groups = [[item.node for item in related[doc_id]] for doc_id in ids]
+                formatted = self._format_documents(
+                    [node for group in groups for node in group], field_selection, context
+                )
+                for doc, children in zip(docs, self._regroup(formatted, groups)):
+                    doc[name] = children
+            
+            elif name == "relatedDocuments":
+                types = self._arguments(field_selection, context).get("types")
+                if isinstance(types, str):
+                    types = [types]
+                related = loader.load_related(ids, "out", types or None)
+                groups = [related[doc_id] for doc_id in ids]
+                formatted = self._format_documents(
+                    [item.node for group in groups for item in group],
+                    self._fields(field_selection).get("document"),
+                    context,
+                )
+                for doc, group, children in zip(docs, groups, self._regroup(formatted, groups)):
+                    doc[name] = [
+                        {
+                            "document": child,
+                            "relationshipType": item.relationship_type,
+                            "strength": item.properties.get("strength", 1.0),
+                            "properties": item.properties,
+                        }
+                        for item, child in zip(group, children)
+                    ]
+            
+            elif name == "implements":
+                related = loader.load_related(ids, "out", ["IMPLEMENTS"], label="Requirement")
+                for doc in docs:
+                    doc[name] = [self._format_requirement(item.node) for item in related[doc["id"]]]
+            
+            elif name == "sections":
+                related = loader.load_related(ids, "in", ["PART_OF"], label="Section")
+                for doc in docs:
+                    doc[name] = [self._format_section(item.node) for item in related[doc["id"]]]
+            
+            elif name == "regulator" and "documents" in self._fields(field_selection):
+                reg_ids = list(dict.fromkeys(
+                    doc["regulator"]["id"] for doc in docs if "regulator" in doc
+                ))
+                regulators = self._format_regulators(
+                    [_REGULATORS_BY_ID[reg_id] for reg_id in reg_ids], field_selection, context
+                )
+                by_id = dict(zip(reg_ids, regulators))
+                for doc in docs:
+                    if "regulator" in doc:
+                        doc["regulator"] = by_id[doc["regulator"]["id"]]
+        
+        return docs
+    
+    def _document_fields(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Format the scalar fields and regulator of a document node."""
         categories = node.get("categories", "").split(",") if node.get("categories") else []
         
         doc = {
@@ -771,23 +1029,49 @@ class GraphQLService:
             "cfrSection": node.get("cfr_section"),
         }
         
-        # Resolve regulator if requested
-        regulator_id = node.get("regulator_id")
-        if regulator_id:
-            for regulator in ALL_REGULATORS.values():
-                if regulator.id == regulator_id:
-                    doc["regulator"] = self._format_regulator(regulator, {}, context)
-                    break
+        regulator = _REGULATORS_BY_ID.get(node.get("regulator_id"))
+        if regulator is not None:
+            doc["regulator"] = self._regulator_fields(regulator)
         
         return doc
     
     def _format_regulator(
         self,
         regulator: Any,
-        selection: dict[str, Any],
+        selection: Optional[dict[str, Any]],
         context: GraphQLContext,
     ) -> dict[str, Any]:
         """Format a regulator for GraphQL response."""
+        return self._format_regulators([regulator], selection, context)[0]
+    
+    def _format_regulators(
+        self,
+        regulators: Sequence[Any],
+        selection: Optional[dict[str, Any]],
+        context: GraphQLContext,
+    ) -> list[dict[str, Any]]:
+        """Format regulators, loading selected documents in one query."""
+        formatted = [self._regulator_fields(regulator) for regulator in regulators]
+        
+        documents_field = self._fields(selection).get("documents")
+        if documents_field and formatted:
+            args = self._arguments(documents_field, context)
+            loaded = self._loader(context).load_regulator_documents(
+                [reg["id"] for reg in formatted],
+                first=int(args.get("first") or 20),
+                category=args.get("category"),
+            )
+            groups = [loaded[reg["id"]] for reg in formatted]
+            documents = self._format_documents(
+                [node for group in groups for node in group], documents_field, context
+            )
+            for reg, children in zip(formatted, self._regroup(documents, groups)):
+                reg["documents"] = children
+        
+        return formatted
+    
+    def _regulator_fields(self, regulator: Any) -> dict[str, Any]:
+        """Format the scalar fields of a regulator."""
         return {
             "id": regulator.id,
             "name": regulator.name,
@@ -797,6 +1081,57 @@ class GraphQLService:
             "website": regulator.website,
         }
     
+    def _format_requirement(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Format a requirement node for GraphQL response."""
+        return {
+            "id": node.get("id", ""),
+            "description": node.get("description", ""),
+            "regulatorId": node.get("regulator_id", ""),
+            "deadlineFrequency": node.get("deadline_frequency"),
+            "deadlineDueDate": node.get("deadline_due_date"),
+            "effectiveDate": node.get("effective_date"),
+        }
+    
+    def _format_section(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Format a section node for GraphQL response."""
+        return {
+            "cfrSection": node.get("cfr_section", ""),
+            "title": node.get("title", ""),
+            "documentId": node.get("document_id", ""),
+            "contentHash": node.get("content_hash"),
+        }
+    
+    # ==================== Selection Helpers ====================
+    
+    @staticmethod
+    def _fields(selection: Optional[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Get the sub-fields selected on a field, by name."""
+        if not selection or not selection.get("selections"):
+            return {}
+        return {
+            sub_field["name"]: sub_field
+            for sub_field in selection["selections"].get("selections", [])
+            if sub_field.get("name")
+        }
+    
+    def _arguments(self, selection: dict[str, Any], context: GraphQLContext) -> dict[str, Any]:
+        """Get a nested field's arguments with variables resolved."""
+        return self._resolve_variables(selection.get("arguments") or {}, context.variables)
+    
+    @staticmethod
+    def _loader(context: GraphQLContext) -> DocumentLoader:
+        """Get the request's loader, creating it if needed."""
+        if context.loader is None:
+            context.loader = DocumentLoader(context.graph_store)
+        return context.loader
+    
+    @staticmethod
+    def _regroup(items: Iterable[Any], groups: Sequence[Sequence[Any]]) -> list[list[Any]]:
+        """Split a flat list back into lists the sizes of groups."""
+        iterator = iter(items)
+        return [[next(iterator) for _ in group] for group in groups]
+    
+
     def _calculate_facets(self, nodes: list[dict[str, Any]]) -> dict[str, Any]:
         """Calculate search facets from results."""
         regulator_counts: dict[str, int] = {}
@@ -834,12 +1169,20 @@ class GraphQLService:
             ],
         }
     
-    def _encode_cursor(self, value: str) -> str:
-        """Encode a cursor value."""
-        import base64
-        return base64.b64encode(value.encode()).decode()
+    def _encode_cursor(self, value: Any) -> str:
+        """Encode a cursor value as URL-safe base64 JSON."""
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
     
-    def _decode_cursor(self, cursor: str) -> str:
-        """Decode a cursor value."""
-        import base64
-        return base64.b64decode(cursor.encode()).decode()
+    def _decode_cursor(self, cursor: str) -> tuple[Any, str]:
+        """Decode a documents cursor into its sort value and document ID.
+        
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            value = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if not isinstance(value, list) or len(value) != 2:
+            raise ValueError("Invalid cursor")
+        return value[0], str(value[1])
@@ -0,0 +1,208 @@
+"""Storage backends for API keys.
+
+Keys are indexed by the digest of the raw key, so validating a presented
+key is a single lookup regardless of how many keys have been issued.
+
+Backends:
+- InMemoryAPIKeyStore: per-process dictionaries (default)
+- DynamoDBAPIKeyStore: persistent table keyed on the key digest
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Any, Optional, Protocol, TYPE_CHECKING
+
+from botocore.exceptions import ClientError
+
+from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from regulatory_kb.api.auth import APIKey
+
+boto3 = lazy_import("boto3")
+logger = get_logger(__name__)
+
+
+class APIKeyStore(Protocol):
+    """Storage interface for API keys."""
+
+    def put(self, api_key: "APIKey") -> None:
+        """Insert or replace a key."""
+        ...
+
+    def get(self, key_id: str) -> Optional["APIKey"]:
+        """Get a key by ID."""
+        ...
+
+    def get_by_hash(self, key_hash: str) -> Optional["APIKey"]:
+        """Get a key by the digest of its raw value."""
+        ...
+
+    def delete(self, key_id: str) -> Optional["APIKey"]:
+        """Delete a key by ID, returning it if it existed."""
+        ...
+
+    def list(self) -> list["APIKey"]:
+        """List all keys."""
+        ...
+
+
+class InMemoryAPIKeyStore:
+    """API keys held in process memory, indexed by ID and digest."""
+
+    def __init__(self):
+        self._by_id: dict[str, "APIKey"] = {}
+        self._by_hash: dict[str, "APIKey"] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def put(self, api_key: "APIKey") -> None:
+        with self._lock:
+            previous = self._by_id.get(api_key.key_id)
+            if previous is not None:
+                self._by_hash.pop(previous.key_hash, None)
+            self._by_id[api_key.key_id] = api_key
+            self._by_hash[api_key.key_hash] = api_key
+
+    def get(self, key_id: str) -> Optional["APIKey"]:
+        return self._by_id.get(key_id)
+
+    def get_by_hash(self, key_hash: str) -> Optional["APIKey"]:
+        return self._by_hash.get(key_hash)
+
+    def delete(self, key_id: str) -> Optional["APIKey"]:
+        with self._lock:
+            api_key = self._by_id.pop(key_id, None)
+            if api_key is not None:
+                self._by_hash.pop(api_key.key_hash, None)
+            return api_key
+
+    def list(self) -> list["APIKey"]:
+        return list(self._by_id.values())
+
+
+class DynamoDBAPIKeyStore:
+    """API keys persisted in DynamoDB.
+
+    The table's partition key is ``key_hash``; lookups by ID use a global
+    secondary index on ``key_id``.
+    """
+
+    KEY_ID_INDEX = "key_id-index"
+
+    def __init__(
+        self,
+        table_name: Optional[str] = None,
+        table: Optional[Any] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            table_name: DynamoDB table name.
+            table: Optional DynamoDB table resource (for testing).
+        """
+        self.table_name = table_name or os.environ.get(
+            "API_KEYS_TABLE", "regulatory-kb-api-keys"
+        )
+        self._table = table
+
+    @property
+    def table(self):
+        """Get DynamoDB table resource."""
+        if self._table is None:
+            self._table = boto3.resource("dynamodb").Table(self.table_name)
+        return self._table
+
+    def put(self, api_key: "APIKey") -> None:
+        previous = self.get(api_key.key_id)
+        self.table.put_item(Item=_to_item(api_key))
+        if previous is not None and previous.key_hash != api_key.key_hash:
+            self.table.delete_item(Key={"key_hash": previous.key_hash})
+
+    def get(self, key_id: str) -> Optional["APIKey"]:
+        response = self.table.query(
+            IndexName=self.KEY_ID_INDEX,
+            KeyConditionExpression="key_id = :key_id",
+            ExpressionAttributeValues={":key_id": key_id},
+        )
+        items = response.get("Items", [])
+        return _from_item(items[0]) if items else None
+
+    def get_by_hash(self, key_hash: str) -> Optional["APIKey"]:
+        try:
+            response = self.table.get_item(
+                Key={"key_hash": key_hash}, ConsistentRead=True
+            )
+        except ClientError as e:
+            logger.error("api_key_lookup_failed", error=str(e))
+            raise
+        item = response.get("Item")
+        return _from_item(item) if item else None
+
+    def delete(self, key_id: str) -> Optional["APIKey"]:
+        api_key = self.get(key_id)
+        if api_key is not None:
+            self.table.delete_item(Key={"key_hash": api_key.key_hash})
+        return api_key
+
+    def list(self) -> list["APIKey"]:
+        items: list[dict[str, Any]] = []
+        kwargs: dict[str, Any] = {}
+        while True:
+            response = self.table.scan(**kwargs)
+            items.extend(response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                break
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        return [_from_item(item) for item in items]
+
+
+def _to_item(api_key: "APIKey") -> dict[str, Any]:
+    """Convert an APIKey to a DynamoDB item."""
+    item: dict[str, Any] = {
+        "key_hash": api_key.key_hash,
+        "key_id": api_key.key_id,
+        "name": api_key.name,
+        "permissions": [p.value for p in api_key.permissions],
+        "created_at": api_key.created_at.isoformat(),
+        "rate_limit": api_key.rate_limit,
+        "is_active": api_key.is_active,
+        "metadata": api_key.metadata,
+    }
+    if api_key.expires_at is not None:
+        item["expires_at"] = api_key.expires_at.isoformat()
+    return item
+
+
+def _from_item(item: dict[str, Any]) -> "APIKey":
+    """Convert a DynamoDB item to an APIKey."""
+    from regulatory_kb.api.auth import APIKey, Permission
+
+    expires_at = item.get("expires_at")
+    return APIKey(
+        key_id=item["key_id"],
+        key_hash=item["key_hash"],
+        name=item["name"],
+        permissions=[Permission(p) for p in item.get("permissions", [])],
+        created_at=datetime.fromisoformat(item["created_at"]),
+        expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
+        rate_limit=int(item.get("rate_limit", 100)),
+        is_active=bool(item.get("is_active", True)),
+        metadata=dict(item.get("metadata", {})),
+    )
+
+
+def api_key_store_from_env() -> Optional[APIKeyStore]:
+    """Create a persistent store when API_KEYS_TABLE is set.
+
+    Returns:
+        A DynamoDB store, or None to use per-process memory.
+    """
+    table_name = os.environ.get("API_KEYS_TABLE")
+    if not table_name:
+        return None
+    return DynamoDBAPIKeyStore(table_name)
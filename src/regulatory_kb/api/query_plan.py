@@ -0,0 +1,472 @@
+"""Query plans for the GraphQL endpoint.
+
+Provides:
+- parse_query: single-pass tokenizer and recursive-descent parser producing
+  the selection tree the GraphQL resolvers walk
+- QueryPlan: a parsed query with its depth and estimated cost
+- QueryLimits: depth, cost, page size and traversal depth limits
+- QueryPlanCache: LRU cache of plans keyed by the query's SHA-256 hash,
+  which also serves persisted (hash-only) queries
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from regulatory_kb.models.regulator import ALL_REGULATORS
+
+_TOKEN = re.compile(
+    r"(?P<skip>[\s,\ufeff]+|#[^\n\r]*)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\")"
+    r"|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[_A-Za-z][_0-9A-Za-z]*)"
+    r"|(?P<punct>\.\.\.|[{}()\[\]:!$=@])"
+)
+
+# Page size assumed for paginated fields without a `first` argument
+DEFAULT_PAGE_SIZE = 20
+
+# Estimated results of relationship list fields, for cost estimates
+RELATIONSHIP_FANOUT = 10
+
+_RELATIONSHIP_FIELDS = frozenset(
+    {"references", "referencedBy", "implements", "sections", "relatedDocuments",
+     "implementingDocuments"}
+)
+
+
+class GraphQLError(ValueError):
+    """Query rejected before execution."""
+
+    def __init__(self, message: str, code: str = "GRAPHQL_VALIDATION_FAILED"):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a GraphQL error entry."""
+        return {"message": self.message, "extensions": {"code": self.code}}
+
+
+@dataclass
+class QueryLimits:
+    """Limits checked when a query is planned.
+
+    Attributes:
+        max_depth: Maximum nesting of selection sets.
+        max_cost: Maximum estimated cost (roughly, result fields produced).
+        max_page_size: Maximum `first` argument.
+        max_traversal_depth: Maximum `maxDepth`/`depth` of graph traversals.
+    """
+
+    max_depth: int = 10
+    max_cost: int = 50_000
+    max_page_size: int = 100
+    max_traversal_depth: int = 5
+
+
+@dataclass
+class QueryPlan:
+    """A parsed query and its static measurements.
+
+    Attributes:
+        query_hash: SHA-256 hex digest of the query string.
+        operation: Parsed selection tree.
+        depth: Nesting depth of the selection.
+        cost: Estimated cost, or None when it depends on variables.
+        uses_variables: Whether any argument refers to a variable.
+    """
+
+    query_hash: str
+    operation: dict[str, Any]
+    depth: int
+    cost: Optional[int]
+    uses_variables: bool
+
+    def check(self, limits: QueryLimits, variables: Optional[dict[str, Any]] = None) -> int:
+        """Check the plan against limits with the request's variables.
+
+        Args:
+            limits: Limits to enforce.
+            variables: Query variables.
+
+        Returns:
+            Estimated cost of the query.
+
+        Raises:
+            GraphQLError: If a limit is exceeded.
+        """
+        if self.depth > limits.max_depth:
+            raise GraphQLError(
+                f"Query depth {self.depth} exceeds maximum of {limits.max_depth}",
+                code="QUERY_TOO_DEEP",
+            )
+        if self.cost is not None:
+            return self.cost
+        return estimate_cost(self.operation, limits, variables or {})
+
+
+def query_hash(query: str) -> str:
+    """Get the SHA-256 hex digest identifying a query string."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def compile_plan(query: str, limits: QueryLimits) -> QueryPlan:
+    """Parse a query and measure it.
+
+    The cost is computed here when the query has no variables; otherwise
+    it is computed per request by QueryPlan.check.
+
+    Args:
+        query: GraphQL query string.
+        limits: Limits to enforce.
+
+    Returns:
+        The compiled plan.
+
+    Raises:
+        GraphQLError: If the query cannot be parsed or exceeds a limit.
+    """
+    parser = _Parser(query)
+    operation = parser.parse_document()
+    plan = QueryPlan(
+        query_hash=query_hash(query),
+        operation=operation,
+        depth=_depth(operation),
+        cost=None,
+        uses_variables=parser.uses_variables,
+    )
+    if not plan.uses_variables:
+        plan.cost = plan.check(limits)
+    return plan
+
+
+def parse_query(query: str) -> dict[str, Any]:
+    """Parse a GraphQL query into a selection tree.
+
+    Each field is a dict with ``name``, ``alias``, ``arguments`` and
+    ``selections`` (a ``{"selections": [...]}`` dict, or None for leaves).
+    Variable references in arguments are ``{"$var": name}``.
+
+    Args:
+        query: GraphQL query string.
+
+    Returns:
+        The operation's selection set.
+
+    Raises:
+        GraphQLError: If the query is malformed.
+    """
+    return _Parser(query).parse_document()
+
+
+def estimate_cost(
+    operation: dict[str, Any],
+    limits: QueryLimits,
+    variables: dict[str, Any],
+) -> int:
+    """Estimate the cost of a selection tree and check argument limits.
+
+    Each field costs 1. Paginated fields, including ``documents`` at any
+    depth, multiply their sub-selection by their page size (the default
+    page size when ``first`` is omitted), relationship lists by an estimated fan-out, and
+    ``relatedDocuments`` traversals by the fan-out per level of depth.
+
+    Raises:
+        GraphQLError: If a page size, traversal depth or the cost is too large.
+    """
+    cost = sum(
+        _field_cost(field, None, limits, variables)
+        for field in operation.get("selections", [])
+    )
+    _check_cost(cost, limits)
+    return cost
+
+
+def _check_cost(cost: int, limits: QueryLimits) -> None:
+    if cost > limits.max_cost:
+        raise GraphQLError(
+            f"Query cost {cost} exceeds maximum of {limits.max_cost}",
+            code="QUERY_TOO_COMPLEX",
+        )
+
+
+def _field_cost(
+    field: dict[str, Any],
+    parent: Optional[str],
+    limits: QueryLimits,
+    variables: dict[str, Any],
+) -> int:
+    name = field["name"]
+    args = {
+        key: variables.get(value["$var"]) if isinstance(value, dict) and "$var" in value else value
+        for key, value in field["arguments"].items()
+    }
+    children = field["selections"]["selections"] if field["selections"] else []
+    child_cost = sum(_field_cost(child, name, limits, variables) for child in children)
+
+    multiplier = 1
+    # Document lists are paged wherever they appear, e.g. Regulator.documents
+    if "first" in args or name == "documents" or (parent is None and name == "searchDocuments"):
+        multiplier = _int_argument(args, "first", DEFAULT_PAGE_SIZE)
+        if multiplier > limits.max_page_size:
+            raise GraphQLError(
+                f"'{name}' requests {multiplier} results; maximum is {limits.max_page_size}",
+                code="QUERY_TOO_COMPLEX",
+            )
+    elif parent is None and name in ("regulatoryPath", "relatedDocuments"):
+        depth = _int_argument(args, "maxDepth" if name == "regulatoryPath" else "depth",
+                              5 if name == "regulatoryPath" else 1)
+        if depth > limits.max_traversal_depth:
+            raise GraphQLError(
+                f"'{name}' depth {depth} exceeds maximum of {limits.max_traversal_depth}",
+                code="QUERY_TOO_COMPLEX",
+            )
+        multiplier = depth if name == "regulatoryPath" else RELATIONSHIP_FANOUT ** depth
+    elif parent is None and name == "regulators":
+        multiplier = len(ALL_REGULATORS)
+    elif name in _RELATIONSHIP_FIELDS:
+        multiplier = RELATIONSHIP_FANOUT
+
+    return 1 + multiplier * child_cost
+
+
+def _int_argument(args: dict[str, Any], key: str, default: int) -> int:
+    value = args.get(key)
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        raise GraphQLError(f"Argument '{key}' must be an integer", code="BAD_USER_INPUT")
+
+
+def _depth(selection_set: Optional[dict[str, Any]]) -> int:
+    if not selection_set:
+        return 0
+    return max(
+        (1 + _depth(field["selections"]) for field in selection_set["selections"]),
+        default=0,
+    )
+
+
+class _Parser:
+    """Recursive-descent parser over a single-pass token list."""
+
+    def __init__(self, source: str):
+        self.tokens: list[tuple[str, str]] = []
+        self.position = 0
+        self.uses_variables = False
+
+        index = 0
+        length = len(source)
+        while index < length:
+            match = _TOKEN.match(source, index)
+            if match is None:
+                raise GraphQLError(
+                    f"Unexpected character {source[index]!r} at offset {index}",
+                    code="GRAPHQL_PARSE_FAILED",
+                )
+            kind = match.lastgroup
+            if kind != "skip":
+                self.tokens.append((kind, match.group()))
+            index = match.end()
+
+    def parse_document(self) -> dict[str, Any]:
+        if not self.tokens:
+            raise GraphQLError("Empty query", code="GRAPHQL_PARSE_FAILED")
+
+        kind, value = self.tokens[0]
+        if kind == "name" and value in ("query", "mutation", "subscription"):
+            self.position = 1
+            token = self._peek()
+            if token is not None and token[0] == "name":
+                self.position += 1  # operation name
+            if self._peek_value() == "(":
+                self._skip_group("(", ")")  # variable definitions
+            while self._peek_value() == "@":
+                self._skip_directive()
+            selection_set = self._selection_set()
+        elif value == "{":
+            selection_set = self._selection_set()
+        else:
+            # Shorthand: bare fields without enclosing braces
+            selections = []
+            while self.position < len(self.tokens):
+                selections.append(self._field())
+            selection_set = {"selections": selections}
+
+        if self.position < len(self.tokens):
+            self._fail("Unexpected content after operation")
+        return selection_set
+
+    def _selection_set(self) -> dict[str, Any]:
+        self._expect("{")
+        selections = []
+        while self._peek_value() != "}":
+            if self.position >= len(self.tokens):
+                self._fail("Unterminated selection set")
+            selections.append(self._field())
+        self.position += 1
+        return {"selections": selections}
+
+    def _field(self) -> dict[str, Any]:
+        name = self._name()
+        alias = None
+        if self._peek_value() == ":":
+            self.position += 1
+            alias, name = name, self._name()
+
+        arguments: dict[str, Any] = {}
+        if self._peek_value() == "(":
+            self.position += 1
+            while self._peek_value() != ")":
+                key = self._name()
+                self._expect(":")
+                arguments[key] = self._value()
+            self.position += 1
+
+        while self._peek_value() == "@":
+            self._skip_directive()
+
+        selections = self._selection_set() if self._peek_value() == "{" else None
+        return {"name": name, "alias": alias, "arguments": arguments, "selections": selections}
+
+    def _value(self) -> Any:
+        kind, value = self._next()
+        if kind == "string":
+            return json.loads(value)
+        if kind == "number":
+            return float(value) if any(c in value for c in ".eE") else int(value)
+        if kind == "name":
+            return {"true": True, "false": False, "null": None}.get(value, value)
+        if value == "$":
+            self.uses_variables = True
+            return {"$var": self._name()}
+        if value == "[":
+            items = []
+            while self._peek_value() != "]":
+                items.append(self._value())
+            self.position += 1
+            return items
+        if value == "{":
+            fields = {}
+            while self._peek_value() != "}":
+                key = self._name()
+                self._expect(":")
+                fields[key] = self._value()
+            self.position += 1
+            return fields
+        self._fail(f"Unexpected {value!r} in argument value", back=1)
+
+    def _skip_directive(self) -> None:
+        self.position += 1
+        self._name()
+        if self._peek_value() == "(":
+            self._skip_group("(", ")")
+
+    def _skip_group(self, opening: str, closing: str) -> None:
+        self._expect(opening)
+        level = 1
+        while level:
+            _, value = self._next()
+            level += (value == opening) - (value == closing)
+
+    def _name(self) -> str:
+        kind, value = self._next()
+        if kind != "name":
+            self._fail(f"Expected a name, found {value!r}", back=1)
+        return value
+
+    def _expect(self, punct: str) -> None:
+        _, value = self._next()
+        if value != punct:
+            self._fail(f"Expected {punct!r}, found {value!r}", back=1)
+
+    def _next(self) -> tuple[str, str]:
+        if self.position >= len(self.tokens):
+            self._fail("Unexpected end of query")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _peek(self) -> Optional[tuple[str, str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _peek_value(self) -> Optional[str]:
+        token = self._peek()
+        return token[1] if token else None
+
+    def _fail(self, message: str, back: int = 0) -> None:
+        raise GraphQLError(
+            f"{message} (token {self.position - back + 1})",
+            code="GRAPHQL_PARSE_FAILED",
+        )
+
+
+class QueryPlanCache:
+    """LRU cache of compiled query plans, keyed by query hash.
+
+    Persisted queries registered up front are kept apart from the LRU
+    entries and never evicted, so clients can always send their hash alone.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached plans; least recently used are evicted.
+        """
+        self.max_entries = max_entries
+        self._plans: OrderedDict[str, QueryPlan] = OrderedDict()
+        self._persisted: dict[str, QueryPlan] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[QueryPlan]:
+        """Get a plan by query hash, or None if absent."""
+        with self._lock:
+            plan = self._persisted.get(key)
+            if plan is None:
+                plan = self._plans.get(key)
+                if plan is not None:
+                    self._plans.move_to_end(key)
+            if plan is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return plan
+
+    def put(self, plan: QueryPlan) -> None:
+        """Cache a plan."""
+        with self._lock:
+            self._plans[plan.query_hash] = plan
+            self._plans.move_to_end(plan.query_hash)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+
+    def persist(self, plan: QueryPlan) -> None:
+        """Register a plan as a persisted query."""
+        with self._lock:
+            self._persisted[plan.query_hash] = plan
+
+    def clear(self) -> None:
+        """Drop all cached plans, keeping persisted queries."""
+        with self._lock:
+            self._plans.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters."""
+        return {
+            "size": len(self._plans),
+            "persisted": len(self._persisted),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,267 @@
+"""Storage backends for the GCRA rate limiter.
+
+Each client is represented by a single theoretical arrival time (TAT).
+A request costing ``n`` tokens is allowed when
+``max(tat, now) + n * interval - now <= span``, where ``interval`` is the
+time to earn one token and ``span`` is the burst capacity in seconds.
+A client whose TAT is in the past is indistinguishable from a new one,
+so idle state can be dropped without changing any decision.
+
+Backends:
+- ShardedMemoryBackend: per-process, sharded dicts with per-shard locks
+- RedisRateLimitBackend: shared across processes via an atomic Lua script
+"""
+
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol
+
+from regulatory_kb.core import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class GCRARequest:
+    """One rate limit acquisition request."""
+
+    key: str
+    interval: float
+    span: float
+    tokens: int = 1
+
+
+@dataclass(frozen=True)
+class GCRADecision:
+    """Outcome of an acquisition.
+
+    ``tat`` is the client's TAT after the request (unchanged if denied)
+    and ``now`` is the clock reading used for the decision.
+    """
+
+    allowed: bool
+    tat: float
+    now: float
+
+
+def gcra_decide(tat: Optional[float], now: float, request: GCRARequest) -> GCRADecision:
+    """Apply the GCRA rule to a stored TAT."""
+    base = now if tat is None or tat < now else tat
+    new_tat = base + request.tokens * request.interval
+    if new_tat - now <= request.span:
+        return GCRADecision(True, new_tat, now)
+    return GCRADecision(False, base, now)
+
+
+class RateLimitBackend(Protocol):
+    """Storage interface for GCRA state."""
+
+    def acquire_many(self, requests: list[GCRARequest]) -> list[GCRADecision]:
+        """Atomically decide each request and update state for allowed ones."""
+        ...
+
+    def peek(self, key: str) -> tuple[Optional[float], float]:
+        """Get (tat or None, now) for a key without consuming."""
+        ...
+
+    def reset(self, key: str) -> bool:
+        """Drop state for a key; returns True if state existed."""
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        """Backend statistics."""
+        ...
+
+
+class _Shard:
+    """One lock-protected partition of client state.
+
+    Dict insertion order doubles as LRU order: each access re-inserts the
+    key, so idle clients collect at the front.
+    """
+
+    __slots__ = ("lock", "tats")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tats: dict[str, float] = {}
+
+
+class ShardedMemoryBackend:
+    """In-process GCRA state split across independently locked shards.
+
+    Idle clients (TAT in the past) are evicted incrementally from the
+    LRU end of each shard on every access. If a shard still exceeds its
+    capacity, the least recently used clients are evicted even though
+    they are not idle, which resets their burst allowance.
+    """
+
+    # Idle entries examined per access
+    SWEEP_BATCH = 8
+
+    def __init__(
+        self,
+        shard_count: int = 16,
+        max_clients: int = 100_000,
+        clock: Any = time.time,
+    ):
+        """Initialize the backend.
+
+        Args:
+            shard_count: Number of shards.
+            max_clients: Upper bound on tracked clients across all shards.
+            clock: Time source returning epoch seconds.
+        """
+        self._shards = [_Shard() for _ in range(max(1, shard_count))]
+        self._max_per_shard = max(1, max_clients // len(self._shards))
+        self._clock = clock
+        self._idle_evictions = 0
+        self._forced_evictions = 0
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+
+    def acquire_many(self, requests: list[GCRARequest]) -> list[GCRADecision]:
+        """Decide requests, taking each shard lock once per batch."""
+        decisions: list[Optional[GCRADecision]] = [None] * len(requests)
+        by_shard: dict[int, list[int]] = {}
+        for i, request in enumerate(requests):
+            by_shard.setdefault(id(self._shard(request.key)), []).append(i)
+
+        for indexes in by_shard.values():
+            shard = self._shard(requests[indexes[0]].key)
+            with shard.lock:
+                now = self._clock()
+                for i in indexes:
+                    request = requests[i]
+                    tat = shard.tats.pop(request.key, None)
+                    decision = gcra_decide(tat, now, request)
+                    if decision.tat > now:
+                        shard.tats[request.key] = decision.tat
+                    decisions[i] = decision
+                self._evict(shard, now)
+        return decisions  # type: ignore[return-value]
+
+    def _evict(self, shard: _Shard, now: float) -> None:
+        """Drop idle entries from the LRU end, then enforce capacity."""
+        tats = shard.tats
+        for _ in range(self.SWEEP_BATCH):
+            if not tats:
+                return
+            oldest = next(iter(tats))
+            if tats[oldest] > now:
+                break
+            del tats[oldest]
+            self._idle_evictions += 1
+        while len(tats) > self._max_per_shard:
+            del tats[next(iter(tats))]
+            self._forced_evictions += 1
+
+    def peek(self, key: str) -> tuple[Optional[float], float]:
+        shard = self._shard(key)
+        with shard.lock:
+            now = self._clock()
+            tat = shard.tats.get(key)
+        return (tat if tat is not None and tat > now else None), now
+
+    def reset(self, key: str) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.tats.pop(key, None) is not None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "memory",
+            "shards": len(self._shards),
+            "tracked_clients": sum(len(s.tats) for s in self._shards),
+            "idle_evictions": self._idle_evictions,
+            "forced_evictions": self._forced_evictions,
+        }
+
+
+# KEYS: one TAT key per request. ARGV: per request (interval, span, tokens).
+# Uses the server clock so every container decides against the same time.
+GCRA_LUA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local results = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[i * 3 - 2])
+    local span = tonumber(ARGV[i * 3 - 1])
+    local tokens = tonumber(ARGV[i * 3])
+    local tat = tonumber(redis.call('GET', key))
+    if tat == nil or tat < now then tat = now end
+    local new_tat = tat + tokens * interval
+    if new_tat - now <= span then
+        redis.call('SET', key, string.format('%.6f', new_tat),
+                   'PX', math.ceil((new_tat - now) * 1000) + 1)
+        results[i] = {1, string.format('%.6f', new_tat), string.format('%.6f', now)}
+    else
+        results[i] = {0, string.format('%.6f', tat), string.format('%.6f', now)}
+    end
+end
+return results
+"""
+
+GCRA_PEEK_LUA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local tat = redis.call('GET', KEYS[1])
+return {tat or '', string.format('%.6f', now)}
+"""
+
+
+class RedisRateLimitBackend:
+    """GCRA state shared through Redis (or any server speaking its protocol).
+
+    All requests in a batch are decided by one atomic script call, and
+    keys expire when their TAT passes, so idle clients cost nothing.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "ratelimit:"):
+        """Initialize the backend.
+
+        Args:
+            client: A redis-py compatible client (``register_script``, ``delete``).
+            key_prefix: Prefix for rate limit keys.
+        """
+        self._client = client
+        self._prefix = key_prefix
+        self._acquire = client.register_script(GCRA_LUA_SCRIPT)
+        self._peek = client.register_script(GCRA_PEEK_LUA_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "ratelimit:") -> "RedisRateLimitBackend":
+        """Create a backend from a redis:// URL."""
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5), key_prefix=key_prefix)
+
+    def acquire_many(self, requests: list[GCRARequest]) -> list[GCRADecision]:
+        if not requests:
+            return []
+        args: list[Any] = []
+        for request in requests:
+            args.extend([repr(request.interval), repr(request.span), request.tokens])
+        raw = self._acquire(keys=[self._prefix + r.key for r in requests], args=args)
+        return [
+            GCRADecision(bool(int(allowed)), float(tat), float(now))
+            for allowed, tat, now in raw
+        ]
+
+    def peek(self, key: str) -> tuple[Optional[float], float]:
+        tat, now = self._peek(keys=[self._prefix + key])
+        tat_value = float(tat) if tat not in (b"", "", None) else None
+        now_value = float(now)
+        if tat_value is not None and tat_value <= now_value:
+            tat_value = None
+        return tat_value, now_value
+
+    def reset(self, key: str) -> bool:
+        return bool(self._client.delete(self._prefix + key))
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "redis", "key_prefix": self._prefix}
@@ -4,13 +4,20 @@ Implements Requirements 13.6:
 - Rate limiting for API access
 """
 
-import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+import math
+import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.api.rate_limit_backends import (
+    GCRADecision,
+    GCRARequest,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    ShardedMemoryBackend,
+)
 
 logger = get_logger(__name__)
 
@@ -24,6 +31,8 @@ class RateLimitConfig:
     default_requests_per_day: int = 10000
     burst_multiplier: float = 2.0
     window_size_seconds: int = 60
+    shard_count: int = 16
+    max_tracked_clients: int = 100_000
 
 
 @dataclass
@@ -48,34 +57,38 @@ class RateLimitResult:
         return headers
 
 
-@dataclass
-class RateLimitBucket:
-    """Token bucket for rate limiting."""
-    
-    tokens: float
-    last_update: float
-    requests_in_window: int = 0
-    window_start: float = field(default_factory=time.time)
-
-
 class RateLimiter:
-    """Rate limiter using token bucket algorithm.
+    """Rate limiter using the generic cell rate algorithm (GCRA).
+    
+    GCRA is equivalent to a token bucket holding ``limit * burst_multiplier``
+    tokens refilled at ``limit`` per window, but stores a single timestamp
+    per client. State lives in a pluggable backend: sharded in-process
+    memory by default, or Redis so limits hold across Lambda containers.
     
     Provides:
     - Per-client rate limiting
     - Configurable limits per minute/hour/day
     - Burst handling
+    - Batched consumption
     - Rate limit headers for responses
     """
     
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ):
         """Initialize the rate limiter.
         
         Args:
             config: Rate limit configuration.
+            backend: Optional state backend (defaults to sharded memory).
         """
         self.config = config or RateLimitConfig()
-        self._buckets: dict[str, RateLimitBucket] = {}
+        self._backend = backend or ShardedMemoryBackend(
+            shard_count=self.config.shard_count,
+            max_clients=self.config.max_tracked_clients,
+        )
         self._client_limits: dict[str, int] = {}
     
     def set_client_limit(self, client_id: str, requests_per_minute: int) -> None:
@@ -115,57 +128,17 @@ class RateLimiter:
         Returns:
             RateLimitResult indicating if request is allowed.
         """
-        now = time.time()
-        limit = self.get_client_limit(client_id)
-        
-        # Get or create bucket
-        bucket = self._get_or_create_bucket(client_id, limit, now)
+        result = self.consume(client_id)
         
-        # Refill tokens based on time elapsed
-        self._refill_tokens(bucket, limit, now)
-        
-        # Check if request is allowed
-        if bucket.tokens >= 1:
-            bucket.tokens -= 1
-            bucket.requests_in_window += 1
-            
-            # Calculate reset time
-            reset_at = datetime.fromtimestamp(
-                bucket.window_start + self.config.window_size_seconds,
-                tz=timezone.utc,
-            )
-            
-            return RateLimitResult(
-                allowed=True,
-                remaining=int(bucket.tokens),
-                limit=limit,
-                reset_at=reset_at,
-            )
-        else:
-            # Calculate retry after
-            tokens_needed = 1 - bucket.tokens
-            refill_rate = limit / self.config.window_size_seconds
-            retry_after = int(tokens_needed / refill_rate) + 1
-            
-            reset_at = datetime.fromtimestamp(
-                now + retry_after,
-                tz=timezone.utc,
-            )
-            
+        if not result.allowed:
             logger.warning(
                 "rate_limit_exceeded",
                 client_id=client_id,
-                limit=limit,
-                retry_after=retry_after,
-            )
-            
-            return RateLimitResult(
-                allowed=False,
-                remaining=0,
-                limit=limit,
-                reset_at=reset_at,
-                retry_after_seconds=retry_after,
+                limit=result.limit,
+                retry_after=result.retry_after_seconds,
             )
+        
+        return result
     
     def consume(self, client_id: str, tokens: int = 1) -> RateLimitResult:
         """Consume tokens from a client's bucket.
@@ -177,41 +150,82 @@ class RateLimiter:
         Returns:
             RateLimitResult indicating if consumption was allowed.
         """
-        now = time.time()
-        limit = self.get_client_limit(client_id)
-        bucket = self._get_or_create_bucket(client_id, limit, now)
+        return self.consume_batch([(client_id, tokens)])[0]
+    
+    def consume_batch(self, requests: list[tuple[str, int]]) -> list[RateLimitResult]:
+        """Consume tokens for several clients in one backend round-trip.
         
-        self._refill_tokens(bucket, limit, now)
+        Each request is decided independently, in order; requests for the
+        same client see the effect of earlier ones in the batch.
         
-        if bucket.tokens >= tokens:
-            bucket.tokens -= tokens
-            bucket.requests_in_window += tokens
+        Args:
+            requests: List of (client_id, tokens) pairs.
             
-            reset_at = datetime.fromtimestamp(
-                bucket.window_start + self.config.window_size_seconds,
-                tz=timezone.utc,
+        Returns:
+            RateLimitResult per request, in input order.
+        """
+        limits = [self.get_client_limit(client_id) for client_id, _ in requests]
+        gcra_requests = [
+            GCRARequest(
+                key=client_id,
+                interval=self._interval(limit),
+                span=self._span(limit),
+                tokens=tokens,
             )
-            
+            for (client_id, tokens), limit in zip(requests, limits)
+        ]
+        try:
+            decisions = self._backend.acquire_many(gcra_requests)
+        except Exception as e:
+            # Fail open: an unavailable shared backend must not block the API
+            logger.error("rate_limit_backend_error", error=str(e))
+            return [
+                RateLimitResult(
+                    allowed=True,
+                    remaining=limit,
+                    limit=limit,
+                    reset_at=datetime.now(timezone.utc),
+                )
+                for limit in limits
+            ]
+        return [
+            self._to_result(decision, request, limit)
+            for decision, request, limit in zip(decisions, gcra_requests, limits)
+        ]
+    
+    def _interval(self, limit: int) -> float:
+        """Seconds to earn one token."""
+        return self.config.window_size_seconds / limit
+    
+    def _span(self, limit: int) -> float:
+        """Burst capacity expressed in seconds."""
+        return limit * self.config.burst_multiplier * self._interval(limit)
+    
+    def _to_result(
+        self,
+        decision: GCRADecision,
+        request: GCRARequest,
+        limit: int,
+    ) -> RateLimitResult:
+        """Convert a GCRA decision to a RateLimitResult."""
+        if decision.allowed:
+            remaining = int((request.span - (decision.tat - decision.now)) / request.interval)
             return RateLimitResult(
                 allowed=True,
-                remaining=int(bucket.tokens),
-                limit=limit,
-                reset_at=reset_at,
-            )
-        else:
-            retry_after = int(
-                (tokens - bucket.tokens) / (limit / self.config.window_size_seconds)
-            ) + 1
-            
-            reset_at = datetime.fromtimestamp(now + retry_after, tz=timezone.utc)
-            
-            return RateLimitResult(
-                allowed=False,
-                remaining=0,
+                remaining=remaining,
                 limit=limit,
-                reset_at=reset_at,
-                retry_after_seconds=retry_after,
+                reset_at=datetime.fromtimestamp(decision.tat, tz=timezone.utc),
             )
+        
+        wait = decision.tat + request.tokens * request.interval - request.span - decision.now
+        retry_after = int(wait) + 1
+        return RateLimitResult(
+            allowed=False,
+            remaining=0,
+            limit=limit,
+            reset_at=datetime.fromtimestamp(decision.now + retry_after, tz=timezone.utc),
+            retry_after_seconds=retry_after,
+        )
     
     def reset_client(self, client_id: str) -> None:
         """Reset rate limit for a client.
@@ -219,13 +233,14 @@ class RateLimiter:
         Args:
             client_id: Client identifier.
         """
-        if client_id in self._buckets:
-            del self._buckets[client_id]
+        if self._backend.reset(client_id):
             logger.info("client_rate_limit_reset", client_id=client_id)
     
     def get_client_stats(self, client_id: str) -> dict[str, Any]:
         """Get rate limit statistics for a client.
         
+        ``requests_in_window`` is the number of tokens not yet refilled.
+        
         Args:
             client_id: Client identifier.
             
@@ -233,9 +248,9 @@ class RateLimiter:
             Dictionary with rate limit stats.
         """
         limit = self.get_client_limit(client_id)
-        bucket = self._buckets.get(client_id)
+        tat, now = self._backend.peek(client_id)
         
-        if not bucket:
+        if tat is None:
             return {
                 "client_id": client_id,
                 "limit": limit,
@@ -243,53 +258,29 @@ class RateLimiter:
                 "requests_in_window": 0,
             }
         
-        now = time.time()
-        self._refill_tokens(bucket, limit, now)
+        interval = self._interval(limit)
+        outstanding = (tat - now) / interval
         
         return {
             "client_id": client_id,
             "limit": limit,
-            "remaining": int(bucket.tokens),
-            "requests_in_window": bucket.requests_in_window,
-            "window_start": datetime.fromtimestamp(bucket.window_start, tz=timezone.utc).isoformat(),
+            "remaining": int(self._span(limit) / interval - outstanding),
+            "requests_in_window": math.ceil(outstanding),
+            "reset_at": datetime.fromtimestamp(tat, tz=timezone.utc).isoformat(),
         }
     
-    def _get_or_create_bucket(
-        self,
-        client_id: str,
-        limit: int,
-        now: float,
-    ) -> RateLimitBucket:
-        """Get or create a rate limit bucket for a client."""
-        if client_id not in self._buckets:
-            # Allow burst up to multiplier
-            max_tokens = limit * self.config.burst_multiplier
-            self._buckets[client_id] = RateLimitBucket(
-                tokens=max_tokens,
-                last_update=now,
-                window_start=now,
-            )
-        return self._buckets[client_id]
+    def get_backend_stats(self) -> dict[str, Any]:
+        """Get state backend statistics (tracked clients, evictions)."""
+        return self._backend.stats()
+
+
+def rate_limit_backend_from_env() -> Optional[RateLimitBackend]:
+    """Create a shared backend when RATE_LIMIT_REDIS_URL is set.
     
-    def _refill_tokens(
-        self,
-        bucket: RateLimitBucket,
-        limit: int,
-        now: float,
-    ) -> None:
-        """Refill tokens based on time elapsed."""
-        elapsed = now - bucket.last_update
-        
-        # Calculate tokens to add
-        refill_rate = limit / self.config.window_size_seconds
-        tokens_to_add = elapsed * refill_rate
-        
-        # Cap at max tokens (with burst)
-        max_tokens = limit * self.config.burst_multiplier
-        bucket.tokens = min(max_tokens, bucket.tokens + tokens_to_add)
-        bucket.last_update = now
-        
-        # Reset window if needed
-        if now - bucket.window_start >= self.config.window_size_seconds:
-            bucket.window_start = now
-            bucket.requests_in_window = 0
+    Returns:
+        A Redis backend, or None to use per-process memory.
+    """
+    url = os.environ.get("RATE_LIMIT_REDIS_URL")
+    if not url:
+        return None
+    return RedisRateLimitBackend.from_url(url)
@@ -0,0 +1,286 @@
+"""Pooled, concurrent delivery engine for webhooks.
+
+Provides:
+- One pooled aiohttp session per event loop instead of one per delivery
+- Per-host connection limits on the pooled connector
+- A persistent background event loop for synchronous callers
+- Min-heap retry scheduling on next_retry_at
+- Delivery latency metrics
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Optional, TypeVar, TYPE_CHECKING
+
+from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+# aiohttp is only needed once something is actually delivered
+aiohttp = lazy_import("aiohttp")
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class DeliveryEngineConfig:
+    """Configuration for the webhook delivery engine."""
+
+    max_connections: int = 100
+    max_per_host: int = 10
+    timeout_seconds: float = 30.0
+    latency_sample_size: int = 1024
+
+
+class DeliveryLatencyMetrics:
+    """Rolling latency and outcome metrics for delivery attempts."""
+
+    def __init__(self, sample_size: int = 1024):
+        """Initialize metrics.
+
+        Args:
+            sample_size: Number of recent latencies kept for percentiles.
+        """
+        self._samples: deque[float] = deque(maxlen=sample_size)
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.successes = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float, success: bool) -> None:
+        """Record one delivery attempt."""
+        with self._lock:
+            self._samples.append(latency_ms)
+            self.attempts += 1
+            self.total_ms += latency_ms
+            self.max_ms = max(self.max_ms, latency_ms)
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile over recent samples in milliseconds."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct / 100 * len(samples))) - 1))
+        return samples[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": self.failures,
+            "mean_ms": round(self.total_ms / self.attempts, 2) if self.attempts else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms if self.attempts else None,
+        }
+
+
+class RetryScheduler:
+    """Min-heap of deliveries keyed on ``next_retry_at``.
+
+    Rescheduling or cancelling a delivery leaves its old heap entry in
+    place; stale entries are skipped when popped.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._entries: dict[str, tuple[int, Any]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, delivery_id: str) -> bool:
+        return delivery_id in self._entries
+
+    def schedule(self, delivery: Any) -> None:
+        """Schedule a delivery at its next_retry_at time."""
+        seq = next(self._counter)
+        due = delivery.next_retry_at or datetime.now(timezone.utc)
+        self._entries[delivery.id] = (seq, delivery)
+        heapq.heappush(self._heap, (due, seq, delivery.id))
+
+    def cancel(self, delivery_id: str) -> bool:
+        """Remove a scheduled delivery."""
+        return self._entries.pop(delivery_id, None) is not None
+
+    def next_due(self) -> Optional[datetime]:
+        """Due time of the earliest scheduled delivery."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_ready(self, now: Optional[datetime] = None) -> list[Any]:
+        """Pop all deliveries due at or before ``now``."""
+        now = now or datetime.now(timezone.utc)
+        ready = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return ready
+            _, _, delivery_id = heapq.heappop(self._heap)
+            ready.append(self._entries.pop(delivery_id)[1])
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            _, seq, delivery_id = self._heap[0]
+            entry = self._entries.get(delivery_id)
+            if entry is not None and entry[0] == seq:
+                return
+            heapq.heappop(self._heap)
+
+
+class WebhookDeliveryEngine:
+    """Sends webhook requests over pooled sessions with per-host limits."""
+
+    def __init__(self, config: Optional[DeliveryEngineConfig] = None):
+        """Initialize the engine.
+
+        Args:
+            config: Engine configuration.
+        """
+        self.config = config or DeliveryEngineConfig()
+        self.metrics = DeliveryLatencyMetrics(self.config.latency_sample_size)
+        self._sessions: dict[asyncio.AbstractEventLoop, "ClientSession"] = {}
+        self._scopes: dict[asyncio.AbstractEventLoop, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ==================== Event Loop ====================
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the persistent background loop, starting it if needed."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="webhook-delivery-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine on the background loop and wait for its result."""
+        loop = self._background_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    # ==================== Requests ====================
+
+    def _session(self) -> "ClientSession":
+        """Get the pooled session for the running loop."""
+        loop = asyncio.get_running_loop()
+        self._prune_closed_loops()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_per_host,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
+            )
+            self._sessions[loop] = session
+        return session
+
+    def _prune_closed_loops(self) -> None:
+        """Forget sessions owned by loops that closed outside a session scope."""
+        for stale in [loop for loop in self._sessions if loop.is_closed()]:
+            del self._sessions[stale]
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[None]:
+        """Scope the running loop's use of its pooled session.
+
+        The background loop keeps its session until ``close()``. On any
+        other loop, e.g. one made by ``asyncio.run`` per invocation, the
+        session is closed when the outermost scope exits, so it never
+        outlives the loop that owns its connector.
+        """
+        loop = asyncio.get_running_loop()
+        self._scopes[loop] = self._scopes.get(loop, 0) + 1
+        try:
+            yield
+        finally:
+            depth = self._scopes.pop(loop) - 1
+            if depth:
+                self._scopes[loop] = depth
+            elif loop is not self._loop:
+                await self._close_sessions(loop)
+
+    async def post(
+        self,
+        url: str,
+        data: str,
+        headers: dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> int:
+        """POST a payload and return the response status.
+
+        Concurrency per host is bounded by the connector's
+        ``max_per_host`` limit; waiting for a pooled connection counts
+        against the timeout.
+
+        Raises:
+            asyncio.TimeoutError: If the request times out.
+            aiohttp.ClientError: On connection errors.
+        """
+        session = self._session()
+        started = time.perf_counter()
+        success = False
+        try:
+            async with session.post(
+                url,
+                data=data,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.config.timeout_seconds),
+            ) as response:
+                success = 200 <= response.status < 300
+                return response.status
+        finally:
+            self.metrics.record((time.perf_counter() - started) * 1000, success)
+
+    # ==================== Lifecycle ====================
+
+    async def _close_sessions(self, loop: asyncio.AbstractEventLoop) -> None:
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def aclose(self) -> None:
+        """Close the session owned by the running loop."""
+        await self._close_sessions(asyncio.get_running_loop())
+
+    def close(self) -> None:
+        """Close the background loop and its pooled session."""
+        with self._lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_sessions(loop), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
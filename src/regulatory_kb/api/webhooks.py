@@ -19,11 +19,17 @@ from enum import Enum
 from typing import Any, Callable, Optional
 from collections import deque
 
-import aiohttp
 import asyncio
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.api.webhook_delivery import (
+    DeliveryEngineConfig,
+    RetryScheduler,
+    WebhookDeliveryEngine,
+)
 
+aiohttp = lazy_import("aiohttp")
 logger = get_logger(__name__)
 
 
@@ -101,6 +107,142 @@ class WebhookSubscription:
         return True
 
 
+@dataclass
+class _EventRoute:
+    """Routing sets for one event type, keyed by subscription ID."""
+    
+    any_regulator: set[str] = field(default_factory=set)
+    by_regulator: dict[str, set[str]] = field(default_factory=dict)
+    any_category: set[str] = field(default_factory=set)
+    by_category: dict[str, set[str]] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.any_regulator) + sum(len(ids) for ids in self.by_regulator.values())
+
+
+class SubscriptionRoutingIndex:
+    """Routing index from event type to active subscriptions.
+    
+    Each event type keeps regulator and category sub-indexes, so routing
+    an event touches only subscriptions that can match it. Produces the
+    same result as calling WebhookSubscription.matches_event on every
+    subscription, in subscription creation order.
+    """
+    
+    def __init__(self):
+        self._routes: dict[WebhookEventType, _EventRoute] = {}
+        self._filters: dict[str, tuple[Optional[frozenset[str]], Optional[frozenset[str]]]] = {}
+        self._event_types: dict[str, frozenset[WebhookEventType]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+    
+    def __len__(self) -> int:
+        return len(self._event_types)
+    
+    def add(self, subscription: WebhookSubscription) -> None:
+        """Index a subscription (no-op for inactive subscriptions)."""
+        self.remove(subscription.id)
+        if subscription.id not in self._order:
+            self._order[subscription.id] = self._next_order
+            self._next_order += 1
+        if not subscription.is_active:
+            return
+        
+        regulators = frozenset(subscription.regulator_filter or ()) or None
+        categories = frozenset(subscription.category_filter or ()) or None
+        event_types = frozenset(subscription.events)
+        self._filters[subscription.id] = (regulators, categories)
+        self._event_types[subscription.id] = event_types
+        
+        for event_type in event_types:
+            route = self._routes.setdefault(event_type, _EventRoute())
+            if regulators:
+                for regulator in regulators:
+                    route.by_regulator.setdefault(regulator, set()).add(subscription.id)
+            else:
+                route.any_regulator.add(subscription.id)
+            if categories:
+                for category in categories:
+                    route.by_category.setdefault(category, set()).add(subscription.id)
+            else:
+                route.any_category.add(subscription.id)
+    
+    def remove(self, subscription_id: str, forget: bool = False) -> None:
+        """Remove a subscription from the index.
+        
+        Args:
+            subscription_id: Subscription to remove.
+            forget: Also drop its creation-order position (on delete).
+        """
+        event_types = self._event_types.pop(subscription_id, frozenset())
+        regulators, categories = self._filters.pop(subscription_id, (None, None))
+        for event_type in event_types:
+            route = self._routes[event_type]
+            route.any_regulator.discard(subscription_id)
+            route.any_category.discard(subscription_id)
+            for regulator in regulators or ():
+                self._discard(route.by_regulator, regulator, subscription_id)
+            for category in categories or ():
+                self._discard(route.by_category, category, subscription_id)
+            if not len(route):
+                del self._routes[event_type]
+        if forget:
+            self._order.pop(subscription_id, None)
+    
+    @staticmethod
+    def _discard(index: dict[str, set[str]], key: str, subscription_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(subscription_id)
+            if not ids:
+                del index[key]
+    
+    def match(self, event_type: WebhookEventType, payload: dict) -> list[str]:
+        """Get IDs of subscriptions matching an event, in creation order."""
+        route = self._routes.get(event_type)
+        if route is None:
+            return []
+        
+        regulator_id = payload.get("regulator_id")
+        categories = payload.get("categories") or []
+        
+        # Regulator dimension: without a regulator ID every subscription passes
+        if regulator_id:
+            by_regulator = [route.any_regulator, route.by_regulator.get(regulator_id, set())]
+        else:
+            by_regulator = [route.any_regulator, *route.by_regulator.values()]
+        by_category = [route.any_category, *(
+            route.by_category[c] for c in categories if c in route.by_category
+        )]
+        
+        # Walk the smaller dimension and check the other per candidate
+        if sum(map(len, by_regulator)) <= sum(map(len, by_category)):
+            candidates = set().union(*by_regulator)
+            matched = [sid for sid in candidates if self._category_matches(sid, categories)]
+        else:
+            candidates = set().union(*by_category)
+            matched = [sid for sid in candidates if self._regulator_matches(sid, regulator_id)]
+        
+        matched.sort(key=self._order.__getitem__)
+        return matched
+    
+    def _regulator_matches(self, subscription_id: str, regulator_id: Optional[str]) -> bool:
+        regulators = self._filters[subscription_id][0]
+        return not regulators or not regulator_id or regulator_id in regulators
+    
+    def _category_matches(self, subscription_id: str, categories: list[str]) -> bool:
+        allowed = self._filters[subscription_id][1]
+        return not allowed or any(c in allowed for c in categories)
+    
+    def subscription_ids(self, event_type: WebhookEventType) -> list[str]:
+        """Get IDs of all active subscriptions to an event type."""
+        route = self._routes.get(event_type)
+        if route is None:
+            return []
+        ids = set(route.any_regulator).union(*route.by_regulator.values())
+        return sorted(ids, key=self._order.__getitem__)
+
+
 @dataclass
 class WebhookDelivery:
     """A webhook delivery attempt."""
@@ -168,6 +310,7 @@ class WebhookService:
         signing_secret: str = "webhook-signing-secret",
         max_retries: int = 5,
         delivery_timeout: int = 30,
+        delivery_engine: Optional[WebhookDeliveryEngine] = None,
     ):
         """Initialize the webhook service.
         
@@ -175,15 +318,20 @@ class WebhookService:
             signing_secret: Secret for signing payloads.
             max_retries: Maximum delivery attempts.
             delivery_timeout: Timeout for delivery requests in seconds.
+            delivery_engine: Optional shared delivery engine (connection pool).
         """
         self.signing_secret = signing_secret
         self.max_retries = max_retries
         self.delivery_timeout = delivery_timeout
+        self._engine = delivery_engine or WebhookDeliveryEngine(
+            DeliveryEngineConfig(timeout_seconds=delivery_timeout)
+        )
         
         self._subscriptions: dict[str, WebhookSubscription] = {}
         self._deliveries: dict[str, WebhookDelivery] = {}
         self._dead_letter_queue: deque[WebhookDelivery] = deque(maxlen=1000)
-        self._pending_retries: list[WebhookDelivery] = []
+        self._pending_retries = RetryScheduler()
+        self._routing_index = SubscriptionRoutingIndex()
     
     # ==================== Subscription Management ====================
     
@@ -216,6 +364,7 @@ class WebhookService:
         )
         
         self._subscriptions[subscription.id] = subscription
+        self._routing_index.add(subscription)
         
         logger.info(
             "webhook_subscription_created",
@@ -267,6 +416,8 @@ class WebhookService:
         if category_filter is not None:
             subscription.category_filter = category_filter
         
+        self._routing_index.add(subscription)
+        
         logger.info(
             "webhook_subscription_updated",
             subscription_id=subscription_id,
@@ -285,6 +436,7 @@ class WebhookService:
         """
         if subscription_id in self._subscriptions:
             del self._subscriptions[subscription_id]
+            self._routing_index.remove(subscription_id, forget=True)
             logger.info("webhook_subscription_deleted", subscription_id=subscription_id)
             return True
         return False
@@ -303,6 +455,12 @@ class WebhookService:
         Returns:
             List of matching subscriptions.
         """
+        if event_type and active_only:
+            return [
+                self._subscriptions[subscription_id]
+                for subscription_id in self._routing_index.subscription_ids(event_type)
+            ]
+        
         subscriptions = list(self._subscriptions.values())
         
         if active_only:
@@ -313,6 +471,16 @@ class WebhookService:
         
         return subscriptions
     
+    def rebuild_routing_index(self) -> None:
+        """Rebuild the routing index from all subscriptions.
+        
+        Needed only if subscription objects were mutated directly rather
+        than through update_subscription.
+        """
+        self._routing_index = SubscriptionRoutingIndex()
+        for subscription in self._subscriptions.values():
+            self._routing_index.add(subscription)
+    
     # ==================== Event Dispatch ====================
     
     def dispatch_event(
@@ -329,13 +497,11 @@ class WebhookService:
         Returns:
             List of created deliveries.
         """
-        deliveries = []
-        
-        # Find matching subscriptions
-        for subscription in self._subscriptions.values():
-            if subscription.matches_event(event_type, data):
-                delivery = self._create_delivery(subscription, event_type, data)
-                deliveries.append(delivery)
+        # Only subscriptions routed to this event type are considered
+        deliveries = [
+            self._create_delivery(self._subscriptions[subscription_id], event_type, data)
+            for subscription_id in self._routing_index.match(event_type, data)
+        ]
         
         logger.info(
             "webhook_event_dispatched",
@@ -594,6 +760,11 @@ class WebhookService:
         Returns:
             True if delivery was successful.
         """
+        async with self._engine.session_scope():
+            return await self._deliver(delivery)
+    
+    async def _deliver(self, delivery: WebhookDelivery) -> bool:
+        """Deliver a webhook within an engine session scope."""
         subscription = self._subscriptions.get(delivery.subscription_id)
         if not subscription:
             delivery.status = WebhookStatus.FAILED
@@ -616,30 +787,29 @@ class WebhookService:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    subscription.url,
-                    data=payload_json,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.delivery_timeout),
-                ) as response:
-                    delivery.response_status = response.status
-                    
-                    if 200 <= response.status < 300:
-                        delivery.status = WebhookStatus.DELIVERED
-                        delivery.delivered_at = datetime.now(timezone.utc)
-                        
-                        logger.info(
-                            "webhook_delivered",
-                            delivery_id=delivery.id,
-                            subscription_id=subscription.id,
-                            status=response.status,
-                        )
-                        
-                        return True
-                    else:
-                        delivery.last_error = f"HTTP {response.status}"
-                        
+            status = await self._engine.post(
+                subscription.url,
+                payload_json,
+                headers,
+                timeout=self.delivery_timeout,
+            )
+            delivery.response_status = status
+            
+            if 200 <= status < 300:
+                delivery.status = WebhookStatus.DELIVERED
+                delivery.delivered_at = datetime.now(timezone.utc)
+                
+                logger.info(
+                    "webhook_delivered",
+                    delivery_id=delivery.id,
+                    subscription_id=subscription.id,
+                    status=status,
+                )
+                
+                return True
+            else:
+                delivery.last_error = f"HTTP {status}"
+                
         except asyncio.TimeoutError:
             delivery.last_error = "Request timeout"
         except aiohttp.ClientError as e:
@@ -651,7 +821,7 @@ class WebhookService:
         if delivery.can_retry:
             delivery.status = WebhookStatus.RETRYING
             delivery.next_retry_at = delivery.calculate_next_retry()
-            self._pending_retries.append(delivery)
+            self._pending_retries.schedule(delivery)
             
             logger.warning(
                 "webhook_delivery_failed_will_retry",
@@ -673,44 +843,62 @@ class WebhookService:
         
         return False
     
+    async def deliver_many(self, deliveries: list[WebhookDelivery]) -> list[bool]:
+        """Deliver webhooks concurrently.
+        
+        Fan-out shares the pooled session, bounded per destination host.
+        
+        Args:
+            deliveries: Deliveries to send.
+            
+        Returns:
+            Success flag per delivery, in input order.
+        """
+        if not deliveries:
+            return []
+        async with self._engine.session_scope():
+            return list(await asyncio.gather(*(self._deliver(d) for d in deliveries)))
+    
     def deliver_sync(self, delivery: WebhookDelivery) -> bool:
         """Synchronous wrapper for deliver.
         
+        Runs on the engine's persistent event loop rather than creating
+        a loop per call.
+        
         Args:
             delivery: Delivery to send.
             
         Returns:
             True if delivery was successful.
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return self._engine.run(self.deliver(delivery))
+    
+    def deliver_many_sync(self, deliveries: list[WebhookDelivery]) -> list[bool]:
+        """Synchronous wrapper for deliver_many.
         
-        return loop.run_until_complete(self.deliver(delivery))
+        Args:
+            deliveries: Deliveries to send.
+            
+        Returns:
+            Success flag per delivery, in input order.
+        """
+        if not deliveries:
+            return []
+        return self._engine.run(self.deliver_many(deliveries))
     
     async def process_pending_retries(self) -> int:
-        """Process pending retries.
+        """Process pending retries that are due, concurrently.
         
         Returns:
             Number of deliveries processed.
         """
-        now = datetime.now(timezone.utc)
-        processed = 0
-        
-        # Get deliveries ready for retry
-        ready = [
-            d for d in self._pending_retries
-            if d.next_retry_at and d.next_retry_at <= now
-        ]
-        
-        for delivery in ready:
-            self._pending_retries.remove(delivery)
-            await self.deliver(delivery)
-            processed += 1
-        
-        return processed
+        ready = self._pending_retries.pop_ready(datetime.now(timezone.utc))
+        await self.deliver_many(ready)
+        return len(ready)
+    
+    def close(self) -> None:
+        """Release pooled connections held by the delivery engine."""
+        self._engine.close()
     
     def _sign_payload(self, payload: str, secret: str) -> str:
         """Sign a payload with HMAC-SHA256.
@@ -771,6 +959,7 @@ class WebhookService:
         for delivery in self._dead_letter_queue:
             if delivery.id == delivery_id:
                 self._dead_letter_queue.remove(delivery)
+                self._pending_retries.cancel(delivery.id)
                 delivery.status = WebhookStatus.PENDING
                 delivery.attempts = 0
                 delivery.last_error = None
@@ -808,6 +997,7 @@ class WebhookService:
             "pending_retries": len(self._pending_retries),
             "subscriptions": len(self._subscriptions),
             "active_subscriptions": len([s for s in self._subscriptions.values() if s.is_active]),
+            "latency": self._engine.metrics.to_dict(),
         }
     
     def get_delivery(self, delivery_id: str) -> Optional[WebhookDelivery]:
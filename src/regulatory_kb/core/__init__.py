@@ -1,6 +1,16 @@
 """Core utilities and frameworks for the regulatory knowledge base."""
 
-from regulatory_kb.core.logging import get_logger, configure_logging
+from regulatory_kb.core.logging import (
+    get_logger,
+    configure_logging,
+    LatencyHistogram,
+    Span,
+    TimingRegistry,
+    get_timing_registry,
+    span,
+    span_scope,
+    timed,
+)
 from regulatory_kb.core.errors import (
     RegulatoryKBError,
     DocumentRetrievalError,
@@ -24,12 +34,31 @@ from regulatory_kb.core.resilience import (
     get_circuit_registry,
     with_retry,
     with_circuit_breaker,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitConfig,
+    ConcurrencyLimitError,
+    Bulkhead,
+    BulkheadConfig,
+    BulkheadRegistry,
+    HedgeConfig,
+    HedgedRequest,
+    get_bulkhead_registry,
+    with_bulkhead,
+    with_concurrency_limit,
+    with_hedging,
 )
 
 __all__ = [
     # Logging
     "get_logger",
     "configure_logging",
+    "LatencyHistogram",
+    "Span",
+    "TimingRegistry",
+    "get_timing_registry",
+    "span",
+    "span_scope",
+    "timed",
     # Errors
     "RegulatoryKBError",
     "DocumentRetrievalError",
@@ -52,4 +81,16 @@ __all__ = [
     "get_circuit_registry",
     "with_retry",
     "with_circuit_breaker",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimitConfig",
+    "ConcurrencyLimitError",
+    "Bulkhead",
+    "BulkheadConfig",
+    "BulkheadRegistry",
+    "HedgeConfig",
+    "HedgedRequest",
+    "get_bulkhead_registry",
+    "with_bulkhead",
+    "with_concurrency_limit",
+    "with_hedging",
 ]
@@ -0,0 +1,90 @@
+"""Deferred imports for Lambda cold-start reduction.
+
+Provides:
+- lazy_exports: PEP 562 ``__getattr__`` for packages that re-export names
+  from submodules, so ``from regulatory_kb.api import AuthService`` only
+  imports ``regulatory_kb.api.auth``
+- lazy_import: module proxy for heavy third-party dependencies that are
+  only needed on some code paths
+"""
+
+import importlib
+import threading
+import types
+from typing import Any, Callable, Iterable
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, Iterable[str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package's re-exports.
+
+    A re-exported name's submodule is only imported the first time the
+    name is accessed, and the value is then cached on the package. Handler
+    cold starts therefore pay only for the submodules a handler actually
+    uses, not for everything its packages re-export.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Mapping of submodule name to the names it exports.
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package module.
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Get a proxy for a module that is imported on first use.
+
+    Args:
+        name: Fully qualified module name.
+
+    Returns:
+        Module proxy.
+    """
+    return LazyModule(name)
@@ -1,11 +1,27 @@
-"""Structured logging configuration for the regulatory knowledge base."""
+"""Structured logging configuration for the regulatory knowledge base.
 
+Also provides timing spans: ``span`` and ``timed`` measure a block or
+function, bind its duration into structlog context inside ``span_scope``
+and aggregate durations into log-linear histograms that export as
+Prometheus text or CloudWatch Embedded Metric Format (EMF).
+"""
+
+import functools
+import json
 import logging
+import os
+import re
 import sys
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
 import structlog
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def configure_logging(
     level: str = "INFO",
@@ -75,3 +91,415 @@ def get_logger(name: str) -> structlog.BoundLogger:
         Configured structlog logger
     """
     return structlog.get_logger(name)
+
+
+# ==================== Timing Spans and Histograms ====================
+
+# Prometheus histogram bucket bounds in seconds
+DEFAULT_PROMETHEUS_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# EMF accepts at most 100 distinct values per metric
+EMF_MAX_VALUES = 100
+
+_PROMETHEUS_NAME = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+class LatencyHistogram:
+    """HDR-style histogram of durations with bounded relative error.
+
+    Durations are recorded in integer microseconds. Values below
+    2**precision_bits are counted exactly; above that each power-of-two
+    range is split into 2**(precision_bits - 1) buckets, so a bucket's
+    width is under 2**(1 - precision_bits) of its value (< 1.6% at the
+    default 7 bits). Buckets are stored sparsely.
+    """
+
+    def __init__(self, precision_bits: int = 7):
+        """Initialize the histogram.
+
+        Args:
+            precision_bits: Bits of value kept per bucket; higher values
+                give finer buckets.
+        """
+        if precision_bits < 2:
+            raise ValueError("precision_bits must be at least 2")
+        self.precision_bits = precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.precision_bits
+        if shift <= 0:
+            return value
+        return (shift + 1) * self._half + (value >> shift) - self._half
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Lowest and highest microsecond values counted in a bucket."""
+        if index < 2 * self._half:
+            return index, index
+        shift = index // self._half - 1
+        mantissa = index % self._half + self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts to this one."""
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        for value in (other.min_us, other.max_us):
+            if value is not None:
+                self.min_us = value if self.min_us is None else min(self.min_us, value)
+                self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """Get non-empty buckets as (low_us, high_us, count), lowest first."""
+        return [(*self._bounds(index), self._counts[index]) for index in sorted(self._counts)]
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get a duration percentile in seconds.
+
+        Args:
+            pct: Percentile between 0 and 100.
+
+        Returns:
+            Highest value of the bucket holding the percentile, capped at
+            the recorded maximum, or None if nothing was recorded.
+        """
+        if not self.count:
+            return None
+        rank = max(1, -(-pct * self.count // 100))
+        seen = 0
+        for _, high, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(high, self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def cumulative_counts(self, bounds: tuple[float, ...]) -> list[int]:
+        """Get the count of durations at or below each bound in seconds.
+
+        A bucket is counted under a bound when its lowest value is, so
+        counts near a bound are accurate to the bucket width.
+        """
+        buckets = self.buckets()
+        counts = []
+        for bound in bounds:
+            limit = bound * 1_000_000
+            counts.append(sum(count for low, _, count in buckets if low <= limit))
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert summary statistics to a dictionary in milliseconds."""
+
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return round(seconds * 1000, 3) if seconds is not None else None
+
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_us / 1000, 3),
+            "min_ms": ms(self.min_us / 1_000_000 if self.min_us is not None else None),
+            "p50_ms": ms(self.percentile(50)),
+            "p90_ms": ms(self.percentile(90)),
+            "p99_ms": ms(self.percentile(99)),
+            "max_ms": ms(self.max_us / 1_000_000 if self.max_us is not None else None),
+        }
+
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class TimingRegistry:
+    """Thread-safe registry of latency histograms keyed by name and labels."""
+
+    def __init__(self, enabled: Optional[bool] = None, precision_bits: int = 7):
+        """Initialize the registry.
+
+        Args:
+            enabled: Whether spans record durations. Defaults to the
+                TIMING_ENABLED environment variable, or True.
+            precision_bits: Histogram precision (see LatencyHistogram).
+        """
+        if enabled is None:
+            enabled = os.environ.get("TIMING_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.enabled = enabled
+        self.precision_bits = precision_bits
+        self._series: dict[SeriesKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, **labels: Any) -> None:
+        """Record a duration for a metric.
+
+        Args:
+            name: Metric name.
+            seconds: Duration in seconds.
+            **labels: Label values identifying the series.
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = LatencyHistogram(self.precision_bits)
+            histogram.record(seconds)
+
+    def histogram(self, name: str, **labels: Any) -> Optional[LatencyHistogram]:
+        """Get the histogram of a series, if any durations were recorded."""
+        return self._series.get((name, tuple(sorted((k, str(v)) for k, v in labels.items()))))
+
+    def reset(self) -> None:
+        """Discard all recorded durations."""
+        with self._lock:
+            self._series.clear()
+
+    def _items(self) -> list[tuple[SeriesKey, LatencyHistogram]]:
+        with self._lock:
+            return sorted(self._series.items(), key=lambda item: item[0])
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Get summary statistics of every series."""
+        return [
+            {"name": name, "labels": dict(labels), **histogram.to_dict()}
+            for (name, labels), histogram in self._items()
+        ]
+
+    def export_prometheus(
+        self,
+        prefix: str = "",
+        buckets: tuple[float, ...] = DEFAULT_PROMETHEUS_BUCKETS,
+    ) -> str:
+        """Export every series as Prometheus text exposition histograms.
+
+        Args:
+            prefix: Prefix for metric names, e.g. "regulatory_kb_".
+            buckets: Upper bounds of the exported buckets in seconds.
+
+        Returns:
+            Text with one ``<name>_seconds`` histogram family per metric.
+        """
+        lines: list[str] = []
+        family = None
+        for (name, labels), histogram in self._items():
+            metric = _PROMETHEUS_NAME.sub("_", f"{prefix}{name}_seconds")
+            if metric != family:
+                family = metric
+                lines.append(f"# HELP {metric} Duration of {name} in seconds.")
+                lines.append(f"# TYPE {metric} histogram")
+            label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+            sep = "," if label_text else ""
+            for bound, count in zip(buckets, histogram.cumulative_counts(buckets)):
+                lines.append(f'{metric}_bucket{{{label_text}{sep}le="{bound:g}"}} {count}')
+            lines.append(f'{metric}_bucket{{{label_text}{sep}le="+Inf"}} {histogram.count}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{metric}_sum{suffix} {histogram.total_us / 1_000_000:.6f}")
+            lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def export_emf(self, namespace: str, timestamp_ms: Optional[int] = None) -> list[dict[str, Any]]:
+        """Export every series as CloudWatch Embedded Metric Format documents.
+
+        Each series becomes one document whose labels are its dimensions
+        and whose durations are Values/Counts arrays in milliseconds.
+
+        Args:
+            namespace: CloudWatch metric namespace.
+            timestamp_ms: Metric timestamp. Defaults to now.
+
+        Returns:
+            List of EMF documents, one per series.
+        """
+        timestamp_ms = timestamp_ms if timestamp_ms is not None else int(time.time() * 1000)
+        documents = []
+        for (name, labels), histogram in self._items():
+            values, counts = _emf_values(histogram)
+            documents.append({
+                "_aws": {
+                    "Timestamp": timestamp_ms,
+                    "CloudWatchMetrics": [{
+                        "Namespace": namespace,
+                        "Dimensions": [[k for k, _ in labels]],
+                        "Metrics": [{"Name": name, "Unit": "Milliseconds"}],
+                    }],
+                },
+                **dict(labels),
+                name: {"Values": values, "Counts": counts},
+            })
+        return documents
+
+    def emit_emf(self, namespace: str, reset: bool = True) -> int:
+        """Write EMF documents to stdout for CloudWatch Logs to ingest.
+
+        Args:
+            namespace: CloudWatch metric namespace.
+            reset: Discard recorded durations afterwards, so each emit
+                covers only the durations since the previous one.
+
+        Returns:
+            Number of documents written.
+        """
+        documents = self.export_emf(namespace)
+        for document in documents:
+            sys.stdout.write(json.dumps(document) + "\n")
+        sys.stdout.flush()
+        if reset:
+            self.reset()
+        return len(documents)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _emf_values(histogram: LatencyHistogram) -> tuple[list[float], list[int]]:
+    """Get bucket midpoints in milliseconds with their counts.
+
+    Adjacent buckets are merged into count-weighted means when there are
+    more than EMF_MAX_VALUES.
+    """
+    buckets = [((low + high) / 2000, count) for low, high, count in histogram.buckets()]
+    group = -(-len(buckets) // EMF_MAX_VALUES)
+    values, counts = [], []
+    for start in range(0, len(buckets), group):
+        chunk = buckets[start:start + group]
+        total = sum(count for _, count in chunk)
+        values.append(round(sum(value * count for value, count in chunk) / total, 3))
+        counts.append(total)
+    return values, counts
+
+
+_timing_registry = TimingRegistry()
+
+# Context keys bound by spans in the current span_scope, or None outside one
+_scope_keys: ContextVar[Optional[list[str]]] = ContextVar("span_scope_keys", default=None)
+
+
+def get_timing_registry() -> TimingRegistry:
+    """Get the global timing registry."""
+    return _timing_registry
+
+
+class Span:
+    """Times a block and records its duration on exit.
+
+    The block is always timed; recording into the registry and binding
+    ``<name>[_<label values>]_ms`` into structlog context only happen when
+    the registry is enabled, and binding only inside ``span_scope``.
+    """
+
+    __slots__ = ("name", "labels", "registry", "started", "duration")
+
+    def __init__(self, name: str, registry: Optional[TimingRegistry] = None, **labels: Any):
+        """Initialize the span.
+
+        Args:
+            name: Metric name.
+            registry: Registry to record into. Defaults to the global one.
+            **labels: Label values identifying the series.
+        """
+        self.name = name
+        self.labels = labels
+        self.registry = registry or _timing_registry
+        self.started = 0.0
+        self.duration: Optional[float] = None
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the span started, or its duration once ended."""
+        seconds = self.duration if self.duration is not None else time.perf_counter() - self.started
+        return round(seconds * 1000, 3)
+
+    @property
+    def context_key(self) -> str:
+        """structlog context key the duration is bound under."""
+        return "_".join([self.name, *(str(v) for v in self.labels.values())]) + "_ms"
+
+    def __enter__(self) -> "Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration = time.perf_counter() - self.started
+        if not self.registry.enabled:
+            return
+        self.registry.record(self.name, self.duration, **self.labels)
+        keys = _scope_keys.get()
+        if keys is not None:
+            key = self.context_key
+            structlog.contextvars.bind_contextvars(**{key: self.elapsed_ms})
+            keys.append(key)
+
+
+def span(name: str, **labels: Any) -> Span:
+    """Time a block as a span recorded in the global registry.
+
+    Example:
+        with span("upload_stage", stage="parsing") as timing:
+            parsed = parser.parse(content, doc_format)
+        logger.info("document_parsed", duration_ms=timing.elapsed_ms)
+
+    Args:
+        name: Metric name.
+        **labels: Label values identifying the series.
+
+    Returns:
+        Span context manager.
+    """
+    return Span(name, **labels)
+
+
+def timed(name: Optional[str] = None, **labels: Any) -> Callable[[F], F]:
+    """Decorator that times each call of a function as a span.
+
+    Args:
+        name: Metric name. Defaults to the function name.
+        **labels: Label values identifying the series.
+    """
+
+    def decorator(func: F) -> F:
+        metric = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _timing_registry.enabled:
+                return func(*args, **kwargs)
+            with Span(metric, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def span_scope() -> Iterator[None]:
+    """Bind span durations into structlog context for the enclosed block.
+
+    Log events inside the block carry the durations of spans that have
+    already finished in it; the bindings are removed on exit so they do
+    not leak into later work on the same thread or task.
+    """
+    token = _scope_keys.set([])
+    try:
+        yield
+    finally:
+        keys = _scope_keys.get()
+        if keys:
+            structlog.contextvars.unbind_contextvars(*keys)
+        _scope_keys.reset(token)
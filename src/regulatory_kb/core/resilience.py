@@ -5,12 +5,19 @@ Implements comprehensive error handling across all components:
 - Circuit breakers for external dependencies
 - Error logging and categorization system
 - Fallback mechanisms for service failures
+- Adaptive concurrency limits and named bulkheads that bound in-flight calls
+- Hedged requests that cut tail latency of idempotent reads
 """
 
 import asyncio
+import concurrent.futures
 import functools
+import os
 import random
+import threading
 import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -676,3 +683,588 @@ def with_circuit_breaker(
         return wrapper
 
     return decorator
+
+
+@dataclass
+class ConcurrencyLimitConfig:
+    """Configuration for the adaptive concurrency limiter.
+
+    The limit follows AIMD: it grows by about one per limit-sized window of
+    calls that complete within the latency threshold, and shrinks by
+    ``backoff_ratio`` when a call is slower than the threshold or fails
+    with an overload error. The threshold is ``target_latency`` if set,
+    otherwise ``latency_tolerance`` times a slowly moving latency baseline.
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    backoff_ratio: float = 0.9
+    latency_tolerance: float = 2.0
+    target_latency: Optional[float] = None
+    smoothing: float = 0.01
+
+
+@dataclass
+class BulkheadConfig:
+    """Configuration for a bulkhead."""
+
+    max_concurrent: int = 10
+    max_wait: float = 0.0
+    adaptive: bool = False
+    min_concurrent: int = 1
+    target_latency: Optional[float] = None
+
+
+@dataclass
+class HedgeConfig:
+    """Configuration for hedged requests."""
+
+    delay: Optional[float] = None  # Fixed hedge delay; else the latency percentile
+    percentile: float = 0.95
+    initial_delay: float = 0.5  # Used until min_samples latencies are observed
+    min_samples: int = 20
+    max_hedges: int = 1
+    window: int = 1000
+
+
+class ConcurrencyLimitError(RegulatoryKBError):
+    """Error raised when a concurrency limit or bulkhead is full."""
+
+    def __init__(self, message: str, name: Optional[str] = None):
+        super().__init__(message, error_code="CONCURRENCY_LIMIT", details={"name": name})
+
+
+def _wake(future: "asyncio.Future") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits in-flight calls, adapting the limit to observed latency.
+
+    Thread-safe; sync callers wait on a condition and async callers on a
+    future of their own event loop, so one limiter can bound a dependency
+    shared by threads and coroutines.
+    """
+
+    def __init__(self, name: str, config: Optional[ConcurrencyLimitConfig] = None):
+        """Initialize the limiter.
+
+        Args:
+            name: Limiter name (for logging and errors).
+            config: Limiter configuration.
+        """
+        self.name = name
+        self.config = config or ConcurrencyLimitConfig()
+        self._limit = float(
+            min(self.config.max_limit, max(self.config.min_limit, self.config.initial_limit))
+        )
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: deque = deque()
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.config.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free, without waiting."""
+        with self._lock:
+            return self._try_acquire_locked()
+
+    def _try_acquire_locked(self) -> bool:
+        if self._in_flight < self.limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def _reject_locked(self) -> None:
+        self.rejected += 1
+        logger.warning(
+            "concurrency_limit_exceeded",
+            limiter=self.name,
+            limit=self.limit,
+            in_flight=self._in_flight,
+        )
+        raise ConcurrencyLimitError(
+            f"Concurrency limit {self.limit} reached for {self.name}", name=self.name
+        )
+
+    def acquire(self, timeout: float = 0.0) -> None:
+        """Take a slot, waiting up to timeout seconds for one.
+
+        Raises:
+            ConcurrencyLimitError: If no slot frees up in time.
+        """
+        deadline = time.monotonic() + timeout
+        with self._available:
+            while not self._try_acquire_locked():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._reject_locked()
+                self._available.wait(remaining)
+
+    async def acquire_async(self, timeout: float = 0.0) -> None:
+        """Take a slot from a coroutine, waiting up to timeout seconds.
+
+        Raises:
+            ConcurrencyLimitError: If no slot frees up in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._try_acquire_locked():
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._reject_locked()
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """Return a slot and adapt the limit.
+
+        Args:
+            latency: Seconds the call took, if it should be sampled.
+            overloaded: Whether the call failed in a way that signals
+                overload (timeout, throttling, connection errors).
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._adapt(latency, overloaded)
+            self._available.notify()
+            if self._async_waiters:
+                loop, future = self._async_waiters.popleft()
+                loop.call_soon_threadsafe(_wake, future)
+
+    def _adapt(self, latency: Optional[float], overloaded: bool) -> None:
+        config = self.config
+        congested = overloaded
+        if latency is not None:
+            if self._baseline is None:
+                self._baseline = latency
+            threshold = config.target_latency or self._baseline * config.latency_tolerance
+            congested = congested or latency > threshold
+            self._baseline += config.smoothing * (latency - self._baseline)
+
+        previous = self.limit
+        if congested:
+            self._limit = max(float(config.min_limit), self._limit * config.backoff_ratio)
+        elif self._in_flight + 1 >= self._limit / 2:
+            # Only grow while the limit is actually being used
+            self._limit = min(float(config.max_limit), self._limit + 1 / self._limit)
+
+        if self.limit != previous:
+            logger.debug("concurrency_limit_changed", limiter=self.name, limit=self.limit)
+
+    @contextmanager
+    def slot(self, timeout: float = 0.0):
+        """Hold a slot for the duration of a with block, sampling its latency."""
+        self.acquire(timeout)
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except Exception as e:
+            overloaded = ErrorCategorizer.is_retryable(e)
+            raise
+        finally:
+            self.release(time.monotonic() - started, overloaded)
+
+    @asynccontextmanager
+    async def slot_async(self, timeout: float = 0.0):
+        """Hold a slot for the duration of an async with block."""
+        await self.acquire_async(timeout)
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except Exception as e:
+            overloaded = ErrorCategorizer.is_retryable(e)
+            raise
+        finally:
+            self.release(time.monotonic() - started, overloaded)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limiter counters."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "rejected": self.rejected,
+            "baseline_latency": self._baseline,
+        }
+
+
+class Bulkhead:
+    """Named pool of call slots isolating one dependency from the others.
+
+    A slow dependency can only occupy its own bulkhead's slots; further
+    calls wait up to ``max_wait`` and then fail fast instead of tying up
+    workers that other dependencies need.
+    """
+
+    def __init__(self, name: str, config: Optional[BulkheadConfig] = None):
+        """Initialize the bulkhead.
+
+        Args:
+            name: Bulkhead name (e.g. "bedrock").
+            config: Bulkhead configuration.
+        """
+        self.name = name
+        self.config = config or BulkheadConfig()
+        minimum = self.config.min_concurrent if self.config.adaptive else self.config.max_concurrent
+        self.limiter = AdaptiveConcurrencyLimiter(
+            name,
+            ConcurrencyLimitConfig(
+                initial_limit=self.config.max_concurrent,
+                min_limit=min(minimum, self.config.max_concurrent),
+                max_limit=self.config.max_concurrent,
+                target_latency=self.config.target_latency,
+            ),
+        )
+
+    async def execute(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Execute an async function in the bulkhead.
+
+        Raises:
+            ConcurrencyLimitError: If the bulkhead stays full for max_wait.
+        """
+        async with self.limiter.slot_async(self.config.max_wait):
+            return await func(*args, **kwargs)
+
+    def execute_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Execute a sync function in the bulkhead.
+
+        Raises:
+            ConcurrencyLimitError: If the bulkhead stays full for max_wait.
+        """
+        with self.limiter.slot(self.config.max_wait):
+            return func(*args, **kwargs)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bulkhead counters."""
+        return self.limiter.get_stats()
+
+
+# Bulkheads for the external dependencies, overridable per name with
+# BULKHEAD_<NAME>_MAX_CONCURRENT. Bedrock's latency grows with output
+# length rather than load, so it would read as congestion; its limit is fixed.
+DEFAULT_BULKHEADS = {
+    "bedrock": BulkheadConfig(max_concurrent=8, max_wait=1.0),
+    "falkordb": BulkheadConfig(max_concurrent=32, max_wait=2.0),
+    "s3": BulkheadConfig(max_concurrent=32, max_wait=5.0),
+    "regulator_websites": BulkheadConfig(max_concurrent=8, max_wait=30.0, adaptive=True),
+}
+
+
+class BulkheadRegistry:
+    """Registry for managing named bulkheads."""
+
+    def __init__(self):
+        self._bulkheads: dict[str, Bulkhead] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self,
+        name: str,
+        config: Optional[BulkheadConfig] = None,
+    ) -> Bulkhead:
+        """Get or create a bulkhead.
+
+        Args:
+            name: Bulkhead name.
+            config: Optional configuration; defaults to DEFAULT_BULKHEADS.
+
+        Returns:
+            Bulkhead instance.
+        """
+        with self._lock:
+            if name not in self._bulkheads:
+                self._bulkheads[name] = Bulkhead(name, config or self._default_config(name))
+            return self._bulkheads[name]
+
+    @staticmethod
+    def _default_config(name: str) -> BulkheadConfig:
+        config = DEFAULT_BULKHEADS.get(name, BulkheadConfig())
+        override = os.environ.get(f"BULKHEAD_{name.upper()}_MAX_CONCURRENT")
+        if override:
+            config = BulkheadConfig(**{**config.__dict__, "max_concurrent": int(override)})
+        return config
+
+    def get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Get counters of all bulkheads."""
+        return {name: bulkhead.get_stats() for name, bulkhead in self._bulkheads.items()}
+
+
+# Global bulkhead registry
+_bulkhead_registry = BulkheadRegistry()
+
+
+def get_bulkhead_registry() -> BulkheadRegistry:
+    """Get the global bulkhead registry."""
+    return _bulkhead_registry
+
+
+class HedgedRequest:
+    """Issues backup attempts for slow idempotent calls.
+
+    If an attempt has not completed after the hedge delay (by default the
+    observed p95 latency), another is started and the first successful
+    result wins. Only use for idempotent reads. Losing async attempts are
+    cancelled; losing sync attempts run to completion in the executor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[HedgeConfig] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        """Initialize the hedger.
+
+        Args:
+            name: Name for logging.
+            config: Hedge configuration.
+            executor: Executor for sync attempts. Creates one if not provided.
+        """
+        self.name = name
+        self.config = config or HedgeConfig()
+        self._executor = executor
+        self._latencies: deque[float] = deque(maxlen=self.config.window)
+        self._delay: Optional[float] = None
+        self._since_update = 0
+        self._lock = threading.Lock()
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait before starting a backup attempt."""
+        if self.config.delay is not None:
+            return self.config.delay
+        with self._lock:
+            if len(self._latencies) < self.config.min_samples:
+                return self.config.initial_delay
+            if self._delay is None or self._since_update >= max(1, self.config.window // 20):
+                ordered = sorted(self._latencies)
+                index = min(len(ordered) - 1, int(self.config.percentile * len(ordered)))
+                self._delay = ordered[index]
+                self._since_update = 0
+            return self._delay
+
+    def record_latency(self, latency: float) -> None:
+        """Record the latency of a successful attempt."""
+        with self._lock:
+            self._latencies.append(latency)
+            self._since_update += 1
+
+    async def execute(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Execute an async idempotent call with hedging.
+
+        Returns:
+            Result of the first successful attempt.
+
+        Raises:
+            The last attempt's exception if every attempt fails.
+        """
+        async def attempt():
+            started = time.monotonic()
+            result = await func(*args, **kwargs)
+            self.record_latency(time.monotonic() - started)
+            return result
+
+        delay = self.hedge_delay()
+        attempts = [asyncio.ensure_future(attempt())]
+        pending = set(attempts)
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                can_hedge = len(attempts) <= self.config.max_hedges
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self._hedge_started(delay)
+                    task = asyncio.ensure_future(attempt())
+                    attempts.append(task)
+                    pending.add(task)
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        if task is not attempts[0]:
+                            self.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise last_error  # type: ignore[misc]
+
+    def execute_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Execute a sync idempotent call with hedging.
+
+        Returns:
+            Result of the first successful attempt.
+
+        Raises:
+            The last attempt's exception if every attempt fails.
+        """
+        def attempt():
+            started = time.monotonic()
+            result = func(*args, **kwargs)
+            self.record_latency(time.monotonic() - started)
+            return result
+
+        executor = self._get_executor()
+        delay = self.hedge_delay()
+        attempts = [executor.submit(attempt)]
+        pending = set(attempts)
+        last_error: Optional[BaseException] = None
+        while pending:
+            can_hedge = len(attempts) <= self.config.max_hedges
+            done, pending = concurrent.futures.wait(
+                pending,
+                timeout=delay if can_hedge else None,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if not done:
+                self._hedge_started(delay)
+                future = executor.submit(attempt)
+                attempts.append(future)
+                pending.add(future)
+                continue
+            for future in done:
+                if future.exception() is None:
+                    if future is not attempts[0]:
+                        self.hedge_wins += 1
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                last_error = future.exception()
+        raise last_error  # type: ignore[misc]
+
+    def _hedge_started(self, delay: float) -> None:
+        self.hedges += 1
+        logger.debug("hedged_request_started", name=self.name, delay=delay)
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix=f"hedge-{self.name}"
+                )
+            return self._executor
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hedging counters."""
+        return {
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "delay": self.hedge_delay(),
+        }
+
+
+def with_bulkhead(
+    name: str,
+    config: Optional[BulkheadConfig] = None,
+):
+    """Decorator for running sync or async functions in a named bulkhead.
+
+    Args:
+        name: Bulkhead name.
+        config: Bulkhead configuration (defaults to DEFAULT_BULKHEADS).
+    """
+    def decorator(func: Callable) -> Callable:
+        bulkhead = get_bulkhead_registry().get_or_create(name, config)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await bulkhead.execute(func, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return bulkhead.execute_sync(func, *args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def with_concurrency_limit(
+    limiter: AdaptiveConcurrencyLimiter,
+    max_wait: float = 0.0,
+):
+    """Decorator for bounding sync or async functions by a limiter.
+
+    Args:
+        limiter: Limiter to take slots from.
+        max_wait: Seconds to wait for a slot before failing.
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                async with limiter.slot_async(max_wait):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with limiter.slot(max_wait):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def with_hedging(
+    config: Optional[HedgeConfig] = None,
+    name: Optional[str] = None,
+):
+    """Decorator for hedging sync or async idempotent reads.
+
+    Apply outside ``with_bulkhead`` so backup attempts also take bulkhead
+    slots.
+
+    Args:
+        config: Hedge configuration.
+        name: Name for logging (defaults to the function name).
+    """
+    def decorator(func: Callable) -> Callable:
+        hedger = HedgedRequest(name or func.__qualname__, config)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await hedger.execute(func, *args, **kwargs)
+            async_wrapper.hedger = hedger
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return hedger.execute_sync(func, *args, **kwargs)
+        wrapper.hedger = hedger
+        return wrapper
+
+    return decorator
@@ -8,21 +8,26 @@ Implements Requirements 11.3-11.7:
 - Weekly status reports and escalated alerts
 """
 
-from regulatory_kb.monitoring.update_monitor import (
-    UpdateMonitor,
-    MonitorConfig,
-    DocumentChange,
-    ChangeType,
-    FeedMonitor,
-    FeedEntry,
-)
-from regulatory_kb.monitoring.reporting import (
-    ReportingService,
-    ReportConfig,
-    StatusReport,
-    AlertLevel,
-    Alert,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.monitoring.update_monitor import (
+        UpdateMonitor,
+        MonitorConfig,
+        DocumentChange,
+        ChangeType,
+        FeedMonitor,
+        FeedEntry,
+    )
+    from regulatory_kb.monitoring.reporting import (
+        ReportingService,
+        ReportConfig,
+        StatusReport,
+        AlertLevel,
+        Alert,
+    )
 
 __all__ = [
     "UpdateMonitor",
@@ -37,3 +42,24 @@ __all__ = [
     "AlertLevel",
     "Alert",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.monitoring.update_monitor": (
+            "UpdateMonitor",
+            "MonitorConfig",
+            "DocumentChange",
+            "ChangeType",
+            "FeedMonitor",
+            "FeedEntry",
+        ),
+        "regulatory_kb.monitoring.reporting": (
+            "ReportingService",
+            "ReportConfig",
+            "StatusReport",
+            "AlertLevel",
+            "Alert",
+        ),
+    },
+)
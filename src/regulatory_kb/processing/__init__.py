@@ -1,44 +1,63 @@
 """Document processing module for parsing, metadata extraction, and validation."""
 
-from regulatory_kb.processing.parser import (
-    DocumentParser,
-    DocumentFormat,
-    ParsedDocument,
-    ParsedSection,
-    ParsedTable,
-)
-from regulatory_kb.processing.metadata import (
-    MetadataExtractor,
-    ExtractedMetadata,
-    RegulatorType,
-)
-from regulatory_kb.processing.validation import (
-    ContentValidator,
-    ValidationResult,
-    ValidationIssue,
-    ValidationSeverity,
-    ValidationCategory,
-    ReferentialIntegrityChecker,
-)
-from regulatory_kb.processing.quality import (
-    DocumentQuarantine,
-    QuarantinedDocument,
-    QuarantineReason,
-    DocumentStatus,
-    QualityScorer,
-    QualityScore,
-    GraphIntegrityChecker,
-    IntegrityIssue,
-    DataConsistencyValidator,
-    ManualReviewQueue,
-)
-from regulatory_kb.processing.chunker import (
-    DocumentChunker,
-    DocumentChunk,
-    ChunkType,
-    ChunkerConfig,
-    ChunkContext,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.processing.parser import (
+        DocumentParser,
+        DocumentFormat,
+        ParsedDocument,
+        ParsedSection,
+        ParsedTable,
+    )
+    from regulatory_kb.processing.metadata import (
+        MetadataExtractor,
+        ExtractedMetadata,
+        RegulatorType,
+    )
+    from regulatory_kb.processing.validation import (
+        ContentValidator,
+        ValidationResult,
+        ValidationIssue,
+        ValidationSeverity,
+        ValidationCategory,
+        ReferentialIntegrityChecker,
+        RulePlan,
+        TextScan,
+        ValidationTask,
+    )
+    from regulatory_kb.processing.quality import (
+        DocumentQuarantine,
+        QuarantinedDocument,
+        QuarantineReason,
+        DocumentStatus,
+        QualityScorer,
+        QualityScore,
+        GraphIntegrityChecker,
+        IntegrityIssue,
+        DataConsistencyValidator,
+        ManualReviewQueue,
+        BloomFilter,
+        s3_document_ids,
+        graph_document_ids,
+    )
+    from regulatory_kb.processing.chunker import (
+        DocumentChunker,
+        DocumentChunk,
+        ChunkType,
+        ChunkerConfig,
+        ChunkContext,
+    )
+    from regulatory_kb.processing.tokenizer import (
+        Tokenizer,
+        CharacterTokenizer,
+        BPETokenizer,
+        TiktokenTokenizer,
+        CachedTokenizer,
+        tokenizer_from_env,
+    )
 
 __all__ = [
     # Parser
@@ -58,6 +77,9 @@ __all__ = [
     "ValidationSeverity",
     "ValidationCategory",
     "ReferentialIntegrityChecker",
+    "RulePlan",
+    "TextScan",
+    "ValidationTask",
     # Quality
     "DocumentQuarantine",
     "QuarantinedDocument",
@@ -69,10 +91,79 @@ __all__ = [
     "IntegrityIssue",
     "DataConsistencyValidator",
     "ManualReviewQueue",
+    "BloomFilter",
+    "s3_document_ids",
+    "graph_document_ids",
     # Chunker
     "DocumentChunker",
     "DocumentChunk",
     "ChunkType",
     "ChunkerConfig",
     "ChunkContext",
+    # Tokenizer
+    "Tokenizer",
+    "CharacterTokenizer",
+    "BPETokenizer",
+    "TiktokenTokenizer",
+    "CachedTokenizer",
+    "tokenizer_from_env",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.processing.parser": (
+            "DocumentParser",
+            "DocumentFormat",
+            "ParsedDocument",
+            "ParsedSection",
+            "ParsedTable",
+        ),
+        "regulatory_kb.processing.metadata": (
+            "MetadataExtractor",
+            "ExtractedMetadata",
+            "RegulatorType",
+        ),
+        "regulatory_kb.processing.validation": (
+            "ContentValidator",
+            "ValidationResult",
+            "ValidationIssue",
+            "ValidationSeverity",
+            "ValidationCategory",
+            "ReferentialIntegrityChecker",
+            "RulePlan",
+            "TextScan",
+            "ValidationTask",
+        ),
+        "regulatory_kb.processing.quality": (
+            "DocumentQuarantine",
+            "QuarantinedDocument",
+            "QuarantineReason",
+            "DocumentStatus",
+            "QualityScorer",
+            "QualityScore",
+            "GraphIntegrityChecker",
+            "IntegrityIssue",
+            "DataConsistencyValidator",
+            "ManualReviewQueue",
+            "BloomFilter",
+            "s3_document_ids",
+            "graph_document_ids",
+        ),
+        "regulatory_kb.processing.chunker": (
+            "DocumentChunker",
+            "DocumentChunk",
+            "ChunkType",
+            "ChunkerConfig",
+            "ChunkContext",
+        ),
+        "regulatory_kb.processing.tokenizer": (
+            "Tokenizer",
+            "CharacterTokenizer",
+            "BPETokenizer",
+            "TiktokenTokenizer",
+            "CachedTokenizer",
+            "tokenizer_from_env",
+        ),
+    },
+)
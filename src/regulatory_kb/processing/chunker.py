@@ -5,6 +5,10 @@ Implements Requirements 3.1, 3.4:
 - Size-based chunking with token limits (1000-4000)
 - Overlap between chunks (200 tokens)
 - Preserve regulatory structure boundaries
+
+Splitting and merging work on (start, end) index spans over paragraphs and
+over the chunk list, with sizes tracked by length, so each chunk's content
+is built once and runs of many tiny sections stay linear in document size.
 """
 
 import re
@@ -14,7 +18,9 @@ from typing import Optional
 
 import structlog
 
+from regulatory_kb.core.logging import span
 from regulatory_kb.processing.parser import ParsedDocument, ParsedSection
+from regulatory_kb.processing.tokenizer import CachedTokenizer, CharacterTokenizer, Tokenizer
 
 logger = structlog.get_logger(__name__)
 
@@ -105,11 +111,19 @@ class DocumentChunker:
     
     Preserves regulatory structure boundaries and maintains
     navigation links between chunks.
+    
+    Chunks are sized with a pluggable Tokenizer; wrap it in a
+    CachedTokenizer so repeated paragraphs are only tokenized once.
     """
 
     # Approximate tokens per character (conservative estimate)
     CHARS_PER_TOKEN = 4
 
+    # Separator between paragraphs and between merged chunks
+    PARAGRAPH_SEPARATOR = "\n\n"
+
+    PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
     # Regulatory section patterns
     SECTION_PATTERNS = [
         re.compile(r"^(?:PART|SUBPART|CHAPTER|SECTION|ARTICLE)\s+\d+", re.IGNORECASE | re.MULTILINE),
@@ -124,29 +138,61 @@ class DocumentChunker:
         re.compile(r"^\d+(?:\.\d+)*\s+[A-Z].+$", re.MULTILINE),  # Numbered sections
     ]
 
-    def __init__(self, config: Optional[ChunkerConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ChunkerConfig] = None,
+        tokenizer: Optional[Tokenizer] = None,
+    ):
         """Initialize the document chunker.
         
         Args:
             config: Chunking configuration. Uses defaults if not provided.
+            tokenizer: Tokenizer for chunk sizing. Uses a character-based
+                estimate if not provided.
         """
         self.config = config or ChunkerConfig()
+        self.tokenizer = (
+            tokenizer if tokenizer is not None else CharacterTokenizer(self.CHARS_PER_TOKEN)
+        )
+        self._separator_tokens = self.tokenizer.count(self.PARAGRAPH_SEPARATOR)
+        # Length-only estimates stay exact when wrapped in a cache
+        base = self.tokenizer
+        while isinstance(base, CachedTokenizer):
+            base = base.tokenizer
+        self._length_tokenizer = base if isinstance(base, CharacterTokenizer) else None
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate the number of tokens in text.
         
-        Uses a simple character-based estimation. For more accurate
-        token counting, integrate with a tokenizer.
-        
         Args:
             text: Text to estimate tokens for.
             
         Returns:
-            Estimated token count.
+            Token count from the configured tokenizer.
         """
-        if not text:
+        return self.tokenizer.count(text)
+
+    def _joined_tokens(self, tokens: int, length: int, parts: int) -> int:
+        """Estimate the tokens of parts joined by PARAGRAPH_SEPARATOR.
+        
+        Character estimates only depend on length, so they are exact.
+        Other tokenizers add the separator's tokens to the part counts.
+        
+        Args:
+            tokens: Sum of the parts' token counts.
+            length: Sum of the parts' character lengths.
+            parts: Number of parts.
+            
+        Returns:
+            Estimated token count of the joined text.
+        """
+        if parts <= 0:
             return 0
-        return max(1, len(text) // self.CHARS_PER_TOKEN)
+        if self._length_tokenizer is not None:
+            return self._length_tokenizer.count_length(
+                length + len(self.PARAGRAPH_SEPARATOR) * (parts - 1)
+            )
+        return tokens + self._separator_tokens * (parts - 1)
 
     def chunk_document(
         self,
@@ -169,29 +215,31 @@ class DocumentChunker:
             section_count=len(parsed_doc.sections),
         )
 
-        chunks: list[DocumentChunk] = []
+        with span("chunk_document") as timing:
+            chunks: list[DocumentChunk] = []
 
-        # If document has sections, use structural chunking
-        if parsed_doc.sections:
-            chunks = self._chunk_by_sections(parsed_doc, document_id)
-        else:
-            # Fall back to text-based chunking
-            chunks = self._chunk_by_size(parsed_doc.text, document_id)
+            # If document has sections, use structural chunking
+            if parsed_doc.sections:
+                chunks = self._chunk_by_sections(parsed_doc, document_id)
+            else:
+                # Fall back to text-based chunking
+                chunks = self._chunk_by_size(parsed_doc.text, document_id)
 
-        # Handle tables as separate chunks if they're large
-        table_chunks = self._chunk_tables(parsed_doc, document_id, len(chunks))
-        chunks.extend(table_chunks)
+            # Handle tables as separate chunks if they're large
+            table_chunks = self._chunk_tables(parsed_doc, document_id, len(chunks))
+            chunks.extend(table_chunks)
 
-        # Merge small chunks
-        chunks = self.merge_small_chunks(chunks)
+            # Merge small chunks
+            chunks = self.merge_small_chunks(chunks)
 
-        # Update navigation links and total counts
-        chunks = self._update_navigation(chunks)
+            # Update navigation links and total counts
+            chunks = self._update_navigation(chunks)
 
         logger.info(
             "chunking_complete",
             document_id=document_id,
             chunk_count=len(chunks),
+            duration_ms=timing.elapsed_ms,
         )
 
         return chunks
@@ -313,74 +361,62 @@ class DocumentChunker:
             List of chunks from the split section.
         """
         chunks: list[DocumentChunk] = []
-        
-        # Split into paragraphs first
+
+        # Prefix sums: paragraphs[a:b] have lengths[b] - lengths[a] characters
         paragraphs = self._split_into_paragraphs(content)
-        
-        current_chunk_content: list[str] = []
+        para_tokens = self.tokenizer.count_batch(paragraphs)
+        lengths = [0]
+        token_sums = [0]
+        for para, tokens in zip(paragraphs, para_tokens):
+            lengths.append(lengths[-1] + len(para))
+            token_sums.append(token_sums[-1] + tokens)
+
+        # The current chunk is paragraphs[start:i]. Paragraphs [start, carried)
+        # are overlap from the previous chunk and are trimmed as one unit.
+        start = carried = 0
+        carried_tokens = 0
         current_tokens = 0
-        
-        for para in paragraphs:
-            para_tokens = self.estimate_tokens(para)
-            
-            # If single paragraph exceeds max, split it further
-            if para_tokens > self.config.max_chunk_tokens:
-                # Flush current chunk first
-                if current_chunk_content:
-                    chunk_content = "\n\n".join(current_chunk_content)
-                    chunks.append(self._create_chunk(
-                        content=chunk_content,
-                        document_id=document_id,
-                        chunk_index=chunk_index + len(chunks),
-                        section_path=section_path,
-                        section_title=section_title,
-                        chunk_type=ChunkType.SIZE_BASED,
-                    ))
-                    current_chunk_content = []
-                    current_tokens = 0
-                
-                # Split large paragraph
-                para_chunks = self._split_paragraph(
-                    para, document_id, chunk_index + len(chunks),
-                    section_path, section_title
-                )
-                chunks.extend(para_chunks)
-                continue
-            
-            # Check if adding this paragraph exceeds target
-            if current_tokens + para_tokens > self.config.target_chunk_tokens:
-                # Create chunk from current content
-                if current_chunk_content:
-                    chunk_content = "\n\n".join(current_chunk_content)
-                    chunks.append(self._create_chunk(
-                        content=chunk_content,
-                        document_id=document_id,
-                        chunk_index=chunk_index + len(chunks),
-                        section_path=section_path,
-                        section_title=section_title,
-                        chunk_type=ChunkType.SIZE_BASED,
-                    ))
-                    
-                    # Add overlap from end of previous chunk
-                    overlap_content = self._get_overlap_content(current_chunk_content)
-                    current_chunk_content = [overlap_content] if overlap_content else []
-                    current_tokens = self.estimate_tokens(overlap_content) if overlap_content else 0
-            
-            current_chunk_content.append(para)
-            current_tokens += para_tokens
-        
-        # Don't forget the last chunk
-        if current_chunk_content:
-            chunk_content = "\n\n".join(current_chunk_content)
+
+        def flush(end: int) -> None:
             chunks.append(self._create_chunk(
-                content=chunk_content,
+                content=self.PARAGRAPH_SEPARATOR.join(paragraphs[start:end]),
                 document_id=document_id,
                 chunk_index=chunk_index + len(chunks),
                 section_path=section_path,
                 section_title=section_title,
                 chunk_type=ChunkType.SIZE_BASED,
             ))
-        
+
+        for i, tokens in enumerate(para_tokens):
+            # If single paragraph exceeds max, split it further
+            if tokens > self.config.max_chunk_tokens:
+                if start < i:
+                    flush(i)
+                chunks.extend(self._split_paragraph(
+                    paragraphs[i], document_id, chunk_index + len(chunks),
+                    section_path, section_title
+                ))
+                start = carried = i + 1
+                current_tokens = 0
+                continue
+
+            # Check if adding this paragraph exceeds target
+            if current_tokens + tokens > self.config.target_chunk_tokens and start < i:
+                flush(i)
+
+                # Carry overlap from the end of the previous chunk
+                start = self._overlap_start(para_tokens, start, carried, carried_tokens, i)
+                carried = i
+                carried_tokens = current_tokens = self._joined_tokens(
+                    token_sums[i] - token_sums[start], lengths[i] - lengths[start], i - start
+                )
+
+            current_tokens += tokens
+
+        # Don't forget the last chunk
+        if start < len(paragraphs):
+            flush(len(paragraphs))
+
         return chunks
 
     def _split_paragraph(
@@ -411,8 +447,7 @@ class DocumentChunker:
         current_content: list[str] = []
         current_tokens = 0
         
-        for sentence in sentences:
-            sentence_tokens = self.estimate_tokens(sentence)
+        for sentence, sentence_tokens in zip(sentences, self.tokenizer.count_batch(sentences)):
             
             if current_tokens + sentence_tokens > self.config.target_chunk_tokens:
                 if current_content:
@@ -454,33 +489,44 @@ class DocumentChunker:
             List of paragraphs.
         """
         # Split on double newlines or more
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = self.PARAGRAPH_BREAK.split(text)
         return [p.strip() for p in paragraphs if p.strip()]
 
-    def _get_overlap_content(self, content_parts: list[str]) -> str:
-        """Get overlap content from the end of a chunk.
+    def _overlap_start(
+        self,
+        para_tokens: list[int],
+        start: int,
+        carried: int,
+        carried_tokens: int,
+        end: int,
+    ) -> int:
+        """Get the first paragraph of the overlap at the end of a chunk.
+        
+        Takes paragraphs from the end of paragraphs[start:end] up to
+        overlap_tokens. Paragraphs [start, carried) were carried over from
+        the chunk before and are kept or dropped together.
         
         Args:
-            content_parts: List of content parts in the chunk.
+            para_tokens: Token count of each paragraph.
+            start: First paragraph of the chunk.
+            carried: End of the carried-over paragraphs.
+            carried_tokens: Token count of the carried-over paragraphs.
+            end: End of the chunk.
             
         Returns:
-            Content to use as overlap for next chunk.
+            Index of the first overlap paragraph (end if there is no overlap).
         """
-        if not content_parts:
-            return ""
-        
-        # Take content from the end up to overlap_tokens
-        overlap_parts: list[str] = []
-        overlap_tokens = 0
-        
-        for part in reversed(content_parts):
-            part_tokens = self.estimate_tokens(part)
-            if overlap_tokens + part_tokens > self.config.overlap_tokens:
-                break
-            overlap_parts.insert(0, part)
-            overlap_tokens += part_tokens
-        
-        return "\n\n".join(overlap_parts)
+        budget = self.config.overlap_tokens
+        used = 0
+        first = end
+        while first > carried:
+            if used + para_tokens[first - 1] > budget:
+                return first
+            used += para_tokens[first - 1]
+            first -= 1
+        if carried > start and used + carried_tokens <= budget:
+            return start
+        return first
 
     def _create_chunk(
         self,
@@ -543,8 +589,7 @@ class DocumentChunker:
             current_content: list[str] = []
             current_tokens = 0
             
-            for para in paragraphs:
-                para_tokens = self.estimate_tokens(para)
+            for para, para_tokens in zip(paragraphs, self.tokenizer.count_batch(paragraphs)):
                 
                 if current_tokens + para_tokens > self.config.target_chunk_tokens:
                     if current_content:
@@ -726,67 +771,103 @@ class DocumentChunker:
         """
         if not chunks:
             return chunks
-        
+
         merged: list[DocumentChunk] = []
-        current_chunk: Optional[DocumentChunk] = None
+        for start, end in self._merge_spans(chunks):
+            if end - start == 1:
+                merged.append(chunks[start])
+            else:
+                merged.append(self._merge_chunk_range(chunks, start, end))
+
+        return merged
+
+    def _merge_spans(self, chunks: list[DocumentChunk]) -> list[tuple[int, int]]:
+        """Group adjacent chunks into (start, end) ranges to merge.
         
-        for chunk in chunks:
+        Merged sizes are tracked by length, so no text is concatenated
+        while deciding the ranges.
+        
+        Args:
+            chunks: List of chunks to group.
+            
+        Returns:
+            List of chunk index ranges covering all chunks in order.
+        """
+        spans: list[tuple[int, int]] = []
+        start: Optional[int] = None
+        length = token_sum = tokens = 0
+
+        for i, chunk in enumerate(chunks):
             # Don't merge table chunks
             if chunk.chunk_type == ChunkType.TABLE:
-                if current_chunk:
-                    merged.append(current_chunk)
-                    current_chunk = None
-                merged.append(chunk)
+                if start is not None:
+                    spans.append((start, i))
+                    start = None
+                spans.append((i, i + 1))
                 continue
-            
-            if current_chunk is None:
-                current_chunk = chunk
+
+            if start is None:
+                start = i
+                length, token_sum = len(chunk.content), chunk.token_count
+                tokens = chunk.token_count
                 continue
-            
+
             # Check if we should merge
-            combined_tokens = current_chunk.token_count + chunk.token_count
-            
-            if (current_chunk.token_count < self.config.min_chunk_tokens and
-                combined_tokens <= self.config.target_chunk_tokens):
-                # Merge chunks
-                current_chunk = self._merge_two_chunks(current_chunk, chunk)
+            if (tokens < self.config.min_chunk_tokens and
+                tokens + chunk.token_count <= self.config.target_chunk_tokens):
+                length += len(chunk.content)
+                token_sum += chunk.token_count
+                tokens = self._joined_tokens(token_sum, length, i - start + 1)
             else:
-                merged.append(current_chunk)
-                current_chunk = chunk
-        
-        if current_chunk:
-            merged.append(current_chunk)
-        
-        return merged
+                spans.append((start, i))
+                start = i
+                length, token_sum = len(chunk.content), chunk.token_count
+                tokens = chunk.token_count
 
-    def _merge_two_chunks(
+        if start is not None:
+            spans.append((start, len(chunks)))
+
+        return spans
+
+    def _merge_chunk_range(
         self,
-        chunk1: DocumentChunk,
-        chunk2: DocumentChunk,
+        chunks: list[DocumentChunk],
+        start: int,
+        end: int,
     ) -> DocumentChunk:
-        """Merge two chunks into one.
+        """Merge chunks[start:end] into one chunk.
         
         Args:
-            chunk1: First chunk.
-            chunk2: Second chunk.
+            chunks: List of chunks.
+            start: First chunk to merge.
+            end: End of the range (exclusive).
             
         Returns:
             Merged chunk.
         """
-        merged_content = f"{chunk1.content}\n\n{chunk2.content}"
-        
-        # Combine section paths (use the more specific one)
-        section_path = chunk2.section_path if chunk2.section_path else chunk1.section_path
-        
+        group = chunks[start:end]
+        first = group[0]
+        merged_content = self.PARAGRAPH_SEPARATOR.join(chunk.content for chunk in group)
+
+        # Use the most specific (last non-empty) section path
+        section_path = next(
+            (chunk.section_path for chunk in reversed(group) if chunk.section_path),
+            first.section_path,
+        )
+        section_title = next(
+            (chunk.section_title for chunk in group if chunk.section_title),
+            group[-1].section_title,
+        )
+
         return DocumentChunk(
-            chunk_id=chunk1.chunk_id,  # Keep first chunk's ID
-            document_id=chunk1.document_id,
+            chunk_id=first.chunk_id,  # Keep first chunk's ID
+            document_id=first.document_id,
             content=merged_content,
-            chunk_index=chunk1.chunk_index,
+            chunk_index=first.chunk_index,
             section_path=section_path,
             token_count=self.estimate_tokens(merged_content),
             chunk_type=ChunkType.MERGED,
-            section_title=chunk1.section_title or chunk2.section_title,
+            section_title=section_title,
         )
 
     def _update_navigation(
@@ -12,17 +12,32 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum
 from io import BytesIO
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import structlog
-from bs4 import BeautifulSoup, NavigableString, Tag
-from PyPDF2 import PdfReader
 
 from regulatory_kb.core.errors import DocumentParsingError
+from regulatory_kb.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+    from regulatory_kb.processing.html_lxml import LxmlHTMLExtractor
+
+# Only the parsers for formats actually seen get imported
+bs4 = lazy_import("bs4")
+PyPDF2 = lazy_import("PyPDF2")
 
 logger = structlog.get_logger(__name__)
 
 
+class HTMLBackend(str, Enum):
+    """HTML parsing backends."""
+
+    AUTO = "auto"  # lxml when installed, else BeautifulSoup
+    LXML = "lxml"
+    BEAUTIFULSOUP = "beautifulsoup"
+
+
 class DocumentFormat(str, Enum):
     """Supported document formats."""
 
@@ -111,9 +126,31 @@ class DocumentParser:
     NAV_ELEMENTS = ["nav", "header", "footer", "aside", "script", "style", "noscript"]
     NAV_CLASSES = ["navigation", "nav", "menu", "sidebar", "footer", "header", "breadcrumb"]
 
-    def __init__(self):
-        """Initialize the document parser."""
+    def __init__(self, html_backend: HTMLBackend = HTMLBackend.AUTO):
+        """Initialize the document parser.
+
+        Args:
+            html_backend: Backend for HTML, CFR, Federal Register and FINTRAC
+                pages. The lxml backend gives the same output as BeautifulSoup
+                and falls back to it for pages it cannot reproduce exactly.
+        """
         self._section_patterns = self._compile_section_patterns()
+        self.html_backend = html_backend
+        self._lxml_extractor: Optional["LxmlHTMLExtractor"] = None
+        self._lxml_unavailable = html_backend == HTMLBackend.BEAUTIFULSOUP
+
+    def _lxml(self) -> Optional["LxmlHTMLExtractor"]:
+        """Get the lxml extractor, or None to use BeautifulSoup."""
+        if self._lxml_extractor is None and not self._lxml_unavailable:
+            try:
+                from regulatory_kb.processing.html_lxml import LxmlHTMLExtractor
+            except ImportError:
+                if self.html_backend == HTMLBackend.LXML:
+                    raise
+                self._lxml_unavailable = True
+                return None
+            self._lxml_extractor = LxmlHTMLExtractor(self.NAV_ELEMENTS, self.NAV_CLASSES)
+        return self._lxml_extractor
 
     def _compile_section_patterns(self) -> dict:
         """Compile regex patterns for section detection."""
@@ -197,7 +234,7 @@ class DocumentParser:
             content = content.encode("utf-8")
 
         pdf_file = BytesIO(content)
-        reader = PdfReader(pdf_file)
+        reader = PyPDF2.PdfReader(pdf_file)
 
         text_parts = []
         sections = []
@@ -245,7 +282,19 @@ class DocumentParser:
         if isinstance(content, bytes):
             content = content.decode("utf-8", errors="replace")
 
-        soup = BeautifulSoup(content, "html.parser")
+        extractor = self._lxml()
+        extraction = extractor.extract_html(content) if extractor else None
+        if extraction is not None:
+            return ParsedDocument(
+                text=extraction.text,
+                sections=extraction.sections,
+                tables=extraction.tables,
+                format=DocumentFormat.HTML,
+                metadata=extraction.metadata,
+                warnings=[],
+            )
+
+        soup = bs4.BeautifulSoup(content, "html.parser")
 
         # Remove navigation and non-content elements
         for element in self.NAV_ELEMENTS:
@@ -291,12 +340,7 @@ class DocumentParser:
 
         # Check if HTML content (from eCFR)
         if "<html" in content.lower() or "<body" in content.lower():
-            soup = BeautifulSoup(content, "html.parser")
-            # Remove navigation
-            for element in self.NAV_ELEMENTS:
-                for tag in soup.find_all(element):
-                    tag.decompose()
-            text = soup.get_text(separator="\n", strip=True)
+            text = self._html_to_text(content)
         else:
             text = content
 
@@ -351,11 +395,7 @@ class DocumentParser:
 
         # Handle HTML content
         if "<html" in content.lower() or "<body" in content.lower():
-            soup = BeautifulSoup(content, "html.parser")
-            for element in self.NAV_ELEMENTS:
-                for tag in soup.find_all(element):
-                    tag.decompose()
-            text = soup.get_text(separator="\n", strip=True)
+            text = self._html_to_text(content)
         else:
             text = content
 
@@ -412,24 +452,15 @@ class DocumentParser:
         if isinstance(content, bytes):
             content = content.decode("utf-8", errors="replace")
 
-        soup = BeautifulSoup(content, "html.parser")
-
-        # Remove navigation elements
-        for element in self.NAV_ELEMENTS:
-            for tag in soup.find_all(element):
-                tag.decompose()
-
-        # FINTRAC-specific: remove government header/footer
-        for tag in soup.find_all(class_=re.compile(r"gc-|wb-", re.IGNORECASE)):
-            if any(nav in str(tag.get("class", [])).lower() for nav in ["nav", "menu", "header", "footer"]):
-                tag.decompose()
-
-        # Extract main content
-        main = soup.find("main") or soup.find(id="wb-cont") or soup.find("article") or soup
-
-        text = self._extract_text_with_structure(main)
-        sections = self._extract_html_sections(main)
-        tables = self._extract_html_tables(main)
+        extractor = self._lxml()
+        extraction = extractor.extract_fintrac(content) if extractor else None
+        if extraction is not None:
+            text = extraction.text
+            sections = extraction.sections
+            tables = extraction.tables
+            page_metadata = extraction.metadata
+        else:
+            text, sections, tables, page_metadata = self._extract_fintrac_soup(content)
 
         metadata = {}
 
@@ -450,10 +481,8 @@ class DocumentParser:
         if thresholds:
             metadata["thresholds"] = list(set(thresholds))
 
-        # Extract last modified date
-        modified = soup.find("time", {"property": "dateModified"})
-        if modified:
-            metadata["last_modified"] = modified.get("datetime") or modified.get_text()
+        # Page-level metadata such as the last modified date
+        metadata.update(page_metadata)
 
         return ParsedDocument(
             text=text,
@@ -464,18 +493,63 @@ class DocumentParser:
             warnings=[],
         )
 
-    def _extract_text_with_structure(self, element: Tag) -> str:
+    def _extract_fintrac_soup(
+        self, content: str
+    ) -> tuple[str, list[ParsedSection], list[ParsedTable], dict]:
+        """Extract FINTRAC page content with BeautifulSoup."""
+        soup = bs4.BeautifulSoup(content, "html.parser")
+
+        # Remove navigation elements
+        for element in self.NAV_ELEMENTS:
+            for tag in soup.find_all(element):
+                tag.decompose()
+
+        # FINTRAC-specific: remove government header/footer
+        for tag in soup.find_all(class_=re.compile(r"gc-|wb-", re.IGNORECASE)):
+            if tag.decomposed:  # inside an already removed element
+                continue
+            if any(nav in str(tag.get("class", [])).lower() for nav in ["nav", "menu", "header", "footer"]):
+                tag.decompose()
+
+        # Extract main content
+        main = soup.find("main") or soup.find(id="wb-cont") or soup.find("article") or soup
+
+        text = self._extract_text_with_structure(main)
+        sections = self._extract_html_sections(main)
+        tables = self._extract_html_tables(main)
+
+        page_metadata = {}
+        modified = soup.find("time", {"property": "dateModified"})
+        if modified:
+            page_metadata["last_modified"] = modified.get("datetime") or modified.get_text()
+
+        return text, sections, tables, page_metadata
+
+    def _html_to_text(self, content: str) -> str:
+        """Get newline-separated page text with navigation elements removed."""
+        extractor = self._lxml()
+        text = extractor.extract_plain_text(content) if extractor else None
+        if text is not None:
+            return text
+
+        soup = bs4.BeautifulSoup(content, "html.parser")
+        for element in self.NAV_ELEMENTS:
+            for tag in soup.find_all(element):
+                tag.decompose()
+        return soup.get_text(separator="\n", strip=True)
+
+    def _extract_text_with_structure(self, element: "Tag") -> str:
         """Extract text from HTML while preserving structure."""
         if element is None:
             return ""
 
         parts = []
         for child in element.children:
-            if isinstance(child, NavigableString):
+            if isinstance(child, bs4.NavigableString):
                 text = str(child).strip()
                 if text:
                     parts.append(text)
-            elif isinstance(child, Tag):
+            elif isinstance(child, bs4.Tag):
                 if child.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
                     parts.append(f"\n\n{child.get_text(strip=True)}\n")
                 elif child.name in ["p", "div"]:
@@ -519,7 +593,7 @@ class DocumentParser:
 
         return sections
 
-    def _extract_html_sections(self, element: Tag) -> list[ParsedSection]:
+    def _extract_html_sections(self, element: "Tag") -> list[ParsedSection]:
         """Extract sections from HTML headings."""
         sections = []
 
@@ -622,7 +696,7 @@ class DocumentParser:
 
         return ParsedTable(headers=headers, rows=rows)
 
-    def _extract_html_tables(self, element: Tag) -> list[ParsedTable]:
+    def _extract_html_tables(self, element: "Tag") -> list[ParsedTable]:
         """Extract tables from HTML content."""
         tables = []
 
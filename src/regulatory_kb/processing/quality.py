@@ -7,10 +7,16 @@ Implements Requirements 12.6, 12.7:
 - Data consistency validation across storage layers
 """
 
+import hashlib
+import heapq
+import itertools
+import math
+import re
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Union
 
 import structlog
 
@@ -132,11 +138,23 @@ class IntegrityIssue:
         }
 
 
+# Heaps are rebuilt once stale entries outnumber live ones by this margin
+_HEAP_SLACK = 64
+
+
 class DocumentQuarantine:
     """Manages quarantined documents that failed processing.
 
     Implements Requirement 12.6: Flag documents with missing critical
     elements for manual review.
+
+    Documents are kept in min-heaps keyed on ``quarantined_at`` (all
+    documents, and resolved ones) so eviction is O(log n), and in indexes
+    of unresolved documents by reason and of retryable documents so
+    queries are O(k) in the result size. Replaced, evicted or released
+    documents leave stale heap entries that are skipped when popped.
+    Resolution and retries must go through ``release`` and
+    ``increment_retry`` to keep the indexes current.
     """
 
     def __init__(self, max_quarantine_size: int = 10000):
@@ -147,6 +165,12 @@ class DocumentQuarantine:
         """
         self._quarantine: dict[str, QuarantinedDocument] = {}
         self._max_size = max_quarantine_size
+        self._counter = itertools.count()
+        self._by_age: list[tuple[datetime, int, QuarantinedDocument]] = []
+        self._resolved_by_age: list[tuple[datetime, int, QuarantinedDocument]] = []
+        self._by_reason: dict[QuarantineReason, dict[str, QuarantinedDocument]] = defaultdict(dict)
+        self._retryable: dict[str, QuarantinedDocument] = {}
+        self._resolved_count = 0
 
     def quarantine(
         self,
@@ -176,7 +200,14 @@ class DocumentQuarantine:
             metadata=metadata or {},
         )
 
+        previous = self._quarantine.get(document_id)
+        if previous is not None:
+            self._unindex(previous)
         self._quarantine[document_id] = doc
+        self._by_reason[reason][document_id] = doc
+        if doc.can_retry():
+            self._retryable[document_id] = doc
+        self._push(self._by_age, doc)
 
         # Enforce size limit
         if len(self._quarantine) > self._max_size:
@@ -191,25 +222,52 @@ class DocumentQuarantine:
 
         return doc
 
+    def _push(
+        self,
+        heap: list[tuple[datetime, int, QuarantinedDocument]],
+        doc: QuarantinedDocument,
+    ) -> None:
+        """Push a document onto an age heap, compacting stale entries."""
+        heapq.heappush(heap, (doc.quarantined_at, next(self._counter), doc))
+        if len(heap) > 2 * len(self._quarantine) + _HEAP_SLACK:
+            resolved_only = heap is self._resolved_by_age
+            heap[:] = [
+                entry for entry in heap
+                if self._is_live(entry[2]) and (entry[2].resolved or not resolved_only)
+            ]
+            heapq.heapify(heap)
+
+    def _is_live(self, doc: QuarantinedDocument) -> bool:
+        return self._quarantine.get(doc.document_id) is doc
+
+    def _pop_oldest(
+        self,
+        heap: list[tuple[datetime, int, QuarantinedDocument]],
+        resolved_only: bool = False,
+    ) -> Optional[QuarantinedDocument]:
+        """Pop the oldest live document from an age heap, skipping stale entries."""
+        while heap:
+            doc = heapq.heappop(heap)[2]
+            if self._is_live(doc) and (doc.resolved or not resolved_only):
+                return doc
+        return None
+
+    def _unindex(self, doc: QuarantinedDocument) -> None:
+        """Remove a document from the reason, retry and resolved indexes."""
+        self._by_reason[doc.reason].pop(doc.document_id, None)
+        self._retryable.pop(doc.document_id, None)
+        if doc.resolved:
+            self._resolved_count -= 1
+
     def _evict_oldest(self) -> None:
         """Evict oldest resolved documents from quarantine."""
-        # First try to evict resolved documents
-        resolved = [
-            (doc_id, doc)
-            for doc_id, doc in self._quarantine.items()
-            if doc.resolved
-        ]
-        if resolved:
-            resolved.sort(key=lambda x: x[1].quarantined_at)
-            oldest_id = resolved[0][0]
-            del self._quarantine[oldest_id]
-            return
-
-        # If no resolved, evict oldest unresolved
-        all_docs = list(self._quarantine.items())
-        all_docs.sort(key=lambda x: x[1].quarantined_at)
-        if all_docs:
-            del self._quarantine[all_docs[0][0]]
+        # First try to evict resolved documents, then the oldest unresolved
+        doc = self._pop_oldest(self._resolved_by_age, resolved_only=True)
+        if doc is None:
+            doc = self._pop_oldest(self._by_age)
+        if doc is not None:
+            self._unindex(doc)
+            del self._quarantine[doc.document_id]
 
     def get(self, document_id: str) -> Optional[QuarantinedDocument]:
         """Get a quarantined document by ID."""
@@ -238,7 +296,11 @@ class DocumentQuarantine:
         if not doc:
             return False
 
-        doc.resolved = True
+        if not doc.resolved:
+            self._unindex(doc)
+            doc.resolved = True
+            self._resolved_count += 1
+            self._push(self._resolved_by_age, doc)
         doc.resolved_at = datetime.now(timezone.utc)
         doc.resolution_notes = resolution_notes
 
@@ -264,30 +326,25 @@ class DocumentQuarantine:
             return False
 
         doc.retry_count += 1
+        if not doc.can_retry():
+            self._retryable.pop(document_id, None)
         return True
 
     def get_pending_retries(self) -> list[QuarantinedDocument]:
         """Get documents that can be retried."""
-        return [
-            doc for doc in self._quarantine.values()
-            if doc.can_retry()
-        ]
+        return [doc for doc in self._retryable.values() if doc.can_retry()]
 
     def get_by_reason(self, reason: QuarantineReason) -> list[QuarantinedDocument]:
         """Get quarantined documents by reason."""
-        return [
-            doc for doc in self._quarantine.values()
-            if doc.reason == reason and not doc.resolved
-        ]
+        return [doc for doc in self._by_reason.get(reason, {}).values() if not doc.resolved]
 
     def get_statistics(self) -> dict:
         """Get quarantine statistics."""
         total = len(self._quarantine)
-        resolved = sum(1 for d in self._quarantine.values() if d.resolved)
-        by_reason = {}
-        for doc in self._quarantine.values():
-            if not doc.resolved:
-                by_reason[doc.reason.value] = by_reason.get(doc.reason.value, 0) + 1
+        resolved = self._resolved_count
+        by_reason = {
+            reason.value: len(docs) for reason, docs in self._by_reason.items() if docs
+        }
 
         return {
             "total": total,
@@ -419,24 +476,50 @@ class QualityScorer:
         ]
 
 
+# (source_type, source_id, target_type, target_id)
+Edge = tuple[str, str, str, str]
+
+
 class GraphIntegrityChecker:
     """Checks referential integrity in the graph database.
 
     Implements Requirement 12.7: Maintain referential integrity between
     related documents and detect orphaned references.
+
+    Issues are maintained incrementally: nodes and relationships are
+    indexed by node type, so registering or removing one updates the
+    outstanding issues in O(degree). ``check_integrity(full=True)``
+    rebuilds them from the indexes on demand.
     """
 
-    def __init__(self):
-        """Initialize integrity checker."""
+    NODE_TYPES = ("Document", "Regulator", "Requirement", "Form", "Section")
+
+    def __init__(self, node_types: Optional[Iterable[str]] = None):
+        """Initialize integrity checker.
+
+        Args:
+            node_types: Node types tracked. Defaults to NODE_TYPES.
+        """
         self._known_nodes: dict[str, set[str]] = {
-            "Document": set(),
-            "Regulator": set(),
-            "Requirement": set(),
-            "Form": set(),
-            "Section": set(),
+            node_type: set() for node_type in (node_types or self.NODE_TYPES)
         }
-        self._relationships: list[tuple[str, str, str, str]] = []  # (source_type, source_id, target_type, target_id)
-        self._issues: list[IntegrityIssue] = []
+        # Relationship multiplicities, and per node type: node ID -> edges
+        self._edge_counts: Counter[Edge] = Counter()
+        self._outgoing: dict[str, dict[str, set[Edge]]] = defaultdict(lambda: defaultdict(set))
+        self._incoming: dict[str, dict[str, set[Edge]]] = defaultdict(lambda: defaultdict(set))
+        # Document -> Regulator relationships per document, and
+        # Document relationships (either direction) per document
+        self._regulator_links: Counter[str] = Counter()
+        self._document_degree: Counter[str] = Counter()
+        self._unreferenced_documents: set[str] = set()
+        self._issues: dict[tuple, IntegrityIssue] = {}
+
+    @property
+    def node_types(self) -> frozenset[str]:
+        """Node types tracked by the checker."""
+        return frozenset(self._known_nodes)
+
+    # ==================== Nodes ====================
 
     def register_node(self, node_type: str, node_id: str) -> None:
         """Register a node as existing in the graph.
@@ -445,8 +528,47 @@ class GraphIntegrityChecker:
             node_type: Type of node (Document, Regulator, etc.).
             node_id: ID of the node.
         """
-        if node_type in self._known_nodes:
-            self._known_nodes[node_type].add(node_id)
+        nodes = self._known_nodes.get(node_type)
+        if nodes is None or node_id in nodes:
+            return
+        nodes.add(node_id)
+
+        for edge in self._outgoing[node_type].get(node_id, ()):
+            self._issues.pop(("orphaned_source", edge), None)
+        for edge in self._incoming[node_type].get(node_id, ()):
+            self._issues.pop(("orphaned_target", edge), None)
+
+        if node_type == "Document":
+            if not self._regulator_links[node_id]:
+                self._add_missing_regulator_issue(node_id)
+            if not self._document_degree[node_id]:
+                self._unreferenced_documents.add(node_id)
+
+    def remove_node(self, node_type: str, node_id: str) -> None:
+        """Remove a node; relationships that use it become orphaned.
+
+        Args:
+            node_type: Type of node.
+            node_id: ID of the node.
+        """
+        nodes = self._known_nodes.get(node_type)
+        if nodes is None or node_id not in nodes:
+            return
+        nodes.discard(node_id)
+
+        for edge in self._outgoing[node_type].get(node_id, ()):
+            self._add_orphan_issue("orphaned_source", edge)
+        for edge in self._incoming[node_type].get(node_id, ()):
+            self._add_orphan_issue("orphaned_target", edge)
+
+        if node_type == "Document":
+            self._issues.pop(("missing_relationship", node_id), None)
+            self._unreferenced_documents.discard(node_id)
+
+    def _is_known(self, node_type: str, node_id: str) -> bool:
+        return node_id in self._known_nodes.get(node_type, ())
+
+    # ==================== Relationships ====================
 
     def register_relationship(
         self,
@@ -463,116 +585,439 @@ class GraphIntegrityChecker:
             target_type: Type of target node.
             target_id: ID of target node.
         """
-        self._relationships.append((source_type, source_id, target_type, target_id))
+        edge = (source_type, source_id, target_type, target_id)
+        self._edge_counts[edge] += 1
+        count = self._edge_counts[edge]
+        if count == 2:
+            self._add_duplicate_issue(edge)
+        if count > 1:
+            return
 
-    def check_integrity(self) -> list[IntegrityIssue]:
-        """Check for integrity issues in the graph.
+        self._outgoing[source_type][source_id].add(edge)
+        self._incoming[target_type][target_id].add(edge)
+        if not self._is_known(source_type, source_id):
+            self._add_orphan_issue("orphaned_source", edge)
+        if not self._is_known(target_type, target_id):
+            self._add_orphan_issue("orphaned_target", edge)
+
+        if source_type == "Document" and target_type == "Regulator":
+            self._regulator_links[source_id] += 1
+            self._issues.pop(("missing_relationship", source_id), None)
+        if source_type == "Document":
+            self._link_document(source_id)
+        if target_type == "Document":
+            self._link_document(target_id)
+
+    def remove_relationship(
+        self,
+        source_type: str,
+        source_id: str,
+        target_type: str,
+        target_id: str,
+    ) -> None:
+        """Remove one registration of a relationship.
 
-        Returns:
-            List of integrity issues found.
+        Args:
+            source_type: Type of source node.
+            source_id: ID of source node.
+            target_type: Type of target node.
+            target_id: ID of target node.
         """
-        self._issues.clear()
+        edge = (source_type, source_id, target_type, target_id)
+        count = self._edge_counts.get(edge, 0)
+        if not count:
+            return
+        if count == 2:
+            self._issues.pop(("duplicate_relationship", edge), None)
+        if count > 1:
+            self._edge_counts[edge] = count - 1
+            return
 
-        # Check for orphaned references
-        self._check_orphaned_references()
+        del self._edge_counts[edge]
+        self._discard_edge(self._outgoing[source_type], source_id, edge)
+        self._discard_edge(self._incoming[target_type], target_id, edge)
+        self._issues.pop(("orphaned_source", edge), None)
+        self._issues.pop(("orphaned_target", edge), None)
+
+        if source_type == "Document" and target_type == "Regulator":
+            self._regulator_links[source_id] -= 1
+            if not self._regulator_links[source_id]:
+                del self._regulator_links[source_id]
+                if self._is_known("Document", source_id):
+                    self._add_missing_regulator_issue(source_id)
+        if source_type == "Document":
+            self._unlink_document(source_id)
+        if target_type == "Document":
+            self._unlink_document(target_id)
+
+    @staticmethod
+    def _discard_edge(index: dict[str, set[Edge]], node_id: str, edge: Edge) -> None:
+        edges = index.get(node_id)
+        if edges is not None:
+            edges.discard(edge)
+            if not edges:
+                del index[node_id]
+
+    def _link_document(self, document_id: str) -> None:
+        self._document_degree[document_id] += 1
+        self._unreferenced_documents.discard(document_id)
+
+    def _unlink_document(self, document_id: str) -> None:
+        self._document_degree[document_id] -= 1
+        if not self._document_degree[document_id]:
+            del self._document_degree[document_id]
+            if self._is_known("Document", document_id):
+                self._unreferenced_documents.add(document_id)
+
+    # ==================== Issues ====================
+
+    def _add_orphan_issue(self, issue_type: str, edge: Edge) -> None:
+        source_type, source_id, target_type, target_id = edge
+        if issue_type == "orphaned_source":
+            message = f"Relationship source {source_type}:{source_id} does not exist"
+        else:
+            message = f"Relationship target {target_type}:{target_id} does not exist"
+        self._issues[(issue_type, edge)] = IntegrityIssue(
+            issue_type=issue_type,
+            source_id=source_id,
+            target_id=target_id,
+            message=message,
+            severity="error",
+        )
 
-        # Check for missing required relationships
-        self._check_required_relationships()
+    def _add_duplicate_issue(self, edge: Edge) -> None:
+        source_type, source_id, target_type, target_id = edge
+        self._issues[("duplicate_relationship", edge)] = IntegrityIssue(
+            issue_type="duplicate_relationship",
+            source_id=source_id,
+            target_id=target_id,
+            message=(
+                f"Relationship {source_type}:{source_id} -> {target_type}:{target_id} "
+                "is registered more than once"
+            ),
+            severity="warning",
+        )
 
-        # Check for duplicate nodes
-        self._check_duplicates()
+    def _add_missing_regulator_issue(self, document_id: str) -> None:
+        self._issues[("missing_relationship", document_id)] = IntegrityIssue(
+            issue_type="missing_relationship",
+            source_id=document_id,
+            target_id=None,
+            message=f"Document {document_id} has no ISSUED_BY relationship to a Regulator",
+            severity="warning",
+        )
+
+    def check_integrity(self, full: bool = False) -> list[IntegrityIssue]:
+        """Get the outstanding integrity issues in the graph.
+
+        Args:
+            full: Rebuild all issues from the indexes instead of returning
+                the incrementally maintained set.
+
+        Returns:
+            List of integrity issues found.
+        """
+        if full:
+            self._recheck()
 
         logger.info(
             "integrity_check_complete",
             issues_found=len(self._issues),
+            full=full,
         )
 
-        return self._issues
-
-    def _check_orphaned_references(self) -> None:
-        """Check for relationships pointing to non-existent nodes."""
-        for source_type, source_id, target_type, target_id in self._relationships:
-            # Check source exists
-            if source_id not in self._known_nodes.get(source_type, set()):
-                self._issues.append(IntegrityIssue(
-                    issue_type="orphaned_source",
-                    source_id=source_id,
-                    target_id=target_id,
-                    message=f"Relationship source {source_type}:{source_id} does not exist",
-                    severity="error",
-                ))
-
-            # Check target exists
-            if target_id not in self._known_nodes.get(target_type, set()):
-                self._issues.append(IntegrityIssue(
-                    issue_type="orphaned_target",
-                    source_id=source_id,
-                    target_id=target_id,
-                    message=f"Relationship target {target_type}:{target_id} does not exist",
-                    severity="error",
-                ))
-
-    def _check_required_relationships(self) -> None:
-        """Check that documents have required relationships."""
-        # Every document should have an ISSUED_BY relationship to a regulator
-        documents_with_regulator = set()
-        for source_type, source_id, target_type, _ in self._relationships:
+        return list(self._issues.values())
+
+    def _recheck(self) -> None:
+        """Recompute issues and per-document counts from the relationships."""
+        self._issues.clear()
+        self._regulator_links.clear()
+        self._document_degree.clear()
+
+        # Check for orphaned references and duplicate relationships
+        for edge, count in self._edge_counts.items():
+            source_type, source_id, target_type, target_id = edge
+            if not self._is_known(source_type, source_id):
+                self._add_orphan_issue("orphaned_source", edge)
+            if not self._is_known(target_type, target_id):
+                self._add_orphan_issue("orphaned_target", edge)
+            if count > 1:
+                self._add_duplicate_issue(edge)
             if source_type == "Document" and target_type == "Regulator":
-                documents_with_regulator.add(source_id)
-
-        for doc_id in self._known_nodes.get("Document", set()):
-            if doc_id not in documents_with_regulator:
-                self._issues.append(IntegrityIssue(
-                    issue_type="missing_relationship",
-                    source_id=doc_id,
-                    target_id=None,
-                    message=f"Document {doc_id} has no ISSUED_BY relationship to a Regulator",
-                    severity="warning",
-                ))
-
-    def _check_duplicates(self) -> None:
-        """Check for potential duplicate nodes."""
-        # This is a placeholder - in practice, would check for similar titles, etc.
-        pass
+                self._regulator_links[source_id] += 1
+            if source_type == "Document":
+                self._document_degree[source_id] += 1
+            if target_type == "Document":
+                self._document_degree[target_id] += 1
+
+        # Check for missing required relationships
+        documents = self._known_nodes.get("Document", set())
+        for doc_id in documents:
+            if not self._regulator_links[doc_id]:
+                self._add_missing_regulator_issue(doc_id)
+
+        self._unreferenced_documents = {
+            doc_id for doc_id in documents if not self._document_degree[doc_id]
+        }
 
     def find_orphaned_documents(self) -> list[str]:
         """Find documents with no incoming references.
 
         Returns:
-            List of document IDs with no incoming references.
+            List of document IDs that are neither the source nor the
+            target of any Document relationship.
         """
-        referenced_docs = set()
-        for _, _, target_type, target_id in self._relationships:
-            if target_type == "Document":
-                referenced_docs.add(target_id)
-
-        # Documents that are sources but never targets
-        source_docs = set()
-        for source_type, source_id, _, _ in self._relationships:
-            if source_type == "Document":
-                source_docs.add(source_id)
-
-        all_docs = self._known_nodes.get("Document", set())
-        orphaned = all_docs - referenced_docs - source_docs
-
-        return list(orphaned)
+        return list(self._unreferenced_documents)
 
     def get_issues_by_severity(self, severity: str) -> list[IntegrityIssue]:
         """Get issues filtered by severity."""
-        return [i for i in self._issues if i.severity == severity]
+        return [i for i in self._issues.values() if i.severity == severity]
+
+    def get_statistics(self) -> dict[str, int]:
+        """Get index and issue counts."""
+        return {
+            "nodes": sum(len(nodes) for nodes in self._known_nodes.values()),
+            "relationships": len(self._edge_counts),
+            "issues": len(self._issues),
+            "unreferenced_documents": len(self._unreferenced_documents),
+        }
 
     def clear(self) -> None:
         """Clear all registered nodes and relationships."""
         for node_set in self._known_nodes.values():
             node_set.clear()
-        self._relationships.clear()
+        self._edge_counts.clear()
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._regulator_links.clear()
+        self._document_degree.clear()
+        self._unreferenced_documents.clear()
         self._issues.clear()
 
 
+# Cross-store consistency rules: (store with the document, store missing
+# it, issue type, message, severity)
+_CONSISTENCY_RULES = (
+    ("s3", "graph", "missing_in_graph", "exists in S3 but not in graph store", "error"),
+    ("graph", "s3", "missing_in_s3", "exists in graph but not in S3", "error"),
+    ("graph", "vector", "missing_in_vector", "exists in graph but not in vector store", "warning"),
+)
+
+_CYPHER_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _merge_key(document_id: str) -> str:
+    """Sort key shared by every reconciliation source.
+
+    S3 lists ``<id>/`` prefixes in this order, which differs from plain id
+    order when an id is followed by a character sorting before "/".
+    """
+    return document_id + "/"
+
+
+def _in_merge_order(ids: Iterable[str]) -> Iterator[str]:
+    """Reorder IDs sorted by plain string order into reconciliation order.
+
+    Only an ID followed by IDs that extend it with a character sorting
+    before "/" (e.g. "a" then "a-1") moves, so IDs are held back just
+    until no later ID can sort before them; the buffer stays as small as
+    the longest such prefix chain.
+    """
+    pending: list[str] = []
+    for document_id in ids:
+        # Every later ID is greater than this one, and so is its key
+        while pending and pending[0] <= document_id:
+            yield heapq.heappop(pending)[:-1]
+        heapq.heappush(pending, _merge_key(document_id))
+    while pending:
+        yield heapq.heappop(pending)[:-1]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over document IDs.
+
+    Membership tests have no false negatives and a false positive rate
+    near the configured one while at most ``expected_items`` are added.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 0.01):
+        """Initialize the filter.
+
+        Args:
+            expected_items: Number of IDs the filter is sized for.
+            false_positive_rate: Target false positive rate.
+        """
+        if expected_items <= 0:
+            raise ValueError("expected_items must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.num_bits = max(8, math.ceil(
+            -expected_items * math.log(false_positive_rate) / math.log(2) ** 2
+        ))
+        self.num_hashes = max(1, round(self.num_bits / expected_items * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def from_ids(
+        cls,
+        ids: Iterable[str],
+        expected_items: int,
+        false_positive_rate: float = 0.01,
+    ) -> "BloomFilter":
+        """Build a filter from a stream of IDs in one pass."""
+        bloom = cls(expected_items, false_positive_rate)
+        for document_id in ids:
+            bloom.add(document_id)
+        return bloom
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Add an ID to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+
+IdSource = Union[Iterable[str], BloomFilter]
+
+
+def s3_document_ids(
+    s3_client: Any,
+    bucket: str,
+    prefix: str = "uploads/completed/",
+    page_size: int = 1000,
+) -> Iterator[str]:
+    """Stream document IDs from ``<prefix><id>/`` keys in S3 listing order.
+
+    Args:
+        s3_client: boto3 S3 client.
+        bucket: Bucket name.
+        prefix: Key prefix holding one folder per document.
+        page_size: Keys requested per listing page.
+
+    Yields:
+        Document IDs in reconciliation order, one page in memory at a time.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": page_size},
+    )
+    for page in pages:
+        for common_prefix in page.get("CommonPrefixes", []):
+            yield common_prefix["Prefix"][len(prefix):].rstrip("/")
+
+
+def graph_document_ids(
+    graph_store: Any,
+    label: str = "Document",
+    id_property: str = "id",
+    page_size: int = 1000,
+    ordered: bool = True,
+) -> Iterator[str]:
+    """Stream document IDs from graph nodes with keyset pagination.
+
+    Ordered pages seek on the ID property itself, so a range index on it
+    serves each page: GraphSchema indexes ``Document.id`` and
+    VectorSearchService.create_vector_indexes indexes
+    ``DocumentEmbedding.document_id``. Any other label/property needs its
+    own index or each page scans the label. The "/" merge order is restored
+    in Python with a small lookahead buffer.
+
+    Args:
+        graph_store: FalkorDBStore to query.
+        label: Node label, e.g. "DocumentEmbedding" for the vector index.
+        id_property: Property holding the document ID.
+        page_size: Nodes per query.
+        ordered: Yield IDs in reconciliation order. Unordered paging walks
+            internal node IDs, which avoids sorting on the ID and suits
+            building a BloomFilter.
+
+    Yields:
+        Document IDs, one page in memory at a time.
+    """
+    for name in (label, id_property):
+        if not _CYPHER_IDENTIFIER.match(name):
+            raise ValueError(f"Invalid Cypher identifier: {name!r}")
+
+    if ordered:
+        query = f"""
+        MATCH (n:{label})
+        WHERE n.{id_property} > $after
+        RETURN DISTINCT n.{id_property} AS key
+        ORDER BY key
+        LIMIT $limit
+        """
+        start: Any = ""
+    else:
+        query = f"""
+        MATCH (n:{label})
+        WHERE id(n) > $after
+        RETURN id(n) AS key, n.{id_property}
+        ORDER BY key
+        LIMIT $limit
+        """
+        start = -1
+
+    def pages() -> Iterator[str]:
+        after = start
+        while True:
+            result = graph_store.query(query, {"after": after, "limit": page_size})
+            rows = (result.raw_result.result_set if result.raw_result else None) or []
+            for row in rows:
+                if ordered:
+                    yield row[0]
+                elif row[1] is not None:
+                    yield row[1]
+            if len(rows) < page_size:
+                return
+            after = rows[-1][0]
+
+    yield from _in_merge_order(pages()) if ordered else pages()
+
+
+def _sorted_keys(source: str, ids: Iterable[str]) -> Iterator[str]:
+    """Get the merge keys of a source, dropping repeats and checking order."""
+    previous = ""
+    for document_id in ids:
+        key = _merge_key(document_id)
+        if key <= previous:
+            if key == previous:
+                continue
+            raise ValidationError(
+                f"{source} document IDs are not sorted: {document_id!r} after {previous[:-1]!r}",
+                document_id=document_id,
+                validation_type="consistency",
+            )
+        previous = key
+        yield key
+
+
 class DataConsistencyValidator:
     """Validates data consistency across storage layers.
 
     Ensures documents in S3, graph database, and vector store are consistent.
+
+    Documents can be registered in memory for ``check_consistency``, or
+    streamed from each store in sorted order with ``reconcile`` and
+    ``reconcile_stores``, which merge-join the streams in constant memory.
     """
 
     def __init__(self):
@@ -600,37 +1045,11 @@ class DataConsistencyValidator:
         Returns:
             List of inconsistency issues.
         """
-        self._inconsistencies.clear()
-
-        # Documents in S3 but not in graph
-        s3_only = self._s3_documents - self._graph_documents
-        for doc_id in s3_only:
-            self._inconsistencies.append({
-                "type": "missing_in_graph",
-                "document_id": doc_id,
-                "message": f"Document {doc_id} exists in S3 but not in graph store",
-                "severity": "error",
-            })
-
-        # Documents in graph but not in S3
-        graph_only = self._graph_documents - self._s3_documents
-        for doc_id in graph_only:
-            self._inconsistencies.append({
-                "type": "missing_in_s3",
-                "document_id": doc_id,
-                "message": f"Document {doc_id} exists in graph but not in S3",
-                "severity": "error",
-            })
-
-        # Documents in graph but not in vector store
-        graph_not_vector = self._graph_documents - self._vector_documents
-        for doc_id in graph_not_vector:
-            self._inconsistencies.append({
-                "type": "missing_in_vector",
-                "document_id": doc_id,
-                "message": f"Document {doc_id} exists in graph but not in vector store",
-                "severity": "warning",
-            })
+        self._inconsistencies = list(self.reconcile(
+            sorted(self._s3_documents, key=_merge_key),
+            sorted(self._graph_documents, key=_merge_key),
+            sorted(self._vector_documents, key=_merge_key),
+        ))
 
         logger.info(
             "consistency_check_complete",
@@ -639,6 +1058,120 @@ class DataConsistencyValidator:
 
         return self._inconsistencies
 
+    def reconcile(
+        self,
+        s3_ids: IdSource,
+        graph_ids: IdSource,
+        vector_ids: IdSource,
+    ) -> Iterator[dict]:
+        """Merge-join sorted ID streams and yield inconsistencies as found.
+
+        Each source is an iterable of IDs sorted by ``id + "/"`` (see
+        s3_document_ids and graph_document_ids), or a BloomFilter built in
+        a pre-pass for a store that cannot be listed in order. A rule is
+        only checked when the store holding the document is a stream, so
+        every reported issue is certain; Bloom false positives can only
+        hide issues.
+
+        Args:
+            s3_ids: Document IDs in S3.
+            graph_ids: Document IDs in the graph store.
+            vector_ids: Document IDs in the vector store.
+
+        Yields:
+            Inconsistency issues in ID order.
+
+        Raises:
+            ValueError: If every source is a BloomFilter.
+            ValidationError: If a stream is not in sorted order.
+        """
+        sources = {"s3": s3_ids, "graph": graph_ids, "vector": vector_ids}
+        filters = [(name, src) for name, src in sources.items() if isinstance(src, BloomFilter)]
+        names = [name for name, src in sources.items() if not isinstance(src, BloomFilter)]
+        if not names:
+            raise ValueError("At least one source must be an ID stream")
+        streams = [_sorted_keys(name, sources[name]) for name in names]
+        rules = [rule for rule in _CONSISTENCY_RULES if rule[0] in names]
+
+        heads = [next(stream, None) for stream in streams]
+        scanned = issues = 0
+        while True:
+            live = [head for head in heads if head is not None]
+            if not live:
+                break
+            key = min(live)
+            scanned += 1
+            # Fast path: the document is in every store
+            if len(live) == 3 and heads[0] == heads[1] == heads[2]:
+                heads = [next(stream, None) for stream in streams]
+                continue
+
+            document_id = key[:-1]
+            present = {name: document_id in bloom for name, bloom in filters}
+            for i, name in enumerate(names):
+                present[name] = heads[i] == key
+                if present[name]:
+                    heads[i] = next(streams[i], None)
+
+            for store, missing_from, issue_type, message, severity in rules:
+                if present[store] and not present[missing_from]:
+                    issues += 1
+                    yield {
+                        "type": issue_type,
+                        "document_id": document_id,
+                        "message": f"Document {document_id} {message}",
+                        "severity": severity,
+                    }
+
+        logger.info("reconciliation_complete", documents_scanned=scanned, inconsistencies_found=issues)
+
+    def reconcile_stores(
+        self,
+        s3_client: Any,
+        bucket: str,
+        graph_store: Any,
+        prefix: str = "uploads/completed/",
+        page_size: int = 1000,
+        bloom_false_positive_rate: Optional[float] = None,
+        expected_documents: int = 1_000_000,
+    ) -> Iterator[dict]:
+        """Reconcile S3, graph and vector stores by paging their IDs.
+
+        Vector store IDs come from the per-document ``DocumentEmbedding``
+        nodes. With ``bloom_false_positive_rate`` set they are loaded into
+        a BloomFilter in an unordered pre-pass instead of being sorted.
+
+        Args:
+            s3_client: boto3 S3 client.
+            bucket: Bucket holding one folder per document under prefix.
+            graph_store: FalkorDBStore holding documents and embeddings.
+            prefix: S3 key prefix of stored documents.
+            page_size: IDs fetched per S3 page or graph query.
+            bloom_false_positive_rate: Enables the vector pre-pass.
+            expected_documents: Vector IDs the BloomFilter is sized for.
+
+        Yields:
+            Inconsistency issues in ID order.
+        """
+        vector_ids: IdSource
+        if bloom_false_positive_rate is not None:
+            vector_ids = BloomFilter.from_ids(
+                graph_document_ids(
+                    graph_store, "DocumentEmbedding", "document_id", page_size, ordered=False
+                ),
+                expected_documents,
+                bloom_false_positive_rate,
+            )
+        else:
+            vector_ids = graph_document_ids(
+                graph_store, "DocumentEmbedding", "document_id", page_size
+            )
+        return self.reconcile(
+            s3_document_ids(s3_client, bucket, prefix, page_size),
+            graph_document_ids(graph_store, page_size=page_size),
+            vector_ids,
+        )
+
     def get_consistent_documents(self) -> set[str]:
         """Get documents that exist in all storage layers."""
         return self._s3_documents & self._graph_documents & self._vector_documents
@@ -670,6 +1203,12 @@ class ManualReviewQueue:
 
     Implements Requirement 12.6: Flag documents with missing critical
     elements for manual review.
+
+    Pending items are kept in a min-heap keyed on (priority, added_at) and
+    all items in an index by status. Entries for items that are no longer
+    pending, or were replaced, are skipped when popped. Status changes must
+    go through ``assign``, ``approve`` and ``reject`` to keep the index
+    current.
     """
 
     @dataclass
@@ -698,6 +1237,9 @@ class ManualReviewQueue:
     def __init__(self):
         """Initialize review queue."""
         self._queue: dict[str, ManualReviewQueue.ReviewItem] = {}
+        self._pending: list[tuple[int, datetime, int, ManualReviewQueue.ReviewItem]] = []
+        self._by_status: dict[str, dict[str, ManualReviewQueue.ReviewItem]] = defaultdict(dict)
+        self._counter = itertools.count()
 
     def add(
         self,
@@ -720,7 +1262,15 @@ class ManualReviewQueue:
             reason=reason,
             priority=max(1, min(5, priority)),
         )
+        previous = self._queue.get(document_id)
+        if previous is not None:
+            self._by_status[previous.status].pop(document_id, None)
         self._queue[document_id] = item
+        self._by_status[item.status][document_id] = item
+        self._push_pending(item)
+        if len(self._pending) > 2 * len(self._by_status["pending"]) + _HEAP_SLACK:
+            self._pending = [entry for entry in self._pending if self._is_pending(entry[3])]
+            heapq.heapify(self._pending)
 
         logger.info(
             "document_queued_for_review",
@@ -731,6 +1281,17 @@ class ManualReviewQueue:
 
         return item
 
+    def _push_pending(self, item: "ManualReviewQueue.ReviewItem") -> None:
+        heapq.heappush(self._pending, (item.priority, item.added_at, next(self._counter), item))
+
+    def _is_pending(self, item: "ManualReviewQueue.ReviewItem") -> bool:
+        return item.status == "pending" and self._queue.get(item.document_id) is item
+
+    def _set_status(self, item: "ManualReviewQueue.ReviewItem", status: str) -> None:
+        self._by_status[item.status].pop(item.document_id, None)
+        item.status = status
+        self._by_status[status][item.document_id] = item
+
     def get(self, document_id: str) -> Optional["ManualReviewQueue.ReviewItem"]:
         """Get a review item by document ID."""
         return self._queue.get(document_id)
@@ -750,7 +1311,7 @@ class ManualReviewQueue:
             return False
 
         item.assigned_to = reviewer
-        item.status = "in_review"
+        self._set_status(item, "in_review")
         return True
 
     def approve(self, document_id: str, notes: Optional[str] = None) -> bool:
@@ -767,7 +1328,7 @@ class ManualReviewQueue:
         if not item:
             return False
 
-        item.status = "approved"
+        self._set_status(item, "approved")
         if notes:
             item.notes.append(f"Approved: {notes}")
         return True
@@ -786,24 +1347,32 @@ class ManualReviewQueue:
         if not item:
             return False
 
-        item.status = "rejected"
+        self._set_status(item, "rejected")
         item.notes.append(f"Rejected: {reason}")
         return True
 
     def get_pending(self, limit: int = 100) -> list["ManualReviewQueue.ReviewItem"]:
-        """Get pending review items sorted by priority."""
-        pending = [
-            item for item in self._queue.values()
-            if item.status == "pending"
-        ]
-        pending.sort(key=lambda x: (x.priority, x.added_at))
-        return pending[:limit]
+        """Get pending review items sorted by priority.
+
+        Pops up to ``limit`` pending items off the heap and pushes them
+        back, so the cost is O(limit log n) plus discarded stale entries.
+        """
+        popped = []
+        while self._pending and len(popped) < limit:
+            entry = heapq.heappop(self._pending)
+            if self._is_pending(entry[3]):
+                popped.append(entry)
+        for entry in popped:
+            heapq.heappush(self._pending, entry)
+        return [entry[3] for entry in popped]
+
+    def get_by_status(self, status: str) -> list["ManualReviewQueue.ReviewItem"]:
+        """Get review items with a status, in the order they were added."""
+        return list(self._by_status.get(status, {}).values())
 
     def get_statistics(self) -> dict:
         """Get queue statistics."""
-        statuses = {}
-        for item in self._queue.values():
-            statuses[item.status] = statuses.get(item.status, 0) + 1
+        statuses = {status: len(items) for status, items in self._by_status.items() if items}
 
         return {
             "total": len(self._queue),
@@ -0,0 +1,285 @@
+"""Tokenizers for chunk sizing.
+
+Provides:
+- Tokenizer: protocol used by DocumentChunker to count tokens
+- CharacterTokenizer: length-based estimate (the chunker's default)
+- BPETokenizer: local byte-level BPE over a tiktoken-format ranks file,
+  matching the embedding model's tokenizer without network access
+- TiktokenTokenizer: tiktoken's native encoder, when the package is installed
+- CachedTokenizer: memoizes counts by text digest, so repeated paragraphs
+  and sentences are only tokenized once per process
+"""
+
+import base64
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Protocol, Sequence
+
+from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+
+logger = get_logger(__name__)
+
+tiktoken = lazy_import("tiktoken")
+
+# Pre-tokenization close to cl100k_base, expressed without \p{...} classes:
+# contractions, letter runs with an optional leading non-letter, 1-3 digit
+# groups, punctuation runs, and whitespace. Every character is matched.
+DEFAULT_PATTERN = (
+    r"'(?i:[sdmt]|ll|ve|re)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+
+class Tokenizer(Protocol):
+    """Counts tokens for chunk sizing."""
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text."""
+        ...
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in each text."""
+        ...
+
+
+class CharacterTokenizer:
+    """Estimates tokens from character length.
+
+    Counts depend only on length, so the chunker can size joined text
+    exactly without building it.
+    """
+
+    def __init__(self, chars_per_token: int = 4):
+        """Initialize the tokenizer.
+
+        Args:
+            chars_per_token: Characters per token (conservative estimate).
+        """
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        """Estimate the tokens in text."""
+        return self.count_length(len(text))
+
+    def count_length(self, length: int) -> int:
+        """Estimate the tokens in text of the given character length."""
+        if not length:
+            return 0
+        return max(1, length // self.chars_per_token)
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Estimate the tokens in each text."""
+        return [self.count_length(len(text)) for text in texts]
+
+
+class BPETokenizer:
+    """Local byte-level BPE tokenizer.
+
+    Uses the merge ranks of a tiktoken encoding (e.g. cl100k_base), loaded
+    from a ``.tiktoken`` file that ships with the deployment. Text is split
+    into words by a pre-tokenization pattern and each distinct word is
+    merged once; regulatory text repeats a small vocabulary of words, so
+    the word cache makes counting close to a regex scan.
+    """
+
+    def __init__(
+        self,
+        ranks: dict[bytes, int],
+        pattern: str = DEFAULT_PATTERN,
+        max_cached_words: int = 100_000,
+    ):
+        """Initialize the tokenizer.
+
+        Args:
+            ranks: Mapping of token bytes to merge rank (lower merges first).
+            pattern: Pre-tokenization regex splitting text into words.
+            max_cached_words: Word counts kept before the cache is reset.
+        """
+        self._ranks = ranks
+        self._pattern = re.compile(pattern)
+        self._max_cached_words = max_cached_words
+        self._word_counts: dict[str, int] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "BPETokenizer":
+        """Load ranks from a tiktoken-format file (``base64-token rank`` lines).
+
+        Args:
+            path: Path to the ranks file.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            BPETokenizer instance.
+        """
+        ranks: dict[bytes, int] = {}
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    token, rank = line.split()
+                    ranks[base64.b64decode(token)] = int(rank)
+        logger.info("bpe_ranks_loaded", path=path, token_count=len(ranks))
+        return cls(ranks, **kwargs)
+
+    def count(self, text: str) -> int:
+        """Count the BPE tokens in text."""
+        word_counts = self._word_counts
+        total = 0
+        for word in self._pattern.findall(text):
+            count = word_counts.get(word)
+            if count is None:
+                count = self._merge_count(word.encode("utf-8"))
+                if len(word_counts) >= self._max_cached_words:
+                    word_counts.clear()
+                word_counts[word] = count
+            total += count
+        return total
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the BPE tokens in each text."""
+        return [self.count(text) for text in texts]
+
+    def _merge_count(self, piece: bytes) -> int:
+        """Number of tokens after applying BPE merges to one word."""
+        ranks = self._ranks
+        if piece in ranks:
+            return 1
+        if len(piece) <= 1:
+            return len(piece)
+
+        parts = [piece[i:i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_rank: Optional[int] = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_index = rank, i
+            if best_rank is None:
+                break
+            parts[best_index:best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+        return len(parts)
+
+
+class TiktokenTokenizer:
+    """Tokenizer backed by tiktoken's native encoder.
+
+    Requires the ``tiktoken`` package and its encoding files (downloaded on
+    first use unless TIKTOKEN_CACHE_DIR points at a bundled copy).
+    """
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        """Initialize the tokenizer.
+
+        Args:
+            encoding_name: tiktoken encoding name.
+        """
+        self.encoding_name = encoding_name
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text."""
+        return len(self._encoding.encode_ordinary(text))
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in each text, encoding in parallel threads."""
+        return [len(tokens) for tokens in self._encoding.encode_ordinary_batch(list(texts))]
+
+
+class CachedTokenizer:
+    """Memoizes token counts by text digest.
+
+    Keys are BLAKE2b digests, so cached paragraphs are not kept alive.
+    Batch counts only send cache misses to the wrapped tokenizer.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, max_entries: int = 50_000):
+        """Initialize the cache.
+
+        Args:
+            tokenizer: Tokenizer to memoize.
+            max_entries: Maximum cached counts; least recently used are evicted.
+        """
+        self.tokenizer = tokenizer
+        self.max_entries = max_entries
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def count(self, text: str) -> int:
+        """Count the tokens in text, using the cache."""
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in each text, tokenizing only cache misses."""
+        digests = [self._digest(text) for text in texts]
+        counts: list[Optional[int]] = [None] * len(texts)
+        missing: dict[bytes, list[int]] = {}
+
+        with self._lock:
+            for i, digest in enumerate(digests):
+                count = self._counts.get(digest)
+                if count is None:
+                    missing.setdefault(digest, []).append(i)
+                else:
+                    self._counts.move_to_end(digest)
+                    counts[i] = count
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            fresh = self.tokenizer.count_batch([texts[indexes[0]] for indexes in missing.values()])
+            with self._lock:
+                for (digest, indexes), count in zip(missing.items(), fresh):
+                    for i in indexes:
+                        counts[i] = count
+                    self._counts[digest] = count
+                while len(self._counts) > self.max_entries:
+                    self._counts.popitem(last=False)
+
+        return counts  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Drop all cached counts."""
+        with self._lock:
+            self._counts.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters."""
+        return {"size": len(self._counts), "hits": self.hits, "misses": self.misses}
+
+
+def tokenizer_from_env() -> Optional[Tokenizer]:
+    """Create the chunk-sizing tokenizer configured in the environment.
+
+    CHUNK_TOKENIZER_RANKS names a tiktoken-format ranks file for the local
+    BPE tokenizer; otherwise CHUNK_TOKENIZER_ENCODING names a tiktoken
+    encoding. Either is wrapped in a CachedTokenizer.
+
+    Returns:
+        A cached tokenizer, or None to use character estimates.
+    """
+    ranks_path = os.environ.get("CHUNK_TOKENIZER_RANKS")
+    if ranks_path:
+        return CachedTokenizer(BPETokenizer.from_file(ranks_path))
+
+    encoding = os.environ.get("CHUNK_TOKENIZER_ENCODING")
+    if encoding:
+        try:
+            return CachedTokenizer(TiktokenTokenizer(encoding))
+        except Exception as e:
+            logger.warning("tokenizer_unavailable", encoding=encoding, error=str(e))
+    return None
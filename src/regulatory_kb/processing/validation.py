@@ -5,12 +5,18 @@ Implements Requirements 12.1-12.7:
 - Quality scoring and flagging mechanisms
 - Referential integrity checks
 - Validation reports for manual review
+
+Checks run from a compiled RulePlan per regulator: the document text is
+lowercased and scanned once for every keyword the plan's checks need, and
+the checks read the resulting hits. ``validate_many`` validates a batch
+across a process pool.
 """
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Iterable, Optional, Sequence
 
 import structlog
 
@@ -110,6 +116,60 @@ class ValidationResult:
         return sum(1 for i in self.issues if i.severity == ValidationSeverity.WARNING)
 
 
+@dataclass(frozen=True)
+class TextScan:
+    """Keyword hits from one scan of a document's text."""
+
+    hits: frozenset[str]
+
+    def has(self, keyword: str) -> bool:
+        """Check if a keyword occurs in the text."""
+        return keyword in self.hits
+
+    def has_any(self, keywords: Iterable[str]) -> bool:
+        """Check if any of the keywords occurs in the text."""
+        return any(k in self.hits for k in keywords)
+
+    def found(self, keywords: Iterable[str]) -> list[str]:
+        """Get the keywords that occur in the text, in the given order."""
+        return [k for k in keywords if k in self.hits]
+
+
+# Check signature: (parsed, metadata, scan, result)
+ValidationCheck = Callable[
+    [ParsedDocument, Optional[ExtractedMetadata], TextScan, "ValidationResult"], None
+]
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """Compiled validation plan for one regulator.
+
+    Holds the checks to run, in order, and every keyword they test for,
+    so a document is scanned once however many checks use the text.
+    Keywords are case-insensitive literals.
+    """
+
+    regulator_type: Optional[RegulatorType]
+    keywords: frozenset[str]
+    checks: tuple[ValidationCheck, ...]
+
+    def scan(self, text: str) -> TextScan:
+        """Scan text for the plan's keywords."""
+        text_lower = text.lower()
+        return TextScan(hits=frozenset(k for k in self.keywords if k in text_lower))
+
+
+@dataclass
+class ValidationTask:
+    """One document to validate with ContentValidator.validate_many."""
+
+    parsed: ParsedDocument
+    metadata: Optional[ExtractedMetadata] = None
+    regulator_type: Optional[RegulatorType] = None
+    document_id: Optional[str] = None
+
+
 class ContentValidator:
     """Validates regulatory document content for completeness and accuracy.
 
@@ -146,6 +206,19 @@ class ContentValidator:
         "osfi": ["guideline", "requirement", "institution", "risk"],
     }
 
+    # Keywords tested by regulator-specific checks
+    FR_Y14_ELEMENTS = ["schedule", "capital", "scenario"]
+    CALL_REPORT_MARKERS = ["call report", "ffiec"]
+    CALL_REPORT_ELEMENTS = ["schedule", "line item"]
+    CTR_MARKERS = ["ctr", "currency transaction"]
+    CTR_THRESHOLDS = ["$10,000", "10,000"]
+    OSFI_GUIDELINE_ELEMENTS = ["requirement", "expectation", "institution"]
+    FINTRAC_THRESHOLDS = ["c$10,000", "10,000"]
+    FINTRAC_TIMING = ["days", "business days", "within"]
+
+    # Batches smaller than this are validated in-process
+    MIN_POOL_BATCH = 8
+
     # Minimum content lengths by format
     MIN_CONTENT_LENGTH = {
         DocumentFormat.PDF: 500,
@@ -158,6 +231,64 @@ class ContentValidator:
     def __init__(self):
         """Initialize the content validator."""
         self._validation_rules = self._build_validation_rules()
+        self._plans: dict[Optional[RegulatorType], RulePlan] = {
+            regulator_type: self._compile_plan(regulator_type)
+            for regulator_type in [None, *RegulatorType]
+        }
+
+    def _compile_plan(self, regulator_type: Optional[RegulatorType]) -> RulePlan:
+        """Compile the checks and keywords for a regulator.
+
+        Args:
+            regulator_type: Regulator, or None for general checks only.
+
+        Returns:
+            RulePlan for the regulator.
+        """
+        checks: list[ValidationCheck] = [
+            self._validate_content_length,
+            self._validate_regulatory_keywords,
+            self._validate_structure,
+            self._validate_metadata_completeness,
+        ]
+        keywords = set(self.REGULATORY_KEYWORDS["general"])
+
+        regulator_rules: dict[RegulatorType, tuple[ValidationCheck, list[str]]] = {
+            RegulatorType.FEDERAL_RESERVE: (self._validate_federal_reserve, self.FR_Y14_ELEMENTS),
+            RegulatorType.OCC: (
+                self._validate_occ, self.CALL_REPORT_MARKERS + self.CALL_REPORT_ELEMENTS
+            ),
+            RegulatorType.FDIC: (self._validate_fdic, []),
+            RegulatorType.FINCEN: (self._validate_fincen, self.CTR_MARKERS + self.CTR_THRESHOLDS),
+            RegulatorType.OSFI: (self._validate_osfi, self.OSFI_GUIDELINE_ELEMENTS),
+            RegulatorType.FINTRAC: (
+                self._validate_fintrac, self.FINTRAC_THRESHOLDS + self.FINTRAC_TIMING
+            ),
+        }
+        if regulator_type in regulator_rules:
+            check, check_keywords = regulator_rules[regulator_type]
+            checks.append(check)
+            keywords.update(check_keywords)
+
+        return RulePlan(
+            regulator_type=regulator_type,
+            keywords=frozenset(k.lower() for k in keywords),
+            checks=tuple(checks),
+        )
+
+    def get_plan(self, regulator_type: Optional[RegulatorType] = None) -> RulePlan:
+        """Get the compiled rule plan for a regulator.
+
+        Args:
+            regulator_type: Regulator, or None for general checks only.
+
+        Returns:
+            RulePlan used by validate.
+        """
+        plan = self._plans.get(regulator_type)
+        if plan is None:
+            plan = self._plans[None]
+        return plan
 
     def _build_validation_rules(self) -> dict:
         """Build validation rules for different document types."""
@@ -195,18 +326,11 @@ class ContentValidator:
             document_id=document_id,
         )
 
-        # Run general validation checks
-        self._validate_content_length(parsed, result)
-        self._validate_regulatory_keywords(parsed, result)
-        self._validate_structure(parsed, result)
-
-        # Run metadata validation if provided
-        if metadata:
-            self._validate_metadata_completeness(metadata, result)
-
-        # Run regulator-specific validation
-        if regulator_type:
-            self._validate_for_regulator(parsed, metadata, regulator_type, result)
+        # Scan the text once, then run general and regulator-specific checks
+        plan = self.get_plan(regulator_type)
+        scan = plan.scan(parsed.text)
+        for check in plan.checks:
+            check(parsed, metadata, scan, result)
 
         # Calculate quality score
         result.quality_score = self._calculate_quality_score(result)
@@ -232,8 +356,56 @@ class ContentValidator:
 
         return result
 
+    def validate_many(
+        self,
+        tasks: Sequence[ValidationTask],
+        max_workers: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> list[ValidationResult]:
+        """Validate a batch of documents across a process pool.
+
+        Falls back to validating in-process for small batches, when
+        max_workers is 1, or where process pools are unavailable (such as
+        AWS Lambda, which lacks shared memory semaphores).
+
+        Args:
+            tasks: Documents to validate.
+            max_workers: Worker processes (defaults to the CPU count).
+            chunksize: Documents sent to a worker at a time.
+
+        Returns:
+            ValidationResults in the same order as tasks.
+        """
+        tasks = list(tasks)
+        if len(tasks) < self.MIN_POOL_BATCH or max_workers == 1:
+            return [_run_task(self, task) for task in tasks]
+
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(type(self),),
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.warning("validation_pool_unavailable", error=str(e))
+            return [_run_task(self, task) for task in tasks]
+
+        with executor:
+            results = list(executor.map(_run_worker_task, tasks, chunksize=max(1, chunksize)))
+
+        logger.info(
+            "validation_batch_complete",
+            document_count=len(results),
+            invalid_count=sum(1 for r in results if not r.is_valid),
+        )
+        return results
+
     def _validate_content_length(
-        self, parsed: ParsedDocument, result: ValidationResult
+        self,
+        parsed: ParsedDocument,
+        metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
+        result: ValidationResult,
     ) -> None:
         """Validate minimum content length."""
         min_length = self.MIN_CONTENT_LENGTH.get(parsed.format, 200)
@@ -249,16 +421,15 @@ class ContentValidator:
             result.add_passed("content_length")
 
     def _validate_regulatory_keywords(
-        self, parsed: ParsedDocument, result: ValidationResult
+        self,
+        parsed: ParsedDocument,
+        metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
+        result: ValidationResult,
     ) -> None:
         """Validate presence of regulatory keywords."""
-        text_lower = parsed.text.lower()
-
         # Check general keywords
-        general_count = sum(
-            1 for kw in self.REGULATORY_KEYWORDS["general"]
-            if kw in text_lower
-        )
+        general_count = len(scan.found(self.REGULATORY_KEYWORDS["general"]))
 
         if general_count < 2:
             result.add_issue(
@@ -272,7 +443,11 @@ class ContentValidator:
 
 
     def _validate_structure(
-        self, parsed: ParsedDocument, result: ValidationResult
+        self,
+        parsed: ParsedDocument,
+        metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
+        result: ValidationResult,
     ) -> None:
         """Validate document structure."""
         # Check for sections
@@ -296,9 +471,16 @@ class ContentValidator:
                 )
 
     def _validate_metadata_completeness(
-        self, metadata: ExtractedMetadata, result: ValidationResult
+        self,
+        parsed: ParsedDocument,
+        metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
+        result: ValidationResult,
     ) -> None:
-        """Validate metadata completeness."""
+        """Validate metadata completeness, if metadata was provided."""
+        if not metadata:
+            return
+
         # Check for critical metadata fields
         if not metadata.form_number and not metadata.cfr_section and not metadata.guideline_number:
             result.add_issue(
@@ -337,31 +519,11 @@ class ContentValidator:
                 suggestion="Manual review recommended",
             )
 
-    def _validate_for_regulator(
-        self,
-        parsed: ParsedDocument,
-        metadata: Optional[ExtractedMetadata],
-        regulator_type: RegulatorType,
-        result: ValidationResult,
-    ) -> None:
-        """Run regulator-specific validation."""
-        if regulator_type == RegulatorType.FEDERAL_RESERVE:
-            self._validate_federal_reserve(parsed, metadata, result)
-        elif regulator_type == RegulatorType.OCC:
-            self._validate_occ(parsed, metadata, result)
-        elif regulator_type == RegulatorType.FDIC:
-            self._validate_fdic(parsed, metadata, result)
-        elif regulator_type == RegulatorType.FINCEN:
-            self._validate_fincen(parsed, metadata, result)
-        elif regulator_type == RegulatorType.OSFI:
-            self._validate_osfi(parsed, metadata, result)
-        elif regulator_type == RegulatorType.FINTRAC:
-            self._validate_fintrac(parsed, metadata, result)
-
     def _validate_federal_reserve(
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate Federal Reserve documents.
@@ -369,12 +531,10 @@ class ContentValidator:
         Implements Requirement 12.1: Validate FR Y-14 instructions have
         capital plan schedules properly extracted.
         """
-        text_lower = parsed.text.lower()
-
         # Check for FR Y-14 specific content
         if metadata and metadata.form_number and "y-14" in metadata.form_number.lower():
-            required = ["schedule", "capital", "scenario"]
-            found = [r for r in required if r in text_lower]
+            required = self.FR_Y14_ELEMENTS
+            found = scan.found(required)
 
             if len(found) < 2:
                 result.add_issue(
@@ -390,14 +550,13 @@ class ContentValidator:
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate OCC documents."""
-        text_lower = parsed.text.lower()
-
         # Check for Call Report specific content
-        if "call report" in text_lower or "ffiec" in text_lower:
-            if "schedule" not in text_lower and "line item" not in text_lower:
+        if scan.has_any(self.CALL_REPORT_MARKERS):
+            if not scan.has_any(self.CALL_REPORT_ELEMENTS):
                 result.add_issue(
                     "Call Report document missing schedule or line item references",
                     ValidationSeverity.WARNING,
@@ -410,6 +569,7 @@ class ContentValidator:
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate FDIC documents.
@@ -445,14 +605,13 @@ class ContentValidator:
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate FinCEN documents."""
-        text_lower = parsed.text.lower()
-
         # Check for threshold amounts
-        if "ctr" in text_lower or "currency transaction" in text_lower:
-            if "$10,000" not in parsed.text and "10,000" not in parsed.text:
+        if scan.has_any(self.CTR_MARKERS):
+            if not scan.has_any(self.CTR_THRESHOLDS):
                 result.add_issue(
                     "CTR document missing $10,000 threshold reference",
                     ValidationSeverity.WARNING,
@@ -465,6 +624,7 @@ class ContentValidator:
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate OSFI documents.
@@ -472,12 +632,9 @@ class ContentValidator:
         Implements Requirement 12.5: Validate OSFI guidelines have
         calculation methodologies and reporting templates extracted.
         """
-        text_lower = parsed.text.lower()
-
         # Check for guideline structure
         if metadata and metadata.guideline_number:
-            required_elements = ["requirement", "expectation", "institution"]
-            found = [e for e in required_elements if e in text_lower]
+            found = scan.found(self.OSFI_GUIDELINE_ELEMENTS)
 
             if len(found) < 2:
                 result.add_issue(
@@ -492,6 +649,7 @@ class ContentValidator:
         self,
         parsed: ParsedDocument,
         metadata: Optional[ExtractedMetadata],
+        scan: TextScan,
         result: ValidationResult,
     ) -> None:
         """Validate FINTRAC documents.
@@ -499,10 +657,8 @@ class ContentValidator:
         Implements Requirement 12.4: Validate FINTRAC guidance has
         threshold amounts and timing requirements captured.
         """
-        text_lower = parsed.text.lower()
-
         # Check for threshold
-        has_threshold = "c$10,000" in text_lower or "10,000" in text_lower
+        has_threshold = scan.has_any(self.FINTRAC_THRESHOLDS)
         if not has_threshold:
             result.add_issue(
                 "FINTRAC document missing threshold amount reference",
@@ -513,8 +669,7 @@ class ContentValidator:
             result.add_passed("fintrac_threshold")
 
         # Check for timing requirements
-        timing_patterns = ["days", "business days", "within"]
-        has_timing = any(p in text_lower for p in timing_patterns)
+        has_timing = scan.has_any(self.FINTRAC_TIMING)
         if not has_timing:
             result.add_issue(
                 "FINTRAC document missing timing requirements",
@@ -636,6 +791,33 @@ class ContentValidator:
         }
 
 
+# ==================== Process pool workers ====================
+
+_worker_validator: Optional[ContentValidator] = None
+
+
+def _init_worker(validator_class: type) -> None:
+    """Create the validator used by a pool worker process."""
+    global _worker_validator
+    _worker_validator = validator_class()
+
+
+def _run_task(validator: ContentValidator, task: ValidationTask) -> ValidationResult:
+    return validator.validate(
+        task.parsed,
+        metadata=task.metadata,
+        regulator_type=task.regulator_type,
+        document_id=task.document_id,
+    )
+
+
+def _run_worker_task(task: ValidationTask) -> ValidationResult:
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = ContentValidator()
+    return _run_task(_worker_validator, task)
+
+
 class ReferentialIntegrityChecker:
     """Checks referential integrity between documents.
 
@@ -1,30 +1,35 @@
 """Document retrieval system for regulatory knowledge base."""
 
-from regulatory_kb.retrieval.scheduler import (
-    DocumentScheduler,
-    ScheduleConfig,
-    ScheduledTask,
-    TaskPriority,
-    UpdateCycle,
-    RetryConfig,
-)
-from regulatory_kb.retrieval.service import (
-    DocumentRetrievalService,
-    RetrievalResult,
-    RetrievalStatus,
-    BaseSourceAdapter,
-    RetrieverConfig,
-)
-from regulatory_kb.retrieval.adapters import (
-    FederalReserveAdapter,
-    OCCAdapter,
-    FDICAdapter,
-    FinCENAdapter,
-    ECFRAdapter,
-    FederalRegisterAdapter,
-    OSFIAdapter,
-    FINTRACAdapter,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.retrieval.scheduler import (
+        DocumentScheduler,
+        ScheduleConfig,
+        ScheduledTask,
+        TaskPriority,
+        UpdateCycle,
+        RetryConfig,
+    )
+    from regulatory_kb.retrieval.service import (
+        DocumentRetrievalService,
+        RetrievalResult,
+        RetrievalStatus,
+        BaseSourceAdapter,
+        RetrieverConfig,
+    )
+    from regulatory_kb.retrieval.adapters import (
+        FederalReserveAdapter,
+        OCCAdapter,
+        FDICAdapter,
+        FinCENAdapter,
+        ECFRAdapter,
+        FederalRegisterAdapter,
+        OSFIAdapter,
+        FINTRACAdapter,
+    )
 
 __all__ = [
     # Scheduler
@@ -50,3 +55,34 @@ __all__ = [
     "OSFIAdapter",
     "FINTRACAdapter",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.retrieval.scheduler": (
+            "DocumentScheduler",
+            "ScheduleConfig",
+            "ScheduledTask",
+            "TaskPriority",
+            "UpdateCycle",
+            "RetryConfig",
+        ),
+        "regulatory_kb.retrieval.service": (
+            "DocumentRetrievalService",
+            "RetrievalResult",
+            "RetrievalStatus",
+            "BaseSourceAdapter",
+            "RetrieverConfig",
+        ),
+        "regulatory_kb.retrieval.adapters": (
+            "FederalReserveAdapter",
+            "OCCAdapter",
+            "FDICAdapter",
+            "FinCENAdapter",
+            "ECFRAdapter",
+            "FederalRegisterAdapter",
+            "OSFIAdapter",
+            "FINTRACAdapter",
+        ),
+    },
+)
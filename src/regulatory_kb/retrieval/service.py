@@ -8,6 +8,7 @@ Implements Requirements 1.1-1.9, 2.1-2.3:
 
 import asyncio
 import hashlib
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -20,6 +21,7 @@ from pydantic import BaseModel, Field
 
 from regulatory_kb.core import get_logger
 from regulatory_kb.core.errors import DocumentRetrievalError
+from regulatory_kb.core.resilience import get_bulkhead_registry
 
 logger = get_logger(__name__)
 
@@ -141,10 +143,22 @@ class BaseSourceAdapter(ABC):
 
         Returns:
             RetrievalResult with document content or error
+
+        Raises:
+            ConcurrencyLimitError: If the regulator_websites bulkhead stays
+                full for its max_wait.
         """
         domain = urlparse(url).netloc
         await self._rate_limit(domain)
 
+        # Hold a bulkhead slot only for the request itself, not the
+        # politeness delay above, so the limit adapts to the server alone
+        bulkhead = get_bulkhead_registry().get_or_create("regulator_websites")
+        await bulkhead.limiter.acquire_async(bulkhead.config.max_wait)
+        started = time.monotonic()
+        latency: Optional[float] = None
+        overloaded = False
+
         headers = {"User-Agent": self.config.user_agent}
         if etag:
             headers["If-None-Match"] = etag
@@ -160,6 +174,9 @@ class BaseSourceAdapter(ABC):
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
                 ssl=self.config.verify_ssl,
             ) as response:
+                # Time to headers; body size says nothing about congestion
+                latency = time.monotonic() - started
+
                 if response.status == 304:
                     logger.info("document_not_modified", url=url)
                     return RetrievalResult(
@@ -177,6 +194,7 @@ class BaseSourceAdapter(ABC):
                     )
 
                 if response.status == 429:
+                    overloaded = True
                     logger.warning("rate_limited", url=url)
                     return RetrievalResult(
                         status=RetrievalStatus.RATE_LIMITED,
@@ -185,6 +203,7 @@ class BaseSourceAdapter(ABC):
                     )
 
                 if response.status >= 400:
+                    overloaded = response.status in (502, 503, 504)
                     error_msg = f"HTTP {response.status}: {response.reason}"
                     logger.error("retrieval_failed", url=url, error=error_msg)
                     return RetrievalResult(
@@ -229,6 +248,7 @@ class BaseSourceAdapter(ABC):
                 return result
 
         except asyncio.TimeoutError:
+            overloaded = True
             error_msg = f"Request timed out after {self.config.timeout_seconds}s"
             logger.error("retrieval_timeout", url=url, timeout=self.config.timeout_seconds)
             return RetrievalResult(
@@ -237,6 +257,7 @@ class BaseSourceAdapter(ABC):
                 error_message=error_msg,
             )
         except aiohttp.ClientError as e:
+            overloaded = True
             error_msg = f"Client error: {str(e)}"
             logger.error("retrieval_client_error", url=url, error=str(e))
             return RetrievalResult(
@@ -244,6 +265,8 @@ class BaseSourceAdapter(ABC):
                 source_url=url,
                 error_message=error_msg,
             )
+        finally:
+            bulkhead.limiter.release(latency, overloaded)
 
     def _parse_content_type(self, content_type_header: str) -> Optional[ContentType]:
         """Parse Content-Type header to ContentType enum."""
@@ -1,30 +1,45 @@
 """Storage layer for the regulatory knowledge base."""
 
-from regulatory_kb.storage.graph_store import (
-    FalkorDBStore,
-    GraphStoreConfig,
-    QueryResult,
-)
-from regulatory_kb.storage.schema import (
-    NodeType,
-    GraphSchema,
-)
-from regulatory_kb.storage.relationship_manager import (
-    RelationshipManager,
-    RelationshipPattern,
-    DetectedRelationship,
-    VersionHistoryEntry,
-    IntegrityCheckResult,
-)
-from regulatory_kb.storage.vector_search import (
-    VectorSearchService,
-    VectorSearchConfig,
-    SearchResult,
-    HybridSearchResult,
-    SimilarityMetric,
-    SearchMode,
-)
-from regulatory_kb.storage.chunk_store import ChunkStore
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.storage.graph_store import (
+        FalkorDBStore,
+        GraphStoreConfig,
+        QueryResult,
+    )
+    from regulatory_kb.storage.schema import (
+        NodeType,
+        GraphSchema,
+    )
+    from regulatory_kb.storage.relationship_manager import (
+        RelationshipManager,
+        RelationshipPattern,
+        DetectedRelationship,
+        VersionHistoryEntry,
+        IntegrityCheckResult,
+    )
+    from regulatory_kb.storage.vector_search import (
+        VectorSearchService,
+        VectorSearchConfig,
+        SearchResult,
+        HybridSearchResult,
+        SimilarityMetric,
+        SearchMode,
+        PoolingStrategy,
+    )
+    from regulatory_kb.storage.embeddings import (
+        EmbeddingProvider,
+        EmbeddingClientConfig,
+        FunctionEmbeddingProvider,
+        BatchingEmbeddingProvider,
+        BedrockEmbeddingProvider,
+        QuantizedVectorIndex,
+        VectorQuantization,
+    )
+    from regulatory_kb.storage.chunk_store import ChunkStore
 
 __all__ = [
     # Graph store
@@ -47,6 +62,58 @@ __all__ = [
     "HybridSearchResult",
     "SimilarityMetric",
     "SearchMode",
+    "PoolingStrategy",
+    # Embeddings
+    "EmbeddingProvider",
+    "EmbeddingClientConfig",
+    "FunctionEmbeddingProvider",
+    "BatchingEmbeddingProvider",
+    "BedrockEmbeddingProvider",
+    "QuantizedVectorIndex",
+    "VectorQuantization",
     # Chunk store
     "ChunkStore",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.storage.graph_store": (
+            "FalkorDBStore",
+            "GraphStoreConfig",
+            "QueryResult",
+        ),
+        "regulatory_kb.storage.schema": (
+            "NodeType",
+            "GraphSchema",
+        ),
+        "regulatory_kb.storage.relationship_manager": (
+            "RelationshipManager",
+            "RelationshipPattern",
+            "DetectedRelationship",
+            "VersionHistoryEntry",
+            "IntegrityCheckResult",
+        ),
+        "regulatory_kb.storage.vector_search": (
+            "VectorSearchService",
+            "VectorSearchConfig",
+            "SearchResult",
+            "HybridSearchResult",
+            "SimilarityMetric",
+            "SearchMode",
+            "PoolingStrategy",
+        ),
+        "regulatory_kb.storage.embeddings": (
+            "EmbeddingProvider",
+            "EmbeddingClientConfig",
+            "FunctionEmbeddingProvider",
+            "BatchingEmbeddingProvider",
+            "BedrockEmbeddingProvider",
+            "QuantizedVectorIndex",
+            "VectorQuantization",
+        ),
+        "regulatory_kb.storage.chunk_store": (
+            "ChunkStore",
+        ),
+    },
+)
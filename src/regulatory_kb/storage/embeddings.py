@@ -0,0 +1,462 @@
+"""Batch embedding providers and quantized vector storage.
+
+Provides:
+- EmbeddingProvider: interface for embedding a batch of texts into a
+  float32 NumPy matrix
+- BatchingEmbeddingProvider: splits texts into request-sized batches and
+  runs them concurrently under a request rate limit, with retries
+- BedrockEmbeddingProvider: Titan and Cohere embedding models on Bedrock
+- QuantizedVectorIndex: in-memory int8/float16 vector scan used to pick
+  candidates that are then reranked on full-precision vectors
+"""
+
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Protocol, Sequence
+
+from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.core.resilience import RetryConfig, RetryHandler, get_bulkhead_registry
+
+if TYPE_CHECKING:
+    import numpy
+
+np = lazy_import("numpy")
+boto3 = lazy_import("boto3")
+logger = get_logger(__name__)
+
+# Embeds one request's worth of texts
+BatchEmbeddingFunction = Callable[[list[str]], Sequence[Sequence[float]]]
+
+
+class VectorQuantization(str, Enum):
+    """Compact encodings for stored embedding vectors."""
+
+    INT8 = "int8"
+    FLOAT16 = "float16"
+
+
+class EmbeddingProvider(Protocol):
+    """Embeds texts in batches."""
+
+    dimension: int
+
+    def embed_batch(self, texts: Sequence[str]) -> "numpy.ndarray":
+        """Embed texts.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            float32 array of shape (len(texts), dimension).
+        """
+        ...
+
+
+class FunctionEmbeddingProvider:
+    """Adapts a per-text embedding function to the batch interface."""
+
+    def __init__(self, embedding_fn: Callable[[str], Sequence[float]], dimension: int):
+        """Initialize the provider.
+
+        Args:
+            embedding_fn: Function returning the embedding of one text.
+            dimension: Embedding dimension.
+        """
+        self.embedding_fn = embedding_fn
+        self.dimension = dimension
+
+    def embed_batch(self, texts: Sequence[str]) -> "numpy.ndarray":
+        """Embed texts one at a time."""
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = self.embedding_fn(text)
+        return matrix
+
+
+@dataclass
+class EmbeddingClientConfig:
+    """Configuration for batched embedding requests."""
+
+    batch_size: int = 32  # Texts per request
+    max_concurrency: int = 4  # Requests in flight
+    requests_per_second: float = 0.0  # 0 for no rate limit
+    bulkhead: Optional[str] = None  # Bulkhead name, e.g. "bedrock"
+    retry: RetryConfig = field(default_factory=lambda: RetryConfig(base_delay=0.5, max_delay=10.0))
+
+
+class BatchingEmbeddingProvider:
+    """Embeds texts with concurrent batched requests.
+
+    Duplicate texts are embedded once. Each request is paced to the
+    configured rate, retried with backoff on transient errors and, when a
+    bulkhead is configured, counted against that dependency's slots.
+    """
+
+    def __init__(
+        self,
+        embed_fn: BatchEmbeddingFunction,
+        dimension: int,
+        config: Optional[EmbeddingClientConfig] = None,
+    ):
+        """Initialize the provider.
+
+        Args:
+            embed_fn: Function embedding one batch of texts per request.
+            dimension: Embedding dimension.
+            config: Client configuration.
+        """
+        self.embed_fn = embed_fn
+        self.dimension = dimension
+        self.config = config or EmbeddingClientConfig()
+        self._retry = RetryHandler(self.config.retry)
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+        self.requests = 0
+        self.texts_embedded = 0
+        self.duplicates = 0
+
+    def embed_batch(self, texts: Sequence[str]) -> "numpy.ndarray":
+        """Embed texts with batched, concurrent requests.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            float32 array of shape (len(texts), dimension).
+
+        Raises:
+            ValueError: If a request returns the wrong number or size of vectors.
+        """
+        positions: dict[str, int] = {}
+        rows = [positions.setdefault(text, len(positions)) for text in texts]
+        unique = list(positions)
+        if not unique:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        size = max(1, self.config.batch_size)
+        batches = [unique[i:i + size] for i in range(0, len(unique), size)]
+        workers = min(max(1, self.config.max_concurrency), len(batches))
+        if workers == 1:
+            results = [self._request(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as executor:
+                results = list(executor.map(self._request, batches))
+
+        with self._lock:
+            self.texts_embedded += len(unique)
+            self.duplicates += len(texts) - len(unique)
+        logger.debug("texts_embedded", texts=len(texts), unique=len(unique), requests=len(batches))
+        return np.concatenate(results)[rows]
+
+    def _request(self, batch: list[str]) -> "numpy.ndarray":
+        """Embed one batch with retries."""
+        vectors = self._retry.execute_sync_with_retry(
+            self._attempt, batch, component="embeddings"
+        )
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.shape != (len(batch), self.dimension):
+            raise ValueError(
+                f"Embedding request returned shape {matrix.shape}, "
+                f"expected ({len(batch)}, {self.dimension})"
+            )
+        return matrix
+
+    def _attempt(self, batch: list[str]) -> Sequence[Sequence[float]]:
+        """Make one paced request, in the bulkhead if configured."""
+        self._pace()
+        with self._lock:
+            self.requests += 1
+        if self.config.bulkhead:
+            bulkhead = get_bulkhead_registry().get_or_create(self.config.bulkhead)
+            return bulkhead.execute_sync(self.embed_fn, batch)
+        return self.embed_fn(batch)
+
+    def _pace(self) -> None:
+        """Wait for the next request slot under requests_per_second."""
+        if self.config.requests_per_second <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + 1.0 / self.config.requests_per_second
+        if start > now:
+            time.sleep(start - now)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get request counters."""
+        return {
+            "requests": self.requests,
+            "texts_embedded": self.texts_embedded,
+            "duplicates": self.duplicates,
+        }
+
+
+class BedrockEmbeddingProvider(BatchingEmbeddingProvider):
+    """Embedding models on Amazon Bedrock.
+
+    Cohere models embed up to 96 texts per request; Titan models embed one
+    text per request, so Titan batches run as concurrent single requests.
+    """
+
+    COHERE_MAX_BATCH = 96
+
+    def __init__(
+        self,
+        model_id: str = "amazon.titan-embed-text-v2:0",
+        dimension: int = 1024,
+        region: str = "us-east-1",
+        config: Optional[EmbeddingClientConfig] = None,
+        client: Any = None,
+    ):
+        """Initialize the provider.
+
+        Args:
+            model_id: Bedrock embedding model ID.
+            dimension: Embedding dimension.
+            region: AWS region.
+            config: Client configuration; defaults to the "bedrock" bulkhead.
+            client: Optional bedrock-runtime client.
+        """
+        config = config or EmbeddingClientConfig(bulkhead="bedrock")
+        self.is_cohere = model_id.startswith("cohere.")
+        limit = self.COHERE_MAX_BATCH if self.is_cohere else 1
+        super().__init__(
+            self._invoke,
+            dimension,
+            replace(config, batch_size=min(config.batch_size, limit)),
+        )
+        self.model_id = model_id
+        self.region = region
+        self._client = client
+
+    def _get_client(self):
+        """Get or create the Bedrock runtime client."""
+        if self._client is None:
+            self._client = boto3.client("bedrock-runtime", region_name=self.region)
+        return self._client
+
+    def _invoke(self, texts: list[str]) -> list[list[float]]:
+        """Embed one batch with a single model invocation."""
+        if self.is_cohere:
+            body = {"texts": texts, "input_type": "search_document"}
+        else:
+            body = {"inputText": texts[0], "dimensions": self.dimension, "normalize": True}
+
+        response = self._get_client().invoke_model(modelId=self.model_id, body=json.dumps(body))
+        payload = json.loads(response["body"].read())
+        if self.is_cohere:
+            return payload["embeddings"]
+        return [payload["embedding"]]
+
+
+# ==================== Quantization ====================
+
+
+def quantize(
+    vectors: "numpy.ndarray", mode: VectorQuantization
+) -> tuple["numpy.ndarray", Optional["numpy.ndarray"]]:
+    """Quantize float vectors.
+
+    int8 uses a symmetric per-vector scale so each vector keeps its full
+    code range; float16 is a plain cast.
+
+    Args:
+        vectors: float32 array of shape (n, dimension).
+        mode: Quantization mode.
+
+    Returns:
+        Tuple of (codes, scales); scales is None for float16.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if VectorQuantization(mode) == VectorQuantization.FLOAT16:
+        return vectors.astype(np.float16), None
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize(codes: "numpy.ndarray", scales: Optional["numpy.ndarray"]) -> "numpy.ndarray":
+    """Restore approximate float32 vectors from quantized codes."""
+    vectors = codes.astype(np.float32)
+    if scales is not None:
+        vectors *= scales[:, None]
+    return vectors
+
+
+def encode_vector(code: "numpy.ndarray") -> str:
+    """Encode one quantized vector as a compact string property."""
+    return base64.b64encode(code.tobytes()).decode("ascii")
+
+
+def decode_vector(value: str, mode: VectorQuantization) -> "numpy.ndarray":
+    """Decode a string property written by encode_vector."""
+    dtype = np.int8 if VectorQuantization(mode) == VectorQuantization.INT8 else np.float16
+    return np.frombuffer(base64.b64decode(value), dtype=dtype)
+
+
+def similarity_scores(
+    vectors: "numpy.ndarray", query: "numpy.ndarray", metric: str
+) -> "numpy.ndarray":
+    """Score vectors against a query, higher meaning more similar.
+
+    Args:
+        vectors: float32 array of shape (n, dimension).
+        query: float32 array of shape (dimension,).
+        metric: "cosine", "dot_product" or "euclidean".
+
+    Returns:
+        float32 array of n scores.
+    """
+    if metric == "euclidean":
+        return 1.0 / (1.0 + np.linalg.norm(vectors - query, axis=1))
+    scores = vectors @ query
+    if metric == "cosine":
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        scores = np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
+    return scores
+
+
+class QuantizedVectorIndex:
+    """In-memory quantized vectors for a fast approximate candidate scan.
+
+    Holds int8 (4x smaller than float32) or float16 (2x smaller) codes.
+    Search dequantizes in blocks so the scan never materializes the full
+    float32 matrix; callers rerank the candidates on full-precision vectors.
+    """
+
+    BLOCK_ROWS = 4096
+
+    def __init__(
+        self,
+        dimension: int,
+        mode: VectorQuantization = VectorQuantization.INT8,
+        metric: str = "cosine",
+    ):
+        """Initialize the index.
+
+        Args:
+            dimension: Vector dimension.
+            mode: Quantization mode.
+            metric: Similarity metric name.
+        """
+        self.dimension = dimension
+        self.mode = VectorQuantization(mode)
+        self.metric = metric
+        self._keys: list[Hashable] = []
+        self._codes: list["numpy.ndarray"] = []
+        self._scales: list["numpy.ndarray"] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by codes and scales."""
+        return sum(c.nbytes for c in self._codes) + sum(s.nbytes for s in self._scales)
+
+    def add(self, keys: Sequence[Hashable], vectors: "numpy.ndarray") -> None:
+        """Quantize and add full-precision vectors.
+
+        Args:
+            keys: One key per vector.
+            vectors: float32 array of shape (len(keys), dimension).
+        """
+        self.add_codes(keys, *self.encode(vectors))
+
+    def encode(
+        self, vectors: "numpy.ndarray"
+    ) -> tuple["numpy.ndarray", Optional["numpy.ndarray"]]:
+        """Quantize vectors the way the index stores them.
+
+        Cosine vectors are normalized first, so codes can be persisted and
+        later restored with add_codes.
+
+        Returns:
+            Tuple of (codes, scales) as returned by quantize.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        return quantize(vectors, self.mode)
+
+    def add_codes(
+        self,
+        keys: Sequence[Hashable],
+        codes: "numpy.ndarray",
+        scales: Optional["numpy.ndarray"] = None,
+    ) -> None:
+        """Add already-quantized vectors, e.g. loaded from storage."""
+        if len(keys) == 0:
+            return
+        with self._lock:
+            self._keys.extend(keys)
+            self._codes.append(codes)
+            if scales is not None:
+                self._scales.append(np.asarray(scales, dtype=np.float32))
+
+    def remove(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove vectors whose key matches a predicate.
+
+        Returns:
+            Number of vectors removed.
+        """
+        with self._lock:
+            keep = np.fromiter((not predicate(k) for k in self._keys), dtype=bool, count=len(self._keys))
+            removed = int(len(keep) - keep.sum())
+            if removed:
+                codes, scales = self._merged()
+                self._keys = [k for k, kept in zip(self._keys, keep) if kept]
+                self._codes = [codes[keep]]
+                self._scales = [scales[keep]] if scales is not None else []
+            return removed
+
+    def _merged(self) -> tuple["numpy.ndarray", Optional["numpy.ndarray"]]:
+        """Merge the added chunks into single arrays (lock held)."""
+        if len(self._codes) > 1:
+            self._codes = [np.concatenate(self._codes)]
+            if self._scales:
+                self._scales = [np.concatenate(self._scales)]
+        if not self._codes:
+            dtype = np.int8 if self.mode == VectorQuantization.INT8 else np.float16
+            return np.zeros((0, self.dimension), dtype=dtype), None
+        return self._codes[0], self._scales[0] if self._scales else None
+
+    def search(self, query: Sequence[float], k: int) -> list[tuple[Hashable, float]]:
+        """Find the k most similar vectors by approximate score.
+
+        Args:
+            query: Query vector.
+            k: Number of candidates.
+
+        Returns:
+            List of (key, approximate score), best first.
+        """
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            codes, scales = self._merged()
+            # add_codes extends the key list in place; only the first
+            # count keys belong to the merged codes
+            keys = self._keys
+            count = len(keys)
+        if k <= 0 or not count:
+            return []
+
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, self.BLOCK_ROWS):
+            end = start + self.BLOCK_ROWS
+            block = dequantize(codes[start:end], scales[start:end] if scales is not None else None)
+            scores[start:end] = similarity_scores(block, query, self.metric)
+
+        k = min(k, count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(keys[i], float(scores[i])) for i in top]
@@ -2,16 +2,25 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
-
-from falkordb import FalkorDB
+from typing import Any, Optional, TYPE_CHECKING
 
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.core.resilience import with_bulkhead
 from regulatory_kb.models.document import Document, DocumentCategory
 from regulatory_kb.models.regulator import Regulator
 from regulatory_kb.models.relationship import GraphRelationship, RelationshipType
 from regulatory_kb.models.requirement import RegulatoryRequirement
 from regulatory_kb.storage.schema import NodeType, GraphSchema
 
+falkordb = lazy_import("falkordb")
+
+if TYPE_CHECKING:
+    from falkordb import FalkorDB
+else:
+    def FalkorDB(*args: Any, **kwargs: Any) -> Any:
+        """Create a FalkorDB client; the driver (and redis) load on first connect."""
+        return falkordb.FalkorDB(*args, **kwargs)
+
 
 @dataclass
 class GraphStoreConfig:
@@ -450,6 +459,7 @@ class FalkorDBStore:
 
     # ==================== Query Operations ====================
 
+    @with_bulkhead("falkordb")
     def query(self, cypher_query: str, params: Optional[dict] = None) -> QueryResult:
         """Execute a raw Cypher query.
         
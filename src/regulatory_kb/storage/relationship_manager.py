@@ -9,11 +9,15 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+from regulatory_kb.core import get_logger
 from regulatory_kb.models.document import Document, DocumentCategory
 from regulatory_kb.models.relationship import GraphRelationship, RelationshipType
-from regulatory_kb.storage.graph_store import FalkorDBStore
+from regulatory_kb.processing.quality import GraphIntegrityChecker
+from regulatory_kb.storage.graph_store import FalkorDBStore, QueryResult
+
+logger = get_logger(__name__)
 
 
 class RelationshipPattern(str, Enum):
@@ -386,6 +390,9 @@ class RelationshipManager:
     def check_integrity(self) -> IntegrityCheckResult:
         """Check referential integrity of all relationships.
         
+        Duplicates are found by grouping relationships per (source,
+        target, type), which is linear in the number of relationships.
+        
         Returns:
             IntegrityCheckResult with any issues found.
         """
@@ -397,23 +404,18 @@ class RelationshipManager:
         WHERE NOT exists(b.id) AND NOT exists(b.number) AND NOT exists(b.cfr_section)
         RETURN type(r) as rel_type, a.id as source
         """
-        orphan_result = self.store.query(orphan_query)
-        for node in orphan_result.nodes:
-            result.orphaned_relationships.append(
-                f"{node.get('source')} -> {node.get('rel_type')}"
-            )
+        for rel_type, source in self._rows(self.store.query(orphan_query)):
+            result.orphaned_relationships.append(f"{source} -> {rel_type}")
         
         # Find duplicate relationships
         duplicate_query = """
-        MATCH (a)-[r1]->(b), (a)-[r2]->(b)
-        WHERE id(r1) < id(r2) AND type(r1) = type(r2)
-        RETURN a.id as source, b.id as target, type(r1) as rel_type
+        MATCH (a)-[r]->(b)
+        WITH a, b, type(r) as rel_type, count(r) as copies
+        WHERE copies > 1
+        RETURN a.id as source, b.id as target, rel_type
         """
-        dup_result = self.store.query(duplicate_query)
-        for node in dup_result.nodes:
-            result.duplicate_relationships.append(
-                f"{node.get('source')} -[{node.get('rel_type')}]-> {node.get('target')}"
-            )
+        for source, target, rel_type in self._rows(self.store.query(duplicate_query)):
+            result.duplicate_relationships.append(f"{source} -[{rel_type}]-> {target}")
         
         result.is_valid = (
             len(result.orphaned_relationships) == 0
@@ -423,6 +425,82 @@ class RelationshipManager:
         
         return result
 
+    @staticmethod
+    def _rows(result: QueryResult) -> list[list[Any]]:
+        """Get the scalar rows of a query result."""
+        if result.raw_result is not None and result.raw_result.result_set:
+            return list(result.raw_result.result_set)
+        return []
+
+    def load_integrity_checker(
+        self,
+        checker: Optional[GraphIntegrityChecker] = None,
+        page_size: int = 5000,
+    ) -> GraphIntegrityChecker:
+        """Load the graph's nodes and relationships into an integrity checker.
+        
+        Pages through the graph by internal ID so each query is bounded.
+        The checker then keeps issues up to date as nodes and relationships
+        are registered or removed, instead of re-checking the whole graph.
+        
+        Args:
+            checker: Checker to load into. Creates one if not provided.
+            page_size: Nodes or relationships fetched per query.
+            
+        Returns:
+            The loaded checker.
+        """
+        checker = checker if checker is not None else GraphIntegrityChecker()
+        tracked = checker.node_types
+        
+        node_query = """
+        MATCH (n)
+        WHERE id(n) > $after
+        RETURN id(n), labels(n)[0], coalesce(n.id, n.number, n.cfr_section)
+        ORDER BY id(n)
+        LIMIT $limit
+        """
+        node_count = 0
+        for _, label, node_id in self._pages(node_query, page_size):
+            if label in tracked and node_id is not None:
+                checker.register_node(label, node_id)
+                node_count += 1
+        
+        relationship_query = """
+        MATCH (a)-[r]->(b)
+        WHERE id(r) > $after
+        RETURN id(r), labels(a)[0], coalesce(a.id, a.number, a.cfr_section),
+               labels(b)[0], coalesce(b.id, b.number, b.cfr_section)
+        ORDER BY id(r)
+        LIMIT $limit
+        """
+        relationship_count = 0
+        for _, source_type, source_id, target_type, target_id in self._pages(
+            relationship_query, page_size
+        ):
+            # Relationships touching untracked node types cannot be verified
+            if source_type in tracked and target_type in tracked:
+                checker.register_relationship(source_type, source_id, target_type, target_id)
+                relationship_count += 1
+        
+        logger.info(
+            "integrity_checker_loaded",
+            node_count=node_count,
+            relationship_count=relationship_count,
+            issue_count=checker.get_statistics()["issues"],
+        )
+        return checker
+
+    def _pages(self, query: str, page_size: int) -> Iterator[list[Any]]:
+        """Run a keyset-paginated query; the first column is the cursor."""
+        after = -1
+        while True:
+            rows = self._rows(self.store.query(query, {"after": after, "limit": page_size}))
+            yield from rows
+            if len(rows) < page_size:
+                return
+            after = rows[-1][0]
+
     # ==================== Version History Tracking ====================
 
     def track_version(
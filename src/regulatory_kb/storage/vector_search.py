@@ -5,13 +5,29 @@ hybrid search (vector + keyword), and real-time index updates.
 """
 
 import hashlib
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from regulatory_kb.core.lazy import lazy_import
 from regulatory_kb.models.document import Document
+from regulatory_kb.storage.embeddings import (
+    EmbeddingProvider,
+    FunctionEmbeddingProvider,
+    QuantizedVectorIndex,
+    VectorQuantization,
+    decode_vector,
+    encode_vector,
+    similarity_scores,
+)
 from regulatory_kb.storage.graph_store import FalkorDBStore
 
+if TYPE_CHECKING:
+    import numpy
+
+np = lazy_import("numpy")
+
 
 class SimilarityMetric(str, Enum):
     """Supported similarity metrics for vector search."""
@@ -21,6 +37,13 @@ class SimilarityMetric(str, Enum):
     DOT_PRODUCT = "dot_product"
 
 
+class PoolingStrategy(str, Enum):
+    """How chunk embeddings combine into a document embedding."""
+
+    MEAN = "mean"  # Centroid of the (normalized) chunk vectors
+    MAX = "max"  # Element-wise maximum
+
+
 class SearchMode(str, Enum):
     """Search modes for hybrid search."""
 
@@ -36,8 +59,17 @@ class VectorSearchConfig:
     embedding_dimension: int = 1536  # Default for many embedding models
     similarity_metric: SimilarityMetric = SimilarityMetric.COSINE
     index_name: str = "document_embeddings"
+    document_index_name: str = "document_centroids"
+    document_pooling: PoolingStrategy = PoolingStrategy.MEAN
     chunk_size: int = 512  # Characters per chunk
     chunk_overlap: int = 50  # Overlap between chunks
+    # Keep an int8/float16 copy of chunk vectors for a resident candidate
+    # scan; candidates are reranked on the full-precision vectors
+    quantization: Optional[VectorQuantization] = None
+    rerank_factor: int = 4  # Candidates scanned per requested result
+    # The resident index only sees this process's writes; it is reloaded
+    # from the graph on first search and then at this interval
+    quantized_refresh_seconds: float = 300.0
 
 
 @dataclass
@@ -85,6 +117,7 @@ class VectorSearchService:
         store: FalkorDBStore,
         config: Optional[VectorSearchConfig] = None,
         embedding_fn: Optional[EmbeddingFunction] = None,
+        embedding_provider: Optional[EmbeddingProvider] = None,
     ):
         """Initialize the vector search service.
         
@@ -93,10 +126,21 @@ class VectorSearchService:
             config: Vector search configuration.
             embedding_fn: Function to generate embeddings from text.
                          If not provided, a simple hash-based mock is used.
+            embedding_provider: Batch embedding provider; takes precedence
+                         over embedding_fn.
         """
         self.store = store
         self.config = config or VectorSearchConfig()
         self._embedding_fn = embedding_fn or self._default_embedding_fn
+        self._provider = embedding_provider
+        self.quantized_index: Optional[QuantizedVectorIndex] = None
+        self._quantized_loaded_at: Optional[float] = None
+        if self.config.quantization:
+            self.quantized_index = QuantizedVectorIndex(
+                self.config.embedding_dimension,
+                self.config.quantization,
+                self.config.similarity_metric.value,
+            )
 
     def _default_embedding_fn(self, text: str) -> list[float]:
         """Default embedding function using hash-based vectors.
@@ -133,48 +177,89 @@ class VectorSearchService:
             embedding_fn: Function that takes text and returns embedding vector.
         """
         self._embedding_fn = embedding_fn
+        self._provider = None
+
+    def set_embedding_provider(self, provider: EmbeddingProvider) -> None:
+        """Set a batch embedding provider.
+        
+        Args:
+            provider: Provider used for all embedding generation.
+        """
+        self._provider = provider
 
     # ==================== Index Management ====================
 
     def create_vector_index(self) -> bool:
-        """Create vector index in FalkorDB.
+        """Create vector indexes in FalkorDB.
         
-        Creates an index for efficient vector similarity search.
+        Creates one index over chunk embeddings and one over document
+        embeddings for efficient vector similarity search, plus a range
+        index on ``DocumentEmbedding.document_id`` for lookups by document.
         
         Returns:
-            True if index was created successfully.
+            True if all indexes were created successfully.
         """
-        # FalkorDB uses a specific syntax for vector indexes
-        query = f"""
-        CREATE VECTOR INDEX {self.config.index_name}
-        FOR (d:Document)
-        ON d.embedding
-        OPTIONS {{
-            dimension: {self.config.embedding_dimension},
-            similarityFunction: '{self.config.similarity_metric.value}'
-        }}
+        return all(self.create_vector_indexes().values())
+
+    def create_vector_indexes(self) -> dict[str, bool]:
+        """Create each vector index, independently of the others.
+        
+        Also creates the range index on ``DocumentEmbedding.document_id``.
+        An index that fails, e.g. because it already exists on an upgraded
+        deployment, does not stop the remaining ones from being created.
+        
+        Returns:
+            Mapping of index name (``Label.property`` for the range index)
+            to whether it was created.
         """
+        indexes = (
+            (self.config.index_name, "DocumentChunk"),
+            (self.config.document_index_name, "DocumentEmbedding"),
+        )
         
+        created = {}
+        for name, label in indexes:
+            # FalkorDB uses a specific syntax for vector indexes
+            query = f"""
+            CREATE VECTOR INDEX {name}
+            FOR (n:{label})
+            ON n.embedding
+            OPTIONS {{
+                dimension: {self.config.embedding_dimension},
+                similarityFunction: '{self.config.similarity_metric.value}'
+            }}
+            """
+            try:
+                self.store.query(query)
+                created[name] = True
+            except Exception:
+                # Index may already exist
+                created[name] = False
+
+        # Range index for the MERGE/MATCH lookups on DocumentEmbedding
+        # by document_id, which the vector index does not serve
         try:
-            self.store.query(query)
-            return True
+            self.store.query("CREATE INDEX FOR (n:DocumentEmbedding) ON (n.document_id)")
+            created["DocumentEmbedding.document_id"] = True
         except Exception:
-            # Index may already exist
-            return False
+            created["DocumentEmbedding.document_id"] = False
+        return created
 
     def drop_vector_index(self) -> bool:
-        """Drop the vector index.
+        """Drop the vector indexes.
+        
+        Each index is dropped even if dropping another fails.
         
         Returns:
-            True if index was dropped successfully.
+            True if both indexes were dropped successfully.
         """
-        query = f"DROP INDEX {self.config.index_name}"
-        
-        try:
-            self.store.query(query)
-            return True
-        except Exception:
-            return False
+        dropped = True
+        for name in (self.config.index_name, self.config.document_index_name):
+            try:
+                self.store.query(f"DROP INDEX {name}")
+            except Exception:
+                dropped = False
+        return dropped
 
     # ==================== Embedding Generation ====================
 
@@ -187,8 +272,24 @@ class VectorSearchService:
         Returns:
             Embedding vector.
         """
+        if self._provider is not None:
+            return self._provider.embed_batch([text])[0].tolist()
         return self._embedding_fn(text)
 
+    def generate_embeddings(self, texts: list[str]) -> "numpy.ndarray":
+        """Generate embeddings for many texts in one provider call.
+        
+        Args:
+            texts: Texts to embed.
+            
+        Returns:
+            float32 array of shape (len(texts), embedding_dimension).
+        """
+        provider = self._provider or FunctionEmbeddingProvider(
+            self._embedding_fn, self.config.embedding_dimension
+        )
+        return provider.embed_batch(texts)
+
     def chunk_text(self, text: str) -> list[str]:
         """Split text into overlapping chunks for embedding.
         
@@ -235,13 +336,9 @@ class VectorSearchService:
             return []
         
         chunks = self.chunk_text(document.content.text)
-        embeddings = []
-        
-        for i, chunk in enumerate(chunks):
-            embedding = self.generate_embedding(chunk)
-            embeddings.append((i, embedding))
+        embeddings = self.generate_embeddings(chunks)
         
-        return embeddings
+        return [(i, embedding.tolist()) for i, embedding in enumerate(embeddings)]
 
     # ==================== Index Updates ====================
 
@@ -260,27 +357,131 @@ class VectorSearchService:
             return 0
         
         chunks = self.chunk_text(document.content.text)
+        self._store_chunks(document, chunks, self.generate_embeddings(chunks))
+        
+        return len(chunks)
+
+    def _store_chunks(
+        self,
+        document: Document,
+        chunks: list[str],
+        embeddings: "numpy.ndarray",
+    ) -> None:
+        """Write a document's chunks and embeddings in one query.
+        
+        Args:
+            document: Document the chunks belong to.
+            chunks: Chunk texts.
+            embeddings: Chunk embeddings, one row per chunk.
+        """
+        if not chunks:
+            return
+        
+        rows = [
+            {"index": i, "text": chunk, "embedding": embedding.tolist()}
+            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+        ]
+        quantized = ""
+        if self.quantized_index is not None:
+            codes, scales = self.quantized_index.encode(embeddings)
+            for i, row in enumerate(rows):
+                row["code"] = encode_vector(codes[i])
+                row["scale"] = float(scales[i]) if scales is not None else None
+            quantized = ", c.embedding_q = chunk.code, c.embedding_scale = chunk.scale"
+            self.quantized_index.remove(lambda key: key[0] == document.id)
+            self.quantized_index.add_codes(
+                [(document.id, i) for i in range(len(chunks))], codes, scales
+            )
+        
+        # Store chunks with embeddings, then the document embedding pooled
+        # from them, so the two never disagree
+        query = f"""
+        UNWIND $chunks AS chunk
+        MERGE (c:DocumentChunk {{document_id: $doc_id, chunk_index: chunk.index}})
+        SET c.text = chunk.text,
+            c.embedding = vecf32(chunk.embedding),
+            c.title = $title{quantized}
+        WITH count(c) AS chunk_count
+        MERGE (e:DocumentEmbedding {{document_id: $doc_id}})
+        SET e.embedding = vecf32($document_embedding),
+            e.title = $title,
+            e.chunk_count = chunk_count
+        """
         
-        for i, chunk in enumerate(chunks):
-            embedding = self.generate_embedding(chunk)
+        self.store.query(query, {
+            "doc_id": document.id,
+            "chunks": rows,
+            "title": document.title,
+            "document_embedding": self.pool_embeddings(embeddings).tolist(),
+        })
+
+    def pool_embeddings(self, embeddings: "numpy.ndarray") -> "numpy.ndarray":
+        """Combine chunk embeddings into one document embedding.
+        
+        For cosine similarity, chunk vectors are normalized before pooling
+        so long chunks do not dominate, and the result is normalized.
+        
+        Args:
+            embeddings: Chunk embeddings, one row per chunk.
             
-            # Store chunk with embedding
-            query = """
-            MERGE (c:DocumentChunk {document_id: $doc_id, chunk_index: $chunk_idx})
-            SET c.text = $text,
-                c.embedding = $embedding,
-                c.title = $title
-            """
+        Returns:
+            Document embedding.
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        cosine = self.config.similarity_metric == SimilarityMetric.COSINE
+        if cosine:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        
+        if self.config.document_pooling == PoolingStrategy.MAX:
+            pooled = vectors.max(axis=0)
+        else:
+            pooled = vectors.mean(axis=0)
+        
+        if cosine:
+            norm = np.linalg.norm(pooled)
+            if norm > 0:
+                pooled = pooled / norm
+        return pooled
+
+    def refresh_document_embedding(self, document_id: str) -> bool:
+        """Recompute a document embedding from its stored chunks.
+        
+        Backfills documents indexed before document embeddings existed,
+        without re-embedding their text.
+        
+        Args:
+            document_id: ID of the document.
             
-            self.store.query(query, {
-                "doc_id": document.id,
-                "chunk_idx": i,
-                "text": chunk,
-                "embedding": embedding,
-                "title": document.title,
-            })
+        Returns:
+            True if the document had chunks and its embedding was stored.
+        """
+        query = """
+        MATCH (c:DocumentChunk {document_id: $doc_id})
+        RETURN c.embedding as embedding, c.title as title
+        """
         
-        return len(chunks)
+        result = self.store.query(query, {"doc_id": document_id})
+        rows = [
+            row for row in (result.raw_result.result_set if result.raw_result else None) or []
+            if row[0] is not None
+        ]
+        if not rows:
+            return False
+        
+        pooled = self.pool_embeddings(np.asarray([row[0] for row in rows], dtype=np.float32))
+        self.store.query("""
+        MERGE (e:DocumentEmbedding {document_id: $doc_id})
+        SET e.embedding = vecf32($document_embedding),
+            e.title = $title,
+            e.chunk_count = $chunk_count
+        """, {
+            "doc_id": document_id,
+            "document_embedding": pooled.tolist(),
+            "title": rows[0][1],
+            "chunk_count": len(rows),
+        })
+        return True
 
     def update_document_index(self, document: Document) -> int:
         """Update index for a modified document.
@@ -308,16 +509,66 @@ class VectorSearchService:
         Returns:
             True if removal was successful.
         """
-        query = """
-        MATCH (c:DocumentChunk {document_id: $doc_id})
-        DELETE c
-        """
-        
         try:
-            self.store.query(query, {"doc_id": document_id})
-            return True
+            self.store.query("""
+            MATCH (e:DocumentEmbedding {document_id: $doc_id})
+            DELETE e
+            """, {"doc_id": document_id})
+            self.store.query("""
+            MATCH (c:DocumentChunk {document_id: $doc_id})
+            DELETE c
+            """, {"doc_id": document_id})
         except Exception:
             return False
+        
+        if self.quantized_index is not None:
+            self.quantized_index.remove(lambda key: key[0] == document_id)
+        return True
+
+    def load_quantized_index(self) -> int:
+        """Load stored quantized chunk vectors into the resident index.
+        
+        Picks up documents indexed by other processes. Called by
+        vector_search on first use and every quantized_refresh_seconds.
+        
+        Returns:
+            Number of chunk vectors loaded.
+        """
+        if self.quantized_index is None:
+            return 0
+        
+        query = """
+        MATCH (c:DocumentChunk)
+        WHERE c.embedding_q IS NOT NULL
+        RETURN c.document_id, c.chunk_index, c.embedding_q, c.embedding_scale
+        """
+        
+        result = self.store.query(query)
+        self._quantized_loaded_at = time.monotonic()
+        rows = result.raw_result.result_set if result.raw_result else None
+        if not rows:
+            return 0
+        
+        mode = self.quantized_index.mode
+        codes = np.stack([decode_vector(row[2], mode) for row in rows])
+        scales = None
+        if mode == VectorQuantization.INT8:
+            scales = np.asarray([row[3] for row in rows], dtype=np.float32)
+        
+        self.quantized_index = QuantizedVectorIndex(
+            self.config.embedding_dimension, mode, self.config.similarity_metric.value
+        )
+        self.quantized_index.add_codes([(row[0], row[1]) for row in rows], codes, scales)
+        return len(rows)
+
+    def _current_quantized_index(self) -> Optional[QuantizedVectorIndex]:
+        """Get the resident index, reloading it from the graph when stale."""
+        if self.quantized_index is None:
+            return None
+        loaded_at = self._quantized_loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self.config.quantized_refresh_seconds:
+            self.load_quantized_index()
+        return self.quantized_index
 
     # ==================== Vector Search ====================
 
@@ -339,6 +590,10 @@ class VectorSearchService:
         """
         query_embedding = self.generate_embedding(query_text)
         
+        quantized_index = self._current_quantized_index()
+        if quantized_index is not None and len(quantized_index):
+            return self._quantized_search(quantized_index, query_embedding, top_k, min_score)
+        
         # FalkorDB vector search query
         query = """
         CALL db.idx.vector.queryNodes(
@@ -375,6 +630,69 @@ class VectorSearchService:
         
         return results
 
+    def _quantized_search(
+        self,
+        quantized_index: QuantizedVectorIndex,
+        query_embedding: list[float],
+        top_k: int,
+        min_score: float,
+    ) -> list[SearchResult]:
+        """Scan the quantized index, then rerank on full-precision vectors.
+        
+        Args:
+            quantized_index: Resident index to scan.
+            query_embedding: Query vector.
+            top_k: Maximum number of results.
+            min_score: Minimum similarity score threshold.
+            
+        Returns:
+            List of search results ordered by exact similarity.
+        """
+        candidates = quantized_index.search(
+            query_embedding, top_k * max(1, self.config.rerank_factor)
+        )
+        if not candidates:
+            return []
+        
+        query = """
+        UNWIND $keys AS key
+        MATCH (c:DocumentChunk {document_id: key[0], chunk_index: key[1]})
+        RETURN c.document_id as doc_id,
+               c.title as title,
+               c.text as chunk_text,
+               c.chunk_index as chunk_idx,
+               c.embedding as embedding
+        """
+        
+        result = self.store.query(query, {"keys": [list(key) for key, _ in candidates]})
+        rows = [
+            row for row in (result.raw_result.result_set if result.raw_result else None) or []
+            if row[4] is not None
+        ]
+        if not rows:
+            return []
+        
+        vectors = np.asarray([row[4] for row in rows], dtype=np.float32)
+        scores = similarity_scores(
+            vectors,
+            np.asarray(query_embedding, dtype=np.float32),
+            self.config.similarity_metric.value,
+        )
+        
+        results = [
+            SearchResult(
+                document_id=row[0],
+                title=row[1] or "",
+                chunk_text=row[2],
+                chunk_index=row[3],
+                score=float(score),
+            )
+            for row, score in zip(rows, scores)
+            if score >= min_score
+        ]
+        results.sort(key=lambda r: r.score, reverse=True)
+        return results[:top_k]
+
     def find_similar_documents(
         self,
         document_id: str,
@@ -389,45 +707,33 @@ class VectorSearchService:
         Returns:
             List of similar documents.
         """
-        # Get the document's embedding (average of chunk embeddings)
+        # One ANN query over document embeddings; the source document is
+        # its own nearest neighbour, so ask for one extra
         query = """
-        MATCH (c:DocumentChunk {document_id: $doc_id})
-        RETURN c.embedding as embedding
-        LIMIT 1
-        """
-        
-        result = self.store.query(query, {"doc_id": document_id})
-        
-        if not result.raw_result or not result.raw_result.result_set:
-            return []
-        
-        doc_embedding = result.raw_result.result_set[0][0]
-        
-        # Search for similar documents (excluding the source)
-        search_query = """
+        MATCH (source:DocumentEmbedding {document_id: $doc_id})
         CALL db.idx.vector.queryNodes(
-            'DocumentChunk',
+            'DocumentEmbedding',
             'embedding',
-            $top_k,
-            vecf32($embedding)
+            $k,
+            source.embedding
         ) YIELD node, score
-        WHERE node.document_id <> $exclude_id
-        RETURN DISTINCT node.document_id as doc_id,
+        WHERE node.document_id <> $doc_id
+        RETURN node.document_id as doc_id,
                node.title as title,
-               max(score) as max_score
-        ORDER BY max_score DESC
+               score
+        ORDER BY score DESC
         LIMIT $top_k
         """
         
-        search_result = self.store.query(search_query, {
-            "embedding": doc_embedding,
-            "exclude_id": document_id,
-            "top_k": top_k * 3,  # Get more to account for duplicates
+        result = self.store.query(query, {
+            "doc_id": document_id,
+            "k": top_k + 1,
+            "top_k": top_k,
         })
         
         results = []
-        if search_result.raw_result and search_result.raw_result.result_set:
-            for row in search_result.raw_result.result_set[:top_k]:
+        if result.raw_result and result.raw_result.result_set:
+            for row in result.raw_result.result_set[:top_k]:
                 results.append(SearchResult(
                     document_id=row[0],
                     title=row[1] or "",
@@ -665,9 +971,21 @@ class VectorSearchService:
         
         for i in range(0, len(documents), batch_size):
             batch = documents[i:i + batch_size]
-            for doc in batch:
-                chunk_count = self.index_document(doc)
-                results[doc.id] = chunk_count
+            
+            # Embed the whole batch in one provider call so requests
+            # run concurrently across documents
+            chunked = [
+                (doc, self.chunk_text((doc.content.text if doc.content else None) or ""))
+                for doc in batch
+            ]
+            texts = [chunk for _, chunks in chunked for chunk in chunks]
+            embeddings = self.generate_embeddings(texts)
+            
+            offset = 0
+            for doc, chunks in chunked:
+                self._store_chunks(doc, chunks, embeddings[offset:offset + len(chunks)])
+                offset += len(chunks)
+                results[doc.id] = len(chunks)
         
         return results
 
@@ -692,6 +1010,11 @@ class VectorSearchService:
             "similarity_metric": self.config.similarity_metric.value,
         }
         
+        if self.quantized_index is not None:
+            stats["quantization"] = self.quantized_index.mode.value
+            stats["quantized_vectors"] = len(self.quantized_index)
+            stats["quantized_bytes"] = self.quantized_index.nbytes
+        
         if result.raw_result and result.raw_result.result_set:
             row = result.raw_result.result_set[0]
             stats["chunk_count"] = row[0]
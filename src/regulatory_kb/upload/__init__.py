@@ -7,38 +7,56 @@ Implements Requirements 1.1-1.7, 2.1-2.6, 4.1-4.5, 5.1-5.5:
 - Batch upload support
 """
 
-from regulatory_kb.upload.models import (
-    UploadStatus,
-    FileType,
-    UploadRequest,
-    UploadResponse,
-    BatchUploadResponse,
-    StatusResponse,
-    BatchStatusResponse,
-    UploadMetadata,
-    ValidationResult,
-    UploadRecord,
-)
-from regulatory_kb.upload.validator import (
-    FileValidator,
-    MetadataValidator,
-    FieldValidationError,
-    MetadataValidationResult,
-)
-from regulatory_kb.upload.service import UploadService
-from regulatory_kb.upload.status_tracker import StatusTracker
-from regulatory_kb.upload.metadata_handler import (
-    MetadataHandler,
-    MergedMetadata,
-    REQUIRED_METADATA_FIELDS,
-)
-from regulatory_kb.upload.version_manager import (
-    VersionManager,
-    VersionRecord,
-    ReplacementResult,
-    MatchingDocument,
-    PreservedRelationship,
-)
+from typing import TYPE_CHECKING
+
+from regulatory_kb.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from regulatory_kb.upload.models import (
+        UploadStatus,
+        FileType,
+        UploadRequest,
+        UploadResponse,
+        BatchUploadResponse,
+        StatusResponse,
+        BatchStatusResponse,
+        UploadMetadata,
+        ValidationResult,
+        UploadRecord,
+    )
+    from regulatory_kb.upload.validator import (
+        FileValidator,
+        MetadataValidator,
+        FieldValidationError,
+        MetadataValidationResult,
+    )
+    from regulatory_kb.upload.service import UploadService
+    from regulatory_kb.upload.status_tracker import (
+        StatusTracker,
+        StatusReadCache,
+        StatusUpdateCoalescer,
+    )
+    from regulatory_kb.upload.metadata_handler import (
+        MetadataHandler,
+        MergedMetadata,
+        REQUIRED_METADATA_FIELDS,
+    )
+    from regulatory_kb.upload.version_manager import (
+        VersionManager,
+        VersionRecord,
+        ReplacementResult,
+        MatchingDocument,
+        PreservedRelationship,
+        NearDuplicateMatch,
+        NearDuplicateDecision,
+    )
+    from regulatory_kb.upload.near_duplicates import (
+        MinHasher,
+        MinHashConfig,
+        LSHIndex,
+        NearDuplicateAction,
+        NearDuplicateConfig,
+    )
 
 __all__ = [
     # Models
@@ -64,10 +82,73 @@ __all__ = [
     # Services
     "UploadService",
     "StatusTracker",
+    "StatusReadCache",
+    "StatusUpdateCoalescer",
     # Version management
     "VersionManager",
     "VersionRecord",
     "ReplacementResult",
     "MatchingDocument",
     "PreservedRelationship",
+    "NearDuplicateMatch",
+    "NearDuplicateDecision",
+    # Near-duplicate detection
+    "MinHasher",
+    "MinHashConfig",
+    "LSHIndex",
+    "NearDuplicateAction",
+    "NearDuplicateConfig",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "regulatory_kb.upload.models": (
+            "UploadStatus",
+            "FileType",
+            "UploadRequest",
+            "UploadResponse",
+            "BatchUploadResponse",
+            "StatusResponse",
+            "BatchStatusResponse",
+            "UploadMetadata",
+            "ValidationResult",
+            "UploadRecord",
+        ),
+        "regulatory_kb.upload.validator": (
+            "FileValidator",
+            "MetadataValidator",
+            "FieldValidationError",
+            "MetadataValidationResult",
+        ),
+        "regulatory_kb.upload.service": (
+            "UploadService",
+        ),
+        "regulatory_kb.upload.status_tracker": (
+            "StatusTracker",
+            "StatusReadCache",
+            "StatusUpdateCoalescer",
+        ),
+        "regulatory_kb.upload.metadata_handler": (
+            "MetadataHandler",
+            "MergedMetadata",
+            "REQUIRED_METADATA_FIELDS",
+        ),
+        "regulatory_kb.upload.version_manager": (
+            "VersionManager",
+            "VersionRecord",
+            "ReplacementResult",
+            "MatchingDocument",
+            "PreservedRelationship",
+            "NearDuplicateMatch",
+            "NearDuplicateDecision",
+        ),
+        "regulatory_kb.upload.near_duplicates": (
+            "MinHasher",
+            "MinHashConfig",
+            "LSHIndex",
+            "NearDuplicateAction",
+            "NearDuplicateConfig",
+        ),
+    },
+)
@@ -0,0 +1,256 @@
+"""Streaming multipart/form-data parsing for upload requests.
+
+Parts are located by scanning for boundaries in the request body and
+returned as ``memoryview`` slices of it, so file content is never copied
+between decoding the request and uploading to S3. Part sizes are checked
+while scanning: the search for a part's closing boundary is bounded by
+the part's size limit, so an oversized file is rejected without scanning
+the rest of the body.
+"""
+
+import io
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Maximum size of one part's header block
+MAX_HEADER_BYTES = 16 * 1024
+
+# Default maximum size of a non-file field (e.g. metadata JSON)
+MAX_FIELD_BYTES = 1024 * 1024
+
+_PARAM = re.compile(rb';\s*([\w*.-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;\s]*))')
+
+
+class MultipartError(ValueError):
+    """Malformed or oversized multipart body."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+@dataclass
+class MultipartPart:
+    """One part of a multipart body."""
+
+    name: Optional[str]
+    filename: Optional[str]
+    content: memoryview
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_file(self) -> bool:
+        """Whether the part is a file upload."""
+        return self.filename is not None
+
+    def text(self) -> str:
+        """Decode the content as UTF-8.
+
+        Raises:
+            UnicodeDecodeError: If the content is not valid UTF-8.
+        """
+        return str(self.content, "utf-8")
+
+
+def get_boundary(content_type: str) -> Optional[str]:
+    """Get the boundary parameter of a multipart Content-Type header.
+
+    Args:
+        content_type: Content-Type header value.
+
+    Returns:
+        Boundary string, or None if absent.
+    """
+    for name, quoted, bare in _PARAM.findall(b";" + content_type.encode("latin-1", "replace")):
+        if name.lower() == b"boundary":
+            value = (quoted or bare).decode("latin-1")
+            return value or None
+    return None
+
+
+def iter_parts(
+    body: Union[bytes, bytearray],
+    boundary: str,
+    max_file_size: Optional[int] = None,
+    max_field_size: int = MAX_FIELD_BYTES,
+    max_parts: int = 100,
+) -> Iterator[MultipartPart]:
+    """Iterate over the parts of a multipart body.
+
+    Accepts CRLF line breaks as required by RFC 2046, and bare LF for
+    lenient clients. Part content is exact: trailing bytes that happen to
+    look like line breaks or dashes are kept.
+
+    Args:
+        body: Request body.
+        boundary: Boundary from the Content-Type header.
+        max_file_size: Maximum bytes of a file part (None for no limit).
+        max_field_size: Maximum bytes of a non-file part.
+        max_parts: Maximum number of parts.
+
+    Yields:
+        MultipartPart objects whose content is a slice of body.
+
+    Raises:
+        MultipartError: If the body is malformed (status 400) or a part
+            exceeds its size limit (status 413).
+    """
+    view = memoryview(body)
+    delimiter = b"--" + boundary.encode("latin-1")
+    marker = b"\n" + delimiter
+
+    if body.startswith(delimiter):
+        position = 0
+    else:
+        position = body.find(marker)
+        if position == -1:
+            raise MultipartError("Multipart boundary not found")
+        position += 1
+
+    count = 0
+    while True:
+        position += len(delimiter)
+        if body[position:position + 2] == b"--":
+            return
+
+        line_end = body.find(b"\n", position, position + MAX_HEADER_BYTES)
+        if line_end == -1:
+            raise MultipartError("Malformed multipart delimiter line")
+        header_start = line_end + 1
+
+        header_end, content_start = _find_header_end(body, header_start)
+        headers = _parse_headers(view[header_start:header_end])
+        name, filename = _content_disposition(headers.get("content-disposition", ""))
+
+        count += 1
+        if count > max_parts:
+            raise MultipartError(f"Multipart body exceeds {max_parts} parts")
+
+        limit = max_file_size if filename is not None else max_field_size
+        search_end = len(body) if limit is None else content_start + limit + 1 + len(marker)
+        next_delimiter = body.find(marker, content_start, search_end)
+        if next_delimiter == -1:
+            if limit is not None and search_end < len(body):
+                raise MultipartError(
+                    f"Multipart part '{name}' exceeds maximum size of {limit} bytes",
+                    status_code=413,
+                )
+            raise MultipartError("Multipart body is missing its closing boundary")
+
+        content_end = next_delimiter
+        if content_end > content_start and body[content_end - 1] == 0x0D:
+            content_end -= 1
+        if limit is not None and content_end - content_start > limit:
+            raise MultipartError(
+                f"Multipart part '{name}' exceeds maximum size of {limit} bytes",
+                status_code=413,
+            )
+
+        yield MultipartPart(
+            name=name,
+            filename=filename,
+            content=view[content_start:content_end],
+            headers=headers,
+        )
+        position = next_delimiter + 1
+
+
+def _find_header_end(data: Union[bytes, bytearray], start: int) -> tuple[int, int]:
+    """Locate the blank line ending a part's headers.
+
+    Returns:
+        Tuple of (end of headers, start of content).
+    """
+    end = start + MAX_HEADER_BYTES
+    if data[start:start + 2] == b"\r\n":
+        return start, start + 2
+    if data[start:start + 1] == b"\n":
+        return start, start + 1
+
+    crlf = data.find(b"\r\n\r\n", start, end)
+    lf = data.find(b"\n\n", start, end)
+    if crlf == -1 and lf == -1:
+        raise MultipartError("Malformed multipart part headers")
+    if lf == -1 or (crlf != -1 and crlf < lf):
+        return crlf, crlf + 4
+    return lf, lf + 2
+
+
+def _parse_headers(block: memoryview) -> dict[str, str]:
+    """Parse a part's header block into lower-cased names and values."""
+    headers: dict[str, str] = {}
+    for line in bytes(block).decode("utf-8", errors="replace").splitlines():
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _content_disposition(value: str) -> tuple[Optional[str], Optional[str]]:
+    """Get the name and filename parameters of a Content-Disposition header."""
+    name = filename = None
+    for key, quoted, bare in _PARAM.findall(value.encode("utf-8")):
+        key = key.lower()
+        text = (quoted.replace(b'\\"', b'"') if quoted else bare).decode("utf-8", errors="replace")
+        if key == b"name":
+            name = text
+        elif key == b"filename":
+            filename = text
+    return name, filename
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable, read-only file object over a buffer, without copying it.
+
+    Lets boto3 stream a memoryview to S3: ``put_object`` and
+    ``upload_fileobj`` accept file objects but not memoryviews.
+    """
+
+    def __init__(self, buffer: Buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        chunk = self._view[self._position:self._position + len(target)]
+        size = len(chunk)
+        memoryview(target).cast("B")[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+
+def as_body(content: Buffer) -> Union[bytes, bytearray, BufferReader]:
+    """Get a boto3 ``Body`` argument for content without copying it."""
+    if isinstance(content, (bytes, bytearray)):
+        return content
+    return BufferReader(content)
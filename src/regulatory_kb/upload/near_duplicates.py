@@ -0,0 +1,241 @@
+"""Near-duplicate detection for uploaded documents.
+
+MinHash signatures estimate the Jaccard similarity of two documents' word
+shingles, so re-uploads with a different title or a reformatted PDF still
+match. Locality-sensitive hashing splits each signature into bands and
+buckets documents by band, so candidates for a new upload are found by
+looking up a fixed number of buckets rather than comparing against every
+stored document.
+"""
+
+import hashlib
+import os
+import re
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from regulatory_kb.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy
+
+np = lazy_import("numpy")
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+_WORD = re.compile(r"\w+")
+
+# Shingles hashed per permutation block, bounding memory for long documents
+_BLOCK = 4096
+
+
+@dataclass
+class MinHashConfig:
+    """Configuration for MinHash signatures and LSH banding.
+
+    With ``bands`` bands of ``rows`` rows each, a pair with Jaccard
+    similarity s becomes a candidate with probability 1 - (1 - s^rows)^bands;
+    the default 16 x 8 makes pairs above ~0.7 likely candidates.
+    """
+
+    num_perm: int = 128
+    bands: int = 16
+    shingle_size: int = 5  # Words per shingle
+    seed: int = 1
+
+    def __post_init__(self):
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+    @property
+    def rows(self) -> int:
+        """Signature values per band."""
+        return self.num_perm // self.bands
+
+
+class NearDuplicateAction(str, Enum):
+    """How an upload is routed after near-duplicate lookup."""
+
+    NEW = "new"
+    REPLACE = "replace"
+    SKIP = "skip"
+
+
+@dataclass
+class NearDuplicateConfig:
+    """Similarity thresholds for routing near-duplicate uploads."""
+
+    skip_threshold: float = 0.95  # Same content: keep the stored document
+    replace_threshold: float = 0.8  # Revised content: new version of it
+
+    @classmethod
+    def from_env(cls) -> "NearDuplicateConfig":
+        """Create config from NEAR_DUPLICATE_*_THRESHOLD variables."""
+        return cls(
+            skip_threshold=float(os.environ.get("NEAR_DUPLICATE_SKIP_THRESHOLD", cls.skip_threshold)),
+            replace_threshold=float(
+                os.environ.get("NEAR_DUPLICATE_REPLACE_THRESHOLD", cls.replace_threshold)
+            ),
+        )
+
+    def action_for(self, similarity: float) -> NearDuplicateAction:
+        """Get the routing action for a similarity score."""
+        if similarity >= self.skip_threshold:
+            return NearDuplicateAction.SKIP
+        if similarity >= self.replace_threshold:
+            return NearDuplicateAction.REPLACE
+        return NearDuplicateAction.NEW
+
+
+class MinHasher:
+    """Computes MinHash signatures of document text."""
+
+    def __init__(self, config: Optional[MinHashConfig] = None):
+        """Initialize the hasher.
+
+        Args:
+            config: MinHash configuration; signatures are only comparable
+                between hashers with the same num_perm and seed.
+        """
+        self.config = config or MinHashConfig()
+        rng = np.random.RandomState(self.config.seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=self.config.num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=self.config.num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> set[str]:
+        """Get the word shingles of text.
+
+        Text is lower-cased and reduced to word characters, so layout,
+        punctuation and whitespace differences do not change shingles.
+        """
+        words = _WORD.findall(text.lower())
+        size = self.config.shingle_size
+        if len(words) <= size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def signature(self, text: str) -> "numpy.ndarray":
+        """Compute the MinHash signature of text.
+
+        Args:
+            text: Document text.
+
+        Returns:
+            uint32 array of num_perm values.
+        """
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in self.shingles(text)), dtype=np.uint64
+        )
+        signature = np.full(self.config.num_perm, MAX_HASH, dtype=np.uint64)
+        a, b = self._a[:, None], self._b[:, None]
+        with np.errstate(over="ignore"):
+            for start in range(0, len(hashes), _BLOCK):
+                block = hashes[None, start:start + _BLOCK]
+                permuted = ((a * block + b) % MERSENNE_PRIME) & MAX_HASH
+                np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature.astype(np.uint32)
+
+
+def estimate_similarity(a: "numpy.ndarray", b: "numpy.ndarray") -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return float(np.mean(np.asarray(a) == np.asarray(b)))
+
+
+def band_keys(signature: "numpy.ndarray", bands: int) -> list[str]:
+    """Get the LSH bucket key of each band of a signature."""
+    rows = len(signature) // bands
+    data = np.ascontiguousarray(signature, dtype=np.uint32)
+    return [
+        f"{band}:{hashlib.blake2b(data[band * rows:(band + 1) * rows].tobytes(), digest_size=8).hexdigest()}"
+        for band in range(bands)
+    ]
+
+
+class LSHIndex:
+    """In-memory LSH index over MinHash signatures."""
+
+    def __init__(self, config: Optional[MinHashConfig] = None):
+        """Initialize the index.
+
+        Args:
+            config: MinHash configuration of the indexed signatures.
+        """
+        self.config = config or MinHashConfig()
+        self._buckets: dict[str, set[str]] = {}
+        self._signatures: dict[str, "numpy.ndarray"] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, document_id: str, signature: "numpy.ndarray") -> None:
+        """Index a document's signature, replacing any previous one."""
+        self.remove(document_id)
+        self._signatures[document_id] = signature
+        for key in band_keys(signature, self.config.bands):
+            self._buckets.setdefault(key, set()).add(document_id)
+
+    def remove(self, document_id: str) -> bool:
+        """Remove a document from the index.
+
+        Returns:
+            True if the document was indexed.
+        """
+        signature = self._signatures.pop(document_id, None)
+        if signature is None:
+            return False
+        for key in band_keys(signature, self.config.bands):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(document_id)
+                if not bucket:
+                    del self._buckets[key]
+        return True
+
+    def candidates(self, signature: "numpy.ndarray") -> set[str]:
+        """Get documents sharing at least one band bucket with a signature."""
+        found: set[str] = set()
+        for key in band_keys(signature, self.config.bands):
+            found |= self._buckets.get(key, set())
+        return found
+
+    def query(self, signature: "numpy.ndarray", threshold: float = 0.0) -> list[tuple[str, float]]:
+        """Find indexed documents similar to a signature.
+
+        Args:
+            signature: Query signature.
+            threshold: Minimum estimated Jaccard similarity.
+
+        Returns:
+            List of (document_id, similarity), most similar first.
+        """
+        return rank_candidates(
+            signature,
+            ((doc_id, self._signatures[doc_id]) for doc_id in self.candidates(signature)),
+            threshold,
+        )
+
+
+def rank_candidates(
+    signature: "numpy.ndarray",
+    candidates: Iterable[tuple[str, "numpy.ndarray"]],
+    threshold: float = 0.0,
+) -> list[tuple[str, float]]:
+    """Verify LSH candidates against a signature and rank them.
+
+    Args:
+        signature: Query signature.
+        candidates: (document_id, signature) pairs.
+        threshold: Minimum estimated Jaccard similarity.
+
+    Returns:
+        List of (document_id, similarity), most similar first.
+    """
+    scored = [
+        (doc_id, estimate_similarity(signature, other)) for doc_id, other in candidates
+    ]
+    scored = [(doc_id, score) for doc_id, score in scored if score >= threshold]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored
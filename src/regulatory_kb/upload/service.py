@@ -4,21 +4,27 @@ Implements Requirements 1.1-1.7, 5.1-5.5:
 - Single document upload with validation
 - Batch upload support (up to 20 documents)
 - S3 storage and SQS queuing
+
+Batches are staged concurrently: each document is validated and stored in
+S3 on a worker thread, then all status records are written with one
+BatchWriteItem and all queue messages sent with SendMessageBatch.
 """
 
 import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Any
 
-import boto3
 from botocore.exceptions import ClientError
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
+from regulatory_kb.core.resilience import with_bulkhead
 from regulatory_kb.upload.models import (
     UploadStatus,
-    FileType,
     UploadMetadata,
     UploadResponse,
     BatchUploadResponse,
@@ -26,14 +32,40 @@ from regulatory_kb.upload.models import (
     UploadRecord,
     ValidationResult,
 )
+from regulatory_kb.upload.multipart import BufferReader, as_body
 from regulatory_kb.upload.validator import FileValidator, MetadataValidator
 from regulatory_kb.upload.status_tracker import StatusTracker
 
+boto3 = lazy_import("boto3")
+s3_transfer = lazy_import("boto3.s3.transfer")
 logger = get_logger(__name__)
 
 # Maximum documents per batch
 MAX_BATCH_SIZE = 20
 
+# Maximum entries per SendMessageBatch call (SQS limit)
+SQS_BATCH_SIZE = 10
+
+# Files at least this large are uploaded to S3 in parts
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+
+@dataclass
+class _StagedUpload:
+    """A document after validation and S3 storage.
+
+    error_code is set if the document was rejected; upload_id is only set
+    once the document passed validation.
+    """
+
+    file_name: str
+    metadata: Optional[UploadMetadata] = None
+    validation: Optional[ValidationResult] = None
+    upload_id: str = ""
+    s3_key: str = ""
+    error_code: Optional[int] = None
+    message: str = ""
+
 
 class UploadService:
     """Service for handling document uploads.
@@ -52,6 +84,8 @@ class UploadService:
         status_tracker: Optional[StatusTracker] = None,
         s3_client: Optional[Any] = None,
         sqs_client: Optional[Any] = None,
+        max_workers: int = 8,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
     ):
         """Initialize upload service.
         
@@ -61,6 +95,9 @@ class UploadService:
             status_tracker: Status tracker instance
             s3_client: Optional S3 client (for testing)
             sqs_client: Optional SQS client (for testing)
+            max_workers: Threads validating and storing batch documents
+            multipart_threshold: File size in bytes above which S3 uploads
+                use multipart transfers
         """
         self.bucket_name = bucket_name or os.environ.get(
             "UPLOAD_BUCKET", "regulatory-kb-uploads"
@@ -73,6 +110,8 @@ class UploadService:
         self.metadata_validator = MetadataValidator()
         self._s3_client = s3_client
         self._sqs_client = sqs_client
+        self.max_workers = max_workers
+        self.multipart_threshold = multipart_threshold
 
     @property
     def s3_client(self):
@@ -112,71 +151,27 @@ class UploadService:
         Returns:
             Tuple of (UploadResponse, error_code or None)
         """
-        # Validate file
-        validation = self.file_validator.validate(file_content, file_name)
-        if not validation.valid:
-            return (
-                UploadResponse(
-                    upload_id="",
-                    status=UploadStatus.FAILED,
-                    message=validation.error_message or "Validation failed",
-                ),
-                validation.error_code,
-            )
-        
-        # Validate metadata if provided
-        if metadata:
-            meta_validation = self.metadata_validator.validate(metadata)
-            if not meta_validation.valid:
-                return (
-                    UploadResponse(
-                        upload_id="",
-                        status=UploadStatus.FAILED,
-                        message=meta_validation.error_message or "Metadata validation failed",
-                    ),
-                    meta_validation.error_code,
-                )
-        
-        # Generate upload ID
-        upload_id = str(uuid.uuid4())
-        
-        # Store file in S3
-        s3_key = f"uploads/pending/{upload_id}/original.{validation.file_type.value}"
-        try:
-            self._store_file(s3_key, file_content, file_name, metadata)
-        except ClientError as e:
-            logger.error("s3_upload_failed", upload_id=upload_id, error=str(e))
+        staged = self._stage_upload(file_content, file_name, metadata)
+        if staged.error_code:
             return (
                 UploadResponse(
-                    upload_id=upload_id,
+                    upload_id=staged.upload_id,
                     status=UploadStatus.FAILED,
-                    message="Failed to store file",
+                    message=staged.message,
                 ),
-                500,
+                staged.error_code,
             )
-        
-        # Create status record
-        record = UploadRecord(
-            upload_id=upload_id,
-            status=UploadStatus.PENDING,
-            uploader_id=uploader_id,
-            file_name=file_name,
-            file_size=validation.file_size,
-            file_type=validation.file_type,
-            s3_key=s3_key,
-            metadata_provided=metadata is not None,
-            user_metadata=metadata.model_dump() if metadata else None,
-        )
+        upload_id = staged.upload_id
         
         try:
-            self.status_tracker.create_record(record)
+            self.status_tracker.create_record(self._build_record(staged, uploader_id))
         except ClientError as e:
             logger.error("status_record_failed", upload_id=upload_id, error=str(e))
             # Continue - file is stored, we can recover
         
         # Queue for processing
         try:
-            self._queue_for_processing(upload_id, s3_key, validation.file_type, metadata, uploader_id)
+            self._queue_for_processing(staged, uploader_id)
         except ClientError as e:
             logger.error("queue_failed", upload_id=upload_id, error=str(e))
             # Update status to indicate queuing failed
@@ -198,7 +193,7 @@ class UploadService:
             "document_uploaded",
             upload_id=upload_id,
             file_name=file_name,
-            file_size=validation.file_size,
+            file_size=staged.validation.file_size,
         )
         
         return (
@@ -223,6 +218,10 @@ class UploadService:
         - Accepts valid documents even when others fail
         - Returns batch ID and individual statuses
         
+        Documents are validated and stored in S3 in parallel. Status
+        records are written in one batch with the batch ID set, and
+        queue messages are sent in batches of up to 10.
+        
         Args:
             documents: List of document dicts with file_content, file_name, metadata
             uploader_id: ID of the uploader
@@ -251,44 +250,66 @@ class UploadService:
             )
         
         batch_id = str(uuid.uuid4())
-        results = []
-        accepted = 0
-        rejected = 0
         
+        parsed = []
         for doc in documents:
-            file_content = doc.get("file_content", b"")
-            file_name = doc.get("file_name", "unknown")
             metadata = doc.get("metadata")
-            
             if metadata and isinstance(metadata, dict):
                 metadata = UploadMetadata(**metadata)
+            parsed.append((doc.get("file_content", b""), doc.get("file_name", "unknown"), metadata))
+        
+        # Validate and store files concurrently
+        workers = max(1, min(self.max_workers, len(parsed)))
+        if workers == 1:
+            staged = [self._stage_upload(*doc) for doc in parsed]
+        else:
+            self.s3_client  # create the client once, before threads share it
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                staged = list(pool.map(lambda doc: self._stage_upload(*doc), parsed))
+        
+        stored = [item for item in staged if not item.error_code]
+        if stored:
+            records = [self._build_record(item, uploader_id, batch_id) for item in stored]
+            try:
+                self.status_tracker.create_records(records)
+            except ClientError as e:
+                logger.error("status_records_failed", batch_id=batch_id, error=str(e))
+                # Continue - files are stored, we can recover
             
-            # Upload individual document
-            response, error_code = self.upload_document(
-                file_content=file_content,
-                file_name=file_name,
-                uploader_id=uploader_id,
-                metadata=metadata,
-            )
-            
-            if error_code:
+            by_id = {item.upload_id: item for item in stored}
+            for upload_id in self._queue_batch_for_processing(stored, uploader_id):
+                item = by_id[upload_id]
+                item.error_code = 500
+                item.message = "Failed to queue for processing"
+                try:
+                    self.status_tracker.update_status(
+                        upload_id,
+                        UploadStatus.FAILED,
+                        error_details="Failed to queue for processing",
+                    )
+                except ClientError as e:
+                    logger.error("status_update_failed", upload_id=upload_id, error=str(e))
+        
+        results = []
+        accepted = 0
+        rejected = 0
+        for item in staged:
+            if item.error_code:
                 rejected += 1
                 results.append(
                     DocumentUploadResult(
                         status="rejected",
-                        file_name=file_name,
-                        error=response.message,
+                        file_name=item.file_name,
+                        error=item.message,
                     )
                 )
             else:
                 accepted += 1
-                # Update record with batch_id
-                self._update_batch_id(response.upload_id, batch_id)
                 results.append(
                     DocumentUploadResult(
-                        upload_id=response.upload_id,
+                        upload_id=item.upload_id,
                         status="pending",
-                        file_name=file_name,
+                        file_name=item.file_name,
                     )
                 )
         
@@ -311,6 +332,82 @@ class UploadService:
             None,
         )
 
+    def _stage_upload(
+        self,
+        file_content: bytes,
+        file_name: str,
+        metadata: Optional[UploadMetadata],
+    ) -> _StagedUpload:
+        """Validate a document and store it in S3.
+        
+        Args:
+            file_content: Raw file content
+            file_name: Original file name
+            metadata: Optional metadata
+            
+        Returns:
+            _StagedUpload, with error_code set if the document was rejected
+        """
+        staged = _StagedUpload(file_name=file_name, metadata=metadata)
+        
+        # Validate file
+        validation = self.file_validator.validate(file_content, file_name)
+        if not validation.valid:
+            staged.error_code = validation.error_code
+            staged.message = validation.error_message or "Validation failed"
+            return staged
+        
+        # Validate metadata if provided
+        if metadata:
+            meta_validation = self.metadata_validator.validate(metadata)
+            if not meta_validation.valid:
+                staged.error_code = meta_validation.error_code
+                staged.message = meta_validation.error_message or "Metadata validation failed"
+                return staged
+        
+        staged.validation = validation
+        staged.upload_id = str(uuid.uuid4())
+        staged.s3_key = f"uploads/pending/{staged.upload_id}/original.{validation.file_type.value}"
+        
+        # Store file in S3
+        try:
+            self._store_file(staged.s3_key, file_content, file_name, metadata)
+        except ClientError as e:
+            logger.error("s3_upload_failed", upload_id=staged.upload_id, error=str(e))
+            staged.error_code = 500
+            staged.message = "Failed to store file"
+        return staged
+
+    def _build_record(
+        self,
+        staged: _StagedUpload,
+        uploader_id: str,
+        batch_id: Optional[str] = None,
+    ) -> UploadRecord:
+        """Build the pending status record for a stored document.
+        
+        Args:
+            staged: Stored document
+            uploader_id: ID of the uploader
+            batch_id: Batch identifier if part of a batch upload
+            
+        Returns:
+            UploadRecord in PENDING status
+        """
+        return UploadRecord(
+            upload_id=staged.upload_id,
+            status=UploadStatus.PENDING,
+            uploader_id=uploader_id,
+            file_name=staged.file_name,
+            file_size=staged.validation.file_size,
+            file_type=staged.validation.file_type,
+            s3_key=staged.s3_key,
+            metadata_provided=staged.metadata is not None,
+            user_metadata=staged.metadata.model_dump() if staged.metadata else None,
+            batch_id=batch_id,
+        )
+
+    @with_bulkhead("s3")
     def _store_file(
         self,
         s3_key: str,
@@ -320,21 +417,36 @@ class UploadService:
     ) -> None:
         """Store file in S3.
         
+        Files at or above the multipart threshold are uploaded in parts.
+        Memoryview content is streamed from the buffer without a copy.
+        
         Args:
             s3_key: S3 object key
-            content: File content
+            content: File content (bytes or memoryview)
             file_name: Original file name
             metadata: Optional metadata
         """
         # Store the file
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=s3_key,
-            Body=content,
-            Metadata={
-                "original_filename": file_name,
-            },
-        )
+        if len(content) >= self.multipart_threshold:
+            self.s3_client.upload_fileobj(
+                BufferReader(content),
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={"Metadata": {"original_filename": file_name}},
+                Config=s3_transfer.TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=self.multipart_threshold,
+                ),
+            )
+        else:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=as_body(content),
+                Metadata={
+                    "original_filename": file_name,
+                },
+            )
         
         # Store metadata alongside if provided
         if metadata:
@@ -346,64 +458,91 @@ class UploadService:
                 ContentType="application/json",
             )
 
-    def _queue_for_processing(
-        self,
-        upload_id: str,
-        s3_key: str,
-        file_type: FileType,
-        metadata: Optional[UploadMetadata],
-        uploader_id: str,
-    ) -> None:
-        """Queue document for processing.
+    def _processing_message(self, staged: _StagedUpload, uploader_id: str) -> dict[str, Any]:
+        """Build the processing queue message for a stored document.
         
         Args:
-            upload_id: Upload identifier
-            s3_key: S3 object key
-            file_type: File type
-            metadata: Optional metadata
+            staged: Stored document
             uploader_id: Uploader ID
+            
+        Returns:
+            Message body and attributes as SendMessage parameters
         """
-        if not self.queue_url:
-            logger.warning("queue_url_not_configured", upload_id=upload_id)
-            return
-        
         message = {
-            "upload_id": upload_id,
-            "file_path": f"s3://{self.bucket_name}/{s3_key}",
-            "file_type": file_type.value,
-            "user_metadata": metadata.model_dump() if metadata else None,
+            "upload_id": staged.upload_id,
+            "file_path": f"s3://{self.bucket_name}/{staged.s3_key}",
+            "file_type": staged.validation.file_type.value,
+            "user_metadata": staged.metadata.model_dump() if staged.metadata else None,
             "uploader_id": uploader_id,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-        
-        self.sqs_client.send_message(
-            QueueUrl=self.queue_url,
-            MessageBody=json.dumps(message),
-            MessageAttributes={
+        return {
+            "MessageBody": json.dumps(message),
+            "MessageAttributes": {
                 "upload_id": {
                     "DataType": "String",
-                    "StringValue": upload_id,
+                    "StringValue": staged.upload_id,
                 },
             },
+        }
+
+    def _queue_for_processing(self, staged: _StagedUpload, uploader_id: str) -> None:
+        """Queue document for processing.
+        
+        Args:
+            staged: Stored document
+            uploader_id: Uploader ID
+        """
+        if not self.queue_url:
+            logger.warning("queue_url_not_configured", upload_id=staged.upload_id)
+            return
+        
+        self.sqs_client.send_message(
+            QueueUrl=self.queue_url,
+            **self._processing_message(staged, uploader_id),
         )
 
-    def _update_batch_id(self, upload_id: str, batch_id: str) -> None:
-        """Update upload record with batch ID.
+    def _queue_batch_for_processing(
+        self,
+        staged: list[_StagedUpload],
+        uploader_id: str,
+    ) -> list[str]:
+        """Queue documents for processing with SendMessageBatch.
         
         Args:
-            upload_id: Upload identifier
-            batch_id: Batch identifier
+            staged: Stored documents
+            uploader_id: Uploader ID
+            
+        Returns:
+            Upload IDs that could not be queued
         """
-        try:
-            self.status_tracker.table.update_item(
-                Key={"upload_id": upload_id},
-                UpdateExpression="SET batch_id = :batch_id",
-                ExpressionAttributeValues={":batch_id": batch_id},
-            )
-        except ClientError as e:
-            logger.warning(
-                "batch_id_update_failed",
-                upload_id=upload_id,
-                batch_id=batch_id,
-                error=str(e),
-            )
+        if not self.queue_url:
+            logger.warning("queue_url_not_configured", upload_count=len(staged))
+            return []
+        
+        failed: list[str] = []
+        for start in range(0, len(staged), SQS_BATCH_SIZE):
+            chunk = staged[start:start + SQS_BATCH_SIZE]
+            entries = [
+                {"Id": str(i), **self._processing_message(item, uploader_id)}
+                for i, item in enumerate(chunk)
+            ]
+            try:
+                response = self.sqs_client.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=entries,
+                )
+            except ClientError as e:
+                logger.error("queue_batch_failed", upload_count=len(chunk), error=str(e))
+                failed.extend(item.upload_id for item in chunk)
+                continue
+            
+            for entry in response.get("Failed", []):
+                upload_id = chunk[int(entry["Id"])].upload_id
+                logger.error(
+                    "queue_failed",
+                    upload_id=upload_id,
+                    error=entry.get("Message", entry.get("Code")),
+                )
+                failed.append(upload_id)
+        return failed
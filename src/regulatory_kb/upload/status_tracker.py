@@ -5,16 +5,23 @@ Implements Requirements 4.1-4.5:
 - Store error details for failures
 - Link to KB document on completion
 - Support batch status queries
+
+Non-terminal stage transitions can be coalesced with StatusUpdateCoalescer,
+and status reads are served from a short-lived cache for polling clients.
 """
 
 import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Any
 
-import boto3
 from botocore.exceptions import ClientError
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
 from regulatory_kb.upload.models import (
     UploadStatus,
     UploadRecord,
@@ -23,8 +30,72 @@ from regulatory_kb.upload.models import (
     FileType,
 )
 
+boto3 = lazy_import("boto3")
 logger = get_logger(__name__)
 
+# Statuses written immediately by StatusUpdateCoalescer
+TERMINAL_STATUSES = frozenset({UploadStatus.COMPLETED, UploadStatus.FAILED})
+
+
+class StatusReadCache:
+    """Short-lived cache of status responses for polling endpoints.
+    
+    Entries expire after ``ttl_seconds``; updates made through the owning
+    tracker invalidate the upload's entry immediately. Batch entries are
+    only expired by time, since updates do not carry the batch ID.
+    """
+    
+    def __init__(self, ttl_seconds: float = 2.0, max_entries: int = 10000):
+        """Initialize the cache.
+        
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching).
+            max_entries: Maximum cached responses; least recently used are evicted.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: str, value: Any) -> None:
+        """Cache a response."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key: str) -> None:
+        """Drop a cached response."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
 
 class StatusTracker:
     """Tracks upload status in DynamoDB.
@@ -40,18 +111,24 @@ class StatusTracker:
         self,
         table_name: Optional[str] = None,
         dynamodb_client: Optional[Any] = None,
+        cache_ttl_seconds: Optional[float] = None,
     ):
         """Initialize status tracker.
         
         Args:
             table_name: DynamoDB table name
             dynamodb_client: Optional DynamoDB client (for testing)
+            cache_ttl_seconds: Seconds status reads are cached (0 disables).
+                Defaults to STATUS_CACHE_TTL_SECONDS or 2 seconds.
         """
         self.table_name = table_name or os.environ.get(
             "UPLOAD_STATUS_TABLE", "regulatory-kb-upload-status"
         )
         self._client = dynamodb_client
         self._table = None
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = float(os.environ.get("STATUS_CACHE_TTL_SECONDS", "2"))
+        self.read_cache = StatusReadCache(ttl_seconds=cache_ttl_seconds)
 
     @property
     def client(self):
@@ -80,6 +157,7 @@ class StatusTracker:
         
         try:
             self.table.put_item(Item=record.to_dynamo_item())
+            self.read_cache.invalidate(f"upload:{record.upload_id}")
             logger.info(
                 "upload_record_created",
                 upload_id=record.upload_id,
@@ -93,6 +171,33 @@ class StatusTracker:
             )
             raise
 
+    def create_records(self, records: list[UploadRecord]) -> None:
+        """Create upload records with BatchWriteItem.
+        
+        The batch writer sends up to 25 items per request and retries
+        unprocessed items.
+        
+        Args:
+            records: Upload records to create
+        """
+        ttl_time = datetime.now(timezone.utc) + timedelta(days=30)
+        
+        try:
+            with self.table.batch_writer() as batch:
+                for record in records:
+                    record.ttl = int(ttl_time.timestamp())
+                    batch.put_item(Item=record.to_dynamo_item())
+            for record in records:
+                self.read_cache.invalidate(f"upload:{record.upload_id}")
+            logger.info("upload_records_created", record_count=len(records))
+        except ClientError as e:
+            logger.error(
+                "upload_records_create_failed",
+                record_count=len(records),
+                error=str(e),
+            )
+            raise
+
     def update_status(
         self,
         upload_id: str,
@@ -141,6 +246,7 @@ class StatusTracker:
                 ExpressionAttributeNames=expr_names,
                 ExpressionAttributeValues=expr_values,
             )
+            self.read_cache.invalidate(f"upload:{upload_id}")
             logger.info(
                 "upload_status_updated",
                 upload_id=upload_id,
@@ -162,12 +268,20 @@ class StatusTracker:
         - Error details for failed status
         - KB document ID for completed status
         
+        Responses are cached briefly; updates made through this tracker
+        invalidate the cached response.
+        
         Args:
             upload_id: Upload identifier
             
         Returns:
             StatusResponse or None if not found
         """
+        cache_key = f"upload:{upload_id}"
+        cached = self.read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.table.get_item(Key={"upload_id": upload_id})
             item = response.get("Item")
@@ -177,7 +291,7 @@ class StatusTracker:
             
             record = UploadRecord.from_dynamo_item(item)
             
-            return StatusResponse(
+            status = StatusResponse(
                 upload_id=record.upload_id,
                 status=record.status,
                 created_at=record.created_at,
@@ -188,6 +302,8 @@ class StatusTracker:
                 error_details=record.error_details,
                 processing_stage=record.processing_stage,
             )
+            self.read_cache.put(cache_key, status)
+            return status
         except ClientError as e:
             logger.error(
                 "upload_status_get_failed",
@@ -203,12 +319,20 @@ class StatusTracker:
         - Aggregate batch status
         - Individual document statuses
         
+        Responses are cached briefly, so documents updated in the last few
+        seconds may show their previous status.
+        
         Args:
             batch_id: Batch identifier
             
         Returns:
             BatchStatusResponse or None if not found
         """
+        cache_key = f"batch:{batch_id}"
+        cached = self.read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Query using batch_id GSI
             response = self.table.query(
@@ -247,7 +371,7 @@ class StatusTracker:
                     )
                 )
             
-            return BatchStatusResponse(
+            batch_status = BatchStatusResponse(
                 batch_id=batch_id,
                 total_documents=len(documents),
                 pending=status_counts[UploadStatus.PENDING],
@@ -256,6 +380,8 @@ class StatusTracker:
                 failed=status_counts[UploadStatus.FAILED],
                 documents=documents,
             )
+            self.read_cache.put(cache_key, batch_status)
+            return batch_status
         except ClientError as e:
             logger.error(
                 "batch_status_get_failed",
@@ -312,3 +438,149 @@ class StatusTracker:
                 error=str(e),
             )
             raise
+
+
+@dataclass
+class _PendingUpdate:
+    """Latest non-terminal status update for one upload."""
+
+    status: UploadStatus
+    processing_stage: Optional[str]
+    kb_document_id: Optional[str]
+    error_details: Optional[str]
+
+
+class StatusUpdateCoalescer:
+    """Coalesces non-terminal status updates before writing them.
+    
+    Intermediate stage transitions (initializing, parsing, chunking, ...)
+    are held and written by a background thread every ``flush_interval``
+    seconds; only the latest update per upload is written. Terminal
+    statuses (completed, failed) are written immediately and discard any
+    pending update for the upload, so a stale stage never overwrites them.
+    
+    Call ``close()`` (or ``flush()``) before the process may be frozen,
+    e.g. at the end of a Lambda invocation.
+    """
+    
+    def __init__(self, tracker: StatusTracker, flush_interval: float = 1.0):
+        """Initialize the coalescer.
+        
+        Args:
+            tracker: Tracker that performs the writes.
+            flush_interval: Seconds between background flushes of
+                pending updates (0 writes every update immediately).
+        """
+        self.tracker = tracker
+        self.flush_interval = flush_interval
+        self._pending: dict[str, _PendingUpdate] = {}
+        self._pending_lock = threading.Lock()
+        # Serializes writes so a terminal update lands after any flush in progress
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.coalesced = 0
+    
+    def update_status(
+        self,
+        upload_id: str,
+        status: UploadStatus,
+        processing_stage: Optional[str] = None,
+        kb_document_id: Optional[str] = None,
+        error_details: Optional[str] = None,
+    ) -> None:
+        """Record a status update.
+        
+        Args:
+            upload_id: Upload identifier
+            status: New status
+            processing_stage: Current processing stage
+            kb_document_id: KB document ID if completed
+            error_details: Error details if failed
+            
+        Raises:
+            ClientError: If a terminal update cannot be written.
+        """
+        update = _PendingUpdate(status, processing_stage, kb_document_id, error_details)
+        if status in TERMINAL_STATUSES or self.flush_interval <= 0:
+            with self._write_lock:
+                with self._pending_lock:
+                    if self._pending.pop(upload_id, None) is not None:
+                        self.coalesced += 1
+                self._write(upload_id, update)
+            return
+        
+        with self._pending_lock:
+            if upload_id in self._pending:
+                self.coalesced += 1
+            self._pending[upload_id] = update
+        self._ensure_flusher()
+    
+    def flush(self) -> int:
+        """Write all pending updates.
+        
+        Failures are logged and dropped; a later update for the same
+        upload supersedes them.
+        
+        Returns:
+            Number of updates written.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            written = 0
+            for upload_id, update in pending.items():
+                try:
+                    self._write(upload_id, update)
+                    written += 1
+                except Exception as e:
+                    logger.warning(
+                        "coalesced_status_update_failed",
+                        upload_id=upload_id,
+                        stage=update.processing_stage,
+                        error=str(e),
+                    )
+            return written
+    
+    def close(self) -> None:
+        """Stop the background flusher and write pending updates."""
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+            self._thread = None
+        self.flush()
+        self._stopped.clear()
+    
+    def get_stats(self) -> dict[str, int]:
+        """Get write and coalescing counters."""
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "coalesced": self.coalesced,
+        }
+    
+    def _write(self, upload_id: str, update: _PendingUpdate) -> None:
+        self.tracker.update_status(
+            upload_id,
+            update.status,
+            processing_stage=update.processing_stage,
+            kb_document_id=update.kb_document_id,
+            error_details=update.error_details,
+        )
+        self.written += 1
+    
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None:
+            return
+        with self._pending_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="status-flusher", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
@@ -6,8 +6,9 @@ Implements Requirements 1.1-1.5, 2.1-2.3:
 - Metadata validation (regulator, category values)
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
 
 from regulatory_kb.upload.models import (
     FileType,
@@ -61,6 +62,13 @@ PDF_MAGIC = b"%PDF"
 HTML_SIGNATURES = [b"<!DOCTYPE", b"<html", b"<HTML", b"<!doctype"]
 
 
+def _contains(content: Union[bytes, memoryview], needle: bytes) -> bool:
+    """Substring test that also works on memoryviews, without copying."""
+    if isinstance(content, (bytes, bytearray)):
+        return needle in content
+    return re.search(re.escape(needle), content) is not None
+
+
 class FileValidator:
     """Validates uploaded files for type and size.
     
@@ -126,18 +134,20 @@ class FileValidator:
         Uses magic bytes for detection, not just file extension.
         
         Args:
-            content: File content
+            content: File content (bytes or memoryview)
             file_name: Original file name (used as fallback)
             
         Returns:
             FileType if valid, None if invalid
         """
+        head = bytes(content[:100])
+        
         # Check for PDF magic bytes
-        if content.startswith(PDF_MAGIC):
+        if head.startswith(PDF_MAGIC):
             return FileType.PDF
         
         # Check for HTML signatures
-        content_start = content[:100].strip()
+        content_start = head.strip()
         for sig in HTML_SIGNATURES:
             if content_start.lower().startswith(sig.lower()):
                 return FileType.HTML
@@ -146,7 +156,7 @@ class FileValidator:
         lower_name = file_name.lower()
         if lower_name.endswith(".html") or lower_name.endswith(".htm"):
             # Additional check: should contain HTML-like content
-            if b"<" in content and b">" in content:
+            if _contains(content, b"<") and _contains(content, b">"):
                 return FileType.HTML
         
         return None
@@ -6,6 +6,7 @@ Implements Requirements 6.1-6.5:
 - Preserve relationships from previous version
 - Query previous versions
 - Webhook notifications for document replacement
+- Near-duplicate detection with MinHash/LSH
 """
 
 import json
@@ -14,13 +15,24 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
 from regulatory_kb.core import get_logger
+from regulatory_kb.core.lazy import lazy_import
 from regulatory_kb.upload.models import UploadStatus, FileType
+from regulatory_kb.upload.multipart import as_body
+from regulatory_kb.upload.near_duplicates import (
+    MinHashConfig,
+    MinHasher,
+    NearDuplicateAction,
+    NearDuplicateConfig,
+    band_keys,
+    rank_candidates,
+)
 from regulatory_kb.upload.status_tracker import StatusTracker
 
+boto3 = lazy_import("boto3")
+np = lazy_import("numpy")
 logger = get_logger(__name__)
 
 
@@ -145,6 +157,50 @@ class MatchingDocument:
         }
 
 
+class NearDuplicateMatch:
+    """A stored document whose content is similar to an upload."""
+    
+    def __init__(
+        self,
+        document_id: str,
+        similarity: float,
+        title: Optional[str] = None,
+        regulator: Optional[str] = None,
+    ):
+        self.document_id = document_id
+        self.similarity = similarity
+        self.title = title
+        self.regulator = regulator
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "document_id": self.document_id,
+            "similarity": self.similarity,
+            "title": self.title,
+            "regulator": self.regulator,
+        }
+
+
+class NearDuplicateDecision:
+    """Routing decision for an upload after near-duplicate lookup."""
+    
+    def __init__(
+        self,
+        action: NearDuplicateAction,
+        match: Optional[NearDuplicateMatch] = None,
+    ):
+        self.action = action
+        self.match = match
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "action": self.action.value,
+            "match": self.match.to_dict() if self.match else None,
+        }
+
+
 class PreservedRelationship:
     """A relationship preserved from a previous version."""
     
@@ -188,6 +244,9 @@ class VersionManager:
         status_tracker: Optional[StatusTracker] = None,
         s3_client: Optional[Any] = None,
         dynamodb_client: Optional[Any] = None,
+        near_duplicate_table_name: Optional[str] = None,
+        minhash_config: Optional[MinHashConfig] = None,
+        near_duplicate_config: Optional[NearDuplicateConfig] = None,
     ):
         """Initialize version manager.
         
@@ -197,6 +256,10 @@ class VersionManager:
             status_tracker: Status tracker instance.
             s3_client: Optional S3 client (for testing).
             dynamodb_client: Optional DynamoDB client (for testing).
+            near_duplicate_table_name: DynamoDB table holding MinHash
+                signatures and LSH buckets.
+            minhash_config: MinHash signature configuration.
+            near_duplicate_config: Similarity thresholds for routing.
         """
         self.bucket_name = bucket_name or os.environ.get(
             "UPLOAD_BUCKET", "regulatory-kb-uploads"
@@ -204,10 +267,18 @@ class VersionManager:
         self.version_table_name = version_table_name or os.environ.get(
             "VERSION_HISTORY_TABLE", "regulatory-kb-version-history"
         )
+        self.near_duplicate_table_name = near_duplicate_table_name or os.environ.get(
+            "NEAR_DUPLICATE_TABLE", "regulatory-kb-near-duplicates"
+        )
         self.status_tracker = status_tracker or StatusTracker()
+        self.near_duplicate_config = near_duplicate_config or NearDuplicateConfig.from_env()
+        self._minhash_config = minhash_config or MinHashConfig()
+        self._minhasher: Optional[MinHasher] = None
         self._s3_client = s3_client
         self._dynamodb_client = dynamodb_client
         self._table = None
+        self._dynamodb = None
+        self._near_duplicate_table = None
 
     @property
     def s3_client(self):
@@ -231,6 +302,214 @@ class VersionManager:
             self._table = dynamodb.Table(self.version_table_name)
         return self._table
 
+    @property
+    def dynamodb(self):
+        """Get DynamoDB service resource."""
+        if self._dynamodb is None:
+            self._dynamodb = boto3.resource("dynamodb")
+        return self._dynamodb
+
+    @property
+    def near_duplicate_table(self):
+        """Get the near-duplicate DynamoDB table resource.
+        
+        Holds one item per signature (``bucket = "sig#<document_id>"``) and
+        one item per LSH bucket (``bucket = "<band>:<hash>"``) whose
+        ``document_ids`` string set lists the documents in it.
+        """
+        if self._near_duplicate_table is None:
+            self._near_duplicate_table = self.dynamodb.Table(self.near_duplicate_table_name)
+        return self._near_duplicate_table
+
+    @property
+    def minhasher(self) -> MinHasher:
+        """Get the MinHash signature generator."""
+        if self._minhasher is None:
+            self._minhasher = MinHasher(self._minhash_config)
+        return self._minhasher
+
+    def compute_signature(self, text: str):
+        """Compute the MinHash signature of document text.
+        
+        Args:
+            text: Parsed document text.
+            
+        Returns:
+            uint32 NumPy array signature.
+        """
+        return self.minhasher.signature(text)
+
+    def register_signature(
+        self,
+        document_id: str,
+        signature,
+        title: Optional[str] = None,
+        regulator: Optional[str] = None,
+    ) -> None:
+        """Store a document's signature and add it to its LSH buckets.
+        
+        Args:
+            document_id: Document identifier.
+            signature: MinHash signature from compute_signature.
+            title: Document title.
+            regulator: Regulator identifier.
+        """
+        item = {
+            "bucket": f"sig#{document_id}",
+            "document_id": document_id,
+            "signature": np.asarray(signature, dtype="<u4").tobytes(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if title:
+            item["title"] = title
+        if regulator:
+            item["regulator"] = regulator
+        
+        try:
+            self.near_duplicate_table.put_item(Item=item)
+            for key in band_keys(signature, self._minhash_config.bands):
+                self.near_duplicate_table.update_item(
+                    Key={"bucket": key},
+                    UpdateExpression="ADD document_ids :ids",
+                    ExpressionAttributeValues={":ids": {document_id}},
+                )
+        except ClientError as e:
+            logger.warning(
+                "register_signature_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+
+    def remove_signature(self, document_id: str) -> bool:
+        """Remove a document's signature and LSH bucket entries.
+        
+        Args:
+            document_id: Document identifier.
+            
+        Returns:
+            True if a signature was removed.
+        """
+        try:
+            item = self.near_duplicate_table.get_item(
+                Key={"bucket": f"sig#{document_id}"}
+            ).get("Item")
+            if not item:
+                return False
+            
+            signature = self._decode_signature(item["signature"])
+            for key in band_keys(signature, self._minhash_config.bands):
+                self.near_duplicate_table.update_item(
+                    Key={"bucket": key},
+                    UpdateExpression="DELETE document_ids :ids",
+                    ExpressionAttributeValues={":ids": {document_id}},
+                )
+            self.near_duplicate_table.delete_item(Key={"bucket": f"sig#{document_id}"})
+            return True
+        except ClientError as e:
+            logger.warning(
+                "remove_signature_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+            return False
+
+    def find_near_duplicates(
+        self,
+        signature,
+        threshold: Optional[float] = None,
+    ) -> list[NearDuplicateMatch]:
+        """Find stored documents whose content is similar to a signature.
+        
+        Reads the signature's LSH buckets, then the signatures of the
+        candidates in them: two batched reads however many documents are
+        stored.
+        
+        Args:
+            signature: MinHash signature from compute_signature.
+            threshold: Minimum estimated Jaccard similarity; defaults to
+                the replace threshold.
+            
+        Returns:
+            List of matches, most similar first.
+        """
+        if threshold is None:
+            threshold = self.near_duplicate_config.replace_threshold
+        
+        try:
+            buckets = self._batch_get(
+                {"bucket": key} for key in band_keys(signature, self._minhash_config.bands)
+            )
+            candidate_ids = sorted(
+                {doc_id for item in buckets for doc_id in item.get("document_ids", ())}
+            )
+            if not candidate_ids:
+                return []
+            
+            items = {
+                item["document_id"]: item
+                for item in self._batch_get({"bucket": f"sig#{doc_id}"} for doc_id in candidate_ids)
+            }
+        except ClientError as e:
+            logger.warning("find_near_duplicates_failed", error=str(e))
+            return []
+        
+        ranked = rank_candidates(
+            signature,
+            ((doc_id, self._decode_signature(item["signature"])) for doc_id, item in items.items()),
+            threshold,
+        )
+        return [
+            NearDuplicateMatch(
+                document_id=doc_id,
+                similarity=similarity,
+                title=items[doc_id].get("title"),
+                regulator=items[doc_id].get("regulator"),
+            )
+            for doc_id, similarity in ranked
+        ]
+
+    def check_near_duplicate(self, signature) -> NearDuplicateDecision:
+        """Decide how to route an upload given its signature.
+        
+        Args:
+            signature: MinHash signature from compute_signature.
+            
+        Returns:
+            SKIP or REPLACE with the most similar stored document, or NEW.
+        """
+        matches = self.find_near_duplicates(signature)
+        if not matches:
+            return NearDuplicateDecision(NearDuplicateAction.NEW)
+        
+        best = matches[0]
+        decision = NearDuplicateDecision(
+            self.near_duplicate_config.action_for(best.similarity), best
+        )
+        logger.info(
+            "near_duplicate_found",
+            document_id=best.document_id,
+            similarity=best.similarity,
+            action=decision.action.value,
+        )
+        return decision
+
+    def _batch_get(self, keys) -> list[dict]:
+        """Read items from the near-duplicate table in batches of 100."""
+        keys = list(keys)
+        items: list[dict] = []
+        for start in range(0, len(keys), 100):
+            request = {self.near_duplicate_table_name: {"Keys": keys[start:start + 100]}}
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                items.extend(response.get("Responses", {}).get(self.near_duplicate_table_name, []))
+                request = response.get("UnprocessedKeys") or None
+        return items
+
+    @staticmethod
+    def _decode_signature(value: Any):
+        """Decode a stored signature (bytes or boto3 Binary)."""
+        return np.frombuffer(bytes(getattr(value, "value", value)), dtype="<u4")
+
     def find_matching_documents(
         self,
         title: str,
@@ -569,7 +848,7 @@ class VersionManager:
                 self.s3_client.put_object(
                     Bucket=self.bucket_name,
                     Key=new_s3_key,
-                    Body=new_file_content,
+                    Body=as_body(new_file_content),
                     Metadata={
                         "original_filename": new_file_name,
                         "document_id": new_document_id,
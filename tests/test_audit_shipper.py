@@ -0,0 +1,194 @@
+"""Tests for batched CloudWatch audit shipping."""
+
+import signal
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from regulatory_kb.api.audit import AuditEvent, AuditEventType
+from regulatory_kb.api.audit_shipper import (
+    CloudWatchLogShipper,
+    MAX_BATCH_BYTES,
+    MAX_BATCH_SPAN_MS,
+)
+from regulatory_kb.api.cloudwatch_audit import CloudWatchAuditLogger
+from regulatory_kb.core.errors import RetryableError
+from regulatory_kb.core.resilience import RetryConfig
+
+
+def _log_event(ts: int, message: str = "{}") -> dict:
+    return {"timestamp": ts, "message": message}
+
+
+def _no_delay_retry(max_retries: int = 3) -> RetryConfig:
+    return RetryConfig(
+        max_retries=max_retries,
+        base_delay=0.0,
+        jitter=False,
+        retryable_exceptions=(RetryableError,),
+    )
+
+
+SIGTERM_SCRIPT = textwrap.dedent("""
+    import os, signal, sys, time
+    from regulatory_kb.api.audit_shipper import CloudWatchLogShipper
+
+    shippers = [
+        CloudWatchLogShipper(lambda batch: print(len(batch), flush=True), flush_interval=60.0)
+        for _ in range(3)
+    ]
+    for shipper in shippers:
+        shipper.enqueue({"timestamp": 1, "message": "{}"})
+    os.kill(os.getpid(), signal.SIGTERM)
+    time.sleep(5)
+    sys.exit(0)
+""")
+
+
+class TestShutdownHooks:
+    """Tests for the process-wide shutdown hooks."""
+
+    def test_sigterm_flushes_then_terminates(self):
+        result = subprocess.run(
+            [sys.executable, "-c", SIGTERM_SCRIPT], capture_output=True, text=True, timeout=30
+        )
+
+        assert result.returncode == -signal.SIGTERM
+        assert result.stdout.split() == ["1", "1", "1"]
+
+    def test_hooks_installed_once(self):
+        first = CloudWatchLogShipper(lambda batch: None, flush_interval=60.0)
+        handler = signal.getsignal(signal.SIGTERM)
+        second = CloudWatchLogShipper(lambda batch: None, flush_interval=60.0)
+
+        assert signal.getsignal(signal.SIGTERM) is handler
+        first.close()
+        second.close()
+
+
+class TestCloudWatchLogShipper:
+    """Tests for CloudWatchLogShipper."""
+
+    def test_flush_sends_single_sorted_batch(self):
+        batches = []
+        shipper = CloudWatchLogShipper(batches.append, background=False)
+        for ts in [3, 1, 2]:
+            shipper.enqueue(_log_event(ts))
+
+        assert shipper.queue_depth == 3
+        shipper.flush()
+
+        assert [[e["timestamp"] for e in b] for b in batches] == [[1, 2, 3]]
+        assert shipper.get_stats()["sent_events"] == 3
+        assert shipper.queue_depth == 0
+
+    def test_batches_respect_byte_limit(self):
+        batches = []
+        shipper = CloudWatchLogShipper(batches.append, background=False)
+        message = "x" * 200_000
+        for ts in range(8):
+            shipper.enqueue(_log_event(ts, message))
+
+        shipper.flush()
+
+        assert len(batches) > 1
+        for batch in batches:
+            assert sum(len(e["message"]) + 26 for e in batch) <= MAX_BATCH_BYTES
+
+    def test_batches_split_on_time_span(self):
+        batches = []
+        shipper = CloudWatchLogShipper(batches.append, background=False)
+        shipper.enqueue(_log_event(0))
+        shipper.enqueue(_log_event(MAX_BATCH_SPAN_MS + 1))
+
+        shipper.flush()
+
+        assert len(batches) == 2
+
+    def test_queue_full_drops_events(self):
+        shipper = CloudWatchLogShipper(lambda batch: None, max_queue_size=2, background=False)
+        assert shipper.enqueue(_log_event(1))
+        assert shipper.enqueue(_log_event(2))
+        assert not shipper.enqueue(_log_event(3))
+
+        assert shipper.get_stats()["dropped_events"] == 1
+
+    def test_retryable_failures_are_retried(self):
+        calls = []
+
+        def flaky_send(batch):
+            calls.append(batch)
+            if len(calls) < 3:
+                raise RetryableError("throttled")
+
+        shipper = CloudWatchLogShipper(flaky_send, retry_config=_no_delay_retry(), background=False)
+        shipper.enqueue(_log_event(1))
+        shipper.flush()
+
+        stats = shipper.get_stats()
+        assert stats["retries"] == 2
+        assert stats["sent_events"] == 1
+        assert stats["failed_events"] == 0
+
+    def test_non_retryable_failure_counts_failed(self):
+        def failing_send(batch):
+            raise ValueError("bad request")
+
+        shipper = CloudWatchLogShipper(failing_send, retry_config=_no_delay_retry(), background=False)
+        shipper.enqueue(_log_event(1))
+        shipper.flush()
+
+        assert shipper.get_stats()["failed_events"] == 1
+
+    def test_background_thread_flushes_on_close(self):
+        batches = []
+        shipper = CloudWatchLogShipper(batches.append, flush_interval=60.0)
+        shipper.enqueue(_log_event(1))
+        shipper.close()
+
+        assert sum(len(b) for b in batches) == 1
+        assert not shipper.enqueue(_log_event(2))
+
+
+class TestCloudWatchAuditLoggerShipping:
+    """Tests for CloudWatchAuditLogger batching behaviour."""
+
+    def _client(self) -> MagicMock:
+        client = MagicMock()
+        client.put_log_events.return_value = {"nextSequenceToken": "token-2"}
+        return client
+
+    def test_events_are_batched_until_flush(self):
+        client = self._client()
+        audit_logger = CloudWatchAuditLogger(cloudwatch_client=client, flush_interval=60.0)
+        for i in range(5):
+            audit_logger.log(AuditEvent(event_type=AuditEventType.DOCUMENT_VIEW, client_id=f"c{i}"))
+
+        client.put_log_events.assert_not_called()
+        audit_logger.flush()
+
+        assert client.put_log_events.call_count == 1
+        assert len(client.put_log_events.call_args.kwargs["logEvents"]) == 5
+        audit_logger.close()
+
+    def test_invalid_sequence_token_is_retried(self):
+        client = self._client()
+        error = ClientError(
+            {"Error": {"Code": "InvalidSequenceTokenException", "expectedSequenceToken": "abc"}},
+            "PutLogEvents",
+        )
+        client.put_log_events.side_effect = [error, {"nextSequenceToken": "def"}]
+        audit_logger = CloudWatchAuditLogger(
+            cloudwatch_client=client,
+            async_shipping=False,
+            retry_config=_no_delay_retry(),
+        )
+
+        audit_logger.log(AuditEvent(client_id="c1"))
+
+        assert client.put_log_events.call_count == 2
+        assert client.put_log_events.call_args.kwargs["sequenceToken"] == "abc"
+        assert audit_logger.get_shipping_stats()["sent_events"] == 1
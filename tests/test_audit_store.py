@@ -0,0 +1,186 @@
+"""Tests for the indexed audit event store and AuditLogger queries."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from regulatory_kb.api.audit import AuditEvent, AuditEventType, AuditLogger
+from regulatory_kb.api.audit_store import (
+    AuditEventStore,
+    AuditQuery,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(i: int, client: str = "client-a", resource: str = "doc-1", **kwargs) -> AuditEvent:
+    return AuditEvent(
+        event_type=kwargs.pop("event_type", AuditEventType.DOCUMENT_VIEW),
+        timestamp=BASE_TIME + timedelta(seconds=i),
+        client_id=client,
+        resource_id=resource,
+        **kwargs,
+    )
+
+
+def _naive_query(events, principal=None, resource_id=None, event_types=None, start=None, end=None):
+    """Reference implementation matching the original linear filter."""
+    result = [
+        e for e in events
+        if (not principal or principal in (e.client_id, e.user_id))
+        and (not resource_id or e.resource_id == resource_id)
+        and (not event_types or e.event_type.value in event_types)
+        and (not start or e.timestamp >= start)
+        and (not end or e.timestamp <= end)
+    ]
+    return sorted(result, key=lambda e: e.timestamp, reverse=True)
+
+
+class TestAuditEventStore:
+    """Tests for AuditEventStore."""
+
+    def test_scan_returns_most_recent_first(self):
+        store = AuditEventStore(segment_size=4)
+        for i in range(10):
+            store.append(_event(i))
+
+        timestamps = [e.timestamp for _, e in store.scan()]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert len(timestamps) == 10
+        assert store.segment_count == 3
+
+    def test_indexed_filters_match_linear_scan(self):
+        store = AuditEventStore(segment_size=8)
+        events = []
+        types = [AuditEventType.DOCUMENT_VIEW, AuditEventType.UPLOAD_INITIATED, AuditEventType.AUTH_SUCCESS]
+        for i in range(100):
+            event = _event(
+                i,
+                client=f"client-{i % 3}",
+                resource=f"doc-{i % 7}",
+                event_type=types[i % 3],
+                user_id=f"user-{i % 5}",
+            )
+            events.append(event)
+            store.append(event)
+
+        cases = [
+            {"principal": "client-1"},
+            {"principal": "user-2"},
+            {"resource_id": "doc-3"},
+            {"event_types": frozenset({"auth.success", "upload.initiated"})},
+            {"principal": "client-2", "resource_id": "doc-4"},
+            {"start": BASE_TIME + timedelta(seconds=20), "end": BASE_TIME + timedelta(seconds=40)},
+            {"resource_id": "doc-0", "start": BASE_TIME + timedelta(seconds=50)},
+        ]
+        for case in cases:
+            query = AuditQuery(**case)
+            expected = _naive_query(events, **case)
+            assert [e.event_id for _, e in store.scan(query)] == [e.event_id for e in expected]
+            assert store.count(query) == len(expected)
+
+    def test_out_of_order_events_stay_sorted(self):
+        store = AuditEventStore(segment_size=4)
+        for i in [5, 1, 9, 3, 7, 2, 8]:
+            store.append(_event(i))
+
+        seconds = [int((e.timestamp - BASE_TIME).total_seconds()) for _, e in store.scan()]
+        assert seconds == [9, 8, 7, 5, 3, 2, 1]
+
+    def test_memory_limit_drops_oldest_segments(self):
+        store = AuditEventStore(max_memory_events=10, segment_size=5)
+        for i in range(23):
+            store.append(_event(i))
+
+        assert len(store) <= 10
+        newest = next(store.scan())[1]
+        assert newest.timestamp == BASE_TIME + timedelta(seconds=22)
+
+    def test_cursor_scan_resumes_after_key(self):
+        store = AuditEventStore(segment_size=3)
+        for i in range(10):
+            store.append(_event(i))
+
+        first = list(store.scan())[:4]
+        rest = [e.event_id for _, e in store.scan(before=first[-1][0])]
+        all_ids = [e.event_id for _, e in store.scan()]
+        assert rest == all_ids[4:]
+
+    def test_cursor_round_trip(self):
+        key = (1704067200.123456, 42)
+        assert decode_cursor(encode_cursor(key)) == key
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor!")
+
+    def test_disk_segments_persist_beyond_memory(self, tmp_path):
+        store = AuditEventStore(max_memory_events=10, segment_size=5, segment_dir=str(tmp_path))
+        events = [_event(i, client=f"client-{i % 2}") for i in range(30)]
+        for event in events:
+            store.append(event)
+
+        assert len(store) == 30
+        assert list(tmp_path.glob("*.seg"))
+        query = AuditQuery(principal="client-1")
+        assert [e.event_id for _, e in store.scan(query)] == [
+            e.event_id for e in _naive_query(events, principal="client-1")
+        ]
+        assert store.count(query) == 15
+        store.close()
+
+        reopened = AuditEventStore(max_memory_events=10, segment_size=5, segment_dir=str(tmp_path))
+        assert len(reopened) > 0
+        assert next(reopened.scan())[1].event_type == AuditEventType.DOCUMENT_VIEW
+        reopened.clear()
+        assert not list(tmp_path.glob("*.seg"))
+
+
+class TestAuditLoggerQueries:
+    """Tests for AuditLogger query methods backed by the store."""
+
+    def test_query_events_offset_pagination(self):
+        audit_logger = AuditLogger()
+        for i in range(25):
+            audit_logger.log(_event(i))
+
+        page, total = audit_logger.query_events(uploader_id="client-a", limit=10, offset=20)
+        assert total == 25
+        assert len(page) == 5
+        assert page[0].timestamp == BASE_TIME + timedelta(seconds=4)
+
+    def test_query_events_page_walks_all_results(self):
+        audit_logger = AuditLogger()
+        for i in range(25):
+            audit_logger.log(_event(i, resource="doc-x" if i % 2 else "doc-y"))
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = audit_logger.query_events_page(document_id="doc-x", limit=4, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert len(seen) == 12
+        assert all(e.resource_id == "doc-x" for e in seen)
+        assert [e.timestamp for e in seen] == sorted((e.timestamp for e in seen), reverse=True)
+
+    def test_get_events_keeps_chronological_order(self):
+        audit_logger = AuditLogger()
+        for i in range(5):
+            audit_logger.log(_event(i))
+        audit_logger.log(_event(5, client="client-b"))
+
+        events = audit_logger.get_events(client_id="client-a", limit=3)
+        assert [e.timestamp for e in events] == [BASE_TIME + timedelta(seconds=i) for i in (2, 3, 4)]
+
+        audit_logger.clear_events()
+        assert audit_logger.get_events() == []
+
+    def test_event_from_dict_round_trip(self):
+        event = _event(1, user_id="user-1", metadata={"k": "v"})
+        assert AuditEvent.from_dict(event.to_dict()) == event
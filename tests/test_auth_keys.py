@@ -0,0 +1,151 @@
+"""Tests for API key storage and validated-key caching."""
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from regulatory_kb.api.auth import AuthConfig, AuthService, Permission
+from regulatory_kb.api.key_store import DynamoDBAPIKeyStore, InMemoryAPIKeyStore
+
+
+class CountingStore(InMemoryAPIKeyStore):
+    """In-memory store that counts digest lookups."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def get_by_hash(self, key_hash):
+        self.lookups += 1
+        return super().get_by_hash(key_hash)
+
+
+@pytest.fixture
+def store():
+    return CountingStore()
+
+
+@pytest.fixture
+def auth(store):
+    return AuthService(AuthConfig(secret_key="test-secret"), key_store=store)
+
+
+class TestKeyLookup:
+    """Tests for digest-indexed key validation."""
+
+    def test_validates_among_many_keys(self, auth, store):
+        keys = [auth.generate_api_key(f"tenant-{i}")[0] for i in range(500)]
+
+        result = auth.validate_api_key(keys[321])
+
+        assert result.success
+        assert result.api_key.name == "tenant-321"
+        assert store.lookups == 1
+
+    def test_unknown_key_rejected(self, auth):
+        auth.generate_api_key("tenant")
+        result = auth.validate_api_key("rk_not-a-real-key")
+        assert not result.success
+        assert result.error == "Invalid API key"
+
+    def test_cache_serves_repeat_validations(self, auth, store):
+        raw_key, _ = auth.generate_api_key("tenant")
+
+        for _ in range(5):
+            assert auth.validate_api_key(raw_key).success
+
+        assert store.lookups == 1
+        assert auth.get_cache_stats()["hits"] == 4
+
+    def test_revocation_invalidates_cache(self, auth):
+        raw_key, api_key = auth.generate_api_key("tenant")
+        assert auth.validate_api_key(raw_key).success
+
+        auth.revoke_api_key(api_key.key_id)
+
+        result = auth.validate_api_key(raw_key)
+        assert not result.success
+        assert result.error == "API key is inactive"
+
+    def test_delete_invalidates_cache(self, auth):
+        raw_key, api_key = auth.generate_api_key("tenant")
+        assert auth.validate_api_key(raw_key).success
+
+        assert auth.delete_api_key(api_key.key_id)
+
+        assert not auth.validate_api_key(raw_key).success
+        assert auth.get_api_key(api_key.key_id) is None
+
+    def test_cache_disabled_with_zero_ttl(self, store):
+        auth = AuthService(
+            AuthConfig(secret_key="test-secret", key_cache_ttl_seconds=0),
+            key_store=store,
+        )
+        raw_key, _ = auth.generate_api_key("tenant")
+
+        auth.validate_api_key(raw_key)
+        auth.validate_api_key(raw_key)
+
+        assert store.lookups == 2
+
+
+class TestDynamoDBAPIKeyStore:
+    """Tests for the persistent key store."""
+
+    @pytest.fixture
+    def table(self, monkeypatch):
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with mock_aws():
+            resource = boto3.resource("dynamodb", region_name="us-east-1")
+            table = resource.create_table(
+                TableName="api-keys",
+                KeySchema=[{"AttributeName": "key_hash", "KeyType": "HASH"}],
+                AttributeDefinitions=[
+                    {"AttributeName": "key_hash", "AttributeType": "S"},
+                    {"AttributeName": "key_id", "AttributeType": "S"},
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        "IndexName": DynamoDBAPIKeyStore.KEY_ID_INDEX,
+                        "KeySchema": [{"AttributeName": "key_id", "KeyType": "HASH"}],
+                        "Projection": {"ProjectionType": "ALL"},
+                    }
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            yield table
+
+    def test_keys_survive_across_services(self, table):
+        config = AuthConfig(secret_key="test-secret")
+        issuer = AuthService(config, key_store=DynamoDBAPIKeyStore(table=table))
+        raw_key, api_key = issuer.generate_api_key(
+            "tenant",
+            permissions=[Permission.UPLOAD_DOCUMENTS],
+            expires_in_days=30,
+            metadata={"tenant_id": "t-1"},
+        )
+
+        verifier = AuthService(config, key_store=DynamoDBAPIKeyStore(table=table))
+        result = verifier.validate_api_key(raw_key)
+
+        assert result.success
+        assert result.api_key.key_id == api_key.key_id
+        assert result.permissions == [Permission.UPLOAD_DOCUMENTS]
+        assert result.api_key.metadata == {"tenant_id": "t-1"}
+        assert result.api_key.expires_at == api_key.expires_at
+
+    def test_revoke_and_delete(self, table):
+        auth = AuthService(
+            AuthConfig(secret_key="test-secret"),
+            key_store=DynamoDBAPIKeyStore(table=table),
+        )
+        raw_key, api_key = auth.generate_api_key("tenant")
+        other_key, _ = auth.generate_api_key("other")
+
+        assert auth.revoke_api_key(api_key.key_id)
+        assert auth.validate_api_key(raw_key).error == "API key is inactive"
+
+        assert auth.delete_api_key(api_key.key_id)
+        assert auth.get_api_key(api_key.key_id) is None
+        assert [k.name for k in auth.list_api_keys()] == ["other"]
+        assert auth.validate_api_key(other_key).success
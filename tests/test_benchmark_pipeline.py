@@ -0,0 +1,67 @@
+"""Tests for the end-to-end pipeline benchmark script."""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "scripts", "benchmark_pipeline.py")
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("benchmark_pipeline", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSyntheticCorpus:
+    """Tests for the deterministic corpus generator."""
+
+    def test_corpus_is_deterministic_and_parseable(self):
+        bench = _load_script()
+        from regulatory_kb.processing.parser import DocumentParser
+
+        corpus = bench.build_corpus(6, sections=5, seed=3)
+
+        assert [d.content for d in corpus] == [d.content for d in bench.build_corpus(6, sections=5, seed=3)]
+        assert [d.content for d in corpus] != [d.content for d in bench.build_corpus(6, sections=5, seed=4)]
+        parser = DocumentParser()
+        for document in corpus:
+            parsed = parser.parse(document.content, document.format, document.id)
+            assert "shall" in parsed.text
+            assert parsed.sections
+
+
+class TestPipelineBenchmark:
+    """Tests for the benchmark report."""
+
+    def test_reports_every_stage(self, tmp_path):
+        output = tmp_path / "report.json"
+        result = subprocess.run(
+            [
+                sys.executable, SCRIPT,
+                "--documents", "6",
+                "--sections", "4",
+                "--queries", "5",
+                "--no-memory",
+                "--json",
+                "--output", str(output),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        report = json.loads(result.stdout)
+
+        assert result.returncode == 0
+        assert json.loads(output.read_text()) == report
+        assert set(report["stages"]) == {
+            "parse", "metadata", "validate", "chunk", "store", "index",
+            "document_search", "vector_search", "hybrid_search",
+        }
+        assert report["corpus"]["by_format"]["pdf"]["documents"] == 2
+        assert report["stages"]["store"]["graph_queries"] > report["stages"]["index"]["graph_queries"]
+        assert report["stages"]["vector_search"]["mean_hits"] > 0
+        assert report["stages"]["parse"]["p50_ms"] <= report["stages"]["parse"]["p99_ms"]
@@ -339,6 +339,66 @@ class TestDocumentChunker:
         assert len(chunks) >= 1
 
 
+class TestSpanChunking:
+    """Tests for span-based splitting and merging."""
+
+    def test_many_tiny_sections_merge_in_order(self):
+        """Test merging a 10k-section document keeps all content in order."""
+        chunker = DocumentChunker()
+        sections = [
+            ParsedSection(number=f"§ 217.{i}", title="", content=f"Paragraph {i}.", level=2)
+            for i in range(10_000)
+        ]
+        parsed = ParsedDocument(text="", sections=sections, format=DocumentFormat.CFR)
+
+        chunks = chunker.chunk_document(parsed, "cfr")
+
+        expected = "\n\n".join(f"§ 217.{i}\n\nParagraph {i}." for i in range(10_000))
+        assert "\n\n".join(c.content for c in chunks) == expected
+        assert all(c.token_count <= chunker.config.target_chunk_tokens for c in chunks)
+        assert all(c.chunk_type == ChunkType.MERGED for c in chunks)
+        assert chunks[-1].section_path == ["§ 217.9999"]
+
+    def test_merge_spans_cover_all_chunks(self):
+        """Test merge ranges are contiguous and tables stay on their own."""
+        chunker = DocumentChunker(ChunkerConfig(min_chunk_tokens=10, target_chunk_tokens=20))
+        types = [ChunkType.SECTION] * 5 + [ChunkType.TABLE] + [ChunkType.SECTION] * 3
+        chunks = [
+            DocumentChunk(
+                chunk_id=f"doc_chunk_{i}",
+                document_id="doc",
+                content="x" * 16,
+                chunk_index=i,
+                token_count=4,
+                chunk_type=chunk_type,
+            )
+            for i, chunk_type in enumerate(types)
+        ]
+
+        spans = chunker._merge_spans(chunks)
+
+        assert spans == [(0, 3), (3, 5), (5, 6), (6, 9)]
+        merged = chunker.merge_small_chunks(chunks)
+        assert merged[2] is chunks[5]
+        assert merged[0].content == "\n\n".join(["x" * 16] * 3)
+
+    def test_split_section_overlap(self):
+        """Test split chunks repeat trailing paragraphs as overlap."""
+        chunker = DocumentChunker(ChunkerConfig(
+            min_chunk_tokens=1, target_chunk_tokens=30, max_chunk_tokens=60, overlap_tokens=10,
+        ))
+        paragraphs = [f"Paragraph {i:02d} " + "x" * 28 for i in range(12)]
+
+        chunks = chunker._split_large_section(
+            "\n\n".join(paragraphs), "doc", 0, ["Part 1"], "Part 1"
+        )
+
+        assert len(chunks) > 2
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous.content.split("\n\n")[-1] == current.content.split("\n\n")[0]
+        assert chunks[-1].content.endswith(paragraphs[-1])
+
+
 class TestChunkerConfig:
     """Tests for ChunkerConfig."""
 
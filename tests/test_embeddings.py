@@ -0,0 +1,307 @@
+"""Tests for batch embedding providers and quantized vector search."""
+
+import io
+import json
+import random
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from regulatory_kb.core.resilience import RetryConfig
+from regulatory_kb.models.document import Document, DocumentContent, DocumentType
+from regulatory_kb.storage.embeddings import (
+    BatchingEmbeddingProvider,
+    BedrockEmbeddingProvider,
+    EmbeddingClientConfig,
+    QuantizedVectorIndex,
+    VectorQuantization,
+    decode_vector,
+    dequantize,
+    encode_vector,
+    quantize,
+)
+from regulatory_kb.storage.graph_store import FalkorDBStore, QueryResult
+from regulatory_kb.storage.vector_search import VectorSearchConfig, VectorSearchService
+
+
+DIMENSION = 16
+
+
+def _vector(text: str) -> list[float]:
+    rng = random.Random(text)
+    return [rng.uniform(-1, 1) for _ in range(DIMENSION)]
+
+
+class RecordingEmbedder:
+    """Batch embedder that records requests and peak concurrency."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.batches: list[list[str]] = []
+        self.failures = failures
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.batches.append(list(texts))
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("throttled")
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return [_vector(text) for text in texts]
+
+
+def _config(**kwargs) -> EmbeddingClientConfig:
+    return EmbeddingClientConfig(retry=RetryConfig(base_delay=0.0, jitter=False), **kwargs)
+
+
+class TestBatchingEmbeddingProvider:
+    """Tests for BatchingEmbeddingProvider."""
+
+    def test_batches_and_deduplicates(self):
+        embedder = RecordingEmbedder()
+        provider = BatchingEmbeddingProvider(embedder, DIMENSION, _config(batch_size=3))
+        texts = ["a", "b", "a", "c", "d", "b", "e"]
+
+        matrix = provider.embed_batch(texts)
+
+        assert matrix.dtype == np.float32 and matrix.shape == (7, DIMENSION)
+        np.testing.assert_allclose(matrix, np.asarray([_vector(t) for t in texts], dtype=np.float32))
+        assert sorted(map(len, embedder.batches)) == [2, 3]
+        assert provider.get_stats() == {"requests": 2, "texts_embedded": 5, "duplicates": 2}
+
+    def test_runs_requests_concurrently(self):
+        embedder = RecordingEmbedder(delay=0.05)
+        provider = BatchingEmbeddingProvider(
+            embedder, DIMENSION, _config(batch_size=1, max_concurrency=4)
+        )
+
+        provider.embed_batch([str(i) for i in range(8)])
+
+        assert 1 < embedder.peak <= 4
+
+    def test_retries_transient_errors(self):
+        embedder = RecordingEmbedder(failures=2)
+        provider = BatchingEmbeddingProvider(embedder, DIMENSION, _config())
+
+        matrix = provider.embed_batch(["a", "b"])
+
+        assert len(embedder.batches) == 3
+        assert matrix.shape == (2, DIMENSION)
+
+    def test_paces_requests(self):
+        embedder = RecordingEmbedder()
+        provider = BatchingEmbeddingProvider(
+            embedder, DIMENSION, _config(batch_size=1, max_concurrency=4, requests_per_second=50)
+        )
+
+        start = time.monotonic()
+        provider.embed_batch([str(i) for i in range(6)])
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_rejects_wrong_shape(self):
+        provider = BatchingEmbeddingProvider(lambda texts: [[0.0] * 3], DIMENSION, _config())
+
+        with pytest.raises(ValueError):
+            provider.embed_batch(["a", "b"])
+
+
+class TestBedrockEmbeddingProvider:
+    """Tests for BedrockEmbeddingProvider request bodies."""
+
+    def _client(self):
+        def invoke_model(modelId, body):
+            request = json.loads(body)
+            if "texts" in request:
+                payload = {"embeddings": [_vector(t) for t in request["texts"]]}
+            else:
+                payload = {"embedding": _vector(request["inputText"])}
+            return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+        client = MagicMock()
+        client.invoke_model.side_effect = invoke_model
+        return client
+
+    def test_cohere_batches_texts(self):
+        client = self._client()
+        provider = BedrockEmbeddingProvider(
+            "cohere.embed-english-v3", DIMENSION, config=_config(batch_size=200), client=client
+        )
+
+        matrix = provider.embed_batch([str(i) for i in range(100)])
+
+        assert client.invoke_model.call_count == 2  # 96 + 4
+        np.testing.assert_allclose(matrix[99], _vector("99"), rtol=1e-6)
+
+    def test_titan_sends_one_text_per_request(self):
+        client = self._client()
+        provider = BedrockEmbeddingProvider("amazon.titan-embed-text-v2:0", DIMENSION, client=client)
+
+        matrix = provider.embed_batch(["a", "b", "c"])
+
+        assert client.invoke_model.call_count == 3
+        assert provider.config.bulkhead == "bedrock"
+        np.testing.assert_allclose(matrix[1], _vector("b"), rtol=1e-6)
+
+
+class TestQuantization:
+    """Tests for vector quantization."""
+
+    def test_round_trip_error_is_bounded(self):
+        rng = np.random.default_rng(44)
+        vectors = rng.normal(size=(50, 64)).astype(np.float32)
+
+        for mode, tolerance in ((VectorQuantization.INT8, 0.5 / 127), (VectorQuantization.FLOAT16, 1e-3)):
+            codes, scales = quantize(vectors, mode)
+            restored = dequantize(codes, scales)
+            peak = np.abs(vectors).max(axis=1, keepdims=True)
+            assert np.all(np.abs(restored - vectors) <= peak * tolerance + 1e-6)
+
+            decoded = decode_vector(encode_vector(codes[3]), mode)
+            np.testing.assert_array_equal(decoded, codes[3])
+
+    def test_index_recall_after_rerank_candidates(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(2000, 64)).astype(np.float32)
+        index = QuantizedVectorIndex(64, VectorQuantization.INT8)
+        index.add([("doc", i) for i in range(len(vectors))], vectors)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        for query in rng.normal(size=(10, 64)).astype(np.float32):
+            exact = set(np.argsort(-(normalized @ query))[:10])
+            candidates = {key[1] for key, _ in index.search(query, 40)}
+            assert exact <= candidates
+
+        assert index.nbytes < vectors.nbytes / 3
+
+    def test_remove(self):
+        index = QuantizedVectorIndex(DIMENSION, VectorQuantization.FLOAT16)
+        index.add([("a", 0), ("b", 0), ("a", 1)], np.asarray([_vector(t) for t in "xyz"]))
+
+        assert index.remove(lambda key: key[0] == "a") == 2
+        assert [key for key, _ in index.search(_vector("x"), 5)] == [("b", 0)]
+
+
+class TestQuantizedVectorSearch:
+    """Tests for VectorSearchService with quantized storage."""
+
+    def _document(self, doc_id: str) -> Document:
+        return Document(
+            id=doc_id,
+            title=doc_id.upper(),
+            document_type=DocumentType.GUIDANCE,
+            regulator_id="us_frb",
+            source_url="https://example.com",
+            content=DocumentContent(text=f"Capital rule {doc_id}. " * 60),
+        )
+
+    def _service(self) -> tuple[VectorSearchService, MagicMock]:
+        store = MagicMock(spec=FalkorDBStore)
+        store.query.return_value = QueryResult(nodes=[], relationships=[], raw_result=None)
+        config = VectorSearchConfig(
+            embedding_dimension=DIMENSION,
+            chunk_size=200,
+            quantization=VectorQuantization.INT8,
+        )
+        return VectorSearchService(store, config, embedding_fn=_vector), store
+
+    def _serve_stored_chunks(self, store: MagicMock) -> dict:
+        """Answer chunk writes, load and rerank queries like the graph would."""
+        chunks = {}
+
+        def write(params):
+            for chunk in params["chunks"]:
+                chunks[(params["doc_id"], chunk["index"])] = chunk
+
+        for call in store.query.call_args_list:
+            write(call[0][1])
+
+        def graph(query, params=None):
+            if params and "chunks" in params:
+                write(params)
+                rows = []
+            elif params is None:
+                rows = [[key[0], key[1], c["code"], c["scale"]] for key, c in chunks.items()]
+            else:
+                rows = [
+                    [key[0], key[0].upper(), chunks[tuple(key)]["text"], key[1],
+                     chunks[tuple(key)]["embedding"]]
+                    for key in params["keys"]
+                ]
+            return QueryResult(nodes=[], relationships=[], raw_result=MagicMock(result_set=rows))
+
+        store.query.side_effect = graph
+        return chunks
+
+    def test_index_writes_one_query_with_codes(self):
+        service, store = self._service()
+
+        count = service.index_document(self._document("d1"))
+
+        assert store.query.call_count == 1
+        query, params = store.query.call_args[0]
+        assert "UNWIND" in query and "embedding_q" in query and "vecf32" in query
+        assert len(params["chunks"]) == count == len(service.quantized_index)
+
+    def test_search_reranks_on_full_precision(self):
+        service, store = self._service()
+        embedder = RecordingEmbedder()
+        service.set_embedding_provider(BatchingEmbeddingProvider(embedder, DIMENSION, _config()))
+        service.batch_index_documents([self._document("d1"), self._document("d2")])
+        assert len(embedder.batches) == 1
+
+        chunks = self._serve_stored_chunks(store)
+        target = next(iter(chunks.values()))
+
+        results = service.vector_search(target["text"], top_k=3)
+
+        assert results[0].chunk_text == target["text"]
+        assert results[0].score == pytest.approx(1.0, abs=1e-5)
+        assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+
+    def test_search_sees_documents_indexed_by_other_processes(self):
+        writer, store = self._service()
+        writer.index_document(self._document("d1"))
+        reader, _ = self._service()
+        reader.store = store
+        chunks = self._serve_stored_chunks(store)
+        reader.config.quantized_refresh_seconds = 3600
+
+        target = chunks[("d1", 0)]
+        assert reader.vector_search(target["text"], top_k=1)[0].document_id == "d1"
+
+        writer.index_document(self._document("d2"))
+        target = chunks[("d2", 0)]
+        assert reader.vector_search(target["text"], top_k=1)[0].document_id == "d1"
+
+        reader.config.quantized_refresh_seconds = 0
+        assert reader.vector_search(target["text"], top_k=1)[0].document_id == "d2"
+
+    def test_load_quantized_index(self):
+        service, store = self._service()
+        service.index_document(self._document("d1"))
+        params = store.query.call_args[0][1]
+        rows = [
+            ["d1", chunk["index"], chunk["code"], chunk["scale"]] for chunk in params["chunks"]
+        ]
+        store.query.return_value = QueryResult(
+            nodes=[], relationships=[], raw_result=MagicMock(result_set=rows)
+        )
+
+        restored, _ = self._service()
+        restored.store = store
+
+        assert restored.load_quantized_index() == len(rows)
+        assert restored.quantized_index.search(_vector("x"), 3) == service.quantized_index.search(
+            _vector("x"), 3
+        )
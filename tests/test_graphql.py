@@ -0,0 +1,421 @@
+"""Tests for GraphQL resolution, batching and pagination."""
+
+import random
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from regulatory_kb.api.graphql import DocumentLoader, GraphQLContext, GraphQLService
+from regulatory_kb.api.query_plan import (
+    GraphQLError,
+    QueryLimits,
+    compile_plan,
+    parse_query,
+    query_hash,
+)
+from regulatory_kb.storage.graph_store import QueryResult
+
+
+REGULATOR_IDS = ["us_frb", "us_occ", "us_fdic"]
+
+
+class FakeGraphStore:
+    """In-memory graph answering the queries issued by GraphQLService."""
+
+    def __init__(self, documents: list[dict], edges: list[tuple[str, str, str]] = ()):
+        self.documents = {doc["id"]: doc for doc in documents}
+        self.requirements: dict[str, dict] = {}
+        self.edges = list(edges)
+        self.queries: list[str] = []
+
+    def get_document_by_id(self, doc_id):
+        self.queries.append("get_document_by_id")
+        return self.documents.get(doc_id)
+
+    def query(self, cypher, params=None):
+        self.queries.append(cypher)
+        params = params or {}
+        if "UNWIND $ids AS source_id" in cypher:
+            rows = self._related_rows(cypher, params)
+        elif "UNWIND $ids AS regulator_id" in cypher:
+            rows = self._regulator_rows(params)
+        elif "RETURN count(d)" in cypher:
+            rows = [[len(self._filter(params))]]
+        else:
+            return self._page(cypher, params)
+        return QueryResult(raw_result=SimpleNamespace(result_set=rows))
+
+    def _filter(self, params):
+        return [
+            doc for doc in self.documents.values()
+            if params.get("regulator_id") in (None, doc["regulator_id"])
+        ]
+
+    def _page(self, cypher, params):
+        field, direction = re.search(r"ORDER BY coalesce\(d\.(\w+), ''\) (\w+)", cypher).groups()
+        descending = direction == "DESC"
+        docs = sorted(
+            self._filter(params),
+            key=lambda d: (d.get(field) or "", d["id"]),
+            reverse=descending,
+        )
+        if "after_id" in params:
+            cursor = (params["after_value"], params["after_id"])
+            docs = [
+                d for d in docs
+                if ((d.get(field) or "", d["id"]) < cursor) == descending
+                and (d.get(field) or "", d["id"]) != cursor
+            ]
+        return QueryResult(nodes=docs[: params["limit"]])
+
+    def _related_rows(self, cypher, params):
+        label = re.search(r"\(t:(\w+)\)", cypher).group(1)
+        outgoing = "-[r]->" in cypher
+        targets = self.documents if label == "Document" else self.requirements
+        rows = []
+        for source_id in params["ids"]:
+            for start, rel_type, end in self.edges:
+                near, far = (start, end) if outgoing else (end, start)
+                if near != source_id or far not in targets:
+                    continue
+                if "types" in params and rel_type not in params["types"]:
+                    continue
+                rows.append([source_id, rel_type, targets[far], {}])
+        return rows
+
+    def _regulator_rows(self, params):
+        return [
+            [
+                reg_id,
+                sorted(
+                    (d for d in self.documents.values() if d["regulator_id"] == reg_id),
+                    key=lambda d: (d["title"], d["id"]),
+                )[: params["limit"]],
+            ]
+            for reg_id in params["ids"]
+        ]
+
+
+def _corpus(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "id": f"doc{i:03d}",
+            "title": rng.choice(["Capital", "Liquidity", "Stress", "Call Report"]),
+            "document_type": "guidance",
+            "regulator_id": rng.choice(REGULATOR_IDS),
+            "effective_date": rng.choice([None, "2023-01-01", "2024-06-30"]),
+        }
+        for i in range(count)
+    ]
+
+
+NESTED_QUERY = """
+query {
+    documents(first: $first) {
+        edges {
+            node {
+                id
+                references {
+                    id
+                    referencedBy {
+                        id
+                    }
+                }
+                implements {
+                    id
+                }
+            }
+        }
+    }
+}
+"""
+
+
+class TestBatchedResolution:
+    """Tests for per-level batched resolution of nested fields."""
+
+    def _store(self, count: int) -> FakeGraphStore:
+        rng = random.Random(41)
+        documents = _corpus(rng, count)
+        ids = [doc["id"] for doc in documents]
+        edges = [(a, "REFERENCES", b) for a in ids for b in rng.sample(ids, 2) if a != b]
+        store = FakeGraphStore(documents, edges)
+        store.requirements = {"req1": {"id": "req1", "description": "Report quarterly"}}
+        store.edges.append((ids[0], "IMPLEMENTS", "req1"))
+        return store
+
+    def test_query_count_independent_of_result_size(self):
+        counts = []
+        for size in (3, 40):
+            store = self._store(size)
+            result = GraphQLService(store).execute(NESTED_QUERY, {"first": size})
+
+            assert not result.errors
+            assert len(result.data["documents"]["edges"]) == size
+            counts.append(len(store.queries))
+
+        # page, references, referencedBy and implements; no count query
+        assert counts == [4, 4]
+
+    def test_nested_fields_match_graph(self):
+        store = self._store(25)
+
+        result = GraphQLService(store).execute(NESTED_QUERY, {"first": 25})
+
+        for edge in result.data["documents"]["edges"]:
+            node = edge["node"]
+            expected = [b for a, t, b in store.edges if a == node["id"] and t == "REFERENCES"]
+            assert [ref["id"] for ref in node["references"]] == expected
+            for ref in node["references"]:
+                assert [r["id"] for r in ref["referencedBy"]] == [
+                    a for a, t, b in store.edges if b == ref["id"] and t == "REFERENCES"
+                ]
+            expected_reqs = ["req1"] if node["id"] == "doc000" else []
+            assert [req["id"] for req in node["implements"]] == expected_reqs
+
+    def test_loader_caches_within_request(self):
+        store = self._store(10)
+        loader = DocumentLoader(store)
+
+        loader.load_related(["doc001", "doc002"], "out", ["REFERENCES"])
+        loader.load_related(["doc002", "doc001"], "out", ["REFERENCES"])
+        loader.load_related(["doc001", "doc003"], "out", ["REFERENCES"])
+
+        assert loader.query_count == 2
+
+    def test_loader_attached_to_context(self):
+        store = self._store(4)
+        context = GraphQLContext(graph_store=store)
+
+        GraphQLService(store).execute(NESTED_QUERY, {"first": 4}, context=context)
+
+        assert isinstance(context.loader, DocumentLoader)
+        assert context.loader.query_count == 3
+
+    def test_regulator_documents_loaded_in_one_query(self):
+        store = FakeGraphStore(_corpus(random.Random(7), 30))
+        query = """
+        query {
+            regulators {
+                id
+                documents(first: 2) {
+                    id
+                }
+            }
+        }
+        """
+
+        result = GraphQLService(store).execute(query)
+
+        assert len(store.queries) == 1
+        for regulator in result.data["regulators"]:
+            docs = [d["id"] for d in regulator["documents"]]
+            assert len(docs) <= 2
+            assert all(store.documents[d]["regulator_id"] == regulator["id"] for d in docs)
+
+
+PAGE_QUERY = """
+query {
+    documents(first: $first, after: $after, orderBy: $order, filter: $filter) {
+        edges {
+            node {
+                id
+            }
+            cursor
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        totalCount
+    }
+}
+"""
+
+
+class TestKeysetPagination:
+    """Tests for cursor pagination on documents."""
+
+    def _pages(self, service, variables):
+        ids, after, counts = [], None, set()
+        while True:
+            result = service.execute(PAGE_QUERY, dict(variables, after=after))
+            assert not result.errors
+            connection = result.data["documents"]
+            ids.extend(edge["node"]["id"] for edge in connection["edges"])
+            counts.add(connection["totalCount"])
+            if not connection["pageInfo"]["hasNextPage"]:
+                return ids, counts
+            after = connection["pageInfo"]["endCursor"]
+
+    def test_pages_are_disjoint_and_complete(self):
+        documents = _corpus(random.Random(41), 53)
+        service = GraphQLService(FakeGraphStore(documents))
+
+        for field, key in (("TITLE", "title"), ("EFFECTIVE_DATE", "effective_date")):
+            for direction in ("ASC", "DESC"):
+                ids, counts = self._pages(
+                    service, {"first": 7, "order": {"field": field, "direction": direction}}
+                )
+
+                expected = sorted(
+                    documents,
+                    key=lambda d: (d.get(key) or "", d["id"]),
+                    reverse=direction == "DESC",
+                )
+                assert ids == [d["id"] for d in expected]
+                assert counts == {53}
+
+    def test_total_count_is_filtered_count(self):
+        documents = _corpus(random.Random(3), 40)
+        store = FakeGraphStore(documents)
+        service = GraphQLService(store)
+
+        result = service.execute(PAGE_QUERY, {"first": 5, "filter": {"regulatorId": "us_occ"}})
+
+        expected = sum(d["regulator_id"] == "us_occ" for d in documents)
+        assert result.data["documents"]["totalCount"] == expected
+        assert sum("RETURN count(d)" in q for q in store.queries) == 1
+
+    def test_rejects_unknown_order_field_and_bad_cursor(self):
+        service = GraphQLService(FakeGraphStore(_corpus(random.Random(1), 5)))
+
+        result = service.execute(PAGE_QUERY, {"first": 2, "order": {"field": "id} DETACH DELETE d //"}})
+        assert result.errors and "Invalid order field" in result.errors[0]["message"]
+
+        result = service.execute(PAGE_QUERY, {"first": 2, "after": "not-a-cursor"})
+        assert result.errors and "Invalid cursor" in result.errors[0]["message"]
+
+
+class TestQueryParser:
+    """Tests for the GraphQL query parser."""
+
+    def test_parses_arguments_aliases_and_shapes(self):
+        query = """
+        query Docs($first: Int = 5, $types: [RelationshipType!]) @cached {
+            # a comment
+            recent: documents(first: $first, filter: {regulatorId: "us_frb", tags: [1, 2.5, null]}) {
+                edges { node { id, title relatedDocuments(types: [REFERENCES, AMENDS]) { document { id } } } }
+            }
+            document(id: "doc \\"1\\"") { id }
+        }
+        """
+
+        operation = parse_query(query)
+        recent, document = operation["selections"]
+
+        assert recent["name"] == "documents" and recent["alias"] == "recent"
+        assert recent["arguments"] == {
+            "first": {"$var": "first"},
+            "filter": {"regulatorId": "us_frb", "tags": [1, 2.5, None]},
+        }
+        node = recent["selections"]["selections"][0]["selections"]["selections"][0]
+        fields = node["selections"]["selections"]
+        assert [f["name"] for f in fields] == ["id", "title", "relatedDocuments"]
+        assert fields[2]["arguments"] == {"types": ["REFERENCES", "AMENDS"]}
+        assert document["arguments"] == {"id": 'doc "1"'}
+        assert document["selections"]["selections"][0]["selections"] is None
+
+    def test_shorthand_and_errors(self):
+        assert [f["name"] for f in parse_query("regulators { id }")["selections"]] == ["regulators"]
+
+        for bad in ("", "{ documents(first: ) { id } }", "{ id ", "{ id } }", "{ a % b }"):
+            with pytest.raises(GraphQLError) as exc:
+                parse_query(bad)
+            assert exc.value.code == "GRAPHQL_PARSE_FAILED"
+
+    def test_aliases_name_results(self):
+        store = FakeGraphStore(_corpus(random.Random(5), 3))
+        query = """
+        {
+            us: regulators(country: "US") { id }
+            ca: regulators(country: "CA") { id }
+        }
+        """
+
+        data = GraphQLService(store).execute(query).data
+
+        assert {r["id"] for r in data["ca"]} == {"ca_osfi", "ca_fintrac"}
+        assert "us_frb" in {r["id"] for r in data["us"]}
+
+
+class TestQueryPlans:
+    """Tests for plan caching, persisted queries and limits."""
+
+    def test_plans_cached_by_hash(self, monkeypatch):
+        import regulatory_kb.api.graphql as graphql
+
+        service = GraphQLService(FakeGraphStore(_corpus(random.Random(6), 8)))
+        compiled = []
+        monkeypatch.setattr(graphql, "compile_plan", lambda q, l: compiled.append(q) or compile_plan(q, l))
+
+        for first in (2, 3, 4):
+            result = service.execute(PAGE_QUERY, {"first": first})
+            assert len(result.data["documents"]["edges"]) == first
+
+        assert compiled == [PAGE_QUERY]
+        assert service.plan_cache.get_stats()["hits"] == 2
+
+    def test_persisted_queries(self):
+        store = FakeGraphStore(_corpus(random.Random(8), 4))
+        service = GraphQLService(store)
+        query = "{ regulators { id } }"
+        digest = service.register_persisted_query(query)
+        service.plan_cache.clear()
+
+        result = service.execute(extensions={"persistedQuery": {"version": 1, "sha256Hash": digest}})
+        assert len(result.data["regulators"]) == 6
+
+        unknown = service.execute(extensions={"persistedQuery": {"sha256Hash": "0" * 64}})
+        assert unknown.errors[0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+        # Automatic registration: query and hash once, then the hash alone
+        other = "{ regulators(country: CA) { id } }"
+        wrong = service.execute(other, extensions={"persistedQuery": {"sha256Hash": digest}})
+        assert wrong.errors[0]["extensions"]["code"] == "BAD_USER_INPUT"
+        service.execute(other, extensions={"persistedQuery": {"sha256Hash": query_hash(other)}})
+        result = service.execute(extensions={"persistedQuery": {"sha256Hash": query_hash(other)}})
+        assert len(result.data["regulators"]) == 2
+
+    def test_limits_reject_before_touching_graph(self):
+        store = FakeGraphStore(_corpus(random.Random(9), 4))
+        service = GraphQLService(store, limits=QueryLimits(max_depth=4, max_cost=500))
+        path = """
+        query Path($depth: Int) {
+            regulatoryPath(fromId: "a", toId: "b", maxDepth: $depth) {
+                depth
+            }
+        }
+        """
+        cases = [
+            (path, {"depth": 9}),
+            ("{ relatedDocuments(documentId: \"a\", depth: 3) { document { id } } }", {}),
+            ("{ documents(first: 1000) { totalCount } }", {}),
+            ("{ document(id: \"a\") { references { references { references { id } } } } }", {}),
+        ]
+
+        for query, variables in cases:
+            result = service.execute(query, variables)
+            assert result.errors[0]["extensions"]["code"] in ("QUERY_TOO_COMPLEX", "QUERY_TOO_DEEP")
+
+        assert store.queries == []
+
+    def test_cost_with_variables_is_computed_per_request(self):
+        limits = QueryLimits(max_cost=300)
+        plan = compile_plan(PAGE_QUERY, limits)
+        static = compile_plan("{ documents(first: 5) { edges { node { id } } } }", limits)
+
+        assert plan.uses_variables and plan.cost is None
+        assert static.cost == 1 + 5 * (1 + 1 + 1)
+        assert plan.check(limits, {"first": 10}) < plan.check(limits, {"first": 30})
+        with pytest.raises(GraphQLError) as exc:
+            plan.check(limits, {"first": 40})
+        assert exc.value.code == "QUERY_TOO_COMPLEX"
+
+    def test_nested_documents_cost_default_page_size(self):
+        limits = QueryLimits()
+        implicit = compile_plan("{ regulators { documents { id title } } }", limits)
+        explicit = compile_plan("{ regulators { documents(first: 20) { id title } } }", limits)
+
+        assert implicit.cost == explicit.cost > 20
@@ -0,0 +1,196 @@
+"""Tests for the lxml HTML backend of DocumentParser."""
+
+import random
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from regulatory_kb.processing.parser import DocumentFormat, DocumentParser, HTMLBackend
+
+
+WORDS = [
+    "capital", "liquidity", "§ 217.10", "within 5 business days", "C$10,000",
+    "Tier&nbsp;1", "R&amp;D", "reporting", "écart", "12 CFR 249", "\n  ", "  ",
+]
+CLASSES = ["content", "sidebar-left", "x-Menu", "gc-nav", "wb-sec", "plain", "Breadcrumbs"]
+INLINE = ["span", "b", "em", "code"]
+BLOCK = ["div", "section", "p", "ul", "table", "h1", "h2", "h3", "nav", "aside", "footer"]
+
+
+def _attrs(rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        return f' class="{rng.choice(CLASSES)} {rng.choice(CLASSES)}"'
+    return ""
+
+
+def _inline(rng: random.Random, depth: int = 0) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 3)):
+        roll = rng.random()
+        if roll < 0.6 or depth > 2:
+            parts.append(rng.choice(WORDS))
+        elif roll < 0.7:
+            parts.append(f"<!-- {rng.choice(WORDS)} -->")
+        else:
+            tag = rng.choice(INLINE)
+            parts.append(f"<{tag}{_attrs(rng)}>{_inline(rng, depth + 1)}</{tag}>")
+    return " ".join(parts)
+
+
+def _table(rng: random.Random) -> str:
+    width = rng.randint(1, 3)
+    row = lambda cell: "<tr>" + "".join(  # noqa: E731
+        f"<{cell}>{_inline(rng, 2)}</{cell}>" for _ in range(width)
+    ) + "</tr>"
+    header = row("th")
+    parts = []
+    if rng.random() < 0.5:
+        parts.append(f"<caption>{rng.choice(WORDS)}</caption>")
+    if rng.random() < 0.5:
+        parts.append(f"<thead>{header}</thead><tbody>")
+        parts.extend(row("td") for _ in range(rng.randint(0, 3)))
+        parts.append("</tbody>")
+    else:
+        parts.append(header)
+        parts.extend(row("td") for _ in range(rng.randint(0, 3)))
+        if rng.random() < 0.3:
+            parts.append(header)  # duplicate of the first row
+    return f"<table{_attrs(rng)}>{''.join(parts)}</table>"
+
+
+def _block(rng: random.Random, depth: int = 0) -> str:
+    tag = rng.choice(BLOCK if depth < 3 else ["p", "h2", "ul"])
+    if tag in ("p", "h1", "h2", "h3"):
+        return f"<{tag}{_attrs(rng)}>{_inline(rng)}</{tag}>"
+    if tag == "ul":
+        items = "".join(f"<li>{_inline(rng)}</li>" for _ in range(rng.randint(0, 3)))
+        return f"<ul{_attrs(rng)}>{items}</ul>"
+    if tag == "table":
+        return _table(rng)
+    return f"<{tag}{_attrs(rng)}>{_blocks(rng, depth + 1)}</{tag}>"
+
+
+def _blocks(rng: random.Random, depth: int = 0) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 5)):
+        if rng.random() < 0.2:
+            parts.append(rng.choice(WORDS))
+        else:
+            parts.append(_block(rng, depth))
+    return "\n".join(parts)
+
+
+def _document(rng: random.Random) -> str:
+    body = _blocks(rng)
+    if rng.random() < 0.5:
+        wrapper = rng.choice(["main", "article"])
+        body = f"{_blocks(rng)}<{wrapper}>{body}</{wrapper}>"
+    extra = ""
+    if rng.random() < 0.3:
+        extra = '<time property="dateModified" datetime="2024-01-15">Jan 15</time>'
+    return (
+        "<!DOCTYPE html>\n<html><head><title>"
+        f"{rng.choice(WORDS)}</title><style>p {{}}</style></head>\n"
+        f"<body>{body}{extra}<script>var x = 1;</script></body></html>"
+    )
+
+
+@pytest.fixture
+def lxml_parser():
+    return DocumentParser(html_backend=HTMLBackend.LXML)
+
+
+@pytest.fixture
+def soup_parser():
+    return DocumentParser(html_backend=HTMLBackend.BEAUTIFULSOUP)
+
+
+class TestLxmlEquivalence:
+    """The lxml backend must match the BeautifulSoup backend."""
+
+    @pytest.mark.parametrize(
+        "format",
+        [
+            DocumentFormat.HTML,
+            DocumentFormat.FINTRAC,
+            DocumentFormat.CFR,
+            DocumentFormat.FEDERAL_REGISTER,
+        ],
+    )
+    def test_random_documents_match(self, lxml_parser, soup_parser, format):
+        rng = random.Random(format.value)
+        for _ in range(150):
+            document = _document(rng)
+            expected = soup_parser.parse(document, format).to_dict()
+            actual = lxml_parser.parse(document, format).to_dict()
+            if "thresholds" in expected["metadata"]:
+                expected["metadata"]["thresholds"].sort()
+                actual["metadata"]["thresholds"].sort()
+            assert actual == expected, document
+
+    def test_sample_regulatory_page_matches(self, lxml_parser, soup_parser):
+        document = """
+        <html><head><title>Capital Rule</title></head>
+        <body class="page">
+          <header class="site-header"><a href="/">Home</a></header>
+          <div class="breadcrumb">Home &gt; Rules</div>
+          <main>
+            <h1>Regulatory Capital</h1>
+            <p>Banks must maintain a minimum Tier 1 ratio.</p>
+            <h2>Reporting</h2>
+            <ul><li>File FR Y-9C quarterly</li><li>Within 30 days</li></ul>
+            <table>
+              <caption>Minimums</caption>
+              <tr><th>Ratio</th><th>Minimum</th></tr>
+              <tr><td>CET1</td><td>4.5%</td></tr>
+            </table>
+          </main>
+          <footer>Contact</footer>
+        </body></html>
+        """
+        expected = soup_parser.parse(document, DocumentFormat.HTML)
+        actual = lxml_parser.parse(document, DocumentFormat.HTML)
+
+        assert actual.to_dict() == expected.to_dict()
+        assert "Home" not in actual.text
+        assert actual.tables[0].caption == "Minimums"
+        assert [s.title for s in actual.sections] == ["Regulatory Capital", "Reporting"]
+
+
+class TestLxmlFallback:
+    """Pages the lxml backend cannot reproduce use BeautifulSoup."""
+
+    def test_fragment_without_body(self, lxml_parser, soup_parser):
+        document = "<h1>Title</h1><p>Some guidance text</p>"
+        assert lxml_parser._lxml().extract_html(document) is None
+        assert (
+            lxml_parser.parse(document, DocumentFormat.HTML).to_dict()
+            == soup_parser.parse(document, DocumentFormat.HTML).to_dict()
+        )
+
+    def test_body_stripped_as_navigation(self, lxml_parser, soup_parser):
+        document = '<html><head><title>T</title></head><body class="has-sidebar"><p>x</p></body></html>'
+        assert lxml_parser._lxml().extract_html(document) is None
+        assert (
+            lxml_parser.parse(document, DocumentFormat.HTML).to_dict()
+            == soup_parser.parse(document, DocumentFormat.HTML).to_dict()
+        )
+
+    def test_auto_backend_without_lxml(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def no_lxml(name, *args, **kwargs):
+            if name == "regulatory_kb.processing.html_lxml":
+                raise ImportError("lxml missing")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_lxml)
+        parser = DocumentParser()
+
+        result = parser.parse("<body><p>Regulation text</p></body>", DocumentFormat.HTML)
+
+        assert result.text == "\nRegulation text".strip()
+        assert parser._lxml() is None
@@ -0,0 +1,98 @@
+"""Tests for lazy imports and handler import budgets."""
+
+import json
+import os
+import subprocess
+import sys
+
+import regulatory_kb.api as api_package
+from regulatory_kb.core.lazy import LazyModule, lazy_import
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _run_python(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"))
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Tests for lazily re-exported package names."""
+
+    def test_names_resolve_and_are_cached(self):
+        auth_service = api_package.AuthService
+        from regulatory_kb.api.auth import AuthService
+
+        assert auth_service is AuthService
+        assert api_package.__dict__["AuthService"] is AuthService
+
+    def test_dir_lists_exports(self):
+        assert set(api_package.__all__) <= set(dir(api_package))
+
+    def test_unknown_name_raises_attribute_error(self):
+        try:
+            api_package.NotAThing
+        except AttributeError as e:
+            assert "NotAThing" in str(e)
+        else:
+            raise AssertionError("expected AttributeError")
+
+    def test_importing_one_name_loads_only_its_module(self):
+        loaded = _run_python(
+            "import sys\n"
+            "from regulatory_kb.api import AuthService\n"
+            "print(','.join(m for m in ('regulatory_kb.api.webhooks', "
+            "'regulatory_kb.api.graphql', 'aiohttp') if m in sys.modules))"
+        )
+        assert loaded == ""
+
+
+class TestLazyModule:
+    """Tests for lazy_import."""
+
+    def test_loads_on_first_attribute_access(self):
+        module = lazy_import("json")
+        assert isinstance(module, LazyModule)
+        assert "not loaded" in repr(module)
+
+        assert module.dumps({"a": 1}) == json.dumps({"a": 1})
+        assert "(loaded)" in repr(module)
+
+    def test_heavy_dependency_not_loaded_until_used(self):
+        loaded = _run_python(
+            "import sys\n"
+            "import regulatory_kb.storage.graph_store as gs\n"
+            "before = 'falkordb' in sys.modules\n"
+            "gs.falkordb.FalkorDB\n"
+            "print(before, 'falkordb' in sys.modules)"
+        )
+        assert loaded == "False True"
+
+
+class TestHandlerImportBudget:
+    """Handlers must not load heavy dependencies at import time."""
+
+    def test_forbidden_modules_not_imported(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                os.path.join(ROOT, "scripts", "profile_imports.py"),
+                "--budget",
+                os.path.join(ROOT, "scripts", "import_budget.json"),
+                "--no-time",
+                "--repeat",
+                "1",
+                "--json",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        report = json.loads(result.stdout)
+
+        assert report["violations"] == []
+        assert result.returncode == 0
+        assert {p["handler"] for p in report["profiles"]} >= {"handlers.api", "handlers.graphql"}
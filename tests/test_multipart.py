@@ -0,0 +1,162 @@
+"""Tests for streaming multipart parsing."""
+
+import base64
+import io
+import json
+import random
+
+import pytest
+
+from regulatory_kb.upload.multipart import (
+    BufferReader,
+    MultipartError,
+    as_body,
+    get_boundary,
+    iter_parts,
+)
+
+
+BOUNDARY = "----FormBoundary7MA4YWxkTrZu0gW"
+
+
+def _encode(fields: list[tuple[str, str | None, bytes]], newline: bytes = b"\r\n") -> bytes:
+    parts = [b"preamble" + newline]
+    for name, filename, content in fields:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        parts.append(
+            b"--" + BOUNDARY.encode() + newline
+            + b"Content-Disposition: " + disposition.encode() + newline
+            + newline + content + newline
+        )
+    parts.append(b"--" + BOUNDARY.encode() + b"--" + newline)
+    return b"".join(parts)
+
+
+class TestIterParts:
+    """Tests for iter_parts."""
+
+    def test_random_binary_parts_round_trip(self):
+        """Test part content is exact, including trailing CR, LF and dashes."""
+        rng = random.Random(40)
+        tails = [b"", b"\r\n", b"--", b"\r\n--\r\n", b"\n", b"-", b"\r"]
+        for _ in range(200):
+            newline = rng.choice([b"\r\n", b"\n"])
+            fields = []
+            for i in range(rng.randint(1, 4)):
+                content = bytes(rng.randrange(256) for _ in range(rng.randint(0, 64)))
+                content += rng.choice(tails)
+                if newline == b"\n" and content.endswith(b"\r"):
+                    content += b"x"  # a CR before a bare-LF delimiter is ambiguous
+                filename = f"f{i}.pdf" if rng.random() < 0.5 else None
+                fields.append((f"field{i}", filename, content))
+            body = _encode(fields, newline)
+
+            parts = list(iter_parts(body, BOUNDARY))
+
+            assert [(p.name, p.filename, bytes(p.content)) for p in parts] == fields
+
+    def test_crlf_parts_are_views_of_body(self):
+        """Test file content is a slice of the body, not a copy."""
+        body = _encode([("file", "a.pdf", b"%PDF-1.4 data\r\n--"), ("metadata", None, b'{"title": "T"}')])
+
+        file_part, metadata_part = iter_parts(body, BOUNDARY)
+
+        assert file_part.is_file and not metadata_part.is_file
+        assert file_part.content.obj is body
+        assert bytes(file_part.content) == b"%PDF-1.4 data\r\n--"
+        assert json.loads(metadata_part.text()) == {"title": "T"}
+
+    def test_oversized_file_rejected_without_closing_boundary(self):
+        """Test the size limit applies before the part's end is found."""
+        body = _encode([("file", "a.pdf", b"x" * 1000)])
+        truncated = body[: body.index(b"x") + 900]
+
+        with pytest.raises(MultipartError) as exc:
+            list(iter_parts(truncated, BOUNDARY, max_file_size=100))
+        assert exc.value.status_code == 413
+
+        with pytest.raises(MultipartError) as exc:
+            list(iter_parts(truncated, BOUNDARY, max_file_size=2000))
+        assert exc.value.status_code == 400
+
+    def test_size_limit_is_inclusive(self):
+        """Test a part of exactly the maximum size is accepted."""
+        body = _encode([("file", "a.pdf", b"x" * 100), ("title", None, b"y" * 10)])
+
+        assert len(list(iter_parts(body, BOUNDARY, max_file_size=100, max_field_size=10))) == 2
+        with pytest.raises(MultipartError):
+            list(iter_parts(body, BOUNDARY, max_file_size=99))
+        with pytest.raises(MultipartError):
+            list(iter_parts(body, BOUNDARY, max_field_size=9))
+
+    def test_malformed_bodies(self):
+        """Test bodies without boundaries or headers are rejected."""
+        with pytest.raises(MultipartError):
+            list(iter_parts(b"no boundary here", BOUNDARY))
+        with pytest.raises(MultipartError):
+            list(iter_parts(f"--{BOUNDARY}\r\nContent-Disposition: form-data".encode(), BOUNDARY))
+
+    def test_get_boundary(self):
+        assert get_boundary(f"multipart/form-data; boundary={BOUNDARY}") == BOUNDARY
+        assert get_boundary('multipart/form-data; charset=utf-8; boundary="a b"') == "a b"
+        assert get_boundary("multipart/form-data") is None
+
+
+class TestBufferReader:
+    """Tests for BufferReader."""
+
+    def test_reads_and_seeks_slice(self):
+        view = memoryview(b"0123456789")[2:8]
+        reader = BufferReader(view)
+
+        assert len(reader) == 6
+        assert reader.read(4) == b"2345"
+        assert reader.read() == b"67"
+        assert reader.seek(-3, io.SEEK_END) == 3
+        assert reader.read(10) == b"567"
+        assert reader.seek(0) == 0 and reader.read() == b"234567"
+
+    def test_as_body_passes_bytes_through(self):
+        data = b"abc"
+        assert as_body(data) is data
+        assert isinstance(as_body(memoryview(data)), BufferReader)
+
+
+class TestMultipartUploadHandler:
+    """Tests for multipart parsing in the upload handler."""
+
+    def _event(self, body: bytes) -> dict:
+        return {
+            "headers": {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+            "body": base64.b64encode(body).decode(),
+            "isBase64Encoded": True,
+        }
+
+    def test_parses_file_and_metadata(self):
+        from src.handlers.upload import _parse_multipart_form_data
+
+        pdf = b"%PDF-1.4\n" + bytes(range(256)) + b"\r\n-"
+        body = _encode([
+            ("file", "report.pdf", pdf),
+            ("metadata", None, b'{"title": "Report"}'),
+            ("regulator", None, b" Fed "),
+        ])
+
+        content, name, metadata = _parse_multipart_form_data(self._event(body))
+
+        assert isinstance(content, memoryview)
+        assert bytes(content) == pdf
+        assert name == "report.pdf"
+        assert metadata == {"title": "Report", "regulator": "Fed"}
+
+    def test_oversized_body_rejected_before_decoding(self, monkeypatch):
+        import src.handlers.upload as upload
+
+        monkeypatch.setattr(upload, "MAX_REQUEST_BYTES", 64)
+        monkeypatch.setattr(upload.base64, "b64decode", pytest.fail)
+
+        with pytest.raises(MultipartError) as exc:
+            upload._parse_multipart_form_data(self._event(b"x" * 200))
+        assert exc.value.status_code == 413
@@ -0,0 +1,314 @@
+"""Tests for MinHash/LSH near-duplicate upload detection."""
+
+import random
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from regulatory_kb.processing.parser import DocumentFormat, ParsedDocument
+from regulatory_kb.upload.models import UploadStatus
+from regulatory_kb.upload.near_duplicates import (
+    LSHIndex,
+    MinHashConfig,
+    MinHasher,
+    NearDuplicateAction,
+    NearDuplicateConfig,
+    estimate_similarity,
+)
+from regulatory_kb.upload.version_manager import (
+    NearDuplicateDecision,
+    NearDuplicateMatch,
+    VersionManager,
+)
+
+
+VOCABULARY = [f"term{i}" for i in range(500)]
+
+
+def _text(rng: random.Random, words: int = 400) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _edit(rng: random.Random, text: str, fraction: float) -> str:
+    words = text.split()
+    for i in rng.sample(range(len(words)), int(len(words) * fraction)):
+        words[i] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+class TestMinHasher:
+    """Tests for MinHash signatures."""
+
+    def test_estimate_tracks_jaccard(self):
+        rng = random.Random(46)
+        hasher = MinHasher(MinHashConfig(num_perm=256, bands=32))
+        for fraction in (0.0, 0.01, 0.05, 0.2, 1.0):
+            a = _text(rng)
+            b = _edit(rng, a, fraction)
+            sa, sb = hasher.shingles(a), hasher.shingles(b)
+            jaccard = len(sa & sb) / len(sa | sb)
+
+            estimate = estimate_similarity(hasher.signature(a), hasher.signature(b))
+
+            assert estimate == pytest.approx(jaccard, abs=0.1)
+
+    def test_layout_does_not_change_signature(self):
+        hasher = MinHasher()
+        text = "Banks must file the FR Y-14A report quarterly, within 52 days."
+        reformatted = "BANKS  must file the\nFR Y-14A report -- quarterly\twithin 52 days"
+
+        assert (hasher.signature(text) == hasher.signature(reformatted)).all()
+
+    def test_config_rejects_uneven_bands(self):
+        with pytest.raises(ValueError):
+            MinHashConfig(num_perm=100, bands=16)
+
+
+class TestLSHIndex:
+    """Tests for the in-memory LSH index."""
+
+    def test_finds_near_duplicates_only(self):
+        rng = random.Random(7)
+        hasher = MinHasher()
+        index = LSHIndex()
+        texts = {f"doc{i}": _text(rng) for i in range(200)}
+        for doc_id, text in texts.items():
+            index.add(doc_id, hasher.signature(text))
+
+        query = hasher.signature(_edit(rng, texts["doc42"], 0.01))
+
+        assert len(index.candidates(query)) < 5
+        matches = index.query(query, threshold=0.5)
+        assert [doc_id for doc_id, _ in matches] == ["doc42"]
+
+        assert index.remove("doc42") and len(index) == 199
+        assert index.query(query, threshold=0.5) == []
+
+
+class TestNearDuplicateConfig:
+    """Tests for threshold routing."""
+
+    def test_action_for(self, monkeypatch):
+        monkeypatch.setenv("NEAR_DUPLICATE_SKIP_THRESHOLD", "0.9")
+        config = NearDuplicateConfig.from_env()
+
+        assert config.action_for(0.92) == NearDuplicateAction.SKIP
+        assert config.action_for(0.85) == NearDuplicateAction.REPLACE
+        assert config.action_for(0.5) == NearDuplicateAction.NEW
+
+
+class TestVersionManagerNearDuplicates:
+    """Tests for the DynamoDB-backed LSH index in VersionManager."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with mock_aws():
+            boto3.resource("dynamodb", region_name="us-east-1").create_table(
+                TableName="near-duplicates",
+                KeySchema=[{"AttributeName": "bucket", "KeyType": "HASH"}],
+                AttributeDefinitions=[{"AttributeName": "bucket", "AttributeType": "S"}],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            yield VersionManager(
+                bucket_name="uploads",
+                near_duplicate_table_name="near-duplicates",
+                status_tracker=MagicMock(),
+                near_duplicate_config=NearDuplicateConfig(),
+            )
+
+    def test_routes_by_similarity(self, manager):
+        rng = random.Random(11)
+        original = _text(rng, 600)
+        manager.register_signature("doc-1", manager.compute_signature(original), title="Rule")
+        manager.register_signature("doc-2", manager.compute_signature(_text(rng, 600)))
+
+        same = manager.check_near_duplicate(manager.compute_signature(original + " "))
+        revised = manager.check_near_duplicate(
+            manager.compute_signature(_edit(rng, original, 0.015))
+        )
+        unrelated = manager.check_near_duplicate(manager.compute_signature(_text(rng, 600)))
+
+        assert same.action == NearDuplicateAction.SKIP
+        assert same.match.document_id == "doc-1" and same.match.title == "Rule"
+        assert revised.action == NearDuplicateAction.REPLACE
+        assert 0.8 <= revised.match.similarity < 0.95
+        assert unrelated.action == NearDuplicateAction.NEW and unrelated.match is None
+
+    def test_remove_signature(self, manager):
+        signature = manager.compute_signature(_text(random.Random(3)))
+        manager.register_signature("doc-1", signature)
+
+        assert manager.remove_signature("doc-1") is True
+        assert manager.find_near_duplicates(signature) == []
+        assert manager.remove_signature("doc-1") is False
+
+
+class TestUploadProcessorNearDuplicates:
+    """Tests for near-duplicate routing in the upload processor."""
+
+    def _processor(self, decision: NearDuplicateDecision):
+        from src.handlers.upload_processor import UploadProcessor
+
+        s3 = MagicMock()
+        s3.get_object.return_value = {
+            "Body": MagicMock(read=lambda: b"<html><body><p>Capital rule text.</p></body></html>")
+        }
+        version_manager = MagicMock(spec=VersionManager)
+        version_manager.compute_signature.return_value = "signature"
+        version_manager.check_near_duplicate.return_value = decision
+        processor = UploadProcessor(
+            bucket_name="uploads",
+            status_tracker=MagicMock(),
+            s3_client=s3,
+            webhook_service=MagicMock(),
+            version_manager=version_manager,
+        )
+        processor.parser = MagicMock()
+        processor.parser.parse.return_value = ParsedDocument(
+            text="Capital rule text.", format=DocumentFormat.HTML
+        )
+        return processor, version_manager
+
+    def _message(self) -> dict:
+        return {
+            "upload_id": "up-1",
+            "file_path": "uploads/pending/up-1/original.html",
+            "file_type": "html",
+            "uploader_id": "user-1",
+        }
+
+    def test_skip_resolves_to_stored_document(self):
+        match = NearDuplicateMatch("doc-1", 0.98)
+        processor, version_manager = self._processor(
+            NearDuplicateDecision(NearDuplicateAction.SKIP, match)
+        )
+        processor.metadata_extractor = MagicMock()
+
+        result = processor.process_upload(self._message())
+        processor.close()
+
+        assert result["status"] == "duplicate"
+        assert result["kb_document_id"] == "doc-1"
+        processor.metadata_extractor.extract.assert_not_called()
+        version_manager.register_signature.assert_not_called()
+
+    def test_replace_creates_new_version(self):
+        match = NearDuplicateMatch("doc-1", 0.85)
+        processor, version_manager = self._processor(
+            NearDuplicateDecision(NearDuplicateAction.REPLACE, match)
+        )
+        version_manager.replace_document.return_value = MagicMock(
+            success=True, new_document_id="doc-1_v2"
+        )
+
+        result = processor.process_upload(self._message())
+        processor.close()
+
+        assert result["kb_document_id"] == "doc-1_v2"
+        assert version_manager.replace_document.call_args.kwargs["existing_document_id"] == "doc-1"
+        version_manager.remove_signature.assert_called_once_with("doc-1")
+        assert version_manager.register_signature.call_args[0][:2] == ("doc-1_v2", "signature")
+
+    def test_signature_not_registered_when_completion_fails(self):
+        match = NearDuplicateMatch("doc-1", 0.85)
+        processor, version_manager = self._processor(
+            NearDuplicateDecision(NearDuplicateAction.REPLACE, match)
+        )
+        version_manager.replace_document.return_value = MagicMock(
+            success=True, new_document_id="doc-1_v2"
+        )
+
+        def update_status(**kwargs):
+            if kwargs["status"] == UploadStatus.COMPLETED:
+                raise ConnectionError("status table unavailable")
+
+        processor.status_updates = MagicMock()
+        processor.status_updates.update_status.side_effect = update_status
+
+        with pytest.raises(Exception):
+            processor.process_upload(self._message())
+
+        version_manager.register_signature.assert_not_called()
+        version_manager.remove_signature.assert_not_called()
+
+
+class TestNearDuplicateReplaceEndToEnd:
+    """Tests for the REPLACE route against a real VersionManager on moto."""
+
+    @pytest.fixture
+    def processor(self, monkeypatch):
+        from src.handlers.upload_processor import UploadProcessor
+
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="uploads")
+            dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+            dynamodb.create_table(
+                TableName="versions",
+                KeySchema=[
+                    {"AttributeName": "document_id", "KeyType": "HASH"},
+                    {"AttributeName": "version_number", "KeyType": "RANGE"},
+                ],
+                AttributeDefinitions=[
+                    {"AttributeName": "document_id", "AttributeType": "S"},
+                    {"AttributeName": "version_number", "AttributeType": "N"},
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            dynamodb.create_table(
+                TableName="near-duplicates",
+                KeySchema=[{"AttributeName": "bucket", "KeyType": "HASH"}],
+                AttributeDefinitions=[{"AttributeName": "bucket", "AttributeType": "S"}],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            version_manager = VersionManager(
+                bucket_name="uploads",
+                version_table_name="versions",
+                near_duplicate_table_name="near-duplicates",
+                status_tracker=MagicMock(),
+                s3_client=s3,
+                near_duplicate_config=NearDuplicateConfig(),
+            )
+            processor = UploadProcessor(
+                bucket_name="uploads",
+                status_tracker=MagicMock(),
+                s3_client=s3,
+                webhook_service=MagicMock(),
+                version_manager=version_manager,
+            )
+            yield processor
+            processor.close()
+
+    def _upload(self, processor, upload_id: str, text: str) -> dict:
+        key = f"uploads/pending/{upload_id}/original.html"
+        processor.s3_client.put_object(
+            Bucket="uploads", Key=key, Body=f"<html><body><p>{text}</p></body></html>".encode()
+        )
+        return processor.process_upload({
+            "upload_id": upload_id,
+            "file_path": key,
+            "file_type": "html",
+            "file_name": "rule.html",
+            "uploader_id": "user-1",
+        })
+
+    def test_revised_upload_becomes_next_version(self, processor):
+        rng = random.Random(11)
+        original = _text(rng, 600)
+        version_manager = processor.version_manager
+
+        first = self._upload(processor, "up-1", original)
+        second = self._upload(processor, "up-2", _edit(rng, original, 0.015))
+
+        assert first["kb_document_id"] == "uploaded_up-1"
+        assert version_manager.get_latest_version("uploaded_up-1").version_number == 1
+        assert second["kb_document_id"] == "uploaded_up-1_v2"
+        latest = version_manager.get_latest_version("uploaded_up-1_v2")
+        assert latest.version_number == 2
+        assert latest.previous_version_id == "uploaded_up-1"
+        matches = version_manager.find_near_duplicates(version_manager.compute_signature(original))
+        assert [m.document_id for m in matches] == ["uploaded_up-1_v2"]
@@ -1,7 +1,13 @@
 """Tests for data quality and validation systems."""
 
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import boto3
 import pytest
 from datetime import datetime, timezone
+from moto import mock_aws
 
 from regulatory_kb.processing.quality import (
     DocumentQuarantine,
@@ -13,7 +19,11 @@ from regulatory_kb.processing.quality import (
     IntegrityIssue,
     DataConsistencyValidator,
     ManualReviewQueue,
+    BloomFilter,
+    s3_document_ids,
+    graph_document_ids,
 )
+from regulatory_kb.core.errors import ValidationError
 
 
 class TestDocumentQuarantine:
@@ -134,6 +144,53 @@ class TestDocumentQuarantine:
         # Should have evicted oldest
         assert len(quarantine._quarantine) <= 10
 
+    def test_eviction_prefers_oldest_resolved(self, quarantine):
+        """Test that resolved documents are evicted before unresolved ones."""
+        for i in range(10):
+            quarantine.quarantine(f"doc_{i:03d}", QuarantineReason.PARSING_FAILED, "Error")
+        quarantine.release("doc_005")
+        quarantine.release("doc_002")
+
+        quarantine.quarantine("doc_010", QuarantineReason.PARSING_FAILED, "Error")
+        assert quarantine.get("doc_002") is None
+        quarantine.quarantine("doc_011", QuarantineReason.PARSING_FAILED, "Error")
+        assert quarantine.get("doc_005") is None
+
+        # Re-quarantining refreshes a document's age
+        quarantine.quarantine("doc_000", QuarantineReason.VALIDATION_FAILED, "Again")
+        quarantine.quarantine("doc_012", QuarantineReason.PARSING_FAILED, "Error")
+        assert quarantine.get("doc_000") is not None
+        assert quarantine.get("doc_001") is None
+
+    def test_indexes_match_full_scan(self):
+        """Test that indexed queries agree with scanning every document."""
+        rng = random.Random(49)
+        quarantine = DocumentQuarantine(max_quarantine_size=50)
+        reasons = list(QuarantineReason)
+        for _ in range(2000):
+            doc_id = f"doc_{rng.randrange(80):03d}"
+            action = rng.random()
+            if action < 0.5:
+                quarantine.quarantine(doc_id, rng.choice(reasons), "Error")
+            elif action < 0.7:
+                quarantine.release(doc_id)
+            else:
+                quarantine.increment_retry(doc_id)
+
+        docs = list(quarantine._quarantine.values())
+        assert len(docs) <= 50
+        assert {d.document_id for d in quarantine.get_pending_retries()} == {
+            d.document_id for d in docs if d.can_retry()
+        }
+        for reason in reasons:
+            assert {d.document_id for d in quarantine.get_by_reason(reason)} == {
+                d.document_id for d in docs if d.reason == reason and not d.resolved
+            }
+        stats = quarantine.get_statistics()
+        assert stats["resolved"] == sum(d.resolved for d in docs)
+        assert stats["by_reason"] == dict(Counter(d.reason.value for d in docs if not d.resolved))
+        assert len(quarantine._by_age) <= 2 * len(docs) + 64
+
 
 class TestQualityScorer:
     """Tests for QualityScorer class."""
@@ -299,6 +356,94 @@ class TestGraphIntegrityChecker:
         assert len(errors) >= 1
 
 
+def _expected_issues(nodes: set, edges: Counter) -> set:
+    """Integrity issues computed from scratch, for comparison."""
+    issues = set()
+    for (st, sid, tt, tid), count in edges.items():
+        if (st, sid) not in nodes:
+            issues.add(("orphaned_source", sid, tid))
+        if (tt, tid) not in nodes:
+            issues.add(("orphaned_target", sid, tid))
+        if count > 1:
+            issues.add(("duplicate_relationship", sid, tid))
+    with_regulator = {sid for st, sid, tt, _ in edges if st == "Document" and tt == "Regulator"}
+    for node_type, node_id in nodes:
+        if node_type == "Document" and node_id not in with_regulator:
+            issues.add(("missing_relationship", node_id, None))
+    return issues
+
+
+class TestIncrementalIntegrity:
+    """Tests for incremental issue maintenance in GraphIntegrityChecker."""
+
+    def test_random_operations_match_full_check(self):
+        """Test incremental issues equal a from-scratch check after every change."""
+        rng = random.Random(11)
+        checker = GraphIntegrityChecker()
+        nodes: set = set()
+        edges: Counter = Counter()
+        types = ["Document", "Regulator", "Requirement"]
+        ids = [f"n{i}" for i in range(8)]
+
+        for _ in range(2000):
+            roll = rng.random()
+            node = (rng.choice(types), rng.choice(ids))
+            if roll < 0.25:
+                checker.register_node(*node)
+                nodes.add(node)
+            elif roll < 0.4:
+                checker.remove_node(*node)
+                nodes.discard(node)
+            elif roll < 0.75:
+                edge = (*node, rng.choice(types), rng.choice(ids))
+                checker.register_relationship(*edge)
+                edges[edge] += 1
+            elif edges:
+                edge = rng.choice(sorted(edges))
+                checker.remove_relationship(*edge)
+                edges[edge] -= 1
+                if not edges[edge]:
+                    del edges[edge]
+
+            actual = {(i.issue_type, i.source_id, i.target_id) for i in checker.check_integrity()}
+            assert actual == _expected_issues(nodes, edges)
+
+            documents = {node_id for node_type, node_id in nodes if node_type == "Document"}
+            linked = {sid for st, sid, _, _ in edges if st == "Document"}
+            linked |= {tid for _, _, tt, tid in edges if tt == "Document"}
+            assert set(checker.find_orphaned_documents()) == documents - linked
+
+        incremental = {(i.issue_type, i.source_id, i.target_id) for i in checker.check_integrity()}
+        full = {(i.issue_type, i.source_id, i.target_id) for i in checker.check_integrity(full=True)}
+        assert incremental == full
+
+    def test_registering_node_resolves_orphans(self):
+        """Test registering a missing node clears only its issues."""
+        checker = GraphIntegrityChecker()
+        checker.register_node("Document", "doc_001")
+        checker.register_relationship("Document", "doc_001", "Regulator", "reg_001")
+        assert [i.issue_type for i in checker.check_integrity()] == ["orphaned_target"]
+
+        checker.register_node("Regulator", "reg_001")
+
+        assert checker.check_integrity() == []
+        assert checker.get_statistics()["relationships"] == 1
+
+    def test_duplicate_relationship_reported_once(self):
+        """Test registering the same relationship twice is flagged."""
+        checker = GraphIntegrityChecker()
+        checker.register_node("Document", "doc_001")
+        checker.register_node("Regulator", "reg_001")
+        for _ in range(3):
+            checker.register_relationship("Document", "doc_001", "Regulator", "reg_001")
+
+        assert [i.issue_type for i in checker.check_integrity()] == ["duplicate_relationship"]
+
+        checker.remove_relationship("Document", "doc_001", "Regulator", "reg_001")
+        checker.remove_relationship("Document", "doc_001", "Regulator", "reg_001")
+        assert checker.check_integrity() == []
+
+
 class TestDataConsistencyValidator:
     """Tests for DataConsistencyValidator class."""
 
@@ -381,6 +526,114 @@ class TestDataConsistencyValidator:
         assert stats["fully_consistent"] == 1
 
 
+class FakeGraphStore:
+    """Answers the keyset-paged ID queries issued by graph_document_ids."""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.queries = 0
+
+    def query(self, cypher, params):
+        self.queries += 1
+        if "id(n)" in cypher:
+            rows = [[i, doc_id] for i, doc_id in enumerate(self.ids) if i > params["after"]]
+        else:
+            assert "'/'" not in cypher
+            rows = [[doc_id] for doc_id in sorted(set(self.ids)) if doc_id > params["after"]]
+        return SimpleNamespace(raw_result=SimpleNamespace(result_set=rows[:params["limit"]]))
+
+
+class TestStreamingReconciliation:
+    """Tests for merge-join reconciliation over ID streams."""
+
+    def _ids(self, rng, count):
+        # Include ids that sort differently with and without a trailing "/"
+        return {f"doc{rng.choice(['', '-', '_', '.'])}{rng.randrange(count)}" for _ in range(count)}
+
+    def test_matches_set_based_check(self):
+        rng = random.Random(50)
+        s3, graph, vector = (self._ids(rng, 300) for _ in range(3))
+        validator = DataConsistencyValidator()
+        for doc_id in s3:
+            validator.register_s3_document(doc_id)
+        for doc_id in graph:
+            validator.register_graph_document(doc_id)
+        for doc_id in vector:
+            validator.register_vector_document(doc_id)
+
+        issues = validator.check_consistency()
+
+        expected = (
+            {("missing_in_graph", d) for d in s3 - graph}
+            | {("missing_in_s3", d) for d in graph - s3}
+            | {("missing_in_vector", d) for d in graph - vector}
+        )
+        assert {(i["type"], i["document_id"]) for i in issues} == expected
+        assert len(issues) == len(expected)
+
+    def test_rejects_unsorted_stream(self):
+        validator = DataConsistencyValidator()
+
+        with pytest.raises(ValidationError):
+            list(validator.reconcile(["b", "a"], [], []))
+
+    def test_bloom_source_reports_only_certain_issues(self):
+        rng = random.Random(5)
+        graph = sorted(self._ids(rng, 2000), key=lambda d: d + "/")
+        vector = set(rng.sample(graph, len(graph) - 100))
+        bloom = BloomFilter.from_ids(vector, len(vector), 0.01)
+
+        issues = list(DataConsistencyValidator().reconcile(graph, graph, bloom))
+
+        missing = {i["document_id"] for i in issues}
+        assert all(i["type"] == "missing_in_vector" for i in issues)
+        assert missing <= set(graph) - vector
+        assert len(missing) >= 90
+
+    def test_reconcile_stores_pages_every_source(self, monkeypatch):
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="docs")
+            for doc_id in ["a", "a-1", "b", "c"]:
+                s3.put_object(Bucket="docs", Key=f"uploads/completed/{doc_id}/document.pdf", Body=b"x")
+
+            assert list(s3_document_ids(s3, "docs", page_size=2)) == ["a-1", "a", "b", "c"]
+
+            graph = FakeGraphStore(["c", "a-1", "a", "d"])
+            store = SimpleNamespace(query=lambda cypher, params: (
+                graph.query(cypher, params) if "DocumentEmbedding" not in cypher
+                else FakeGraphStore(["a", "a-1"]).query(cypher, params)
+            ))
+            issues = list(DataConsistencyValidator().reconcile_stores(
+                s3, "docs", store, page_size=2, bloom_false_positive_rate=0.01, expected_documents=10,
+            ))
+
+        assert [(i["type"], i["document_id"]) for i in issues] == [
+            ("missing_in_graph", "b"),
+            ("missing_in_vector", "c"),
+            ("missing_in_s3", "d"),
+            ("missing_in_vector", "d"),
+        ]
+
+    def test_graph_ids_in_pages(self):
+        store = FakeGraphStore([f"doc{i}" for i in range(25)] + ["doc1-a", "doc1.b", "doc1-a-c"])
+
+        ids = list(graph_document_ids(store, page_size=10))
+
+        assert ids == sorted(store.ids, key=lambda d: d + "/")
+        assert store.queries == 3
+        with pytest.raises(ValueError):
+            next(graph_document_ids(store, label="Document) DETACH DELETE (n"))
+
+    def test_graph_ids_restore_merge_order(self):
+        rng = random.Random(51)
+        ids = sorted(self._ids(rng, 500) | {f"doc-{i}-{j}" for i in range(5) for j in range(5)})
+        store = FakeGraphStore(ids)
+
+        assert list(graph_document_ids(store, page_size=7)) == sorted(ids, key=lambda d: d + "/")
+
+
 class TestManualReviewQueue:
     """Tests for ManualReviewQueue class."""
 
@@ -466,3 +719,24 @@ class TestManualReviewQueue:
 
         assert item1.priority == 1  # Clamped to minimum
         assert item2.priority == 5  # Clamped to maximum
+
+    def test_get_pending_skips_reviewed_items(self, queue):
+        """Test that the pending heap drops items once reviewed."""
+        rng = random.Random(7)
+        for i in range(200):
+            queue.add(f"doc_{i:03d}", "Reason", priority=rng.randint(1, 5))
+        for i in range(0, 200, 3):
+            queue.assign(f"doc_{i:03d}", "reviewer")
+        queue.add("doc_001", "Re-queued", priority=1)
+
+        expected = sorted(
+            (item for item in queue._queue.values() if item.status == "pending"),
+            key=lambda item: (item.priority, item.added_at),
+        )
+
+        assert queue.get_pending(limit=20) == expected[:20]
+        assert queue.get_pending(limit=1000) == expected
+        assert [i.document_id for i in queue.get_by_status("in_review")] == [
+            f"doc_{i:03d}" for i in range(0, 200, 3)
+        ]
+        assert queue.get_statistics()["by_status"] == {"pending": 133, "in_review": 67}
@@ -0,0 +1,243 @@
+"""Tests for the GCRA rate limiter and its backends."""
+
+import os
+import threading
+
+import pytest
+
+from regulatory_kb.api.rate_limit_backends import (
+    GCRA_LUA_SCRIPT,
+    GCRARequest,
+    RedisRateLimitBackend,
+    ShardedMemoryBackend,
+    gcra_decide,
+)
+from regulatory_kb.api.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    rate_limit_backend_from_env,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedRedis:
+    """Stand-in for redis-py's script API, evaluating the GCRA rule in Python.
+
+    Mirrors the Lua scripts' inputs and string outputs so the backend's
+    argument encoding and result parsing are exercised without a server.
+    """
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.data: dict[str, str] = {}
+        self.calls = 0
+
+    def register_script(self, source: str):
+        if source == GCRA_LUA_SCRIPT:
+            return self._acquire
+        return self._peek
+
+    def _acquire(self, keys, args):
+        self.calls += 1
+        now = self.clock()
+        results = []
+        for i, key in enumerate(keys):
+            interval, span, tokens = args[i * 3: i * 3 + 3]
+            stored = self.data.get(key)
+            request = GCRARequest(key, float(interval), float(span), int(tokens))
+            decision = gcra_decide(float(stored) if stored else None, now, request)
+            if decision.allowed:
+                self.data[key] = "%.6f" % decision.tat
+            results.append([int(decision.allowed), "%.6f" % decision.tat, "%.6f" % now])
+        return results
+
+    def _peek(self, keys):
+        return [self.data.get(keys[0], ""), "%.6f" % self.clock()]
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+def _limiter(clock: FakeClock, rpm: int = 60, **kwargs) -> RateLimiter:
+    config = RateLimitConfig(default_requests_per_minute=rpm, burst_multiplier=2.0)
+    return RateLimiter(config, backend=ShardedMemoryBackend(clock=clock, **kwargs))
+
+
+class TestGCRARateLimiter:
+    """Tests for RateLimiter decisions."""
+
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, rpm=60)
+
+        results = [limiter.check_rate_limit("client") for _ in range(121)]
+        assert all(r.allowed for r in results[:120])
+        assert results[0].remaining == 119
+        assert results[119].remaining == 0
+
+        denied = results[120]
+        assert not denied.allowed
+        assert denied.retry_after_seconds == 2
+
+        clock.now += 1.0
+        assert limiter.check_rate_limit("client").allowed
+        assert not limiter.check_rate_limit("client").allowed
+
+    def test_custom_limit_and_headers(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        limiter.set_client_limit("vip", 600)
+
+        result = limiter.check_rate_limit("vip")
+        headers = result.to_headers()
+        assert headers["X-RateLimit-Limit"] == "600"
+        assert headers["X-RateLimit-Remaining"] == "1199"
+
+    def test_consume_batch_matches_sequential(self):
+        batch = [("a", 50), ("b", 10), ("a", 50), ("a", 30), ("b", 200)]
+
+        sequential = _limiter(FakeClock())
+        expected = [sequential.consume(client, tokens) for client, tokens in batch]
+
+        batched = _limiter(FakeClock())
+        results = batched.consume_batch(batch)
+
+        assert [r.allowed for r in results] == [True, True, True, False, False]
+        assert [(r.allowed, r.remaining) for r in results] == [
+            (r.allowed, r.remaining) for r in expected
+        ]
+
+    def test_reset_client_and_stats(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        for _ in range(10):
+            limiter.check_rate_limit("client")
+
+        stats = limiter.get_client_stats("client")
+        assert stats["requests_in_window"] == 10
+        assert stats["remaining"] == 110
+
+        limiter.reset_client("client")
+        assert limiter.get_client_stats("client")["requests_in_window"] == 0
+
+    def test_backend_failure_fails_open(self):
+        class BrokenBackend:
+            def acquire_many(self, requests):
+                raise ConnectionError("unreachable")
+
+        limiter = RateLimiter(backend=BrokenBackend())
+        assert limiter.check_rate_limit("client").allowed
+
+
+class TestShardedMemoryBackend:
+    """Tests for the in-process backend."""
+
+    def test_idle_clients_are_evicted(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, shard_count=1)
+        for i in range(100):
+            limiter.check_rate_limit(f"client-{i}")
+        assert limiter.get_backend_stats()["tracked_clients"] == 100
+
+        clock.now += 10.0
+        for _ in range(20):
+            limiter.check_rate_limit("active")
+
+        stats = limiter.get_backend_stats()
+        assert stats["tracked_clients"] < 100
+        assert stats["idle_evictions"] > 0
+        assert stats["forced_evictions"] == 0
+
+    def test_memory_is_bounded(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, shard_count=4, max_clients=40)
+        for i in range(1000):
+            limiter.check_rate_limit(f"client-{i}")
+
+        stats = limiter.get_backend_stats()
+        assert stats["tracked_clients"] <= 40
+        assert stats["forced_evictions"] > 0
+
+    def test_concurrent_consumption_is_exact(self):
+        limiter = RateLimiter(
+            RateLimitConfig(default_requests_per_minute=1, burst_multiplier=500.0)
+        )
+        allowed = []
+        lock = threading.Lock()
+
+        def worker():
+            count = sum(limiter.check_rate_limit("shared").allowed for _ in range(100))
+            with lock:
+                allowed.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(allowed) == 500
+
+
+class TestRedisRateLimitBackend:
+    """Tests for the Redis backend."""
+
+    def test_batch_is_one_round_trip(self):
+        clock = FakeClock()
+        client = ScriptedRedis(clock)
+        limiter = RateLimiter(
+            RateLimitConfig(default_requests_per_minute=60),
+            backend=RedisRateLimitBackend(client),
+        )
+
+        results = limiter.consume_batch([("a", 100), ("b", 1), ("a", 30)])
+
+        assert client.calls == 1
+        assert [r.allowed for r in results] == [True, True, False]
+        assert "ratelimit:a" in client.data
+        assert limiter.get_client_stats("a")["requests_in_window"] == 100
+
+        limiter.reset_client("a")
+        assert "ratelimit:a" not in client.data
+
+    def test_limits_shared_across_limiters(self):
+        clock = FakeClock()
+        client = ScriptedRedis(clock)
+        config = RateLimitConfig(default_requests_per_minute=60, burst_multiplier=1.0)
+        first = RateLimiter(config, backend=RedisRateLimitBackend(client))
+        second = RateLimiter(config, backend=RedisRateLimitBackend(client))
+
+        assert first.consume("client", 60).allowed
+        assert not second.check_rate_limit("client").allowed
+
+    def test_backend_from_env_unset(self, monkeypatch):
+        monkeypatch.delenv("RATE_LIMIT_REDIS_URL", raising=False)
+        assert rate_limit_backend_from_env() is None
+
+    @pytest.mark.skipif(
+        not os.environ.get("RATE_LIMIT_TEST_REDIS_URL"),
+        reason="RATE_LIMIT_TEST_REDIS_URL not set",
+    )
+    def test_real_redis(self):
+        backend = RedisRateLimitBackend.from_url(
+            os.environ["RATE_LIMIT_TEST_REDIS_URL"], key_prefix="ratelimit-test:"
+        )
+        backend.reset("client")
+        limiter = RateLimiter(
+            RateLimitConfig(default_requests_per_minute=60, burst_multiplier=1.0),
+            backend=backend,
+        )
+
+        results = limiter.consume_batch([("client", 60), ("client", 1)])
+
+        assert [r.allowed for r in results] == [True, False]
+        backend.reset("client")
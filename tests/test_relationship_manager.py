@@ -257,6 +257,54 @@ class TestIntegrityCheck:
         assert len(result.orphaned_relationships) == 0
         assert len(result.duplicate_relationships) == 0
 
+    def test_integrity_check_reads_duplicate_rows(self, relationship_manager, mock_store):
+        """Test duplicates are read from the aggregated query rows."""
+        def query(cypher, params=None):
+            raw = MagicMock()
+            raw.result_set = [["doc_1", "us_frb", "ISSUED_BY"]] if "copies" in cypher else []
+            return QueryResult(nodes=[], relationships=[], raw_result=raw)
+
+        mock_store.query.side_effect = query
+
+        result = relationship_manager.check_integrity()
+
+        assert result.is_valid is False
+        assert result.duplicate_relationships == ["doc_1 -[ISSUED_BY]-> us_frb"]
+
+    def test_load_integrity_checker_pages_by_id(self, relationship_manager, mock_store):
+        """Test nodes and relationships are loaded page by page."""
+        nodes = [
+            [0, "Document", "doc_1"],
+            [1, "Document", "doc_2"],
+            [2, "Regulator", "us_frb"],
+            [3, "Chunk", "chunk_1"],
+        ]
+        relationships = [
+            [10, "Document", "doc_1", "Regulator", "us_frb"],
+            [11, "Document", "doc_2", "Regulator", "us_occ"],
+            [12, "Chunk", "chunk_1", "Document", "doc_1"],
+        ]
+        cursors = []
+
+        def query(cypher, params=None):
+            rows = nodes if "MATCH (n)" in cypher else relationships
+            cursors.append(params["after"])
+            page = [row for row in rows if row[0] > params["after"]][: params["limit"]]
+            raw = MagicMock()
+            raw.result_set = page
+            return QueryResult(nodes=[], relationships=[], raw_result=raw)
+
+        mock_store.query.side_effect = query
+
+        checker = relationship_manager.load_integrity_checker(page_size=2)
+
+        assert cursors == [-1, 1, 3, -1, 11]
+        stats = checker.get_statistics()
+        assert stats["nodes"] == 3
+        assert stats["relationships"] == 2
+        issues = checker.check_integrity()
+        assert [(i.issue_type, i.target_id) for i in issues] == [("orphaned_target", "us_occ")]
+
 
 class TestVersionHistory:
     """Tests for version history tracking."""
@@ -1,7 +1,9 @@
 """Tests for resilience patterns - retry logic, circuit breakers, and error handling."""
 
 import asyncio
+import random
 import pytest
+import threading
 import time
 
 from regulatory_kb.core.resilience import (
@@ -17,6 +19,17 @@ from regulatory_kb.core.resilience import (
     ErrorRecord,
     get_error_logger,
     get_circuit_registry,
+    get_bulkhead_registry,
+    AdaptiveConcurrencyLimiter,
+    Bulkhead,
+    BulkheadConfig,
+    BulkheadRegistry,
+    ConcurrencyLimitConfig,
+    ConcurrencyLimitError,
+    HedgeConfig,
+    HedgedRequest,
+    with_bulkhead,
+    with_hedging,
 )
 from regulatory_kb.core.errors import (
     RegulatoryKBError,
@@ -365,3 +378,204 @@ class TestCircuitBreakerRegistry:
         states = registry.get_all_states()
         assert states["service_a"] == "closed"
         assert states["service_b"] == "open"
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_grows_when_busy_and_fast_and_backs_off_when_slow(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", ConcurrencyLimitConfig(initial_limit=4, min_limit=2, max_limit=8)
+        )
+
+        for _ in range(200):
+            while limiter.try_acquire():
+                pass
+            for _ in range(limiter.in_flight):
+                limiter.release(latency=0.01)
+        assert limiter.limit == 8
+
+        for _ in range(50):
+            assert limiter.try_acquire()
+            limiter.release(latency=1.0)
+        assert limiter.limit == 2
+
+    def test_overload_errors_back_off_but_other_errors_do_not(self):
+        limiter = AdaptiveConcurrencyLimiter("test", ConcurrencyLimitConfig(initial_limit=10))
+
+        with pytest.raises(ValueError):
+            with limiter.slot():
+                raise ValueError("bad input")
+        assert limiter.limit == 10
+
+        with pytest.raises(TimeoutError):
+            with limiter.slot():
+                raise TimeoutError("timed out")
+        assert limiter.limit == 9
+        assert limiter.in_flight == 0
+
+    def test_waiting_threads_and_coroutines_get_released_slots(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", ConcurrencyLimitConfig(initial_limit=1, min_limit=1, max_limit=1)
+        )
+        limiter.acquire()
+
+        with pytest.raises(ConcurrencyLimitError):
+            limiter.acquire(timeout=0.01)
+        assert limiter.rejected == 1
+
+        threading.Timer(0.05, limiter.release).start()
+        limiter.acquire(timeout=2.0)
+
+        async def wait_for_slot():
+            asyncio.get_running_loop().call_later(0.05, limiter.release)
+            await limiter.acquire_async(timeout=2.0)
+
+        asyncio.run(wait_for_slot())
+        assert limiter.in_flight == 1
+
+
+class TestBulkhead:
+    """Tests for bulkheads."""
+
+    def test_full_bulkhead_does_not_block_other_dependencies(self):
+        slow = Bulkhead("slow", BulkheadConfig(max_concurrent=2, max_wait=0.01))
+        fast = Bulkhead("fast", BulkheadConfig(max_concurrent=2))
+        gate = threading.Event()
+        workers = [
+            threading.Thread(target=slow.execute_sync, args=(gate.wait, 5))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        while slow.limiter.in_flight < 2:
+            time.sleep(0.001)
+
+        try:
+            with pytest.raises(ConcurrencyLimitError):
+                slow.execute_sync(lambda: "never")
+            assert fast.execute_sync(lambda: "ok") == "ok"
+        finally:
+            gate.set()
+            for worker in workers:
+                worker.join()
+        assert slow.get_stats()["rejected"] == 1
+
+    def test_regulator_fetch_backs_off_on_throttling_not_politeness_delay(self):
+        from regulatory_kb.retrieval.adapters.fdic import FDICAdapter
+        from regulatory_kb.retrieval.service import RetrieverConfig, RetrievalStatus
+
+        class FakeResponse:
+            def __init__(self, status):
+                self.status = status
+                self.reason = "Too Many Requests" if status == 429 else "OK"
+                self.headers = {"Content-Type": "application/pdf"}
+
+            async def read(self):
+                return b"%PDF"
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class FakeSession:
+            status = 200
+
+            def get(self, url, **kwargs):
+                return FakeResponse(self.status)
+
+        registry = get_bulkhead_registry()
+        bulkhead = Bulkhead(
+            "regulator_websites",
+            BulkheadConfig(max_concurrent=8, adaptive=True, target_latency=0.01),
+        )
+        registry._bulkheads["regulator_websites"] = bulkhead
+        adapter = FDICAdapter(RetrieverConfig(rate_limit_delay=0.05))
+        session = FakeSession()
+        url = "https://www.fdic.gov/doc.pdf"
+
+        async def fetch(times):
+            return [(await adapter.retrieve(url, session)).status for _ in range(times)]
+
+        try:
+            assert asyncio.run(fetch(5)) == [RetrievalStatus.SUCCESS] * 5
+            assert bulkhead.limiter.limit == 8
+
+            session.status = 429
+            assert asyncio.run(fetch(3)) == [RetrievalStatus.RATE_LIMITED] * 3
+            assert bulkhead.limiter.limit < 8
+            assert bulkhead.limiter.in_flight == 0
+        finally:
+            registry._bulkheads.pop("regulator_websites", None)
+
+    def test_bedrock_limit_ignores_long_completions(self):
+        rng = random.Random(43)
+        bedrock = Bulkhead("bedrock", BulkheadRegistry._default_config("bedrock"))
+
+        for _ in range(500):
+            assert bedrock.limiter.try_acquire()
+            # Mostly short calls with occasional long generations
+            bedrock.limiter.release(latency=rng.choice([0.2, 0.3, 0.5, 12.0]))
+
+        assert bedrock.limiter.limit == 8
+
+    def test_decorator_wraps_sync_and_async_functions(self):
+        @with_bulkhead("test-decorator", BulkheadConfig(max_concurrent=1))
+        def read(x):
+            return x * 2
+
+        @with_bulkhead("test-decorator-async", BulkheadConfig(max_concurrent=1))
+        async def read_async(x):
+            return x * 3
+
+        assert read(2) == 4
+        assert asyncio.run(read_async(2)) == 6
+
+
+class TestHedgedRequest:
+    """Tests for hedged requests."""
+
+    def test_delay_follows_latency_percentile(self):
+        hedger = HedgedRequest("test", HedgeConfig(initial_delay=0.2, min_samples=10))
+        assert hedger.hedge_delay() == 0.2
+
+        for i in range(1, 101):
+            hedger.record_latency(i / 100)
+
+        assert hedger.hedge_delay() == pytest.approx(0.96)
+
+    def test_async_backup_wins_when_primary_is_slow(self):
+        calls = []
+
+        @with_hedging(HedgeConfig(delay=0.02))
+        async def read():
+            calls.append(len(calls))
+            await asyncio.sleep(5 if len(calls) == 1 else 0)
+            return len(calls)
+
+        started = time.monotonic()
+        assert asyncio.run(read()) == 2
+        assert time.monotonic() - started < 1
+        assert read.hedger.get_stats()["hedge_wins"] == 1
+
+    def test_sync_hedges_only_slow_primary(self):
+        hedger = HedgedRequest("test", HedgeConfig(delay=0.5))
+        assert hedger.execute_sync(lambda: "primary") == "primary"
+        assert hedger.hedges == 0
+
+        gate = threading.Event()
+        calls = []
+        slow = HedgedRequest("slow", HedgeConfig(delay=0.02))
+
+        def slow_primary():
+            calls.append(1)
+            if len(calls) == 1:
+                gate.wait(5)
+                return "primary"
+            return "backup"
+
+        assert slow.execute_sync(slow_primary) == "backup"
+        gate.set()
+        assert slow.hedges == 1
@@ -7,10 +7,13 @@ Tests Requirements 4.1-4.5:
 """
 
 import json
+import threading
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+from botocore.exceptions import ClientError
+
 from regulatory_kb.upload.models import (
     UploadStatus,
     UploadRecord,
@@ -18,7 +21,7 @@ from regulatory_kb.upload.models import (
     BatchStatusResponse,
     FileType,
 )
-from regulatory_kb.upload.status_tracker import StatusTracker
+from regulatory_kb.upload.status_tracker import StatusTracker, StatusUpdateCoalescer
 
 
 class TestStatusTracker:
@@ -224,6 +227,138 @@ class TestStatusTracker:
         assert ":completed_at" not in expr_values
 
 
+class TestStatusReadCache:
+    """Tests for cached status reads."""
+
+    @pytest.fixture
+    def mock_table(self):
+        """Create a mock DynamoDB table holding one processing upload."""
+        record = UploadRecord(
+            upload_id="upload-1",
+            status=UploadStatus.PROCESSING,
+            uploader_id="user-123",
+            file_name="test-document.pdf",
+            file_size=1024,
+            file_type=FileType.PDF,
+            s3_key="uploads/pending/upload-1/original.pdf",
+        )
+        table = MagicMock()
+        table.get_item.return_value = {"Item": record.to_dynamo_item()}
+        return table
+
+    def _tracker(self, mock_table, ttl):
+        tracker = StatusTracker(table_name="test-table", cache_ttl_seconds=ttl)
+        tracker._table = mock_table
+        return tracker
+
+    def test_repeated_polls_read_once(self, mock_table):
+        """Test polling within the TTL is served from the cache."""
+        tracker = self._tracker(mock_table, ttl=60)
+
+        for _ in range(5):
+            assert tracker.get_status("upload-1").status == UploadStatus.PROCESSING
+
+        assert mock_table.get_item.call_count == 1
+        assert tracker.read_cache.get_stats()["hits"] == 4
+
+    def test_update_invalidates_cached_status(self, mock_table):
+        """Test updates through the tracker are visible on the next read."""
+        tracker = self._tracker(mock_table, ttl=60)
+        tracker.get_status("upload-1")
+
+        tracker.update_status("upload-1", UploadStatus.COMPLETED)
+        tracker.get_status("upload-1")
+
+        assert mock_table.get_item.call_count == 2
+
+    def test_missing_uploads_are_not_cached(self, mock_table):
+        """Test a not-yet-created upload is looked up again."""
+        tracker = self._tracker(mock_table, ttl=60)
+        mock_table.get_item.return_value = {}
+
+        assert tracker.get_status("upload-2") is None
+        assert tracker.get_status("upload-2") is None
+        assert mock_table.get_item.call_count == 2
+
+    def test_zero_ttl_disables_cache(self, mock_table):
+        """Test a zero TTL always reads from DynamoDB."""
+        tracker = self._tracker(mock_table, ttl=0)
+
+        tracker.get_status("upload-1")
+        tracker.get_status("upload-1")
+
+        assert mock_table.get_item.call_count == 2
+
+
+class TestStatusUpdateCoalescer:
+    """Tests for coalesced status writes."""
+
+    @pytest.fixture
+    def tracker(self):
+        """Create a mock tracker recording writes."""
+        return MagicMock(spec=StatusTracker)
+
+    def _written(self, tracker):
+        return [
+            (c.args[0], c.args[1], c.kwargs["processing_stage"])
+            for c in tracker.update_status.call_args_list
+        ]
+
+    def test_intermediate_stages_keep_latest(self, tracker):
+        """Test only the latest pending stage per upload is written."""
+        coalescer = StatusUpdateCoalescer(tracker, flush_interval=60)
+        for stage in ["initializing", "parsing", "chunking"]:
+            coalescer.update_status("a", UploadStatus.PROCESSING, processing_stage=stage)
+        coalescer.update_status("b", UploadStatus.PROCESSING, processing_stage="parsing")
+
+        assert tracker.update_status.call_count == 0
+        assert coalescer.flush() == 2
+        assert sorted(self._written(tracker)) == [
+            ("a", UploadStatus.PROCESSING, "chunking"),
+            ("b", UploadStatus.PROCESSING, "parsing"),
+        ]
+        assert coalescer.get_stats() == {"pending": 0, "written": 2, "coalesced": 2}
+        coalescer.close()
+
+    def test_terminal_status_written_immediately(self, tracker):
+        """Test completed and failed statuses bypass the queue and drop stale stages."""
+        coalescer = StatusUpdateCoalescer(tracker, flush_interval=60)
+        coalescer.update_status("a", UploadStatus.PROCESSING, processing_stage="storage")
+        coalescer.update_status("a", UploadStatus.COMPLETED, processing_stage="completed")
+        coalescer.close()
+
+        assert self._written(tracker) == [("a", UploadStatus.COMPLETED, "completed")]
+
+    def test_background_flush(self, tracker):
+        """Test pending stages are written by the background thread."""
+        coalescer = StatusUpdateCoalescer(tracker, flush_interval=0.01)
+        coalescer.update_status("a", UploadStatus.PROCESSING, processing_stage="parsing")
+
+        for _ in range(200):
+            if tracker.update_status.called:
+                break
+            threading.Event().wait(0.01)
+        coalescer.close()
+
+        assert self._written(tracker) == [("a", UploadStatus.PROCESSING, "parsing")]
+
+    def test_failed_flush_is_dropped(self, tracker):
+        """Test a failing intermediate write does not raise or retry."""
+        tracker.update_status.side_effect = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}},
+            "UpdateItem",
+        )
+        coalescer = StatusUpdateCoalescer(tracker, flush_interval=60)
+        coalescer.update_status("a", UploadStatus.PROCESSING, processing_stage="parsing")
+
+        assert coalescer.flush() == 0
+        assert coalescer.flush() == 0
+        assert tracker.update_status.call_count == 1
+
+        with pytest.raises(ClientError):
+            coalescer.update_status("a", UploadStatus.FAILED, error_details="boom")
+
+
 class TestUploadHandler:
     """Tests for upload handler status endpoints."""
 
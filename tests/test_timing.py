@@ -0,0 +1,136 @@
+"""Tests for timing spans and latency histograms in core.logging."""
+
+import json
+import random
+
+import pytest
+import structlog
+
+from regulatory_kb.core.logging import (
+    LatencyHistogram,
+    Span,
+    TimingRegistry,
+    get_timing_registry,
+    span_scope,
+    timed,
+)
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_bucket_precision(self):
+        rng = random.Random(48)
+        samples = sorted(rng.lognormvariate(-4, 1.5) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for pct in (50, 90, 99, 99.9):
+            exact = samples[int(pct / 100 * len(samples)) - 1]
+            assert histogram.percentile(pct) == pytest.approx(exact, rel=0.02, abs=2e-6)
+        assert histogram.percentile(100) == pytest.approx(samples[-1], abs=1e-6)
+        assert len(histogram.buckets()) < 1500
+
+    def test_merge(self):
+        a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(100):
+            (a if i % 2 else b).record(i / 1000)
+            combined.record(i / 1000)
+
+        a.merge(b)
+
+        assert a.buckets() == combined.buckets()
+        assert a.to_dict() == combined.to_dict()
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(precision_bits=5))
+
+
+class TestTimingRegistry:
+    """Tests for registry exports."""
+
+    def _registry(self) -> TimingRegistry:
+        registry = TimingRegistry(enabled=True)
+        for ms in (2, 4, 20, 300):
+            registry.record("upload_stage", ms / 1000, stage="parsing")
+        registry.record("chunk_document", 0.5)
+        return registry
+
+    def test_prometheus_text(self):
+        text = self._registry().export_prometheus(prefix="kb_", buckets=(0.005, 0.1))
+
+        assert "# TYPE kb_upload_stage_seconds histogram" in text
+        assert 'kb_upload_stage_seconds_bucket{stage="parsing",le="0.005"} 2' in text
+        assert 'kb_upload_stage_seconds_bucket{stage="parsing",le="0.1"} 3' in text
+        assert 'kb_upload_stage_seconds_bucket{stage="parsing",le="+Inf"} 4' in text
+        assert 'kb_upload_stage_seconds_sum{stage="parsing"} 0.326000' in text
+        assert "kb_chunk_document_seconds_count 1" in text
+
+    def test_emf_documents(self, capsys):
+        registry = self._registry()
+
+        assert registry.emit_emf("RegulatoryKB/Test") == 2
+        documents = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        stage = next(d for d in documents if "upload_stage" in d)
+        metrics = stage["_aws"]["CloudWatchMetrics"][0]
+
+        assert metrics["Namespace"] == "RegulatoryKB/Test"
+        assert metrics["Dimensions"] == [["stage"]]
+        assert stage["stage"] == "parsing"
+        assert sum(stage["upload_stage"]["Counts"]) == 4
+        assert stage["upload_stage"]["Values"][0] == pytest.approx(2.0, rel=0.02)
+        assert registry.snapshot() == []
+
+    def test_emf_caps_distinct_values(self):
+        registry = TimingRegistry(enabled=True)
+        for i in range(1000):
+            registry.record("search", i / 1000)
+
+        values = registry.export_emf("NS")[0]["search"]
+
+        assert len(values["Values"]) <= 100
+        assert sum(values["Counts"]) == 1000
+
+
+class TestSpans:
+    """Tests for spans, the decorator and structlog binding."""
+
+    def test_scope_binds_and_unbinds_durations(self):
+        registry = TimingRegistry(enabled=True)
+
+        with span_scope():
+            with Span("upload_stage", registry, stage="parsing") as timing:
+                pass
+            bound = structlog.contextvars.get_contextvars()
+        after = structlog.contextvars.get_contextvars()
+
+        assert bound["upload_stage_parsing_ms"] == timing.elapsed_ms
+        assert "upload_stage_parsing_ms" not in after
+        assert registry.histogram("upload_stage", stage="parsing").count == 1
+
+    def test_disabled_registry_records_nothing(self):
+        registry = TimingRegistry(enabled=False)
+
+        with span_scope():
+            with Span("parse", registry) as timing:
+                pass
+            bound = structlog.contextvars.get_contextvars()
+
+        assert timing.duration is not None
+        assert registry.snapshot() == []
+        assert "parse_ms" not in bound
+
+    def test_timed_decorator(self):
+        registry = get_timing_registry()
+        registry.reset()
+
+        @timed("lookup", source="cache")
+        def lookup(key):
+            return key * 2
+
+        assert lookup(21) == 42
+        with pytest.raises(TypeError):
+            lookup(None)
+
+        assert registry.histogram("lookup", source="cache").count == 2
+        registry.reset()
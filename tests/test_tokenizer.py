@@ -0,0 +1,199 @@
+"""Tests for chunk-sizing tokenizers."""
+
+import base64
+import random
+
+import pytest
+
+from regulatory_kb.processing.chunker import ChunkerConfig, DocumentChunker
+from regulatory_kb.processing.parser import DocumentFormat, ParsedDocument, ParsedSection
+from regulatory_kb.processing.tokenizer import (
+    BPETokenizer,
+    CachedTokenizer,
+    CharacterTokenizer,
+    tokenizer_from_env,
+)
+
+
+MERGES = [b"ca", b"it", b"al", b"cap", b"ital", b" t", b"ie", b"er", b" tier", b"\n\n"]
+
+
+def _ranks() -> dict[bytes, int]:
+    ranks = {bytes([b]): b for b in range(256)}
+    for merge in MERGES:
+        ranks[merge] = len(ranks)
+    return ranks
+
+
+class CountingTokenizer:
+    """Word counter that records which texts it tokenized."""
+
+    def __init__(self):
+        self.seen: list[str] = []
+
+    def count(self, text: str) -> int:
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts):
+        self.seen.extend(texts)
+        return [len(text.split()) for text in texts]
+
+
+class TestCharacterTokenizer:
+    """Tests for CharacterTokenizer."""
+
+    def test_matches_length_estimate(self):
+        tokenizer = CharacterTokenizer(4)
+        assert tokenizer.count("") == 0
+        assert tokenizer.count("abc") == 1
+        assert tokenizer.count("x" * 41) == 10
+        assert tokenizer.count_batch(["", "x" * 8]) == [0, 2]
+
+
+class TestBPETokenizer:
+    """Tests for the local BPE tokenizer."""
+
+    @pytest.fixture
+    def tokenizer(self):
+        return BPETokenizer(_ranks())
+
+    def test_applies_merges_by_rank(self, tokenizer):
+        # " capital" -> " " "cap" "ital"; " tier" is a single token
+        assert tokenizer.count(" capital") == 3
+        assert tokenizer.count(" tier") == 1
+        assert tokenizer.count("capital tier") == 3
+
+    def test_counts_unmerged_bytes(self, tokenizer):
+        assert tokenizer.count("") == 0
+        assert tokenizer.count("xyz") == 3
+        assert tokenizer.count("§") == 2  # two UTF-8 bytes
+
+    def test_batch_matches_single(self, tokenizer):
+        rng = random.Random(3)
+        words = ["capital", " tier", "§ 217.10", "\n\n", "écart", "_x", "1234567"]
+        texts = ["".join(rng.choice(words) for _ in range(rng.randint(0, 12))) for _ in range(50)]
+
+        assert tokenizer.count_batch(texts) == [tokenizer.count(t) for t in texts]
+        assert BPETokenizer(_ranks(), max_cached_words=2).count_batch(texts) == tokenizer.count_batch(texts)
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "ranks.tiktoken"
+        path.write_bytes(b"".join(
+            base64.b64encode(token) + b" " + str(rank).encode() + b"\n"
+            for token, rank in _ranks().items()
+        ))
+
+        tokenizer = BPETokenizer.from_file(str(path))
+
+        assert tokenizer.count("capital tier") == 3
+
+
+class TestCachedTokenizer:
+    """Tests for CachedTokenizer."""
+
+    def test_tokenizes_each_distinct_text_once(self):
+        inner = CountingTokenizer()
+        tokenizer = CachedTokenizer(inner)
+
+        assert tokenizer.count_batch(["a b", "c", "a b"]) == [2, 1, 2]
+        assert tokenizer.count("a b") == 2
+
+        assert inner.seen == ["a b", "c"]
+        assert tokenizer.get_stats() == {"size": 2, "hits": 2, "misses": 2}
+
+    def test_evicts_least_recently_used(self):
+        inner = CountingTokenizer()
+        tokenizer = CachedTokenizer(inner, max_entries=2)
+
+        tokenizer.count("a")
+        tokenizer.count("b")
+        tokenizer.count("a")
+        tokenizer.count("c")  # evicts "b"
+        tokenizer.count("b")
+
+        assert inner.seen == ["a", "b", "c", "b"]
+
+
+class TestChunkerTokenizer:
+    """Tests for DocumentChunker with a pluggable tokenizer."""
+
+    def _document(self) -> ParsedDocument:
+        paragraph = "The capital tier ratio must be reported. " * 3
+        return ParsedDocument(
+            text="",
+            format=DocumentFormat.CFR,
+            sections=[
+                ParsedSection(
+                    number=f"§ {i}",
+                    title="capital",
+                    content="\n\n".join([paragraph] * (40 if i % 5 == 0 else 1)),
+                    level=1,
+                )
+                for i in range(30)
+            ],
+        )
+
+    def test_chunks_sized_by_tokenizer(self):
+        bpe = BPETokenizer(_ranks())
+        config = ChunkerConfig(
+            min_chunk_tokens=200, target_chunk_tokens=600, max_chunk_tokens=1200, overlap_tokens=100
+        )
+        chunker = DocumentChunker(config, tokenizer=bpe)
+
+        chunks = chunker.chunk_document(self._document(), "doc")
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.token_count == bpe.count(chunk.content)
+            assert chunk.token_count <= config.max_chunk_tokens
+
+    def test_repeated_paragraphs_use_cache(self):
+        tokenizer = CachedTokenizer(BPETokenizer(_ranks()))
+        chunker = DocumentChunker(
+            ChunkerConfig(min_chunk_tokens=200, target_chunk_tokens=600, max_chunk_tokens=1200),
+            tokenizer=tokenizer,
+        )
+
+        first = chunker.chunk_document(self._document(), "doc")
+        misses = tokenizer.misses
+        second = chunker.chunk_document(self._document(), "doc")
+
+        assert [c.content for c in first] == [c.content for c in second]
+        assert tokenizer.misses == misses
+        assert tokenizer.hits > 0
+
+    def test_cached_character_estimates_stay_exact(self):
+        config = ChunkerConfig(min_chunk_tokens=200, target_chunk_tokens=600, max_chunk_tokens=1200)
+        plain = DocumentChunker(config, tokenizer=CharacterTokenizer())
+        cached = DocumentChunker(config, tokenizer=CachedTokenizer(CharacterTokenizer()))
+
+        expected = plain.chunk_document(self._document(), "doc")
+        chunks = cached.chunk_document(self._document(), "doc")
+
+        assert [c.content for c in chunks] == [c.content for c in expected]
+        assert [c.token_count for c in chunks] == [c.token_count for c in expected]
+        # Ten 7-character parts: the joined text is 88 characters, 22 tokens
+        assert cached._joined_tokens(10, 70, 10) == plain._joined_tokens(10, 70, 10) == 22
+
+
+class TestTokenizerFromEnv:
+    """Tests for tokenizer_from_env."""
+
+    def test_defaults_to_character_estimates(self, monkeypatch):
+        monkeypatch.delenv("CHUNK_TOKENIZER_RANKS", raising=False)
+        monkeypatch.delenv("CHUNK_TOKENIZER_ENCODING", raising=False)
+        assert tokenizer_from_env() is None
+
+    def test_ranks_file(self, monkeypatch, tmp_path):
+        path = tmp_path / "ranks.tiktoken"
+        path.write_bytes(b"".join(
+            base64.b64encode(token) + b" " + str(rank).encode() + b"\n"
+            for token, rank in _ranks().items()
+        ))
+        monkeypatch.setenv("CHUNK_TOKENIZER_RANKS", str(path))
+
+        tokenizer = tokenizer_from_env()
+
+        assert isinstance(tokenizer, CachedTokenizer)
+        assert isinstance(tokenizer.tokenizer, BPETokenizer)
+        assert tokenizer.count(" capital") == 3
@@ -20,6 +20,9 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, AsyncMock
 from io import BytesIO
 
+import boto3
+from moto import mock_aws
+
 from regulatory_kb.upload.service import UploadService
 from regulatory_kb.upload.status_tracker import StatusTracker
 from regulatory_kb.upload.validator import FileValidator, MetadataValidator
@@ -457,6 +460,140 @@ class TestBatchUploadIntegration:
         assert response.rejected == 1
 
 
+class TestConcurrentBatchUpload:
+    """Batch uploads against moto-backed S3, DynamoDB and SQS."""
+
+    PDF = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj\n<<\n/Type /Catalog\n>>\nendobj\n"
+
+    @pytest.fixture
+    def aws(self, monkeypatch):
+        """Create the upload bucket, status table and processing queue."""
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="uploads")
+            sqs = boto3.client("sqs", region_name="us-east-1")
+            queue_url = sqs.create_queue(QueueName="processing")["QueueUrl"]
+            table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+                TableName="upload-status",
+                KeySchema=[{"AttributeName": "upload_id", "KeyType": "HASH"}],
+                AttributeDefinitions=[
+                    {"AttributeName": "upload_id", "AttributeType": "S"},
+                    {"AttributeName": "batch_id", "AttributeType": "S"},
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        "IndexName": "batch_id-index",
+                        "KeySchema": [{"AttributeName": "batch_id", "KeyType": "HASH"}],
+                        "Projection": {"ProjectionType": "ALL"},
+                    }
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            tracker = StatusTracker(table_name="upload-status")
+            tracker._table = table
+            service = UploadService(
+                bucket_name="uploads",
+                queue_url=queue_url,
+                status_tracker=tracker,
+                s3_client=s3,
+                sqs_client=sqs,
+                multipart_threshold=5 * 1024 * 1024,
+            )
+            yield service, s3, sqs, queue_url
+
+    def _receive_all(self, sqs, queue_url) -> list[dict]:
+        messages = []
+        while True:
+            batch = sqs.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+            if not batch:
+                return messages
+            messages.extend(json.loads(m["Body"]) for m in batch)
+            sqs.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[{"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]} for i, m in enumerate(batch)],
+            )
+
+    def test_batch_records_and_messages(self, aws):
+        """Test each accepted document is stored, recorded with its batch and queued once."""
+        service, s3, sqs, queue_url = aws
+        documents = [
+            {"file_content": self.PDF + bytes([i]) * 100, "file_name": f"doc{i}.pdf"}
+            for i in range(14)
+        ]
+        documents.insert(3, {"file_content": b"not a pdf", "file_name": "bad.txt"})
+
+        response, error_code = service.upload_batch(documents, uploader_id="user-1")
+
+        assert error_code is None
+        assert (response.accepted, response.rejected) == (14, 1)
+        assert [d.file_name for d in response.documents] == [d["file_name"] for d in documents]
+        assert response.documents[3].status == "rejected"
+
+        batch = service.status_tracker.get_batch_status(response.batch_id)
+        accepted_ids = {d.upload_id for d in response.documents if d.status == "pending"}
+        assert {d.upload_id for d in batch.documents} == accepted_ids
+        assert batch.pending == 14
+
+        messages = self._receive_all(sqs, queue_url)
+        assert sorted(m["upload_id"] for m in messages) == sorted(accepted_ids)
+
+        first = response.documents[0]
+        body = s3.get_object(Bucket="uploads", Key=f"uploads/pending/{first.upload_id}/original.pdf")["Body"]
+        assert body.read() == documents[0]["file_content"]
+
+    def test_large_file_uses_multipart_upload(self, aws):
+        """Test files above the multipart threshold are stored intact."""
+        service, s3, _, _ = aws
+        content = self.PDF + b"x" * (6 * 1024 * 1024)
+
+        response, error_code = service.upload_batch(
+            [{"file_content": content, "file_name": "large.pdf"}], uploader_id="user-1"
+        )
+
+        assert error_code is None
+        key = f"uploads/pending/{response.documents[0].upload_id}/original.pdf"
+        head = s3.head_object(Bucket="uploads", Key=key)
+        assert head["ContentLength"] == len(content)
+        assert "-" in head["ETag"]  # multipart ETags carry a part count
+        assert "large.pdf" in head["Metadata"].values()
+
+    def test_memoryview_content_is_stored(self, aws):
+        """Test memoryview slices from the multipart parser upload intact."""
+        service, s3, _, _ = aws
+        body = b"--boundary\r\n" + self.PDF + b"\x00\r\n--" + b"\r\n--boundary--"
+        content = memoryview(body)[12:-14]
+
+        response, error_code = service.upload_document(content, "view.pdf", uploader_id="user-1")
+
+        assert error_code is None
+        key = f"uploads/pending/{response.upload_id}/original.pdf"
+        assert s3.get_object(Bucket="uploads", Key=key)["Body"].read() == bytes(content)
+
+    def test_failed_queue_entries_are_rejected(self, aws):
+        """Test documents SQS rejects are reported and marked failed."""
+        service, _, _, queue_url = aws
+        sqs = MagicMock()
+
+        def send_message_batch(QueueUrl, Entries):
+            return {
+                "Successful": [{"Id": e["Id"]} for e in Entries[1:]],
+                "Failed": [{"Id": Entries[0]["Id"], "Code": "InternalError", "SenderFault": False}],
+            }
+
+        sqs.send_message_batch.side_effect = send_message_batch
+        service._sqs_client = sqs
+        documents = [{"file_content": self.PDF, "file_name": f"doc{i}.pdf"} for i in range(3)]
+
+        response, _ = service.upload_batch(documents, uploader_id="user-1")
+
+        assert (response.accepted, response.rejected) == (2, 1)
+        failed = response.documents[0]
+        assert failed.error == "Failed to queue for processing"
+        batch = service.status_tracker.get_batch_status(response.batch_id)
+        assert (batch.pending, batch.failed) == (2, 1)
+
+
 class TestStatusTrackingIntegration:
     """Integration tests for status tracking through all states."""
 
@@ -1205,6 +1342,35 @@ class TestUploadProcessorIntegration:
         # Verify webhook was triggered
         mock_webhook_service.dispatch_upload_processing_completed.assert_called_once()
 
+    def test_intermediate_stages_are_coalesced(self, mock_s3_client, mock_dynamodb_table, mock_webhook_service):
+        """Test a fast pipeline run writes only its terminal status."""
+        from src.handlers.upload_processor import UploadProcessor
+        
+        status_tracker = StatusTracker(table_name="test-table")
+        status_tracker._table = mock_dynamodb_table
+        
+        processor = UploadProcessor(
+            bucket_name="test-bucket",
+            status_tracker=status_tracker,
+            s3_client=mock_s3_client,
+            webhook_service=mock_webhook_service,
+            status_flush_interval=60,
+        )
+        
+        processor.process_upload({
+            "upload_id": "test-upload-003",
+            "file_path": "s3://test-bucket/uploads/pending/test-upload-003/original.html",
+            "file_type": "html",
+            "uploader_id": "user-123",
+        })
+        processor.close()
+        
+        statuses = [
+            c.kwargs["ExpressionAttributeValues"][":status"]
+            for c in mock_dynamodb_table.update_item.call_args_list
+        ]
+        assert statuses == ["completed"]
+
 
 class TestFileValidationIntegration:
     """Integration tests for file validation across the upload flow."""
@@ -2,8 +2,10 @@
 
 import pytest
 
+from regulatory_kb.processing import validation
 from regulatory_kb.processing.validation import (
     ContentValidator,
+    ValidationTask,
     ValidationResult,
     ValidationSeverity,
     ValidationCategory,
@@ -199,6 +201,80 @@ class TestContentValidator:
         assert isinstance(report["summary"]["quality_score"], float)
 
 
+class TestRulePlans:
+    """Tests for compiled validation rule plans."""
+
+    @pytest.fixture
+    def validator(self):
+        return ContentValidator()
+
+    def test_plan_collects_keywords_of_all_checks(self, validator):
+        """Test a regulator plan scans for general and regulator keywords."""
+        plan = validator.get_plan(RegulatorType.FINTRAC)
+
+        assert {"regulation", "c$10,000", "business days"} <= plan.keywords
+        assert plan.checks[-1] == validator._validate_fintrac
+        assert validator.get_plan(None).keywords == frozenset(
+            ContentValidator.REGULATORY_KEYWORDS["general"]
+        )
+
+    def test_unknown_regulator_uses_general_plan(self, validator):
+        """Test regulators without specific checks run general checks only."""
+        assert validator.get_plan(RegulatorType.BASEL).checks == validator.get_plan(None).checks
+
+    def test_scan_is_case_insensitive(self, validator):
+        """Test keyword hits ignore case."""
+        scan = validator.get_plan(RegulatorType.FINCEN).scan("CURRENCY TRANSACTION over $10,000")
+
+        assert scan.has_any(ContentValidator.CTR_MARKERS)
+        assert scan.found(ContentValidator.CTR_THRESHOLDS) == ["$10,000", "10,000"]
+        assert not scan.has("ctr")
+
+
+class TestValidateMany:
+    """Tests for batch validation."""
+
+    @pytest.fixture
+    def tasks(self):
+        texts = [
+            "Currency transaction reports over $10,000 must be filed within 15 days. " * 5,
+            "Short text",
+            "This regulation sets capital requirements and reporting deadlines. " * 5,
+        ]
+        return [
+            ValidationTask(
+                parsed=ParsedDocument(text=texts[i % 3], format=DocumentFormat.HTML),
+                regulator_type=RegulatorType.FINCEN if i % 2 else None,
+                document_id=f"doc_{i}",
+            )
+            for i in range(12)
+        ]
+
+    def test_matches_validate_in_order(self, tasks):
+        """Test pooled results equal one-by-one validation, in input order."""
+        validator = ContentValidator()
+        expected = [
+            validator.validate(t.parsed, t.metadata, t.regulator_type, t.document_id).to_dict()
+            for t in tasks
+        ]
+
+        results = validator.validate_many(tasks, max_workers=2, chunksize=4)
+
+        assert [r.to_dict() for r in results] == expected
+
+    def test_falls_back_when_pool_unavailable(self, tasks, monkeypatch):
+        """Test validation runs in-process where process pools cannot start."""
+        def no_pool(*args, **kwargs):
+            raise OSError(38, "Function not implemented")
+
+        monkeypatch.setattr(validation, "ProcessPoolExecutor", no_pool)
+
+        results = ContentValidator().validate_many(tasks)
+
+        assert [r.document_id for r in results] == [t.document_id for t in tasks]
+        assert not results[1].is_valid
+
+
 class TestValidationResult:
     """Tests for ValidationResult class."""
 
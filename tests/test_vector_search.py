@@ -11,6 +11,7 @@ from regulatory_kb.storage.vector_search import (
     HybridSearchResult,
     SimilarityMetric,
     SearchMode,
+    PoolingStrategy,
 )
 from regulatory_kb.storage.graph_store import FalkorDBStore, QueryResult
 from regulatory_kb.models.document import (
@@ -254,26 +255,84 @@ class TestVectorSearch:
         assert len(results) == 0
 
     def test_find_similar_documents(self, vector_service, mock_store):
-        """Test finding similar documents."""
-        # First query returns document embedding
-        mock_embedding_result = MagicMock()
-        mock_embedding_result.result_set = [[[0.1] * 1536]]
-        
-        # Second query returns similar documents
+        """Test finding similar documents with one document-level query."""
         mock_search_result = MagicMock()
         mock_search_result.result_set = [
             ["doc_2", "Similar Doc", 0.9],
         ]
-        
-        mock_store.query.side_effect = [
-            QueryResult(nodes=[], relationships=[], raw_result=mock_embedding_result),
-            QueryResult(nodes=[], relationships=[], raw_result=mock_search_result),
-        ]
+        mock_store.query.return_value = QueryResult(
+            nodes=[], relationships=[], raw_result=mock_search_result
+        )
         
         results = vector_service.find_similar_documents("doc_1", top_k=5)
         
         assert len(results) == 1
         assert results[0].document_id == "doc_2"
+        assert mock_store.query.call_count == 1
+        query, params = mock_store.query.call_args[0]
+        assert "DocumentEmbedding" in query
+        assert params["k"] == 6
+
+
+class TestDocumentEmbeddings:
+    """Tests for pooled document-level embeddings."""
+
+    def test_index_stores_pooled_embedding(self, mock_store, sample_document):
+        """Test the document embedding is written with its chunks."""
+        service = VectorSearchService(mock_store, VectorSearchConfig(chunk_size=100))
+        
+        service.index_document(sample_document)
+        
+        assert mock_store.query.call_count == 1
+        query, params = mock_store.query.call_args[0]
+        assert "MERGE (e:DocumentEmbedding" in query
+        expected = service.pool_embeddings(
+            service.generate_embeddings([c["text"] for c in params["chunks"]])
+        )
+        assert params["document_embedding"] == pytest.approx(expected.tolist())
+
+    def test_mean_and_max_pooling(self, mock_store):
+        """Test pooling normalizes chunks for cosine similarity."""
+        embeddings = [[3.0, 0.0], [0.0, 1.0]]
+        mean = VectorSearchService(mock_store, VectorSearchConfig(embedding_dimension=2))
+        pooled_max = VectorSearchService(
+            mock_store,
+            VectorSearchConfig(embedding_dimension=2, document_pooling=PoolingStrategy.MAX),
+        )
+        dot = VectorSearchService(
+            mock_store,
+            VectorSearchConfig(
+                embedding_dimension=2, similarity_metric=SimilarityMetric.DOT_PRODUCT
+            ),
+        )
+        
+        assert mean.pool_embeddings(embeddings).tolist() == pytest.approx([0.7071068, 0.7071068])
+        assert pooled_max.pool_embeddings([[2.0, 0.0], [-0.6, 0.8]]).tolist() == pytest.approx(
+            [0.7808688, 0.6246950]
+        )
+        assert dot.pool_embeddings(embeddings).tolist() == pytest.approx([1.5, 0.5])
+
+    def test_refresh_from_stored_chunks(self, vector_service, mock_store):
+        """Test backfilling a document embedding from stored chunks."""
+        chunk_result = MagicMock()
+        chunk_result.result_set = [[[1.0] + [0.0] * 1535, "Doc"], [[0.0, 1.0] + [0.0] * 1534, "Doc"]]
+        mock_store.query.side_effect = [
+            QueryResult(nodes=[], relationships=[], raw_result=chunk_result),
+            QueryResult(nodes=[], relationships=[]),
+        ]
+        
+        assert vector_service.refresh_document_embedding("doc_1") is True
+        
+        params = mock_store.query.call_args[0][1]
+        assert params["chunk_count"] == 2
+        assert params["document_embedding"][:2] == pytest.approx([0.7071068, 0.7071068])
+
+    def test_remove_deletes_document_embedding(self, vector_service, mock_store):
+        """Test removing a document drops its document embedding."""
+        vector_service.remove_document_from_index("doc_1")
+        
+        queries = [c[0][0] for c in mock_store.query.call_args_list]
+        assert any("DocumentEmbedding" in q and "DELETE" in q for q in queries)
 
 
 class TestKeywordSearch:
@@ -444,8 +503,8 @@ class TestIndexManagement:
         
         assert result is True
         mock_store.query.assert_called()
-        call_args = mock_store.query.call_args[0][0]
-        assert "CREATE VECTOR INDEX" in call_args
+        queries = [call[0][0] for call in mock_store.query.call_args_list]
+        assert sum("CREATE VECTOR INDEX" in query for query in queries) == 2
 
     def test_create_vector_index_already_exists(self, vector_service, mock_store):
         """Test creating index when it already exists."""
@@ -455,6 +514,25 @@ class TestIndexManagement:
         
         assert result is False
 
+    def test_existing_chunk_index_does_not_block_document_index(self, vector_service, mock_store):
+        """Test each index is created even if an earlier one fails."""
+        mock_store.query.side_effect = [Exception("Index already exists"), None, None]
+        
+        created = vector_service.create_vector_indexes()
+        
+        assert created == {
+            "document_embeddings": False,
+            "document_centroids": True,
+            "DocumentEmbedding.document_id": True,
+        }
+
+    def test_creates_document_id_range_index(self, vector_service, mock_store):
+        """Test DocumentEmbedding lookups by document_id get a range index."""
+        vector_service.create_vector_indexes()
+        
+        queries = [call[0][0] for call in mock_store.query.call_args_list]
+        assert "CREATE INDEX FOR (n:DocumentEmbedding) ON (n.document_id)" in queries
+
     def test_drop_vector_index(self, vector_service, mock_store):
         """Test dropping vector index."""
         result = vector_service.drop_vector_index()
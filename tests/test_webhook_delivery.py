@@ -0,0 +1,195 @@
+"""Tests for the pooled webhook delivery engine and retry scheduling."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+
+from regulatory_kb.api.webhook_delivery import (
+    DeliveryEngineConfig,
+    DeliveryLatencyMetrics,
+    RetryScheduler,
+    WebhookDeliveryEngine,
+)
+from regulatory_kb.api.webhooks import (
+    WebhookDelivery,
+    WebhookEventType,
+    WebhookService,
+    WebhookStatus,
+)
+
+
+class _WebhookServer:
+    """Local webhook receiver running on a background loop."""
+
+    def __init__(self, delay: float = 0.0, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.requests = 0
+        self._engine = WebhookDeliveryEngine()
+        self._runner = None
+        self.url = ""
+
+    async def _handle(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return web.Response(status=self.status)
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/hook", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/hook"
+
+    def start(self):
+        self._engine.run(self._start())
+        return self
+
+    def stop(self):
+        self._engine.run(self._runner.cleanup())
+        self._engine.close()
+
+
+@pytest.fixture
+def slow_server():
+    server = _WebhookServer(delay=0.2).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def failing_server():
+    server = _WebhookServer(status=503).start()
+    yield server
+    server.stop()
+
+
+class TestRetryScheduler:
+    """Tests for RetryScheduler."""
+
+    def _delivery(self, seconds: int) -> WebhookDelivery:
+        return WebhookDelivery(
+            next_retry_at=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds)
+        )
+
+    def test_pop_ready_in_due_order(self):
+        scheduler = RetryScheduler()
+        deliveries = [self._delivery(s) for s in (30, 10, 20, 40)]
+        for d in deliveries:
+            scheduler.schedule(d)
+
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=30)
+        ready = scheduler.pop_ready(now)
+
+        assert [d.next_retry_at.second for d in ready] == [10, 20, 30]
+        assert len(scheduler) == 1
+
+    def test_cancel_and_reschedule_skip_stale_entries(self):
+        scheduler = RetryScheduler()
+        first, second = self._delivery(10), self._delivery(20)
+        scheduler.schedule(first)
+        scheduler.schedule(second)
+        scheduler.cancel(first.id)
+        second.next_retry_at += timedelta(seconds=100)
+        scheduler.schedule(second)
+
+        later = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=50)
+        assert scheduler.pop_ready(later) == []
+        assert scheduler.next_due() == second.next_retry_at
+
+
+class TestDeliveryLatencyMetrics:
+    """Tests for DeliveryLatencyMetrics."""
+
+    def test_percentiles_and_counts(self):
+        metrics = DeliveryLatencyMetrics()
+        for ms in range(1, 101):
+            metrics.record(float(ms), success=ms % 10 != 0)
+
+        stats = metrics.to_dict()
+        assert stats["attempts"] == 100
+        assert stats["failures"] == 10
+        assert stats["p50_ms"] == 50.0
+        assert stats["p95_ms"] == 95.0
+        assert stats["max_ms"] == 100.0
+
+
+class TestWebhookFanOut:
+    """Tests for concurrent delivery through WebhookService."""
+
+    def test_fan_out_takes_about_one_round_trip(self, slow_server):
+        engine = WebhookDeliveryEngine(DeliveryEngineConfig(max_per_host=50))
+        service = WebhookService(delivery_engine=engine)
+        for _ in range(20):
+            service.create_subscription(slow_server.url, [WebhookEventType.DOCUMENT_CREATED])
+
+        deliveries = service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, {"document_id": "d1"})
+        started = time.perf_counter()
+        results = service.deliver_many_sync(deliveries)
+        elapsed = time.perf_counter() - started
+
+        assert results == [True] * 20
+        assert slow_server.requests == 20
+        assert elapsed < 2.0
+        assert service.get_delivery_stats()["latency"]["successes"] == 20
+        service.close()
+
+    def test_per_host_limit_bounds_concurrency(self, slow_server):
+        engine = WebhookDeliveryEngine(DeliveryEngineConfig(max_per_host=2))
+        service = WebhookService(delivery_engine=engine)
+        for _ in range(4):
+            service.create_subscription(slow_server.url, [WebhookEventType.DOCUMENT_CREATED])
+
+        deliveries = service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, {})
+        started = time.perf_counter()
+        service.deliver_many_sync(deliveries)
+
+        # Two waves of two requests each
+        assert time.perf_counter() - started >= 0.4
+        service.close()
+
+    def test_caller_loop_sessions_closed_after_each_call(self, slow_server):
+        engine = WebhookDeliveryEngine()
+        service = WebhookService(delivery_engine=engine)
+        service.create_subscription(slow_server.url, [WebhookEventType.DOCUMENT_CREATED])
+        sessions = []
+
+        async def deliver_and_capture():
+            deliveries = service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, {})
+            async with engine.session_scope():
+                results = await service.deliver_many(deliveries)
+                sessions.append(engine._session())
+            return results
+
+        for _ in range(2):
+            assert asyncio.run(deliver_and_capture()) == [True]
+
+        assert len(sessions) == 2 and all(session.closed for session in sessions)
+        assert engine._sessions == {}
+        service.close()
+
+    def test_failed_delivery_is_scheduled_for_retry(self, failing_server):
+        service = WebhookService()
+        service.create_subscription(failing_server.url, [WebhookEventType.DOCUMENT_CREATED])
+
+        [delivery] = service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, {})
+        assert service.deliver_sync(delivery) is False
+
+        assert delivery.status == WebhookStatus.RETRYING
+        assert delivery.last_error == "HTTP 503"
+        assert service.get_delivery_stats()["pending_retries"] == 1
+
+        # Force the retry to be due
+        delivery.next_retry_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        service._pending_retries.schedule(delivery)
+        processed = service._engine.run(service.process_pending_retries())
+
+        assert processed == 1
+        assert delivery.attempts == 2
+        service.close()
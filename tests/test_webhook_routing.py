@@ -0,0 +1,96 @@
+"""Tests for webhook subscription routing."""
+
+import random
+
+from regulatory_kb.api.webhooks import (
+    SubscriptionRoutingIndex,
+    WebhookEventType,
+    WebhookService,
+)
+
+
+REGULATORS = ["us_frb", "us_occ", "us_fdic", "ca_osfi"]
+CATEGORIES = ["capital", "liquidity", "aml", "reporting"]
+EVENTS = [
+    WebhookEventType.DOCUMENT_CREATED,
+    WebhookEventType.DOCUMENT_UPDATED,
+    WebhookEventType.CFR_AMENDMENT,
+]
+
+
+def _random_service(rng: random.Random, count: int = 200) -> WebhookService:
+    service = WebhookService()
+    for i in range(count):
+        service.create_subscription(
+            url=f"https://example.com/hook/{i}",
+            events=rng.sample(EVENTS, rng.randint(1, len(EVENTS))),
+            regulator_filter=rng.choice([None, [], rng.sample(REGULATORS, rng.randint(1, 2))]),
+            category_filter=rng.choice([None, rng.sample(CATEGORIES, rng.randint(1, 2))]),
+        )
+    return service
+
+
+class TestSubscriptionRoutingIndex:
+    """Tests for SubscriptionRoutingIndex."""
+
+    def test_dispatch_matches_linear_scan(self):
+        rng = random.Random(7)
+        service = _random_service(rng)
+        subscriptions = service.list_subscriptions(active_only=False)
+
+        for _ in range(50):
+            event_type = rng.choice(EVENTS)
+            payload = {
+                "regulator_id": rng.choice([None, *REGULATORS]),
+                "categories": rng.sample(CATEGORIES, rng.randint(0, 2)),
+            }
+            expected = [s.id for s in subscriptions if s.matches_event(event_type, payload)]
+            deliveries = service.dispatch_event(event_type, payload)
+            assert [d.subscription_id for d in deliveries] == expected
+
+    def test_update_and_delete_maintain_index(self):
+        service = WebhookService()
+        sub = service.create_subscription(
+            "https://example.com/a",
+            [WebhookEventType.DOCUMENT_CREATED],
+            regulator_filter=["us_frb"],
+        )
+        payload = {"regulator_id": "us_occ", "categories": []}
+
+        assert service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, payload) == []
+
+        service.update_subscription(sub.id, regulator_filter=["us_occ"])
+        assert len(service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, payload)) == 1
+
+        service.update_subscription(sub.id, is_active=False)
+        assert service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, payload) == []
+
+        service.update_subscription(sub.id, is_active=True, events=[WebhookEventType.DOCUMENT_UPDATED])
+        assert service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, payload) == []
+        assert len(service.dispatch_event(WebhookEventType.DOCUMENT_UPDATED, payload)) == 1
+
+        service.delete_subscription(sub.id)
+        assert service.dispatch_event(WebhookEventType.DOCUMENT_UPDATED, payload) == []
+        assert len(service._routing_index) == 0
+
+    def test_updated_subscription_keeps_creation_order(self):
+        service = WebhookService()
+        first = service.create_subscription("https://example.com/1", [WebhookEventType.DOCUMENT_CREATED])
+        second = service.create_subscription("https://example.com/2", [WebhookEventType.DOCUMENT_CREATED])
+        service.update_subscription(first.id, url="https://example.com/1b")
+
+        deliveries = service.dispatch_event(WebhookEventType.DOCUMENT_CREATED, {})
+        assert [d.subscription_id for d in deliveries] == [first.id, second.id]
+
+    def test_list_subscriptions_by_event_uses_index(self):
+        service = _random_service(random.Random(3), count=50)
+        expected = [
+            s.id for s in service.list_subscriptions(active_only=False)
+            if s.is_active and WebhookEventType.CFR_AMENDMENT in s.events
+        ]
+        listed = service.list_subscriptions(event_type=WebhookEventType.CFR_AMENDMENT)
+        assert [s.id for s in listed] == expected
+
+    def test_empty_index_routes_nothing(self):
+        index = SubscriptionRoutingIndex()
+        assert index.match(WebhookEventType.DOCUMENT_CREATED, {"regulator_id": "us_frb"}) == []